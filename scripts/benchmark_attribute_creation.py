@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+Benchmark of creating the PaSD bus device's dynamic attributes.
+
+``MccsPasdBus`` creates a Tango attribute for every register of every PaSD
+device of a full 24-smartbox station whenever it is initialised. This
+measures the time taken to create them in a minimal Tango device, working
+out the metadata of each attribute from the register configuration, as
+the device used to, and creating them from a template per register, as it
+does now. The time spent adding the attributes to Tango is reported
+separately, as it is the same for both.
+
+Usage::
+
+    python scripts/benchmark_attribute_creation.py [--repeats N]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Callable
+
+import tango
+from ska_low_pasd_driver.pasd_bus_register_map import DesiredPowerEnum
+from tango.server import Device, attribute
+from tango.test_context import DeviceTestContext
+
+from ska_low_mccs_pasd import PasdData
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_attribute_template import (
+    build_attribute_templates,
+)
+from ska_low_mccs_pasd.pasd_controllers_configuration import ControllerDict
+
+TYPES: dict[str, type] = {
+    "int": int,
+    "float": float,
+    "str": str,
+    "bool": bool,
+    "DesiredPowerEnum": DesiredPowerEnum,
+}
+
+
+def _controllers() -> list[tuple[ControllerDict, list[str]]]:
+    """
+    Return each controller's configuration and the prefixes of its devices.
+
+    :return: the configuration of each controller, with the prefixes of the
+        devices on a full station that have that configuration.
+    """
+    smartbox_ids = range(1, PasdData.MAX_NUMBER_OF_SMARTBOXES_PER_STATION + 1)
+    return [
+        (
+            controller,
+            (
+                [
+                    controller["prefix"] + str(smartbox_id)
+                    for smartbox_id in smartbox_ids
+                ]
+                if key == "FNSC"
+                else [controller["prefix"]]
+            ),
+        )
+        for key, controller in PasdData.CONTROLLERS_CONFIG.items()
+    ]
+
+
+def _per_attribute_kwargs(
+    controllers: list[tuple[ControllerDict, list[str]]]
+) -> list[tuple[str, dict[str, Any]]]:
+    """
+    Work out the metadata of each attribute, the way the device used to.
+
+    :param controllers: the configuration of each controller, with the
+        prefixes of its devices.
+
+    :return: the name and metadata of each attribute.
+    """
+    attributes = []
+    for controller, prefixes in controllers:
+        for prefix in prefixes:
+            for register in controller["registers"].values():
+                data_type = TYPES[register["data_type"]]
+                dtype = data_type if register["tango_dim_x"] == 1 else (data_type,)
+                base_type = dtype[0] if isinstance(dtype, tuple) else dtype
+                attributes.append(
+                    (
+                        prefix + register["tango_attr_name"],
+                        {
+                            "dtype": dtype,
+                            "max_dim_x": register["tango_dim_x"],
+                            "access": (
+                                tango.AttrWriteType.READ_WRITE
+                                if register["writable"]
+                                else tango.AttrWriteType.READ
+                            ),
+                            **(
+                                {"rel_change": 1, "archive_rel_change": 1}
+                                if base_type in (int, float)
+                                else {}
+                            ),
+                        },
+                    )
+                )
+    return attributes
+
+
+def _templated_kwargs(
+    controllers: list[tuple[ControllerDict, list[str]]]
+) -> list[tuple[str, dict[str, Any]]]:
+    """
+    Work out the metadata of each attribute from a template per register.
+
+    :param controllers: the configuration of each controller, with the
+        prefixes of its devices.
+
+    :return: the name and metadata of each attribute.
+    """
+    attributes = []
+    for controller, prefixes in controllers:
+        templates = build_attribute_templates(controller, TYPES)
+        for prefix in prefixes:
+            for template in templates:
+                attributes.append(
+                    (
+                        prefix + template.name,
+                        {
+                            "dtype": template.dtype,
+                            "max_dim_x": template.max_dim_x,
+                            "access": template.access,
+                            **template.event_kwargs,
+                        },
+                    )
+                )
+    return attributes
+
+
+def _benchmark_device(repeats: int, results: dict[str, list[float]]) -> type[Device]:
+    """
+    Return a device that times creating its attributes both ways on init.
+
+    :param repeats: the number of times to create the attributes each way.
+    :param results: a dictionary to put the times taken each way in.
+
+    :return: the device class.
+    """
+
+    class _BenchmarkDevice(Device):
+        def init_device(self: _BenchmarkDevice) -> None:
+            super().init_device()
+            controllers = _controllers()
+            ways: list[tuple[str, Callable[..., Any]]] = [
+                ("per attribute", _per_attribute_kwargs),
+                ("template", _templated_kwargs),
+            ]
+            for repeat in range(repeats):
+                # Alternate the order, as adding attributes slows as they grow.
+                for label, build in ways[:: 1 if repeat % 2 else -1]:
+                    start = time.perf_counter()
+                    attributes = build(controllers)
+                    built = time.perf_counter()
+                    for name, kwargs in attributes:
+                        name = f"r{repeat}{label[0]}{name}"
+                        self.add_attribute(
+                            attribute(
+                                name=name,
+                                label=name,
+                                fget=self._read,
+                                fset=self._write,
+                                **kwargs,
+                            )
+                        )
+                        self.set_change_event(name, True, False)
+                        self.set_archive_event(name, True, False)
+                    results[label].append(built - start)
+                    results["adding to Tango"].append(time.perf_counter() - built)
+            results["attributes"] = [len(attributes)]
+
+        def _read(self: _BenchmarkDevice, attr: tango.Attribute) -> None:
+            pass
+
+        def _write(self: _BenchmarkDevice, attr: tango.Attribute) -> None:
+            pass
+
+    return _BenchmarkDevice
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    results: dict[str, list[float]] = {
+        "per attribute": [],
+        "template": [],
+        "adding to Tango": [],
+    }
+    with DeviceTestContext(_benchmark_device(args.repeats, results), process=False):
+        pass
+
+    count = results.pop("attributes")[0]
+    print(f"{count:.0f} attributes on a full station")
+    print(f"{'':>16} {'ms per init (best)':>19}")
+    for label, times in results.items():
+        print(f"{label:>16} {1e3 * min(times):>19.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+Micro-benchmark of dispatching PaSD attribute change events in a smartbox.
+
+Every change event of a smartbox's attribute on the PaSD bus device is
+mapped, by the smartbox's proxy to the PaSD bus, onto the name of the
+smartbox's own attribute, and then dispatched by ``MccsSmartBox`` to the
+handling for that kind of attribute. This measures the cost per event of
+that mapping and dispatch, without the handling itself: parsing the name
+with a regular expression compiled for every event, searching the
+register configuration for it and then testing it for substrings, as the
+smartbox used to; and looking it up in a table of names and then in a
+dispatch table, as it does now.
+
+Usage::
+
+    python scripts/benchmark_attribute_dispatch.py [--repeats N]
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import timeit
+from typing import Any, Callable, Optional
+
+from ska_low_mccs_pasd.pasd_controllers_configuration import PasdControllersConfig
+from ska_low_mccs_pasd.pasd_utils import (
+    PasdAttributeKind,
+    build_attribute_dispatch_table,
+)
+
+SMARTBOX_NUMBER = 5
+CONFIG = PasdControllersConfig.get_smartbox()
+
+
+def _handle(kind: str) -> Callable[..., None]:
+    """
+    Return a handler of an attribute change that does nothing.
+
+    :param kind: the kind of attribute that it handles.
+
+    :return: the handler.
+    """
+
+    def _handler(*args: Any) -> None:
+        pass
+
+    _handler.__name__ = kind
+    return _handler
+
+
+HANDLERS = {kind: _handle(kind.name) for kind in PasdAttributeKind}
+
+
+def _old_dispatch(attr_name: str) -> None:
+    """
+    Map and dispatch an event the way the smartbox used to.
+
+    :param attr_name: the name of the PaSD bus attribute.
+    """
+    smartbox_attribute = re.compile(r"smartbox(\d{1,2})(.*)").match(attr_name)
+    assert smartbox_attribute is not None
+    assert int(smartbox_attribute.group(1)) == SMARTBOX_NUMBER
+    name = smartbox_attribute.group(2).lower()
+    if name == "status":
+        name = "pasdstatus"
+    assert [
+        register["tango_attr_name"]
+        for register in CONFIG["registers"].values()
+        if register["tango_attr_name"].lower() == name.lower()
+    ]
+    if "portspowersensed" in name.lower():
+        HANDLERS[PasdAttributeKind.PORT_POWER]()
+    if "pasdstatus" in name.lower():
+        pass
+    if name.endswith("thresholds"):
+        HANDLERS[PasdAttributeKind.THRESHOLD]()
+    elif name.endswith("status"):
+        HANDLERS[PasdAttributeKind.STATUS]()
+    elif "portbreakerstripped" in name.lower():
+        HANDLERS[PasdAttributeKind.BREAKER]()
+    else:
+        HANDLERS[PasdAttributeKind.MONITORING_POINT]()
+
+
+def _new_dispatcher() -> Callable[[str], None]:
+    """
+    Return a function that maps and dispatches an event the way it is now.
+
+    :return: the function.
+    """
+    pattern = re.compile(r"smartbox(\d{1,2})(.*)")
+    attribute_names: dict[str, Optional[str]] = {}
+    handlers = build_attribute_dispatch_table(CONFIG, HANDLERS)
+
+    def _resolve(attr_name: str) -> Optional[str]:
+        smartbox_attribute = pattern.match(attr_name)
+        if (
+            smartbox_attribute is None
+            or int(smartbox_attribute.group(1)) != SMARTBOX_NUMBER
+        ):
+            return None
+        name = smartbox_attribute.group(2).lower()
+        return "pasdstatus" if name == "status" else name
+
+    def _dispatch(attr_name: str) -> None:
+        try:
+            name = attribute_names[attr_name]
+        except KeyError:
+            name = _resolve(attr_name)
+            attribute_names[attr_name] = name
+        assert name is not None
+        handlers[name]()
+
+    return _dispatch
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    # The names of the PaSD bus attributes, as received in change events.
+    events = [
+        f"smartbox{SMARTBOX_NUMBER}"
+        + ("Status" if name == "PasdStatus" else name).lower()
+        for name in (
+            register["tango_attr_name"] for register in CONFIG["registers"].values()
+        )
+    ]
+    new_dispatch = _new_dispatcher()
+    print(f"{len(events)} smartbox attributes")
+    print(f"{'':>16} {'us per event':>13}")
+    for label, dispatch in [("per event", _old_dispatch), ("table", new_dispatch)]:
+        total = timeit.timeit(
+            lambda dispatch=dispatch: [dispatch(event) for event in events],
+            number=args.repeats,
+        )
+        print(f"{label:>16} {1e6 * total / args.repeats / len(events):>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+Micro-benchmark of the PaSD bus device's attribute name lookups.
+
+``MccsPasdBus._pasd_device_state_callback`` maps every value in every poll
+response onto a Tango attribute name, and ``_write_pasd_attribute`` maps
+every written Tango attribute back onto a PaSD device and register. This
+measures both lookups for every register of a full 24-smartbox station,
+using ``PasdAttributeIndex``, and compares them against the linear scans
+that the device used to do.
+
+Usage::
+
+    python scripts/benchmark_attribute_index.py [--repeats N]
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from ska_low_mccs_pasd import PasdData
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_attribute_index import PasdAttributeIndex
+
+
+def _linear_tango_attribute_name(device_id: int, pasd_attribute_name: str) -> str:
+    """
+    Look up a Tango attribute name the way the device used to, for comparison.
+
+    :param device_id: the ID of the PaSD device.
+    :param pasd_attribute_name: the name of the register in the Modbus API.
+
+    :return: the name of the Tango attribute.
+    """
+    for controller in PasdData.CONTROLLERS_CONFIG.values():
+        if controller.get("modbus_address") == device_id:
+            for key, register in controller["registers"].items():
+                if key == pasd_attribute_name:
+                    return controller["prefix"] + register["tango_attr_name"]
+    for key, register in PasdData.CONTROLLERS_CONFIG["FNSC"]["registers"].items():
+        if key == pasd_attribute_name:
+            return (
+                PasdData.CONTROLLERS_CONFIG["FNSC"]["prefix"]
+                + str(device_id)
+                + register["tango_attr_name"]
+            )
+    return ""
+
+
+def _linear_pasd_attribute(tango_attribute_name: str) -> tuple[int, str] | None:
+    """
+    Look up a PaSD register the way the device used to, for comparison.
+
+    :param tango_attribute_name: the name of the Tango attribute.
+
+    :return: the ID of the PaSD device and the name of the register.
+    """
+    if tango_attribute_name.startswith("fndh"):
+        tango_attribute_name = tango_attribute_name.removeprefix("fndh")
+        device_id = PasdData.FNDH_DEVICE_ID
+        controller_config = PasdData.CONTROLLERS_CONFIG["FNPC"]
+    elif tango_attribute_name.startswith("fncc"):
+        tango_attribute_name = tango_attribute_name.removeprefix("fncc")
+        device_id = PasdData.FNCC_DEVICE_ID
+        controller_config = PasdData.CONTROLLERS_CONFIG["FNCC"]
+    else:
+        tango_attribute_name = tango_attribute_name.removeprefix("smartbox")
+        device_id = (
+            int(tango_attribute_name[0:2])
+            if tango_attribute_name[0:2].isdigit()
+            else int(tango_attribute_name[0])
+        )
+        tango_attribute_name = tango_attribute_name.lstrip("0123456789")
+        controller_config = PasdData.CONTROLLERS_CONFIG["FNSC"]
+    for key, register in controller_config["registers"].items():
+        if register["tango_attr_name"] == tango_attribute_name:
+            return (device_id, key)
+    return None
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=100)
+    args = parser.parse_args()
+
+    smartbox_ids = list(range(1, PasdData.MAX_NUMBER_OF_SMARTBOXES_PER_STATION + 1))
+    attribute_index = PasdAttributeIndex(PasdData.CONTROLLERS_CONFIG, smartbox_ids)
+
+    # Every register of every device on the station, as in a full set of
+    # poll responses.
+    station_reads = [
+        (device_id, key)
+        for device_id, controller_type in [
+            (PasdData.FNDH_DEVICE_ID, "FNPC"),
+            (PasdData.FNCC_DEVICE_ID, "FNCC"),
+        ]
+        + [(smartbox_id, "FNSC") for smartbox_id in smartbox_ids]
+        for key in PasdData.CONTROLLERS_CONFIG[controller_type]["registers"]
+    ]
+    tango_names = [
+        attribute_index.get_tango_attribute_name(device_id, key)
+        for device_id, key in station_reads
+    ]
+    for (device_id, key), tango_name in zip(station_reads, tango_names):
+        assert _linear_tango_attribute_name(device_id, key) == tango_name
+        assert _linear_pasd_attribute(tango_name) == (device_id, key)
+
+    results = {
+        "PaSD -> Tango": (
+            timeit.timeit(
+                lambda: [
+                    _linear_tango_attribute_name(device_id, key)
+                    for device_id, key in station_reads
+                ],
+                number=args.repeats,
+            ),
+            timeit.timeit(
+                lambda: [
+                    attribute_index.get_tango_attribute_name(device_id, key)
+                    for device_id, key in station_reads
+                ],
+                number=args.repeats,
+            ),
+        ),
+        "Tango -> PaSD": (
+            timeit.timeit(
+                lambda: [_linear_pasd_attribute(name) for name in tango_names],
+                number=args.repeats,
+            ),
+            timeit.timeit(
+                lambda: [
+                    attribute_index.get_pasd_attribute(name) for name in tango_names
+                ],
+                number=args.repeats,
+            ),
+        ),
+    }
+
+    print(f"{len(station_reads)} attributes on a full station")
+    print(
+        f"{'lookup':>14} {'linear (us/attr)':>18} {'index (us/attr)':>18} "
+        f"{'station/s before':>18} {'station/s after':>18}"
+    )
+    for name, (linear, indexed) in results.items():
+        per_station_linear = linear / args.repeats
+        per_station_indexed = indexed / args.repeats
+        print(
+            f"{name:>14} "
+            f"{1e6 * per_station_linear / len(station_reads):>18.3f} "
+            f"{1e6 * per_station_indexed / len(station_reads):>18.3f} "
+            f"{1 / per_station_linear:>18.1f} "
+            f"{1 / per_station_indexed:>18.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+Benchmark of loading the PaSD controllers' configuration.
+
+Importing ``ska_low_mccs_pasd`` gets the PaSD controllers' configuration
+five times: twice for ``PasdData``, and once each for the FNCC, FNDH and
+smartbox devices. This measures the time taken to do so when every get
+parses and validates the YAML file, as it used to; when it is parsed and
+validated once per process; and when the validated configuration is read
+from the on-disk cache.
+
+Usage::
+
+    python scripts/benchmark_controllers_config.py [--repeats N]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import timeit
+
+from ska_low_mccs_pasd.pasd_controllers_configuration import (
+    CACHE_DIR_ENV_VAR,
+    PasdControllersConfig,
+)
+
+
+def _get_all_configs() -> None:
+    """Get the configurations that are got on importing ska_low_mccs_pasd."""
+    PasdControllersConfig.get_all()
+    PasdControllersConfig.get_smartbox()
+    PasdControllersConfig.get_fncc()
+    PasdControllersConfig.get_fndh()
+    PasdControllersConfig.get_smartbox()
+
+
+def _uncached() -> None:
+    """Get the configurations, parsing and validating the file every time."""
+    for _ in range(5):
+        PasdControllersConfig.clear_cache()
+        PasdControllersConfig.get_all()
+
+
+def _memoised() -> None:
+    """Get the configurations in a new process, without an on-disk cache."""
+    PasdControllersConfig.clear_cache()
+    _get_all_configs()
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    os.environ.pop(CACHE_DIR_ENV_VAR, None)
+    results = {
+        "parse every get": timeit.timeit(_uncached, number=args.repeats),
+        "parse once": timeit.timeit(_memoised, number=args.repeats),
+    }
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ[CACHE_DIR_ENV_VAR] = cache_dir
+        _memoised()  # Populate the cache
+        results["on-disk cache"] = timeit.timeit(_memoised, number=args.repeats)
+        del os.environ[CACHE_DIR_ENV_VAR]
+
+    print(f"{'configuration':>16} {'ms per import':>14}")
+    for name, total in results.items():
+        print(f"{name:>16} {1e3 * total / args.repeats:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+Micro-benchmark of the PaSD bus request provider's delayed request queue.
+
+Measures the per-tick cost of ``PasdBusRequestProvider.get_request`` for a
+range of delayed request queue depths, and compares it against the linear
+scan that the queue used to be serviced with.
+
+Usage::
+
+    python scripts/benchmark_delayed_requests.py [--ticks N] [--depths 1 8 64 ...]
+"""
+from __future__ import annotations
+
+import argparse
+import heapq
+import logging
+import time
+import timeit
+
+from ska_low_mccs_pasd import PasdData
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_poll_management import (
+    DelayedRequest,
+    PasdBusRequestProvider,
+)
+
+
+def _make_provider(depth: int) -> PasdBusRequestProvider:
+    """
+    Create a request provider with a queue of delayed requests.
+
+    All but one of the queued requests are not yet due, so that each tick
+    has to inspect the queue without emptying it.
+
+    :param depth: the number of delayed requests to queue.
+
+    :return: a request provider.
+    """
+    provider = PasdBusRequestProvider(
+        1,
+        logging.getLogger(__name__),
+        attribute_read_delay=1.0,
+        port_status_read_delay=4.0,
+        port_power_delay=5.0,
+        smartbox_ids=list(range(1, PasdData.MAX_NUMBER_OF_SMARTBOXES_PER_STATION + 1)),
+    )
+    now = time.time()
+    for index in range(depth):
+        heapq.heappush(
+            provider._delayed_requests,
+            DelayedRequest(
+                PasdData.FNDH_DEVICE_ID, ("PORTS", None), now + 3600 + index
+            ),
+        )
+    return provider
+
+
+def _linear_scan(delayed_requests: list[DelayedRequest]) -> DelayedRequest | None:
+    """
+    Service the delayed requests the way they used to be, for comparison.
+
+    :param delayed_requests: the list of delayed requests.
+
+    :return: the first due request, if any.
+    """
+    for delayed_request in delayed_requests:
+        if delayed_request.not_before < time.time():
+            delayed_requests.remove(delayed_request)
+            return delayed_request
+    return None
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument(
+        "--depths", type=int, nargs="+", default=[0, 1, 8, 56, 256, 1024, 4096]
+    )
+    args = parser.parse_args()
+
+    print(f"{'depth':>8} {'get_request (us)':>18} {'linear scan (us)':>18}")
+    for depth in args.depths:
+        provider = _make_provider(depth)
+        per_tick = timeit.timeit(lambda: provider.get_request(1), number=args.ticks)
+
+        reference = list(provider._delayed_requests)
+        per_scan = timeit.timeit(lambda: _linear_scan(reference), number=args.ticks)
+        print(
+            f"{depth:>8} {1e6 * per_tick / args.ticks:>18.2f} "
+            f"{1e6 * per_scan / args.ticks:>18.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
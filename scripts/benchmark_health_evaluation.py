@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+Micro-benchmark of evaluating the health of a FNDH and of a smartbox.
+
+Every change to a monitoring point of a FNDH or a smartbox passes all of
+its monitoring points to its health model, which evaluates its health.
+This measures the cost per change of that evaluation, when one monitoring
+point changes at a time, with the health of every monitoring point
+computed for every change, as the health models used to, and with only
+the health of the changed monitoring point computed, as they do now.
+
+Usage::
+
+    python scripts/benchmark_health_evaluation.py [--repeats N]
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import timeit
+from typing import Any
+
+from ska_control_model import PowerState
+from ska_low_pasd_driver.pasd_bus_conversions import FndhStatusMap, SmartboxStatusMap
+
+from ska_low_mccs_pasd.fndh.fndh_health_model import FndhHealthModel
+from ska_low_mccs_pasd.pasd_data import PasdData
+from ska_low_mccs_pasd.smart_box.smartbox_health_model import SmartBoxHealthModel
+
+THRESHOLDS = [100.0, 80.0, 2.0, 0.0]
+
+
+def _health_changed(*args: Any, **kwargs: Any) -> None:
+    """
+    Handle a change in health, by doing nothing.
+
+    :param args: positional args.
+    :param kwargs: keyword args.
+    """
+
+
+def _fndh_health_model() -> tuple[FndhHealthModel, dict[str, Any]]:
+    """
+    Return a healthy FNDH health model, and its monitoring points.
+
+    :return: the health model, and the dictionary of its monitoring points.
+    """
+    health_model = FndhHealthModel(_health_changed, logging.getLogger(__name__))
+    health_model.health_params = {
+        name: THRESHOLDS for name in FndhHealthModel.SUPPORTED_MONITORING_POINTS
+    }
+    monitoring_points: dict[str, Any] = {
+        name: 40.0 for name in FndhHealthModel.SUPPORTED_MONITORING_POINTS
+    }
+    monitoring_points["portspowercontrol"] = [True] * PasdData.NUMBER_OF_FNDH_PORTS
+    monitoring_points["portspowersensed"] = [True] * PasdData.NUMBER_OF_FNDH_PORTS
+    health_model.update_state(
+        communicating=True,
+        power=PowerState.ON,
+        status=FndhStatusMap.OK.name,
+        ports_with_smartbox=list(
+            range(1, PasdData.MAX_NUMBER_OF_SMARTBOXES_PER_STATION + 1)
+        ),
+        monitoring_points=monitoring_points,
+    )
+    return health_model, monitoring_points
+
+
+def _smartbox_health_model() -> tuple[SmartBoxHealthModel, dict[str, Any]]:
+    """
+    Return a healthy smartbox health model, and its monitoring points.
+
+    :return: the health model, and the dictionary of its monitoring points.
+    """
+    names = [
+        "inputvoltage",
+        "powersupplyoutputvoltage",
+        "powersupplytemperature",
+        "pcbtemperature",
+        "femambienttemperature",
+        "femcasetemperature1",
+        "femcasetemperature2",
+        "femheatsinktemperature1",
+        "femheatsinktemperature2",
+    ]
+    health_model = SmartBoxHealthModel(_health_changed, logging.getLogger(__name__))
+    health_model.health_params = {name: THRESHOLDS for name in names}
+    monitoring_points: dict[str, Any] = {name: 40.0 for name in names}
+    health_model.update_state(
+        communicating=True,
+        power=PowerState.ON,
+        status=SmartboxStatusMap.OK.name,
+        port_breakers_tripped=[False] * PasdData.NUMBER_OF_SMARTBOX_PORTS,
+        monitoring_points=monitoring_points,
+    )
+    return health_model, monitoring_points
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'':>24} {'us per change (best)':>21}")
+    for label, build in [
+        ("FNDH", _fndh_health_model),
+        ("smartbox", _smartbox_health_model),
+    ]:
+        for incremental in [False, True]:
+            health_model, monitoring_points = build()
+            health_model.incremental = incremental
+            names = [
+                name for name in health_model.health_params if name in monitoring_points
+            ]
+
+            def _change(
+                health_model: Any = health_model,
+                monitoring_points: dict[str, Any] = monitoring_points,
+                names: list[str] = names,
+            ) -> None:
+                for value in (41.0, 40.0):
+                    for name in names:
+                        monitoring_points[name] = value
+                        health_model.update_state(monitoring_points=monitoring_points)
+
+            total = min(timeit.repeat(_change, number=args.repeats, repeat=5))
+            changes = args.repeats * 2 * len(names)
+            mode = "incremental" if incremental else "full"
+            print(f"{label + ' ' + mode:>24} {1e6 * total / changes:>21.2f}")
+
+
+if __name__ == "__main__":
+    main()
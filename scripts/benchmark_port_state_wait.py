@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+Micro-benchmark of waiting for the ports of a PaSD device to change state.
+
+A command that powers ports waits for their power states to be reported.
+This measures, for a wait that can be aborted, the latency from the
+delivery of the desired port states to the end of the wait, and how often
+the waiting thread wakes while it waits: polling for changes every 0.1 s
+on an event that is cleared after every wait, as the component managers
+used to; and waiting on a ``PortStateCondition``, as they do now.
+
+Usage::
+
+    python scripts/benchmark_port_state_wait.py [--repeats N] [--delay S]
+"""
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from typing import Callable
+
+from ska_control_model import PowerState
+
+from ska_low_mccs_pasd.pasd_data import PasdData
+from ska_low_mccs_pasd.pasd_utils import PortStateCondition
+
+PORTS = PasdData.NUMBER_OF_SMARTBOX_PORTS
+TIMEOUT = 60.0
+
+
+class _PolledPortStates:
+    """Port power states that are polled for, the way they used to be."""
+
+    def __init__(self: _PolledPortStates) -> None:
+        """Initialise a new instance, with the state of every port unknown."""
+        self.port_powers = [PowerState.UNKNOWN] * PORTS
+        self.change = threading.Event()
+        self.wakeups = 0
+
+    def update(self: _PolledPortStates, port_powers: list[PowerState]) -> None:
+        """
+        Update the power states of the ports.
+
+        :param port_powers: the power state of each port.
+        """
+        self.port_powers = list(port_powers)
+        self.change.set()
+
+    def wait_for(
+        self: _PolledPortStates,
+        desired_port_powers: list[bool],
+        timeout: float,
+        abort_event: threading.Event,
+    ) -> bool:
+        """
+        Poll for ports to be in their desired power states.
+
+        :param desired_port_powers: whether each port is desired on.
+        :param timeout: the maximum time to wait, in seconds.
+        :param abort_event: an event that stops the wait when set.
+
+        :return: whether the ports are in their desired states.
+        """
+        desired = [
+            PowerState.ON if power else PowerState.OFF for power in desired_port_powers
+        ]
+        deadline = time.monotonic() + timeout
+        while self.port_powers != desired:
+            if abort_event.is_set():
+                return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self.change.wait(min(remaining, 0.1))
+            self.change.clear()
+            self.wakeups += 1
+        return True
+
+
+def _wait(
+    port_states_factory: Callable[[], _PolledPortStates | PortStateCondition],
+    delay: float,
+) -> tuple[float, int]:
+    """
+    Wait for ports to be reported on, after a delay.
+
+    :param port_states_factory: a function that returns new port states.
+    :param delay: the time until the ports are reported on, in seconds.
+
+    :return: the latency from the report to the end of the wait, in
+        seconds, and the number of times that the waiting thread woke.
+    """
+    port_states = port_states_factory()
+    abort_event = threading.Event()
+    delivered: list[float] = []
+
+    def _deliver() -> None:
+        time.sleep(delay)
+        delivered.append(time.monotonic())
+        port_states.update([PowerState.ON] * PORTS)
+
+    deliverer = threading.Thread(target=_deliver)
+    deliverer.start()
+    assert port_states.wait_for([True] * PORTS, TIMEOUT, abort_event)
+    woken = time.monotonic()
+    deliverer.join()
+    return woken - delivered[0], port_states.wakeups
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=1.0)
+    args = parser.parse_args()
+
+    print(f"ports reported on after {args.delay} s, {args.repeats} waits")
+    print(f"{'':>10} {'mean latency (ms)':>18} {'max latency (ms)':>17} {'wakeups':>8}")
+    for label, factory in [
+        ("polled", _PolledPortStates),
+        ("condition", PortStateCondition),
+    ]:
+        results = [_wait(factory, args.delay) for _ in range(args.repeats)]
+        latencies = [latency for latency, _ in results]
+        print(
+            f"{label:>10} {1e3 * sum(latencies) / len(latencies):>18.3f} "
+            f"{1e3 * max(latencies):>17.3f} "
+            f"{sum(wakeups for _, wakeups in results) / len(results):>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+Benchmark of powering on the FNDH ports of a station under a simulated load.
+
+Runs a ``PasdBusComponentManager`` against a local
+``PasdBusSimulatorModbusServer``, whose FNDH PSU current is simulated from
+the ports that are powered on: each port draws a steady current, plus an
+inrush current for a short time after it is powered on. All of the FNDH
+ports are then powered on, first one at a time ``PortPowerDelay`` apart,
+and then in batches planned from the PSU readings by a
+``PowerSequencingPlanner``. For each, the time taken to power on every
+port is reported, along with the peak PSU current and the number of times
+that it exceeded the breaker limit.
+
+Usage::
+
+    python scripts/benchmark_power_sequencing.py [--port-current A] [--limit A]
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import threading
+import time
+import unittest.mock
+from typing import Any
+
+from ska_low_pasd_driver import PasdBusSimulator, PasdBusSimulatorModbusServer
+from ska_ser_devices.client_server import TcpServer
+
+from ska_low_mccs_pasd import PasdData
+from ska_low_mccs_pasd.pasd_bus import PasdBusComponentManager
+
+PASD_CONFIG_PATH = "tests/data/pasd_configuration.yaml"
+STATION_LABEL = "ci-1"
+PSU_VOLTAGE = 48.0
+
+
+class _LoadedFndh:
+    """
+    An FNDH simulator whose PSU current follows the ports that are on.
+
+    All other attributes are those of the wrapped simulator.
+    """
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def __init__(
+        self: _LoadedFndh,
+        fndh: Any,
+        port_current: float,
+        inrush_factor: float,
+        inrush_time: float,
+        breaker_limit: float,
+    ) -> None:
+        """
+        Initialise a new instance.
+
+        :param fndh: the FNDH simulator to wrap.
+        :param port_current: the steady current, in amps, drawn by each port.
+        :param inrush_factor: the multiple of the steady current drawn by a
+            port just after it is powered on.
+        :param inrush_time: the time in seconds for which a port draws its
+            inrush current.
+        :param breaker_limit: the PSU current, in amps, at which a real
+            breaker would trip.
+        """
+        object.__setattr__(self, "_fndh", fndh)
+        object.__setattr__(self, "_port_current", port_current)
+        object.__setattr__(self, "_inrush_factor", inrush_factor)
+        object.__setattr__(self, "_inrush_time", inrush_time)
+        object.__setattr__(self, "_breaker_limit", breaker_limit)
+        object.__setattr__(self, "_power_on_times", {})
+        object.__setattr__(self, "peak_current", 0.0)
+        object.__setattr__(self, "trips", 0)
+
+    def __getattr__(self: _LoadedFndh, name: str) -> Any:
+        return getattr(self._fndh, name)
+
+    def __setattr__(self: _LoadedFndh, name: str, value: Any) -> None:
+        setattr(self._fndh, name, value)
+
+    def _load(self: _LoadedFndh) -> float:
+        now = time.monotonic()
+        power_on_times = self._power_on_times
+        current = 0.0
+        for port, sensed in enumerate(self._fndh.ports_power_sensed):
+            if not sensed:
+                power_on_times.pop(port, None)
+                continue
+            power_on_time = power_on_times.setdefault(port, now)
+            inrush = now - power_on_time < self._inrush_time
+            current += self._port_current * (self._inrush_factor if inrush else 1.0)
+        if current > self.peak_current:
+            object.__setattr__(self, "peak_current", current)
+        if current > self._breaker_limit:
+            object.__setattr__(self, "trips", self.trips + 1)
+        return current
+
+    @property
+    def psu48v_current(self: _LoadedFndh) -> float:
+        """
+        Return the simulated PSU current.
+
+        :return: the PSU current, in amps.
+        """
+        return self._load()
+
+    @property
+    def psu48v_voltage_1(self: _LoadedFndh) -> float:
+        """
+        Return the simulated PSU voltage, which sags as the load rises.
+
+        :return: the PSU voltage, in volts.
+        """
+        return PSU_VOLTAGE - 0.05 * self._load()
+
+
+# pylint: disable=too-many-locals
+def _power_on_station(
+    args: argparse.Namespace, current_limit: float
+) -> tuple[float, float, int]:
+    """
+    Power on all of the FNDH ports of a simulated station.
+
+    :param args: the parsed command line arguments.
+    :param current_limit: the PSU current limit to plan batches against,
+        or zero to power on the ports one at a time.
+
+    :return: the time taken to power on all of the ports, the peak PSU
+        current, and the number of PSU readings over the breaker limit.
+
+    :raises TimeoutError: if the ports are not all powered on within the
+        timeout.
+    """
+    logger = logging.getLogger("benchmark")
+    pasd_bus_simulator = PasdBusSimulator(
+        PASD_CONFIG_PATH,
+        STATION_LABEL,
+        logger,
+        smartboxes_depend_on_attached_ports=True,
+    )
+    fndh_simulator = pasd_bus_simulator.get_fndh()
+    fndh_simulator.initialize()
+    fndh = _LoadedFndh(
+        fndh_simulator,
+        args.port_current,
+        args.inrush_factor,
+        args.inrush_time,
+        args.breaker_limit,
+    )
+    simulators = pasd_bus_simulator.get_all_devices()
+    simulators[PasdData.FNDH_DEVICE_ID] = fndh
+
+    server = TcpServer("localhost", 0, PasdBusSimulatorModbusServer(simulators))
+    with server:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address
+        component_manager = PasdBusComponentManager(
+            host,
+            port,
+            args.polling_rate,
+            args.polling_rate,
+            1.0,  # poll delay after failure
+            1.0,  # attribute read delay
+            args.settle_time,  # port status read delay
+            args.port_power_delay,
+            0.0,  # smartbox startup delay
+            3.0,  # timeout
+            10.0,  # failed poll window
+            1.0,  # failed poll prune interval
+            logger,
+            unittest.mock.Mock(),
+            unittest.mock.Mock(),
+            unittest.mock.Mock(),
+            unittest.mock.Mock(),
+            [0] * PasdData.NUMBER_OF_FNDH_PORTS,
+            False,
+            None,
+            port_power_current_limit=current_limit,
+            port_power_current=args.port_current,
+        )
+        component_manager.start_communicating()
+        try:
+            # Let the startup reads finish before powering on the ports.
+            time.sleep(5 * args.polling_rate)
+            start = time.monotonic()
+            component_manager.set_fndh_port_powers(
+                [True] * PasdData.NUMBER_OF_FNDH_PORTS, False
+            )
+            while not all(fndh_simulator.ports_power_sensed):
+                if time.monotonic() - start > args.timeout:
+                    raise TimeoutError("Timed out powering on the FNDH ports")
+                time.sleep(0.01)
+            elapsed = time.monotonic() - start
+        finally:
+            component_manager.stop_communicating()
+            server.shutdown()
+    return elapsed, fndh.peak_current, fndh.trips
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port-current", type=float, default=0.5)
+    parser.add_argument("--inrush-factor", type=float, default=3.0)
+    parser.add_argument("--inrush-time", type=float, default=0.2)
+    parser.add_argument("--limit", type=float, default=12.0)
+    parser.add_argument("--breaker-limit", type=float, default=16.0)
+    parser.add_argument("--polling-rate", type=float, default=0.02)
+    parser.add_argument("--settle-time", type=float, default=0.3)
+    parser.add_argument("--port-power-delay", type=float, default=0.5)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    print(f"{'sequencing':<12}{'time (s)':>10}{'peak (A)':>10}{'trips':>8}")
+    for name, current_limit in [("fixed", 0.0), ("adaptive", args.limit)]:
+        elapsed, peak_current, trips = _power_on_station(args, current_limit)
+        print(f"{name:<12}{elapsed:>10.2f}{peak_current:>10.2f}{trips:>8d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+Micro-benchmark of the PaSD bus device's attribute state store.
+
+``MccsPasdBus`` keeps the value, quality and timestamp of every PaSD
+attribute of a full 24-smartbox station, and updates them for every value
+in every poll response. This measures the memory used to hold that state,
+and the time taken to update and invalidate every attribute once, a poll
+response at a time, using ``PasdStateStore``, and compares them against the
+dataclass per attribute that the device used to keep.
+
+Usage::
+
+    python scripts/benchmark_state_store.py [--repeats N]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from tango import AttrQuality
+
+from ska_low_mccs_pasd import PasdData
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_state_store import PasdStateStore
+
+
+@dataclass
+class _PasdAttribute:
+    """The state of a PaSD attribute, as the device used to keep it."""
+
+    tango_attribute_name: str
+    value: Any
+    quality: AttrQuality
+    timestamp: float
+    read_once: bool
+    abs_deadband: Optional[float] = None
+    rel_deadband: Optional[float] = None
+
+
+def _station_attribute_names() -> list[str]:
+    """
+    Return the names of all of the PaSD attributes of a full station.
+
+    :return: the names of the attributes.
+    """
+    smartbox_ids = range(1, PasdData.MAX_NUMBER_OF_SMARTBOXES_PER_STATION + 1)
+    return [
+        prefix + register["tango_attr_name"]
+        for key, controller in PasdData.CONTROLLERS_CONFIG.items()
+        for prefix in (
+            [controller["prefix"] + str(smartbox_id) for smartbox_id in smartbox_ids]
+            if key == "FNSC"
+            else [controller["prefix"]]
+        )
+        for register in controller["registers"].values()
+    ]
+
+
+def _measure_memory(build: Callable[[], Any]) -> tuple[Any, int]:
+    """
+    Measure the memory allocated to build a state store.
+
+    :param build: a function that builds the store.
+
+    :return: the store, and the number of bytes allocated for it.
+    """
+    gc.collect()
+    tracemalloc.start()
+    store = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return store, size
+
+
+def _build_dataclasses(names: list[str]) -> dict[str, _PasdAttribute]:
+    """
+    Build the state of the attributes the way the device used to.
+
+    :param names: the names of the attributes.
+
+    :return: a dataclass for each attribute, keyed by name.
+    """
+    return {
+        name: _PasdAttribute(name, None, AttrQuality.ATTR_INVALID, 0, False)
+        for name in names
+    }
+
+
+def _build_store(names: list[str]) -> PasdStateStore:
+    """
+    Build the state of the attributes in a store.
+
+    :param names: the names of the attributes.
+
+    :return: the store.
+    """
+    store = PasdStateStore(len(names))
+    for name in names:
+        store.add(name)
+    return store
+
+
+def _cycle_dataclasses(
+    state: dict[str, _PasdAttribute], signals: dict[str, Any], names: list[str]
+) -> None:
+    """
+    Update and then invalidate every attribute, the way the device used to.
+
+    :param state: the dataclass for each attribute.
+    :param signals: the device's signals, which it used to overwrite with
+        every new value.
+    :param names: the names of the attributes.
+    """
+    for name in names:
+        pasd_state = state[name]
+        pasd_state.timestamp = 1000.0
+        pasd_state.value = 48.0
+        pasd_state.quality = AttrQuality.ATTR_VALID
+        signals[name] = 48.0
+    for name in names:
+        if state[name].quality != AttrQuality.ATTR_INVALID:
+            state[name].timestamp = 1001.0
+            state[name].quality = AttrQuality.ATTR_INVALID
+            signals[name] = state[name].value
+
+
+def _cycle_store(store: PasdStateStore, responses: list[list[str]]) -> None:
+    """
+    Update and then invalidate every attribute in a store, a response at a time.
+
+    :param store: the store.
+    :param responses: the names of the attributes in each poll response.
+    """
+    for response in responses:
+        store.update(
+            [store.handle(name) for name in response],
+            [48.0] * len(response),
+            1000.0,
+        )
+    for response in responses:
+        store.mark_invalid([store.handle(name) for name in response], 1001.0)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=100)
+    args = parser.parse_args()
+
+    names = _station_attribute_names()
+    # Poll responses of about as many values as an attribute group.
+    responses = [names[start : start + 20] for start in range(0, len(names), 20)]
+
+    state, dataclass_size = _measure_memory(lambda: _build_dataclasses(names))
+    store, store_size = _measure_memory(lambda: _build_store(names))
+    signals: dict[str, Any] = dict.fromkeys(names)
+
+    dataclass_time = timeit.timeit(
+        lambda: _cycle_dataclasses(state, signals, names), number=args.repeats
+    )
+    store_time = timeit.timeit(
+        lambda: _cycle_store(store, responses), number=args.repeats
+    )
+
+    print(f"{len(names)} attributes on a full station")
+    print(f"{'':>10} {'memory (KiB)':>14} {'update+invalidate (us/attr)':>28}")
+    for label, size, time in [
+        ("dataclass", dataclass_size, dataclass_time),
+        ("store", store_size, store_time),
+    ]:
+        print(
+            f"{label:>10} {size / 1024:>14.1f} "
+            f"{1e6 * time / args.repeats / len(names):>28.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -36,14 +36,62 @@ __all__ = [
 ]
 
 
-import tango.server
+import importlib
+from typing import TYPE_CHECKING, Any, Final
 
-from .field_station import MccsFieldStation
-from .fncc import MccsFNCC
-from .fndh import MccsFNDH
-from .pasd_bus import MccsPasdBus
-from .pasd_data import PasdData
-from .smart_box import MccsSmartBox
+if TYPE_CHECKING:
+    from .field_station import MccsFieldStation
+    from .fncc import MccsFNCC
+    from .fndh import MccsFNDH
+    from .pasd_bus import MccsPasdBus
+    from .pasd_data import PasdData
+    from .smart_box import MccsSmartBox
+
+# The device classes, and their subpackages, are only imported when they are
+# first used, so that a device server only imports the classes it hosts.
+_LAZY_ATTRIBUTES: Final = {
+    "MccsFieldStation": ".field_station",
+    "MccsFNCC": ".fncc",
+    "MccsFNDH": ".fndh",
+    "MccsPasdBus": ".pasd_bus",
+    "MccsSmartBox": ".smart_box",
+    "PasdData": ".pasd_data",
+    "field_station": "",
+    "fncc": "",
+    "fndh": "",
+    "pasd_bus": "",
+    "smart_box": "",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a device class or subpackage on first use.
+
+    :param name: the name of the attribute.
+
+    :raises AttributeError: if the package has no such attribute.
+
+    :return: the device class or subpackage.
+    """
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name = _LAZY_ATTRIBUTES[name]
+    if module_name:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    else:
+        value = importlib.import_module(f".{name}", __name__)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    Return the names of the attributes of the package.
+
+    :return: the names of the attributes, including those not yet imported.
+    """
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 
 def main(*args: str, **kwargs: str) -> int:  # pragma: no cover
@@ -55,8 +103,7 @@ def main(*args: str, **kwargs: str) -> int:  # pragma: no cover
 
     :return: exit code
     """
-    return tango.server.run(
-        classes=(MccsFieldStation, MccsFNCC, MccsFNDH, MccsPasdBus, MccsSmartBox),
-        args=args or None,
-        **kwargs,
-    )
+    # Imported here as it imports tango, which importing the package need not.
+    from .device_server import run  # pylint: disable=import-outside-toplevel
+
+    return run(list(args) or None, **kwargs)
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+This module implements timing reports of the phases of long running commands.
+
+Powering on a station passes through several devices: MccsFieldStation
+turns on the FNDH and then the smartboxes, each MccsSmartBox has its FNDH
+port and then its own ports powered, and MccsPasdBus sequences the Modbus
+writes and reads that do so. A ``CommandTimer`` records when each phase of
+a command starts and how long it takes, along with any instantaneous
+events, and the reports of the commands that it was made up of. Each
+device keeps its most recent reports in a ``CommandTimingLog``.
+
+Commands are correlated by command ID. MccsSmartBox passes the ID of its
+command to the MccsPasdBus commands that it calls, so that their reports
+can be joined, and nests their reports in its own.
+"""
+from __future__ import annotations
+
+import collections
+import contextlib
+import threading
+import time
+import uuid
+from typing import Any, Iterator, Optional
+
+__all__ = ["CommandTimer", "CommandTimingLog"]
+
+
+class CommandTimer:
+    """Records the phases of a single command."""
+
+    def __init__(
+        self: CommandTimer,
+        command_name: str,
+        command_id: Optional[str] = None,
+        start_time: Optional[float] = None,
+    ) -> None:
+        """
+        Initialise a new instance.
+
+        :param command_name: the name of the command being timed.
+        :param command_id: the ID of the command. If not provided, a new
+            one is generated.
+        :param start_time: the time.time() at which the command started.
+            Defaults to now.
+        """
+        self.command_name = command_name
+        self.command_id = command_id or uuid.uuid4().hex
+        self.start_time = time.time() if start_time is None else start_time
+        self.end_time: Optional[float] = None
+        self.result: Optional[str] = None
+        self._phases: list[dict[str, Any]] = []
+        self._events: list[dict[str, Any]] = []
+        self._children: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def finished(self: CommandTimer) -> bool:
+        """
+        Return whether the command has finished.
+
+        :return: whether the command has finished.
+        """
+        return self.end_time is not None
+
+    def add_phase(
+        self: CommandTimer,
+        name: str,
+        start_time: float,
+        end_time: float,
+        **details: Any,
+    ) -> None:
+        """
+        Record a phase of the command.
+
+        :param name: the name of the phase.
+        :param start_time: the time.time() at which the phase started.
+        :param end_time: the time.time() at which the phase ended.
+        :param details: any further details of the phase to report.
+        """
+        with self._lock:
+            self._phases.append(
+                {
+                    "name": name,
+                    "start": start_time - self.start_time,
+                    "duration": end_time - start_time,
+                    **details,
+                }
+            )
+
+    @contextlib.contextmanager
+    def phase(self: CommandTimer, name: str, **details: Any) -> Iterator[None]:
+        """
+        Time a phase of the command, as the body of a with statement.
+
+        The phase is recorded even if the body raises an exception.
+
+        :param name: the name of the phase.
+        :param details: any further details of the phase to report.
+
+        :yields: to the body of the with statement.
+        """
+        start_time = time.time()
+        try:
+            yield
+        finally:
+            self.add_phase(name, start_time, time.time(), **details)
+
+    def mark(
+        self: CommandTimer, name: str, timestamp: Optional[float] = None, **details: Any
+    ) -> None:
+        """
+        Record an instantaneous event during the command.
+
+        :param name: the name of the event.
+        :param timestamp: the time.time() of the event. Defaults to now.
+        :param details: any further details of the event to report.
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            self._events.append(
+                {"name": name, "at": timestamp - self.start_time, **details}
+            )
+
+    def add_child(self: CommandTimer, report: dict[str, Any]) -> None:
+        """
+        Nest the report of a command that this command was made up of.
+
+        :param report: the timing report of the other command.
+        """
+        with self._lock:
+            self._children.append(report)
+
+    def finish(
+        self: CommandTimer, result: str, end_time: Optional[float] = None
+    ) -> None:
+        """
+        Record that the command has finished.
+
+        :param result: the result of the command, e.g. "OK".
+        :param end_time: the time.time() at which the command finished.
+            Defaults to now.
+        """
+        self.end_time = time.time() if end_time is None else end_time
+        self.result = result
+
+    def report(self: CommandTimer) -> dict[str, Any]:
+        """
+        Return the timing report of the command.
+
+        Times within the report are offsets in seconds from the start of
+        the command, which is itself a POSIX timestamp.
+
+        :return: a JSON-serialisable report of the command's phases.
+        """
+        end_time = time.time() if self.end_time is None else self.end_time
+        with self._lock:
+            report: dict[str, Any] = {
+                "command": self.command_name,
+                "command_id": self.command_id,
+                "start": self.start_time,
+                "duration": end_time - self.start_time,
+                "result": self.result,
+                "phases": list(self._phases),
+            }
+            if self._events:
+                report["events"] = list(self._events)
+            if self._children:
+                report["children"] = list(self._children)
+        return report
+
+
+class CommandTimingLog:
+    """Keeps the timers of the most recent commands of a device."""
+
+    def __init__(self: CommandTimingLog, capacity: int = 20) -> None:
+        """
+        Initialise a new instance.
+
+        :param capacity: the number of commands whose reports are kept.
+        """
+        self._timers: collections.deque[CommandTimer] = collections.deque(
+            maxlen=max(capacity, 1)
+        )
+        self._lock = threading.Lock()
+
+    def start(
+        self: CommandTimingLog, command_name: str, command_id: Optional[str] = None
+    ) -> CommandTimer:
+        """
+        Start timing a command.
+
+        :param command_name: the name of the command.
+        :param command_id: the ID of the command. If not provided, a new
+            one is generated.
+
+        :return: the timer of the command.
+        """
+        timer = CommandTimer(command_name, command_id)
+        with self._lock:
+            self._timers.append(timer)
+        return timer
+
+    def reports(
+        self: CommandTimingLog, command_id: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Return the reports of the most recent commands, oldest first.
+
+        Commands that are still running are reported up to now, with no
+        result.
+
+        :param command_id: only return the reports of commands with this ID.
+
+        :return: a list of timing reports.
+        """
+        with self._lock:
+            timers = list(self._timers)
+        return [
+            timer.report()
+            for timer in timers
+            if command_id is None or timer.command_id == command_id
+        ]
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+This module implements the ``pasd`` device server entry point.
+
+A ``pasd`` device server instance usually hosts only some of the device
+classes in this package, so only those classes are imported, along with
+their dependencies. The classes to host are given by the ``--classes``
+option, e.g. ``pasd ci-1 --classes=MccsPasdBus``; otherwise they are the
+classes that the Tango database has registered for the server instance;
+failing that, all of the device classes are hosted.
+
+With the ``--profile-startup`` option, the server reports how long it
+spent importing each device class, in ``init_device`` of each device, in
+creating the dynamic attributes of each PaSD bus device, and until the
+first successful poll of each PaSD bus device, measured from the start of
+the server.
+"""
+from __future__ import annotations
+
+import functools
+import importlib
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Final, Iterator, Optional, TextIO
+
+import tango
+import tango.server
+
+__all__ = [
+    "DEVICE_CLASSES",
+    "STARTUP_PROFILER",
+    "StartupProfiler",
+    "get_device_class_names",
+    "run",
+]
+
+DEVICE_CLASSES: Final = (
+    "MccsFieldStation",
+    "MccsFNCC",
+    "MccsFNDH",
+    "MccsPasdBus",
+    "MccsSmartBox",
+)
+"""The names of the device classes that the server can host."""
+
+CLASSES_OPTION: Final = "--classes"
+PROFILE_STARTUP_OPTION: Final = "--profile-startup"
+
+
+class StartupProfiler:
+    """
+    A recorder of the time spent in each phase of device server startup.
+
+    It records nothing until it is enabled, so that the devices can report
+    their startup phases to it unconditionally. Each timing is reported as
+    it is recorded.
+    """
+
+    def __init__(
+        self: StartupProfiler,
+        stream: Optional[TextIO] = None,
+    ) -> None:
+        """
+        Initialise a new instance.
+
+        :param stream: the stream to report to. Defaults to standard error.
+        """
+        self.enabled = False
+        self._stream = stream
+        self._start = time.perf_counter()
+        self._timings: dict[tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def timings(self: StartupProfiler) -> dict[tuple[str, str], float]:
+        """
+        Return the timings recorded so far.
+
+        :return: the time recorded for each phase, in seconds, keyed by
+            phase and by what it applies to, e.g. a class or device name.
+        """
+        with self._lock:
+            return dict(self._timings)
+
+    def enable(self: StartupProfiler) -> None:
+        """Start recording, timing milestones from now."""
+        self._start = time.perf_counter()
+        self.enabled = True
+
+    @contextmanager
+    def measure(self: StartupProfiler, phase: str, name: str = "") -> Iterator[None]:
+        """
+        Time a startup phase.
+
+        :param phase: the phase, e.g. "init_device".
+        :param name: what the phase applies to, e.g. a device name.
+
+        :yields: control to the phase being timed.
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(phase, name, time.perf_counter() - start)
+
+    def mark(self: StartupProfiler, phase: str, name: str = "") -> None:
+        """
+        Record the time from the start of the server to a startup milestone.
+
+        Only the first time that the milestone is reached is recorded.
+
+        :param phase: the milestone, e.g. "first successful poll".
+        :param name: what the milestone applies to, e.g. a device name.
+        """
+        if not self.enabled or (phase, name) in self._timings:
+            return
+        self._record(phase, name, time.perf_counter() - self._start, once=True)
+
+    def _record(
+        self: StartupProfiler,
+        phase: str,
+        name: str,
+        seconds: float,
+        once: bool = False,
+    ) -> None:
+        with self._lock:
+            if once and (phase, name) in self._timings:
+                return
+            self._timings[(phase, name)] = seconds
+        print(
+            f"Startup profile: {' '.join(filter(None, (phase, name)))}: "
+            f"{seconds:.3f} s",
+            file=self._stream or sys.stderr,
+            flush=True,
+        )
+
+
+STARTUP_PROFILER: Final = StartupProfiler()
+"""The profiler of this process's device server startup."""
+
+
+def _pop_option(args: list[str], option: str) -> Optional[str]:
+    """
+    Remove an option from the command line arguments.
+
+    :param args: the command line arguments, which are modified in place.
+    :param option: the option, e.g. "--classes".
+
+    :return: the value of the option, an empty string if it has no value,
+        or None if it is not given.
+    """
+    for index, arg in enumerate(args):
+        if arg == option:
+            del args[index]
+            if option == CLASSES_OPTION and index < len(args):
+                return args.pop(index)
+            return ""
+        if arg.startswith(f"{option}="):
+            del args[index]
+            return arg.split("=", 1)[1]
+    return None
+
+
+def get_device_class_names(
+    args: list[str],
+    get_server_class_list: Optional[Callable[[str], list[str]]] = None,
+) -> list[str]:
+    """
+    Return the names of the device classes to host in this server.
+
+    :param args: the command line arguments, starting with the server name
+        and instance. The ``--classes`` option is removed from them.
+    :param get_server_class_list: a function that returns the classes that
+        the Tango database has registered for a server instance, given
+        as "<server name>/<instance>". Defaults to querying the database.
+
+    :raises ValueError: if ``--classes`` names a class that is not in this
+        package.
+
+    :return: the names of the device classes, in the order of
+        ``DEVICE_CLASSES``.
+    """
+    option = _pop_option(args, CLASSES_OPTION)
+    if option:
+        names = {name.strip() for name in option.split(",") if name.strip()}
+        unknown = names - set(DEVICE_CLASSES)
+        if unknown:
+            raise ValueError(
+                f"Unknown device classes {sorted(unknown)}; "
+                f"choose from {list(DEVICE_CLASSES)}"
+            )
+        return [name for name in DEVICE_CLASSES if name in names]
+
+    if len(args) >= 2 and not args[1].startswith("-") and "-nodb" not in args:
+        server = f"{os.path.basename(args[0])}/{args[1]}"
+        try:
+            registered = set((get_server_class_list or _get_server_class_list)(server))
+        except tango.DevFailed:
+            registered = set()
+        hosted = [name for name in DEVICE_CLASSES if name in registered]
+        if hosted:
+            return hosted
+    return list(DEVICE_CLASSES)
+
+
+def _get_server_class_list(server: str) -> list[str]:
+    """
+    Return the classes that the Tango database has registered for a server.
+
+    :param server: the server instance, as "<server name>/<instance>".
+
+    :return: the names of the classes.
+    """
+    return list(tango.Database().get_server_class_list(server))
+
+
+def _profile_init_device(device_class: type, profiler: StartupProfiler) -> None:
+    """
+    Time ``init_device`` of every device of a class.
+
+    :param device_class: the device class.
+    :param profiler: the profiler to record the time with.
+    """
+    init_device = device_class.init_device  # type: ignore[attr-defined]
+
+    @functools.wraps(init_device)
+    def _init_device(device: tango.server.Device) -> None:
+        with profiler.measure("init_device", device.get_name()):
+            init_device(device)
+
+    device_class.init_device = _init_device  # type: ignore[attr-defined]
+
+
+def run(args: Optional[list[str]] = None, **kwargs: Any) -> int:
+    """
+    Run the ``pasd`` device server, hosting only the device classes it needs.
+
+    :param args: the command line arguments, starting with the server name.
+        Defaults to ``sys.argv``.
+    :param kwargs: keyword arguments for ``tango.server.run``.
+
+    :return: exit code
+    """
+    args = list(args or sys.argv)
+    profiling = _pop_option(args, PROFILE_STARTUP_OPTION) is not None
+    if profiling:
+        STARTUP_PROFILER.enable()
+
+    package = importlib.import_module(__package__)
+    classes = []
+    for name in get_device_class_names(args):
+        with STARTUP_PROFILER.measure("import", name):
+            device_class = getattr(package, name)
+        if profiling:
+            _profile_init_device(device_class, STARTUP_PROFILER)
+        classes.append(device_class)
+
+    return tango.server.run(classes=tuple(classes), args=args, **kwargs)
@@ -5,6 +5,7 @@
 #
 # Distributed under the terms of the BSD 3-clause new license.
 # See LICENSE for more info.
+# pylint: disable=too-many-lines
 """This module implements the component management for FieldStation."""
 from __future__ import annotations
 
@@ -12,7 +13,10 @@ import functools
 import json
 import logging
 import threading
-from typing import Any, Callable, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
 
 import tango
 from ska_control_model import CommunicationStatus, PowerState, TaskStatus
@@ -29,9 +33,20 @@ from ska_tango_base.base import check_communicating
 from ska_tango_base.commands import ResultCode
 from ska_tango_base.executor import TaskExecutorComponentManager
 
+from ska_low_mccs_pasd.command_timing import CommandTimer, CommandTimingLog
+from ska_low_mccs_pasd.pasd_data import PasdData
+
 __all__ = ["FieldStationComponentManager"]
 
 
+@dataclass(frozen=True)
+class _AntennaRoute:
+    """The smartbox that an antenna is on, and the port that it is on."""
+
+    smartbox_trl: str
+    port: int
+
+
 # pylint: disable=too-many-arguments, too-many-positional-arguments
 class _SmartboxProxy(DeviceComponentManager):
     """A proxy to a MccsSmartbox device, for a station to use."""
@@ -95,6 +110,7 @@ class FieldStationComponentManager(TaskExecutorComponentManager):
     """A component manager for MccsFieldStation."""
 
     FIELDSTATION_ON_COMMAND_TIMEOUT = 600  # seconds
+    ANTENNA_POWERS_COMMAND_TIMEOUT = 60  # seconds
 
     # pylint: disable=too-many-arguments, too-many-positional-arguments
     def __init__(
@@ -163,6 +179,15 @@ class FieldStationComponentManager(TaskExecutorComponentManager):
         )
         self._smartbox_power_state = {}
         self._smartbox_proxys = {}
+        # The smartbox and port of each antenna, read from each smartbox once
+        # and forgotten when communication with it changes.
+        self._antenna_routes: dict[str, _AntennaRoute] = {}
+        self._routed_smartboxes: set[str] = set()
+        # The number of times the antennas of each smartbox have been forgotten,
+        # so that antennas read before they were forgotten are not used.
+        self._antenna_route_generations: dict[str, int] = {}
+        self._antenna_routes_lock = threading.Lock()
+        self._command_timings = CommandTimingLog()
         if _smartbox_proxys:
             self._smartbox_proxys = _smartbox_proxys
         else:
@@ -246,10 +271,113 @@ class FieldStationComponentManager(TaskExecutorComponentManager):
         fqdn: str,
         communication_state: CommunicationStatus,
     ) -> None:
+        if fqdn in self._smartbox_proxys:
+            self._invalidate_antenna_routes(fqdn)
         self._communication_manager.update_communication_status(
             fqdn, communication_state
         )
 
+    def _invalidate_antenna_routes(
+        self: FieldStationComponentManager, smartbox_trl: str
+    ) -> None:
+        """
+        Forget the antennas of a smartbox, so that they are read again when next used.
+
+        :param smartbox_trl: the TRL of the smartbox.
+        """
+        with self._antenna_routes_lock:
+            self._antenna_route_generations[smartbox_trl] = (
+                self._antenna_route_generations.get(smartbox_trl, 0) + 1
+            )
+            if smartbox_trl not in self._routed_smartboxes:
+                return
+            self._routed_smartboxes.discard(smartbox_trl)
+            self._antenna_routes = {
+                name: route
+                for name, route in self._antenna_routes.items()
+                if route.smartbox_trl != smartbox_trl
+            }
+
+    def _get_antenna_routes(
+        self: FieldStationComponentManager,
+    ) -> dict[str, _AntennaRoute]:
+        """
+        Get the smartbox and port of each antenna on this station.
+
+        The antennas of each smartbox are only read from the smartbox the
+        first time that they are needed after communication with it has
+        changed, rather than for every command. The smartboxes are read
+        without holding the lock, so that a slow smartbox doesn't hold up
+        the communication state callbacks of the others.
+
+        :return: the smartbox and port of each antenna, by antenna name.
+        """
+        with self._antenna_routes_lock:
+            unrouted = {
+                smartbox_trl: self._antenna_route_generations.get(smartbox_trl, 0)
+                for smartbox_trl in self._smartbox_proxys
+                if smartbox_trl not in self._routed_smartboxes
+            }
+        smartbox_antennas: dict[str, list[tuple[str, int]]] = {}
+        for smartbox_trl in unrouted:
+            proxy = self._smartbox_proxys[smartbox_trl]._proxy
+            if proxy is None:
+                continue
+            try:
+                smartbox_antennas[smartbox_trl] = list(
+                    zip(list(proxy.antennaNames), list(proxy.portsWithAntennas))
+                )
+            except tango.DevFailed as e:
+                self.logger.warning(
+                    f"Failed to read the antennas of {smartbox_trl}: {e}"
+                )
+
+        with self._antenna_routes_lock:
+            for smartbox_trl, antennas in smartbox_antennas.items():
+                if (
+                    smartbox_trl in self._routed_smartboxes
+                    or self._antenna_route_generations.get(smartbox_trl, 0)
+                    != unrouted[smartbox_trl]
+                ):
+                    # Already read by another command, or forgotten since.
+                    continue
+                for antenna_name, port in antennas:
+                    route = self._antenna_routes.setdefault(
+                        antenna_name, _AntennaRoute(smartbox_trl, port)
+                    )
+                    if route.smartbox_trl != smartbox_trl:
+                        self.logger.warning(
+                            f"Antenna {antenna_name} is on both "
+                            f"{route.smartbox_trl} and {smartbox_trl}, "
+                            f"using {route.smartbox_trl}."
+                        )
+                self._routed_smartboxes.add(smartbox_trl)
+            return self._antenna_routes
+
+    def _group_antennas_by_smartbox(
+        self: FieldStationComponentManager, antenna_names: Iterable[str]
+    ) -> tuple[dict[str, dict[str, int]], set[str]]:
+        """
+        Group antennas by the smartbox that they are on.
+
+        :param antenna_names: the names of the antennas.
+
+        :return: the port of each antenna on each smartbox, by smartbox TRL,
+            and the names of the antennas that are not on any smartbox.
+        """
+        routes = self._get_antenna_routes()
+        smartbox_antennas: dict[str, dict[str, int]] = {}
+        unrouted: set[str] = set()
+        for antenna_name in antenna_names:
+            route = routes.get(antenna_name)
+            if route is None:
+                unrouted.add(antenna_name)
+            else:
+                smartbox_antennas.setdefault(route.smartbox_trl, {})[
+                    antenna_name
+                ] = route.port
+        return smartbox_antennas, unrouted
+
     def abort(
         self: FieldStationComponentManager,
         task_callback: Optional[Callable] = None,
@@ -275,13 +403,18 @@ class FieldStationComponentManager(TaskExecutorComponentManager):
         smartbox_trls: list,
         timeout: int,
         task_abort_event: Optional[threading.Event],
+        timer: CommandTimer,
     ) -> tuple[ResultCode, str]:
         """
         Turn on smartboxes in blocks, returning on failure or abort.
 
+        Each block is timed as a phase of the command, and the timing
+        report of each smartbox's On command is nested in its report.
+
         :param smartbox_trls: list of smartbox TRLs to turn on.
         :param timeout: timeout in seconds for each block's commands.
         :param task_abort_event: event signalling an abort.
+        :param timer: the timer of the command.
         :return: (OK, "") on success, (ABORTED, "") if aborted, or
             (result, failure_message) if a block fails.
         """
@@ -308,10 +441,21 @@ class FieldStationComponentManager(TaskExecutorComponentManager):
                 self._nof_blocks,
                 smartbox_block,
             )
+            block_start = time.time()
             result, message = smartbox_on_commands(
                 command_evaluator=CompositeCommandResultEvaluator(),
                 timeout=timeout,
             )
+            timer.add_phase(
+                f"smartbox_block_{block_index}",
+                block_start,
+                time.time(),
+                smartboxes=smartbox_block,
+            )
+            for smartbox_trl in smartbox_block:
+                report = self._get_smartbox_on_report(smartbox_trl, block_start)
+                if report is not None:
+                    timer.add_child({"device": smartbox_trl, **report})
             if result != ResultCode.OK:
                 return result, (
                     f"Smartbox block {block_index} failed: "
@@ -319,6 +463,62 @@ class FieldStationComponentManager(TaskExecutorComponentManager):
                 )
         return ResultCode.OK, ""
 
+    def _get_smartbox_on_report(
+        self: FieldStationComponentManager, smartbox_trl: str, since: float
+    ) -> Optional[dict[str, Any]]:
+        """
+        Get the timing report of a smartbox's most recent On command.
+
+        :param smartbox_trl: the TRL of the smartbox.
+        :param since: the time.time() after which the command started.
+
+        :return: the timing report, or None if it can't be read.
+        """
+        smartbox_proxy = self._smartbox_proxys[smartbox_trl]._proxy
+        if smartbox_proxy is None:
+            return None
+        try:
+            reports = json.loads(smartbox_proxy.commandTimingReports)
+        except (tango.DevFailed, TypeError, ValueError) as e:
+            self.logger.debug(f"Failed to read the timings of {smartbox_trl}: {e}")
+            return None
+        for report in reversed(reports):
+            if report["command"] == "On" and report["start"] >= since:
+                return report
+        return None
+
+    def _timed_task_callback(
+        self: FieldStationComponentManager,
+        timer: CommandTimer,
+        task_callback: Callable,
+    ) -> Callable:
+        """
+        Wrap a task callback to finish timing the command when it has a result.
+
+        :param timer: the timer of the command.
+        :param task_callback: the task callback to wrap.
+
+        :return: the wrapped task callback.
+        """
+
+        def _task_callback(**kwargs: Any) -> None:
+            if "result" in kwargs:
+                timer.finish(ResultCode(kwargs["result"][0]).name)
+            task_callback(**kwargs)
+
+        return _task_callback
+
+    @property
+    def command_timing_reports(
+        self: FieldStationComponentManager,
+    ) -> list[dict[str, Any]]:
+        """
+        Return the timing reports of the most recent On commands.
+
+        :return: a list of timing reports, oldest first.
+        """
+        return self._command_timings.reports()
+
     def do_on(
         self: FieldStationComponentManager,
         task_callback: Callable,
@@ -333,6 +533,8 @@ class FieldStationComponentManager(TaskExecutorComponentManager):
         :param task_callback: Update task state, defaults to None
         :param task_abort_event: Event signalling an abort
         """
+        timer = self._command_timings.start("On")
+        task_callback = self._timed_task_callback(timer, task_callback)
         task_callback(status=TaskStatus.IN_PROGRESS)
         timeout = self.FIELDSTATION_ON_COMMAND_TIMEOUT
         if task_abort_event is not None and task_abort_event.is_set():
@@ -347,12 +549,13 @@ class FieldStationComponentManager(TaskExecutorComponentManager):
             fndh_on_command = MccsCommandProxy(
                 device_name=self._fndh_name, command_name="On", logger=self.logger
             )
-            result, message = fndh_on_command(
-                timeout=timeout,
-                is_lrc=True,
-                wait_for_result=True,
-                task_abort_event=task_abort_event,
-            )
+            with timer.phase("fndh_on"):
+                result, message = fndh_on_command(
+                    timeout=timeout,
+                    is_lrc=True,
+                    wait_for_result=True,
+                    task_abort_event=task_abort_event,
+                )
             if task_abort_event is not None and task_abort_event.is_set():
                 self.logger.info("ON command aborted.")
                 task_callback(
@@ -365,7 +568,7 @@ class FieldStationComponentManager(TaskExecutorComponentManager):
 
         if result == ResultCode.OK:
             result, message = self._turn_on_smartbox_blocks(
-                list(self._smartbox_proxys), timeout, task_abort_event
+                list(self._smartbox_proxys), timeout, task_abort_event, timer
             )
             if message:
                 self.logger.error(f"Failure in the `ON` command -> {message}")
@@ -545,23 +748,20 @@ class FieldStationComponentManager(TaskExecutorComponentManager):
         :param task_abort_event: Event signalling an abort
         """
         task_callback(status=TaskStatus.IN_PROGRESS)
-        for smartbox_trl, smartbox_proxy in self._smartbox_proxys.items():
-            if (
-                smartbox_proxy._proxy is not None
-                and antenna_name in smartbox_proxy._proxy.antennaNames
-            ):
-                antenna_on_command = MccsCommandProxy(
-                    device_name=smartbox_trl,
-                    command_name="PowerOnAntenna",
-                    logger=self.logger,
-                )
-                result = antenna_on_command(
-                    arg=antenna_name, is_lrc=True, wait_for_result=True
-                )
-                task_callback(
-                    status=TaskStatus.COMPLETED,
-                    result=result,
-                )
+        route = self._get_antenna_routes().get(antenna_name)
+        if route is None:
+            self._reject_unrouted_antenna(antenna_name, task_callback)
+            return
+        antenna_on_command = MccsCommandProxy(
+            device_name=route.smartbox_trl,
+            command_name="PowerOnAntenna",
+            logger=self.logger,
+        )
+        result = antenna_on_command(arg=antenna_name, is_lrc=True, wait_for_result=True)
+        task_callback(
+            status=TaskStatus.COMPLETED,
+            result=result,
+        )
 
     @check_communicating
     def power_off_antenna(
@@ -582,23 +782,199 @@ class FieldStationComponentManager(TaskExecutorComponentManager):
         :param task_abort_event: Event signalling an abort
         """
         task_callback(status=TaskStatus.IN_PROGRESS)
-        for smartbox_trl, smartbox_proxy in self._smartbox_proxys.items():
-            if (
-                smartbox_proxy._proxy is not None
-                and antenna_name in smartbox_proxy._proxy.antennaNames
+        route = self._get_antenna_routes().get(antenna_name)
+        if route is None:
+            self._reject_unrouted_antenna(antenna_name, task_callback)
+            return
+        antenna_off_command = MccsCommandProxy(
+            device_name=route.smartbox_trl,
+            command_name="PowerOffAntenna",
+            logger=self.logger,
+        )
+        result, message = antenna_off_command(
+            arg=antenna_name, is_lrc=True, wait_for_result=True
+        )
+        task_callback(
+            status=TaskStatus.COMPLETED,
+            result=(result, message),
+        )
+
+    def _reject_unrouted_antenna(
+        self: FieldStationComponentManager, antenna_name: str, task_callback: Callable
+    ) -> None:
+        """
+        Reject a command for an antenna that is not on any smartbox.
+
+        :param antenna_name: the name of the antenna.
+        :param task_callback: callback to be called when the status of
+            the command changes
+        """
+        msg = f"Antenna {antenna_name} not found on any smartbox"
+        self.logger.warning(msg)
+        task_callback(
+            status=TaskStatus.REJECTED,
+            result=(ResultCode.REJECTED, msg),
+        )
+
+    @check_communicating
+    def set_antenna_powers(
+        self: FieldStationComponentManager,
+        antenna_powers: dict[str, bool],
+        task_callback: Callable,
+        task_abort_event: Optional[threading.Event] = None,
+    ) -> None:
+        """
+        Turn antennas on or off, with one command to each of their smartboxes.
+
+        The antennas are grouped by the smartbox that they are on, and each
+        smartbox is sent a single SetPortPowers command for all of its
+        antennas. The commands to different smartboxes are run concurrently.
+
+        The command completes with the result of each antenna, as a JSON
+        object mapping each antenna name to its result code and message.
+
+        :param antenna_powers: whether each antenna, by name, is to be on.
+        :param task_callback: callback to be called when the status of
+            the command changes
+        :param task_abort_event: Event signalling an abort
+        """
+        task_callback(status=TaskStatus.IN_PROGRESS)
+        smartbox_antennas, unrouted = self._group_antennas_by_smartbox(antenna_powers)
+        antenna_results: dict[str, tuple[ResultCode, str]] = {
+            name: (ResultCode.REJECTED, "Antenna not found on any smartbox")
+            for name in unrouted
+        }
+        for smartbox_trl in list(smartbox_antennas):
+            if self._smartbox_power_state.get(smartbox_trl) == PowerState.OFF and any(
+                antenna_powers[name] for name in smartbox_antennas[smartbox_trl]
             ):
-                antenna_on_command = MccsCommandProxy(
-                    device_name=smartbox_trl,
-                    command_name="PowerOffAntenna",
-                    logger=self.logger,
-                )
-                result, message = antenna_on_command(
-                    arg=antenna_name, is_lrc=True, wait_for_result=True
-                )
-                task_callback(
-                    status=TaskStatus.COMPLETED,
-                    result=(result, message),
+                for name in smartbox_antennas.pop(smartbox_trl):
+                    antenna_results[name] = (
+                        ResultCode.REJECTED,
+                        f"Smartbox {smartbox_trl} is off",
+                    )
+
+        if smartbox_antennas:
+            with ThreadPoolExecutor(
+                max_workers=len(smartbox_antennas),
+                thread_name_prefix="set_antenna_powers",
+            ) as executor:
+                smartbox_results = executor.map(
+                    lambda item: self._set_smartbox_antenna_powers(
+                        item[0],
+                        {name: antenna_powers[name] for name in item[1]},
+                        item[1],
+                        task_abort_event,
+                    ),
+                    smartbox_antennas.items(),
                 )
+                for antenna_names, smartbox_result in zip(
+                    smartbox_antennas.values(), smartbox_results
+                ):
+                    for name in antenna_names:
+                        antenna_results[name] = smartbox_result
+
+        if task_abort_event is not None and task_abort_event.is_set():
+            task_callback(
+                status=TaskStatus.ABORTED,
+                result=(ResultCode.ABORTED, "Setting antenna powers aborted."),
+            )
+            return
+        message = json.dumps(
+            {
+                name: {"result": result.name, "message": result_message}
+                for name, (result, result_message) in sorted(antenna_results.items())
+            }
+        )
+        results = {result for result, _ in antenna_results.values()}
+        if results == {ResultCode.OK}:
+            task_callback(status=TaskStatus.COMPLETED, result=(ResultCode.OK, message))
+        elif results <= {ResultCode.REJECTED}:
+            self.logger.warning(f"No antenna powers were set: {message}")
+            task_callback(
+                status=TaskStatus.REJECTED, result=(ResultCode.REJECTED, message)
+            )
+        else:
+            self.logger.error(f"Failed to set antenna powers: {message}")
+            task_callback(status=TaskStatus.FAILED, result=(ResultCode.FAILED, message))
+
+    def _set_smartbox_antenna_powers(
+        self: FieldStationComponentManager,
+        smartbox_trl: str,
+        antenna_powers: dict[str, bool],
+        antenna_ports: dict[str, int],
+        task_abort_event: Optional[threading.Event],
+    ) -> tuple[ResultCode, str]:
+        """
+        Set the powers of the ports of antennas on a smartbox.
+
+        :param smartbox_trl: the TRL of the smartbox.
+        :param antenna_powers: whether each antenna is to be on.
+        :param antenna_ports: the port of each antenna.
+        :param task_abort_event: Event signalling an abort
+
+        :return: the result code and message of the smartbox's command.
+        """
+        if task_abort_event is not None and task_abort_event.is_set():
+            return ResultCode.ABORTED, "Aborted"
+        port_powers: list[Optional[bool]] = [None] * PasdData.NUMBER_OF_SMARTBOX_PORTS
+        for name, power in antenna_powers.items():
+            port_powers[antenna_ports[name] - 1] = power
+        set_port_powers_command = MccsCommandProxy(
+            device_name=smartbox_trl,
+            command_name="SetPortPowers",
+            logger=self.logger,
+        )
+        try:
+            result, message = set_port_powers_command(
+                arg=json.dumps(
+                    {"port_powers": port_powers, "stay_on_when_offline": True}
+                ),
+                timeout=self.ANTENNA_POWERS_COMMAND_TIMEOUT,
+                is_lrc=True,
+                wait_for_result=True,
+                task_abort_event=task_abort_event,
+            )
+        except Exception as ex:  # pylint: disable=broad-except
+            self.logger.error(f"SetPortPowers on {smartbox_trl} failed: {ex!r}")
+            return ResultCode.FAILED, f"SetPortPowers on {smartbox_trl} failed"
+        return ResultCode(result), message
+
+    def power_on_antennas(
+        self: FieldStationComponentManager,
+        antenna_names: list[str],
+        task_callback: Callable,
+        task_abort_event: Optional[threading.Event] = None,
+    ) -> None:
+        """
+        Turn on antennas, with one command to each of their smartboxes.
+
+        :param antenna_names: the names of the antennas to turn on.
+        :param task_callback: callback to be called when the status of
+            the command changes
+        :param task_abort_event: Event signalling an abort
+        """
+        self.set_antenna_powers(
+            dict.fromkeys(antenna_names, True), task_callback, task_abort_event
+        )
+
+    def power_off_antennas(
+        self: FieldStationComponentManager,
+        antenna_names: list[str],
+        task_callback: Callable,
+        task_abort_event: Optional[threading.Event] = None,
+    ) -> None:
+        """
+        Turn off antennas, with one command to each of their smartboxes.
+
+        :param antenna_names: the names of the antennas to turn off.
+        :param task_callback: callback to be called when the status of
+            the command changes
+        :param task_abort_event: Event signalling an abort
+        """
+        self.set_antenna_powers(
+            dict.fromkeys(antenna_names, False), task_callback, task_abort_event
+        )
 
     @check_communicating
     def set_antenna_masking(
@@ -621,21 +997,11 @@ class FieldStationComponentManager(TaskExecutorComponentManager):
         """
         task_callback(status=TaskStatus.IN_PROGRESS)
         mask_dict: dict[str, bool] = json.loads(antenna_mask)
-        unrouted = set(mask_dict.keys())
+        smartbox_antennas, unrouted = self._group_antennas_by_smartbox(mask_dict)
         failed_result: Optional[tuple[ResultCode, str]] = None
 
-        for smartbox_trl, smartbox_proxy in self._smartbox_proxys.items():
-            if smartbox_proxy._proxy is None:
-                continue
-            smartbox_antennas = set(smartbox_proxy._proxy.antennaNames)
-            subset = {
-                name: masked
-                for name, masked in mask_dict.items()
-                if name in smartbox_antennas
-            }
-            if not subset:
-                continue
-            unrouted -= subset.keys()
+        for smartbox_trl, antenna_ports in smartbox_antennas.items():
+            subset = {name: mask_dict[name] for name in antenna_ports}
             mask_command = MccsCommandProxy(
                 device_name=smartbox_trl,
                 command_name="SetAntennaMasking",
@@ -435,6 +435,120 @@ class MccsFieldStation(MccsBaseDevice):
 
         return task
 
+    AntennaNames_schema: Final = {
+        "type": "array",
+        "items": {"type": "string"},
+        "minItems": 1,
+    }
+
+    @stb.long_running_commands.long_running_command
+    def PowerOnAntennas(
+        self: MccsFieldStation, argin: str
+    ) -> stb.type_hints.TaskFunctionType:
+        """
+        Turn on antennas.
+
+        The antennas are grouped by smartbox, and each smartbox is sent one
+        command to turn on all of its antennas. The smartboxes are commanded
+        concurrently.
+
+        :param argin: JSON list of the names of the antennas to turn on,
+            e.g. ``'["sb01-01", "sb03-01"]'``.
+
+        :return: A tuple containing a return code and a string message
+            indicating status. The message is for information purposes only.
+            The command completes with a JSON object mapping each antenna
+            name to its result and message.
+        """
+        antenna_names = json.loads(argin)
+        validate(antenna_names, self.AntennaNames_schema)
+
+        def task(
+            task_callback: stb.type_hints.TaskCallbackType,
+            task_abort_event: threading.Event,
+        ) -> None:
+            self.component_manager.power_on_antennas(
+                antenna_names,
+                task_callback=task_callback,
+                task_abort_event=task_abort_event,
+            )
+
+        return task
+
+    @stb.long_running_commands.long_running_command
+    def PowerOffAntennas(
+        self: MccsFieldStation, argin: str
+    ) -> stb.type_hints.TaskFunctionType:
+        """
+        Turn off antennas.
+
+        The antennas are grouped by smartbox, and each smartbox is sent one
+        command to turn off all of its antennas. The smartboxes are commanded
+        concurrently.
+
+        :param argin: JSON list of the names of the antennas to turn off,
+            e.g. ``'["sb01-01", "sb03-01"]'``.
+
+        :return: A tuple containing a return code and a string message
+            indicating status. The message is for information purposes only.
+            The command completes with a JSON object mapping each antenna
+            name to its result and message.
+        """
+        antenna_names = json.loads(argin)
+        validate(antenna_names, self.AntennaNames_schema)
+
+        def task(
+            task_callback: stb.type_hints.TaskCallbackType,
+            task_abort_event: threading.Event,
+        ) -> None:
+            self.component_manager.power_off_antennas(
+                antenna_names,
+                task_callback=task_callback,
+                task_abort_event=task_abort_event,
+            )
+
+        return task
+
+    AntennaPowers_schema: Final = {
+        "type": "object",
+        "additionalProperties": {"type": "boolean"},
+        "minProperties": 1,
+    }
+
+    @stb.long_running_commands.long_running_command
+    def SetAntennaPowers(
+        self: MccsFieldStation, argin: str
+    ) -> stb.type_hints.TaskFunctionType:
+        """
+        Turn antennas on or off.
+
+        The antennas are grouped by smartbox, and each smartbox is sent one
+        command to set the powers of all of its antennas. The smartboxes are
+        commanded concurrently.
+
+        :param argin: JSON string mapping antenna names to whether they are
+            to be on, e.g. ``'{"sb01-01": true, "sb03-01": false}'``.
+
+        :return: A tuple containing a return code and a string message
+            indicating status. The message is for information purposes only.
+            The command completes with a JSON object mapping each antenna
+            name to its result and message.
+        """
+        antenna_powers = json.loads(argin)
+        validate(antenna_powers, self.AntennaPowers_schema)
+
+        def task(
+            task_callback: stb.type_hints.TaskCallbackType,
+            task_abort_event: threading.Event,
+        ) -> None:
+            self.component_manager.set_antenna_powers(
+                antenna_powers,
+                task_callback=task_callback,
+                task_abort_event=task_abort_event,
+            )
+
+        return task
+
     @stb.long_running_commands.long_running_command
     def SetAntennaMasking(
         self: MccsFieldStation, argin: str
@@ -498,6 +612,20 @@ class MccsFieldStation(MccsBaseDevice):
             raise ValueError("Outside temperature not read yet")
         return self.component_manager.outsideTemperature
 
+    @attribute(dtype="DevString", label="commandTimingReports")
+    def commandTimingReports(self: MccsFieldStation) -> str:
+        """
+        Return the timing reports of the most recent On commands.
+
+        Each report gives the start and duration of each phase of the
+        command: turning on the FNDH, and each block of smartboxes. It
+        nests the report of each smartbox's On command, which in turn
+        nests the reports of the MccsPasdBus commands that it made.
+
+        :return: a JSON list of timing reports, oldest first.
+        """
+        return json.dumps(self.component_manager.command_timing_reports)
+
     @attribute(dtype="DevString")
     def healthReport(self: MccsFieldStation) -> str:
         """
@@ -10,7 +10,6 @@ from __future__ import annotations
 
 import json
 import logging
-import re
 import threading
 import time
 from datetime import datetime, timezone
@@ -24,7 +23,9 @@ from ska_tango_base.base import check_communicating
 from ska_tango_base.commands import ResultCode
 from ska_tango_base.executor import TaskExecutorComponentManager
 
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_snapshot import decode_snapshot
 from ska_low_mccs_pasd.pasd_data import PasdData
+from ska_low_mccs_pasd.pasd_utils import PortStateCondition
 
 __all__ = ["FndhComponentManager", "_PasdBusProxy"]
 
@@ -67,6 +68,9 @@ class _PasdBusProxy(DeviceComponentManager):
         self._update_port_power_states = update_port_power_states
         self._attribute_change_callback = attribute_change_callback
         self._pasd_device = PasdData.FNDH_DEVICE_ID
+        # The FNDH attribute name for each PaSD bus attribute name, or None for
+        # an attribute that isn't the FNDH's. Filled in as events arrive.
+        self._attribute_names: dict[str, Optional[str]] = {}
 
         super().__init__(
             fqdn,
@@ -106,36 +110,78 @@ class _PasdBusProxy(DeviceComponentManager):
         :param attr_value: The value of the attribute that is changing.
         :param attr_quality: The quality of the attribute.
         """
-        is_a_fndh = re.search("^fndh", attr_name)
+        try:
+            tango_attribute_name = self._attribute_names[attr_name]
+        except KeyError:
+            tango_attribute_name = (
+                attr_name.removeprefix("fndh").lower()
+                if attr_name.startswith("fndh")
+                else None
+            )
+            self._attribute_names[attr_name] = tango_attribute_name
 
-        if is_a_fndh:
-            tango_attribute_name = attr_name[is_a_fndh.end() :].lower()
-            if tango_attribute_name.lower() == "portspowersensed":
+        if tango_attribute_name is None:
+            self.logger.info(
+                f"Attribute subscription {attr_name} does not seem to begin"
+                "with 'fndh' string so it is assumed it is a incorrect subscription"
+            )
+        elif tango_attribute_name == "snapshot":
+            self._on_snapshot_change(attr_value)
+        else:
+            timestamp = datetime.now(timezone.utc).timestamp()
+            self._on_fndh_attribute_change(
+                tango_attribute_name, attr_value, timestamp, attr_quality
+            )
 
-                def get_power_state(powerstate: bool) -> PowerState:
-                    if powerstate:
-                        return PowerState.ON
-                    return PowerState.OFF
+    def _on_fndh_attribute_change(
+        self: _PasdBusProxy,
+        tango_attribute_name: str,
+        attr_value: Any,
+        timestamp: float,
+        attr_quality: tango.AttrQuality,
+    ) -> None:
+        if tango_attribute_name == "portspowersensed":
 
-                port_power_states = map(get_power_state, attr_value)
+            def get_power_state(powerstate: bool) -> PowerState:
+                if powerstate:
+                    return PowerState.ON
+                return PowerState.OFF
 
-                self._update_port_power_states(list(port_power_states))
+            port_power_states = map(get_power_state, attr_value)
 
-            # Status is a bad name since it conflicts with TANGO status.
-            if tango_attribute_name.lower() == "status":
-                tango_attribute_name = "pasdstatus"
+            self._update_port_power_states(list(port_power_states))
 
-            timestamp = datetime.now(timezone.utc).timestamp()
-            self._attribute_change_callback(
-                tango_attribute_name, attr_value, timestamp, attr_quality
-            )
-            return
+        # Status is a bad name since it conflicts with TANGO status.
+        if tango_attribute_name == "status":
+            tango_attribute_name = "pasdstatus"
 
-        self.logger.info(
-            f"Attribute subscription {attr_name} does not seem to begin"
-            "with 'fndh' string so it is assumed it is a incorrect subscription"
+        self._attribute_change_callback(
+            tango_attribute_name, attr_value, timestamp, attr_quality
         )
 
+    def _on_snapshot_change(self: _PasdBusProxy, encoded_snapshot: str) -> None:
+        """
+        Handle a change of the FNDH's snapshot attribute.
+
+        Each value in the snapshot is handled as if it had been received in
+        a change event of its own attribute.
+
+        :param encoded_snapshot: the encoded snapshot.
+        """
+        try:
+            snapshot = decode_snapshot(encoded_snapshot)
+        except ValueError as error:
+            self.logger.error(f"Invalid snapshot of FNDH: {error}")
+            return
+        for values, attr_quality in [
+            (snapshot.values, tango.AttrQuality.ATTR_VALID),
+            (snapshot.invalid, tango.AttrQuality.ATTR_INVALID),
+        ]:
+            for name, value in values.items():
+                self._on_fndh_attribute_change(
+                    name.lower(), value, snapshot.timestamp, attr_quality
+                )
+
     def set_fndh_port_powers(
         self: _PasdBusProxy, json_argument: str
     ) -> tuple[ResultCode, str]:
@@ -211,7 +257,7 @@ class FndhComponentManager(TaskExecutorComponentManager):
         self._pasd_fqdn = pasd_fqdn
         self._ports_with_smartbox = ports_with_smartbox
         self._fndh_port_powers = [PowerState.UNKNOWN] * PasdData.NUMBER_OF_FNDH_PORTS
-        self.fndh_ports_change = threading.Event()
+        self.fndh_port_states = PortStateCondition()
         self._power_state = PowerState.UNKNOWN
 
         self._pasd_bus_proxy = _pasd_bus_proxy or _PasdBusProxy(
@@ -274,6 +320,8 @@ class FndhComponentManager(TaskExecutorComponentManager):
         """
         self.logger.info("Aborting PasdBus.")
         result = super().abort(task_callback)
+        # Wake any commands waiting for port states, so that they see the abort.
+        self.fndh_port_states.interrupt()
         if self._pasd_bus_proxy._proxy is not None:
             self._pasd_bus_proxy._proxy.Abort()
         return result
@@ -474,30 +522,18 @@ class FndhComponentManager(TaskExecutorComponentManager):
         timeout: int,
         task_abort_event: Optional[threading.Event] = None,
     ) -> tuple[ResultCode, int, str]:
-        desired_port_power_states = [
-            Any if power is None else PowerState.ON if power else PowerState.OFF
-            for power in desired_port_powers
-        ]
         deadline = time.monotonic() + timeout
-        poll = 0.1 if task_abort_event else timeout
-        while not all(
-            demanded_state in (Any, port_state)
-            for port_state, demanded_state in zip(
-                self._fndh_port_powers, desired_port_power_states
-            )
+        self.logger.debug("Waiting for unmasked smartbox ports to change state")
+        if not self.fndh_port_states.wait_for(
+            desired_port_powers, timeout, task_abort_event
         ):
             if task_abort_event and task_abort_event.is_set():
                 msg = "Aborted waiting for FNDH port powers to change state"
                 self.logger.info(msg)
                 return (ResultCode.ABORTED, int(deadline - time.monotonic()), msg)
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
-                msg = "Timeout reached waiting for FNDH port powers to change state"
-                self.logger.error(msg)
-                return ResultCode.FAILED, 0, msg
-            self.logger.debug("Waiting for unmasked smartbox ports to change state")
-            self.fndh_ports_change.wait(min(remaining, poll))
-            self.fndh_ports_change.clear()
+            msg = "Timeout reached waiting for FNDH port powers to change state"
+            self.logger.error(msg)
+            return ResultCode.FAILED, 0, msg
         return (
             ResultCode.OK,
             int(deadline - time.monotonic()),
@@ -40,7 +40,12 @@ from tango.server import attribute, command, device_property
 from ska_low_mccs_pasd.pasd_data import PasdData
 
 from ..pasd_controllers_configuration import ControllerDict, PasdControllersConfig
-from ..pasd_utils import PasdDatabase, PasdThresholds
+from ..pasd_utils import (
+    PasdAttributeKind,
+    PasdDatabase,
+    PasdThresholds,
+    build_attribute_dispatch_table,
+)
 from .fndh_component_manager import FndhComponentManager
 from .fndh_health_model import FndhHealthModel
 
@@ -147,6 +152,9 @@ class MccsFNDH(MccsBaseDevice[FndhComponentManager]):
         self._thresholds_pasd: PasdThresholds
 
         self.threshold_fault: Optional[bool] = None
+        self._attribute_handlers: dict[
+            str, Callable[[str, Any, float, tango.AttrQuality], None]
+        ] = {}
 
         # Health monitor points contains a cache of monitoring points as they
         # are updated in a poll. When communication is lost this cache is
@@ -168,6 +176,7 @@ class MccsFNDH(MccsBaseDevice[FndhComponentManager]):
 
         # Setup attributes shared with the MccsPasdBus.
         self._setup_fndh_attributes()
+        self._attribute_handlers = self._build_attribute_handlers()
 
         # Attributes for specific ports on the FNDH.
         # These attributes are a breakdown of the portPowerSensed
@@ -899,7 +908,7 @@ class MccsFNDH(MccsBaseDevice[FndhComponentManager]):
                 if power_states[port] != PowerState.UNKNOWN:
                     self._port_power_states[port] = power_states[port]
         self.component_manager._fndh_port_powers = self._port_power_states
-        self.component_manager.fndh_ports_change.set()
+        self.component_manager.fndh_port_states.update(self._port_power_states)
         self.component_manager._evaluate_power()
 
     def _component_state_changed_callback(
@@ -1026,8 +1035,7 @@ class MccsFNDH(MccsBaseDevice[FndhComponentManager]):
                     self.threshold_fault = False
                 self._component_state_changed_callback()
 
-    # pylint: disable=too-many-branches
-    def _attribute_changed_callback(  # noqa: C901
+    def _attribute_changed_callback(
         self: MccsFNDH,
         attr_name: str,
         attr_value: Any,
@@ -1048,89 +1056,135 @@ class MccsFNDH(MccsBaseDevice[FndhComponentManager]):
         :param: timestamp: the timestamp for the current change
         :param: attr_quality: the quality factor for the attribute
         """
-        try:
-            assert (
-                len(
-                    [
-                        register["tango_attr_name"]
-                        for register in self.CONFIG["registers"].values()
-                        if register["tango_attr_name"].lower() == attr_name.lower()
-                    ]
-                )
-                > 0
-            )
-            if attr_value is None:
-                # This happens when the upstream attribute's quality factor has
-                # been set to INVALID. Pushing a change event with None
-                # triggers an exception so we change it to the last known value here
-                attr_value = self._fndh_attributes[attr_name].value
-            else:
-                self._fndh_attributes[attr_name].value = attr_value
-            # Status register mapping to quality to health:
-            # UNINITIALISED -> ATTR_VALID -> OK
-            # OK -> ATTR_VALID -> OK
-            # WARNING -> ATTR_WARNING -> DEGRADED
-            # ALARM -> ATTR_ALARM -> FAILED
-            # RECOVERY -> ATTR_ALARM -> FAILED
-            # POWERDOWN -> ATTR_INVALID -> UNKNOWN (shouldn't be seen in operation)
-            if "pasdstatus" in attr_name.lower():
-                attr_quality = self._convert_status_to_quality(attr_value)
-                if (
-                    attr_quality
-                    in [
-                        tango.AttrQuality.ATTR_ALARM,
-                        tango.AttrQuality.ATTR_WARNING,
-                    ]
-                    and self.dev_state() == tango.DevState.ON
-                ):
-                    self.set_state(tango.DevState.ALARM)
-            self._fndh_attributes[attr_name].quality = attr_quality
-            self._fndh_attributes[attr_name].timestamp = timestamp
-
-            self.push_change_event(attr_name, attr_value, timestamp, attr_quality)
-            self.push_archive_event(attr_name, attr_value, timestamp, attr_quality)
-
-            # If we are reading alarm thresholds, update the alarm configuration
-            # for the corresponding Tango attribute
-            if self._health_model is not None:
-                if attr_name.endswith("thresholds"):
-                    try:
-                        threshold_attribute_name = attr_name.removesuffix("thresholds")
-                        self._health_model.update_monitoring_point_threshold(
-                            threshold_attribute_name, attr_value
-                        )
-                    except DevFailed:
-                        # No corresponding attribute to update, continue
-                        pass
-                elif attr_name.endswith("status"):
-                    self._health_model.update_state(status=attr_value)
-                else:
-                    self._health_monitor_points[attr_name] = attr_value
-                    self._health_model.update_state(
-                        monitoring_points=self._health_monitor_points
-                    )
-            else:
-                if attr_name.endswith("thresholds"):
-                    self._thresholds_pasd.update({attr_name: attr_value})
-                    diff = self._threshold_differences()
-                    if diff:
-                        self.logger.error(
-                            f"Mismatch between firmware and tango thresholds: {diff}"
-                        )
-                        self.threshold_fault = True
-                    else:
-                        if self.op_state_model._op_state == tango.DevState.UNKNOWN:
-                            self.threshold_fault = None
-                        else:
-                            self.threshold_fault = False
-                    self._component_state_changed_callback()
-            if attr_name in ("portspowersensed", "portspowercontrol"):
-                self._evaluate_faulty_ports()
-        except AssertionError:
+        handler = self._attribute_handlers.get(attr_name)
+        if handler is None:
             self.logger.error(
                 f"""The attribute {attr_name} pushed from MccsPasdBus
                 device does not exist in MccsFNDH"""
             )
+            return
+        if attr_value is None:
+            # This happens when the upstream attribute's quality factor has
+            # been set to INVALID. Pushing a change event with None
+            # triggers an exception so we change it to the last known value here
+            attr_value = self._fndh_attributes[attr_name].value
+        else:
+            self._fndh_attributes[attr_name].value = attr_value
+        handler(attr_name, attr_value, timestamp, attr_quality)
+
+    def _build_attribute_handlers(
+        self: MccsFNDH,
+    ) -> dict[str, Callable[[str, Any, float, tango.AttrQuality], None]]:
+        return build_attribute_dispatch_table(
+            self.CONFIG,
+            {
+                PasdAttributeKind.THRESHOLD: self._on_threshold_changed,
+                PasdAttributeKind.STATUS: self._on_status_changed,
+                PasdAttributeKind.PORT_POWER: self._on_port_power_changed,
+                # The FNDH has no port breakers
+                PasdAttributeKind.BREAKER: self._on_monitoring_point_changed,
+                PasdAttributeKind.MONITORING_POINT: self._on_monitoring_point_changed,
+            },
+        )
+
+    def _publish_attribute(
+        self: MccsFNDH,
+        attr_name: str,
+        attr_value: Any,
+        timestamp: float,
+        attr_quality: tango.AttrQuality,
+    ) -> None:
+        self._fndh_attributes[attr_name].quality = attr_quality
+        self._fndh_attributes[attr_name].timestamp = timestamp
+
+        self.push_change_event(attr_name, attr_value, timestamp, attr_quality)
+        self.push_archive_event(attr_name, attr_value, timestamp, attr_quality)
+
+    def _on_threshold_changed(
+        self: MccsFNDH,
+        attr_name: str,
+        attr_value: Any,
+        timestamp: float,
+        attr_quality: tango.AttrQuality,
+    ) -> None:
+        self._publish_attribute(attr_name, attr_value, timestamp, attr_quality)
+        # If we are reading alarm thresholds, update the alarm configuration
+        # for the corresponding Tango attribute
+        if self._health_model is not None:
+            try:
+                threshold_attribute_name = attr_name.removesuffix("thresholds")
+                self._health_model.update_monitoring_point_threshold(
+                    threshold_attribute_name, attr_value
+                )
+            except DevFailed:
+                # No corresponding attribute to update, continue
+                pass
+            return
+        self._thresholds_pasd.update({attr_name: attr_value})
+        diff = self._threshold_differences()
+        if diff:
+            self.logger.error(f"Mismatch between firmware and tango thresholds: {diff}")
+            self.threshold_fault = True
+        else:
+            if self.op_state_model._op_state == tango.DevState.UNKNOWN:
+                self.threshold_fault = None
+            else:
+                self.threshold_fault = False
+        self._component_state_changed_callback()
+
+    def _on_status_changed(
+        self: MccsFNDH,
+        attr_name: str,
+        attr_value: Any,
+        timestamp: float,
+        attr_quality: tango.AttrQuality,
+    ) -> None:
+        # Status register mapping to quality to health:
+        # UNINITIALISED -> ATTR_VALID -> OK
+        # OK -> ATTR_VALID -> OK
+        # WARNING -> ATTR_WARNING -> DEGRADED
+        # ALARM -> ATTR_ALARM -> FAILED
+        # RECOVERY -> ATTR_ALARM -> FAILED
+        # POWERDOWN -> ATTR_INVALID -> UNKNOWN (shouldn't be seen in operation)
+        attr_quality = self._convert_status_to_quality(attr_value)
+        if (
+            attr_quality
+            in [
+                tango.AttrQuality.ATTR_ALARM,
+                tango.AttrQuality.ATTR_WARNING,
+            ]
+            and self.dev_state() == tango.DevState.ON
+        ):
+            self.set_state(tango.DevState.ALARM)
+        self._publish_attribute(attr_name, attr_value, timestamp, attr_quality)
+        if self._health_model is not None:
+            self._health_model.update_state(status=attr_value)
+
+    def _on_port_power_changed(
+        self: MccsFNDH,
+        attr_name: str,
+        attr_value: Any,
+        timestamp: float,
+        attr_quality: tango.AttrQuality,
+    ) -> None:
+        self._on_monitoring_point_changed(
+            attr_name, attr_value, timestamp, attr_quality
+        )
+        self._evaluate_faulty_ports()
+
+    def _on_monitoring_point_changed(
+        self: MccsFNDH,
+        attr_name: str,
+        attr_value: Any,
+        timestamp: float,
+        attr_quality: tango.AttrQuality,
+    ) -> None:
+        self._publish_attribute(attr_name, attr_value, timestamp, attr_quality)
+        if self._health_model is not None:
+            self._health_monitor_points[attr_name] = attr_value
+            self._health_model.update_state(
+                monitoring_points=self._health_monitor_points
+            )
 
     def _evaluate_faulty_ports(self: MccsFNDH) -> None:
         port_power_control = self._fndh_attributes.get("portspowercontrol")
@@ -15,6 +15,7 @@ import numpy as np
 from ska_control_model import HealthState
 from ska_low_mccs_common.health import BaseHealthModel, HealthChangedCallbackProtocol
 
+from ..pasd_utils import MonitoringPointHealthCache
 from .fndh_health_rules import FndhHealthRules, join_health_reports
 
 
@@ -88,6 +89,16 @@ class FndhHealthModel(BaseHealthModel):
         self._health_rules: FndhHealthRules = FndhHealthRules(
             self._logger, dict(self.SUPPORTED_MONITORING_POINTS)
         )
+        self._incremental = True
+        self._monitoring_point_health = MonitoringPointHealthCache(
+            lambda name, value, thresholds: (
+                self._health_rules.compute_monitoring_point_health(
+                    monitoring_point_name=name,
+                    monitoring_point=value,
+                    thresholds=thresholds,
+                )
+            )
+        )
 
         super().__init__(
             health_changed_callback,
@@ -117,6 +128,29 @@ class FndhHealthModel(BaseHealthModel):
             # force a re-evaluation
             self.evaluate_health()
 
+    @property
+    def incremental(self: FndhHealthModel) -> bool:
+        """
+        A flag to represent if the health is evaluated incrementally.
+
+        When it is, the health of each monitoring point is cached, and only
+        recomputed when its value or its thresholds change. Thresholds must
+        therefore be changed through this model, not in place.
+
+        :returns: True if the health is evaluated incrementally.
+        """
+        return self._incremental
+
+    @incremental.setter
+    def incremental(self: FndhHealthModel, val: bool) -> None:
+        """
+        Toggle incremental evaluation of the health.
+
+        :param val: True if we want to evaluate the health incrementally.
+        """
+        self._incremental = val
+        self._monitoring_point_health.clear()
+
     def _get_report_from_rules(self: FndhHealthModel) -> tuple[HealthState, str]:
         # Retrieve the values first so we are using consistent data to
         # evaluate the health rules.
@@ -203,11 +237,21 @@ class FndhHealthModel(BaseHealthModel):
         Return a dictionary containing health information about monitoring points.
 
         For monitoring points with a threshold defined evaluates the health of
-        and add to a dictionary.
+        and add to a dictionary. When evaluating incrementally, only the
+        monitoring points whose value or thresholds have changed are evaluated.
 
         :return: health information about monitoring points.
         """
         mon_points = self._state.get("monitoring_points", {})
+        if self._incremental:
+            return {
+                attribute_name: self._monitoring_point_health.get(
+                    attribute_name,
+                    mon_points.get(attribute_name),
+                    self.health_params.get(attribute_name),
+                )
+                for attribute_name in self.SUPPORTED_MONITORING_POINTS
+            }
         return {
             attribute_name: self._health_rules.compute_monitoring_point_health(
                 monitoring_point_name=attribute_name,
@@ -237,6 +281,7 @@ class FndhHealthModel(BaseHealthModel):
         self._health_rules.update_monitoring_point_thresholds(
             monitoring_point, threshold_values
         )
+        self._monitoring_point_health.invalidate(monitoring_point)
 
         # re-evaluate
         self.evaluate_health()
@@ -261,3 +306,4 @@ class FndhHealthModel(BaseHealthModel):
         self._health_rules.thresholds = self._merge_dicts(
             self._health_rules.thresholds, params
         )
+        self._monitoring_point_health.invalidate(*params)
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+This module implements an index of the PaSD bus device's PaSD attributes.
+
+Every value in every poll response is keyed by the name of its register
+in the Modbus API, and has to be mapped onto the Tango attribute of the
+device it was read from; every write to a Tango attribute has to be
+mapped back. The index makes both lookups a single dictionary access.
+"""
+from __future__ import annotations
+
+from typing import Iterable, Mapping
+
+from ..pasd_controllers_configuration import ControllerDict
+
+__all__ = ["PasdAttributeIndex"]
+
+
+class PasdAttributeIndex:
+    """A bidirectional index of PaSD register names and Tango attribute names."""
+
+    def __init__(
+        self: PasdAttributeIndex,
+        controllers_config: Mapping[str, ControllerDict],
+        smartbox_ids: Iterable[int],
+    ) -> None:
+        """
+        Initialise a new instance.
+
+        :param controllers_config: the configuration of each type of PaSD
+            controller, keyed by controller type.
+        :param smartbox_ids: the IDs of the smartboxes on the bus.
+        """
+        self._tango_names: dict[tuple[int, str], str] = {}
+        self._pasd_attributes: dict[str, tuple[int, str]] = {}
+        self._prefixes: dict[int, str] = {}
+        self._device_attributes: dict[int, list[str]] = {}
+        smartbox_ids = list(smartbox_ids)
+        for key, controller in controllers_config.items():
+            if key == "FNSC":
+                for smartbox_id in smartbox_ids:
+                    self._add_controller(
+                        controller, smartbox_id, controller["prefix"] + str(smartbox_id)
+                    )
+            else:
+                self._add_controller(
+                    controller, controller["modbus_address"], controller["prefix"]
+                )
+
+    def _add_controller(
+        self: PasdAttributeIndex,
+        controller: ControllerDict,
+        device_id: int,
+        prefix: str,
+    ) -> None:
+        self._prefixes[device_id] = prefix
+        device_attributes = self._device_attributes.setdefault(device_id, [])
+        for key, register in controller["registers"].items():
+            tango_name = prefix + register["tango_attr_name"]
+            self._tango_names[(device_id, key)] = tango_name
+            self._pasd_attributes[tango_name] = (device_id, key)
+            device_attributes.append(tango_name)
+
+    @property
+    def device_ids(self: PasdAttributeIndex) -> list[int]:
+        """
+        Return the IDs of the PaSD devices in the index.
+
+        :return: a list of device IDs.
+        """
+        return list(self._prefixes)
+
+    def get_prefix(self: PasdAttributeIndex, device_id: int) -> str:
+        """
+        Return the prefix of the Tango attribute names of a PaSD device.
+
+        :param device_id: the ID of the PaSD device.
+
+        :return: the prefix, e.g. "fndh" or "smartbox5", or an empty string
+            if the device is not in the index.
+        """
+        return self._prefixes.get(device_id, "")
+
+    def get_tango_attribute_names(
+        self: PasdAttributeIndex, device_id: int
+    ) -> list[str]:
+        """
+        Return the names of all the Tango attributes of a PaSD device.
+
+        :param device_id: the ID of the PaSD device.
+
+        :return: a list of Tango attribute names, which is empty if the
+            device is not in the index.
+        """
+        return list(self._device_attributes.get(device_id, []))
+
+    def get_tango_attribute_name(
+        self: PasdAttributeIndex, device_id: int, pasd_attribute_name: str
+    ) -> str:
+        """
+        Return the name of the Tango attribute for a PaSD register.
+
+        :param device_id: the ID of the PaSD device.
+        :param pasd_attribute_name: the name of the register in the Modbus API.
+
+        :return: the name of the Tango attribute, or an empty string if there
+            is none.
+        """
+        return self._tango_names.get((device_id, pasd_attribute_name), "")
+
+    def get_pasd_attribute(
+        self: PasdAttributeIndex, tango_attribute_name: str
+    ) -> tuple[int, str] | None:
+        """
+        Return the PaSD device and register for a Tango attribute.
+
+        :param tango_attribute_name: the name of the Tango attribute.
+
+        :return: the ID of the PaSD device and the name of the register in
+            the Modbus API, or None if the attribute is not a PaSD attribute.
+        """
+        return self._pasd_attributes.get(tango_attribute_name)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+This module implements templates of the PaSD bus device's PaSD attributes.
+
+The PaSD bus device has a Tango attribute for every register of every
+PaSD device on the bus. Every smartbox has the same registers, so rather
+than working out the Tango metadata of each attribute from the register
+configuration for every smartbox, it is worked out once per register, in
+a template, from which the attribute of each device is then created.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Optional
+
+import tango
+
+from ..pasd_controllers_configuration import ControllerDict
+
+__all__ = ["PasdAttributeTemplate", "build_attribute_templates"]
+
+
+# pylint: disable=too-many-instance-attributes
+@dataclass(frozen=True)
+class PasdAttributeTemplate:
+    """
+    Class representing the metadata of the Tango attribute for a PaSD register.
+
+    The name of the attribute is the name of the template, prefixed by the
+    PaSD device, e.g. "smartbox5" + "InputVoltage".
+    """
+
+    name: str
+    dtype: type | tuple[type]
+    max_dim_x: int
+    access: tango.AttrWriteType
+    read_once: bool = False
+    abs_deadband: Optional[float] = None
+    rel_deadband: Optional[float] = None
+    event_kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+def build_attribute_templates(
+    controller_config: ControllerDict, types: Mapping[str, type]
+) -> list[PasdAttributeTemplate]:
+    """
+    Build a template for the attribute of each register of a PaSD controller.
+
+    :param controller_config: the configuration of the controller.
+    :param types: the Python type of each register data type.
+
+    :return: a template for each register, in configuration order.
+    """
+    templates = []
+    for register in controller_config["registers"].values():
+        data_type = types[register["data_type"]]
+        templates.append(
+            PasdAttributeTemplate(
+                name=register["tango_attr_name"],
+                dtype=data_type if register["tango_dim_x"] == 1 else (data_type,),
+                max_dim_x=register["tango_dim_x"],
+                access=(
+                    tango.AttrWriteType.READ_WRITE
+                    if register["writable"]
+                    else tango.AttrWriteType.READ
+                ),
+                read_once=register["read_once"],
+                abs_deadband=register.get("abs_deadband"),
+                rel_deadband=register.get("rel_deadband"),
+                # rel_change/archive_rel_change are only valid for numeric attributes
+                event_kwargs=(
+                    {"rel_change": 1, "archive_rel_change": 1}
+                    if data_type in (int, float)
+                    else {}
+                ),
+            )
+        )
+    return templates
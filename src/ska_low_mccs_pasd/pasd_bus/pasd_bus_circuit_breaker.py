@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+This module implements a per-device circuit breaker for a PaSD bus.
+
+Each poll of a device that has stopped responding costs the full Modbus
+timeout. A circuit breaker stops a failing device from being polled for
+a backoff period, which doubles each time the device fails again, so
+that an unresponsive device is polled less and less often while the
+other devices on the bus carry on being polled as normal.
+"""
+from __future__ import annotations
+
+import enum
+import logging
+import time
+
+__all__ = ["CircuitBreakerState", "DeviceCircuitBreaker"]
+
+
+class CircuitBreakerState(enum.Enum):
+    """The state of a device's circuit breaker."""
+
+    CLOSED = enum.auto()
+    """The device is communicating normally, and is polled as usual."""
+
+    OPEN = enum.auto()
+    """The device has failed, and is not polled until its backoff expires."""
+
+    HALF_OPEN = enum.auto()
+    """The device's backoff has expired, and the next poll is a probe."""
+
+
+class DeviceCircuitBreaker:
+    """
+    A circuit breaker for communications with a single PaSD device.
+
+    The breaker opens when a poll of the device fails. Once the backoff
+    period has passed, the breaker is half-open and a single probe poll is
+    allowed. If the probe succeeds the breaker closes; if it fails the
+    breaker opens again, for twice as long, up to a maximum backoff.
+    """
+
+    def __init__(
+        self: DeviceCircuitBreaker,
+        device_id: int,
+        backoff: float,
+        max_backoff: float,
+        logger: logging.Logger,
+    ) -> None:
+        """
+        Initialise a new instance.
+
+        :param device_id: the ID of the device this breaker is for.
+        :param backoff: time in seconds for which the breaker stays open
+            after the first failure.
+        :param max_backoff: the maximum time in seconds for which the
+            breaker stays open.
+        :param logger: a logger.
+        """
+        self._device_id = device_id
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._logger = logger
+        self._state = CircuitBreakerState.CLOSED
+        self._consecutive_failures = 0
+        self._retry_time = 0.0
+
+    @property
+    def state(self: DeviceCircuitBreaker) -> CircuitBreakerState:
+        """
+        Return the state of the breaker.
+
+        :return: the state of the breaker.
+        """
+        return self._state
+
+    @property
+    def consecutive_failures(self: DeviceCircuitBreaker) -> int:
+        """
+        Return the number of polls that have failed since the last success.
+
+        :return: the number of consecutive failed polls.
+        """
+        return self._consecutive_failures
+
+    @property
+    def retry_time(self: DeviceCircuitBreaker) -> float:
+        """
+        Return the time after which the device may be probed again.
+
+        :return: a time.time() timestamp.
+        """
+        return self._retry_time
+
+    def allow_request(self: DeviceCircuitBreaker) -> bool:
+        """
+        Return whether the device may be communicated with now.
+
+        If the breaker is open but its backoff has expired, it becomes
+        half-open, and the request that is allowed is a probe.
+
+        :return: whether the device may be communicated with.
+        """
+        if self._state == CircuitBreakerState.OPEN:
+            if time.time() < self._retry_time:
+                return False
+            self._state = CircuitBreakerState.HALF_OPEN
+            self._logger.info(f"Probing unresponsive device {self._device_id}")
+        return True
+
+    def record_success(self: DeviceCircuitBreaker) -> None:
+        """Record a successful poll of the device, closing the breaker."""
+        if self._state != CircuitBreakerState.CLOSED:
+            self._logger.info(
+                f"Device {self._device_id} is responding again after "
+                f"{self._consecutive_failures} failed polls"
+            )
+        self._state = CircuitBreakerState.CLOSED
+        self._consecutive_failures = 0
+
+    def record_failure(self: DeviceCircuitBreaker) -> None:
+        """Record a failed poll of the device, opening the breaker."""
+        self._consecutive_failures += 1
+        # Cap the exponent, which would otherwise grow without bound
+        # for a device that never comes back.
+        exponent = min(self._consecutive_failures - 1, 32)
+        backoff = min(self._backoff * 2**exponent, self._max_backoff)
+        self._retry_time = time.time() + backoff
+        self._state = CircuitBreakerState.OPEN
+        self._logger.warning(
+            f"Device {self._device_id} failed {self._consecutive_failures} "
+            f"consecutive polls, backing off for {backoff:.1f}s"
+        )
@@ -5,6 +5,7 @@
 #
 # Distributed under the terms of the BSD 3-clause new license.
 # See LICENSE for more info.
+# pylint: disable=too-many-lines
 """This module implements a component manager for a PaSD bus."""
 
 from __future__ import annotations
@@ -13,7 +14,7 @@ import logging
 import math
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Callable, Final, Optional
 
 from ska_control_model import CommunicationStatus, PowerState, ResultCode, TaskStatus
@@ -23,7 +24,14 @@ from ska_tango_base.poller import PollingComponentManager
 
 from ska_low_mccs_pasd.pasd_data import PasdData
 
+from .pasd_bus_flight_recorder import FlightRecorder, TransactionOutcome
+from .pasd_bus_latency_histogram import LatencyMonitor
 from .pasd_bus_poll_management import PasdBusRequestProvider
+from .pasd_bus_poll_schedule import PollSchedule, load_poll_schedules
+from .pasd_bus_port_power_timing import PortPowerTimingTracker
+from .pasd_bus_read_planner import PasdBusReadPlanner, ReadBlock
+from .pasd_bus_rtt_estimator import RttEstimator
+from .pasd_bus_state_publisher import PasdStatePublisher
 from .poll_failure_tracker import PollFailureSnapshot, PollFailureTracker
 
 _POLL_THREAD_STARTUP_DELAY: Final[float] = 0.2
@@ -38,13 +46,20 @@ class PasdBusRequest:
     command arguments or values
 
     If the command name and attribute_to_write are both None, then the arguments
-    are interpreted as a list of attribute values to read.
+    are interpreted as a list of attribute values to read. If the read merges
+    several attribute groups into one block, the groups hold the attributes of
+    each of them.
+
+    The kind of request (e.g. "INFO" or "SET_PORT_POWERS") is used to keep
+    track of how long each kind of request takes.
     """
 
     device_id: int
     command: str | None
     attribute_to_write: str | None
     arguments: list[Any]
+    groups: tuple[tuple[str, ...], ...] = field(default=())
+    kind: str = ""
 
 
 @dataclass
@@ -63,6 +78,7 @@ class PasdBusResponse:
     device_id: int
     command: str | None
     data: dict[str, Any]
+    groups: tuple[tuple[str, ...], ...] = field(default=())
 
 
 # pylint: disable=too-many-public-methods, too-many-instance-attributes
@@ -142,6 +158,16 @@ class PasdBusComponentManager(PollingComponentManager[PasdBusRequest, PasdBusRes
         smartbox_ids: list[int],
         enable_pymodbus_logging: bool,
         pymodbus_log_dir: Optional[str],
+        read_coalescing_max_gap: int = 32,
+        poll_schedule: str = "",
+        max_failure_backoff: float = 60.0,
+        bus_failure_device_count: int = 2,
+        flight_recorder_size: int = 1000,
+        port_power_current_limit: float = 0.0,
+        port_power_current: float = 0.5,
+        port_power_min_voltage: float = 0.0,
+        port_power_max_hold_time: float = 60.0,
+        pasd_device_response_callback: Optional[Callable[[int], None]] = None,
     ) -> None:
         """
         Initialise a new instance.
@@ -152,8 +178,11 @@ class PasdBusComponentManager(PollingComponentManager[PasdBusRequest, PasdBusRes
             on the PaSD bus
         :param device_polling_rate: minimum amount of time between communications
             with the same device.
-        :param poll_delay_after_failure: time in seconds to wait before next poll
-            after a comms failure
+        :param poll_delay_after_failure: time in seconds to wait before the next
+            poll of a device after it fails to respond. This doubles with each
+            consecutive failure of the device. If several devices fail in a
+            row, the bus itself is assumed to have failed, and all polling is
+            delayed by this time.
         :param attribute_read_delay: time in seconds to wait after writing an
             attribute before reading it again
         :param port_status_read_delay: time in seconds to wait after setting
@@ -188,6 +217,35 @@ class PasdBusComponentManager(PollingComponentManager[PasdBusRequest, PasdBusRes
             each FNDH port.
         :param enable_pymodbus_logging: whether to enable pymodbus logging
         :param pymodbus_log_dir: optional directory path for pymodbus logging
+        :param read_coalescing_max_gap: the maximum number of unused registers
+            between two attribute groups read one after the other, for them to
+            be merged into a single Modbus block read. A negative value
+            disables merging.
+        :param poll_schedule: a YAML or JSON poll schedule specification,
+            setting how often each attribute group is read. An empty string
+            reads every group in every poll cycle.
+        :param max_failure_backoff: the maximum time in seconds to wait
+            before the next poll of a device that keeps failing to respond.
+        :param bus_failure_device_count: the number of different devices
+            that must fail, with no successful polls in between, for the
+            failure to be attributed to the bus rather than the devices.
+        :param flight_recorder_size: the number of most recent transactions
+            to keep in the flight recorder. Zero disables it.
+        :param port_power_current_limit: the FNDH PSU current, in amps, that
+            powering on FNDH ports should not exceed. If positive, ports are
+            powered on in batches planned from the PSU readings, rather than
+            one at a time ``port_power_delay`` apart.
+        :param port_power_current: the estimated current, in amps, drawn by
+            each FNDH port once it is powered on.
+        :param port_power_min_voltage: the FNDH PSU voltage below which no
+            more FNDH ports are powered on. Zero disables the voltage check.
+        :param port_power_max_hold_time: the time in seconds for which FNDH
+            port power-on is held for lack of PSU headroom before the pending
+            ports are dropped. Zero holds them indefinitely.
+        :param pasd_device_response_callback: optional callback to be called
+            with the device number, once all of the state changes read in a
+            single poll response of a PaSD device have been passed to
+            ``pasd_device_state_callback``.
         """
         self._logger = logger
         self._pasd_bus_api_client = PasdBusModbusApiClient(
@@ -199,13 +257,42 @@ class PasdBusComponentManager(PollingComponentManager[PasdBusRequest, PasdBusRes
             pymodbus_log_dir,
         )
 
-        self._pasd_bus_device_state_callback = pasd_device_state_callback
+        # State updates are published on their own thread, so that slow
+        # Tango clients can't slow down polling.
+        self._state_publisher = PasdStatePublisher(
+            pasd_device_state_callback,
+            logger,
+            response_callback=pasd_device_response_callback,
+        )
+        self._pasd_bus_device_state_callback = self._state_publisher.publish
+        self._rtt_estimators: dict[tuple[int, str], RttEstimator] = {}
+        self._latency_monitor = LatencyMonitor()
+        self._flight_recorder = FlightRecorder(flight_recorder_size)
+        self._port_power_timing = PortPowerTimingTracker()
         self._polling_rate = polling_rate
         self._poll_delay_after_failure = poll_delay_after_failure
         self._attribute_read_delay = attribute_read_delay
         self._port_status_read_delay = port_status_read_delay
         self._port_power_delay = port_power_delay
         self._smartbox_startup_delay = smartbox_startup_delay
+        self._poll_schedules = load_poll_schedules(poll_schedule)
+        self._read_plan: dict[str, list[ReadBlock]] = {}
+        self._read_cycles: dict[str, list[str]] = {}
+        self._read_planners = self._create_read_planners(
+            read_coalescing_max_gap, self._poll_schedules
+        )
+        periodic_reads = {
+            controller: schedule.periodic
+            for controller, schedule in self._poll_schedules.items()
+        }
+        max_ages = {
+            controller: schedule.max_ages
+            for controller, schedule in self._poll_schedules.items()
+        }
+        self._logger.info(
+            f"PaSD bus read cycles: {self._read_cycles}, "
+            f"periodic reads: {periodic_reads}, maximum ages: {max_ages}"
+        )
         self._request_provider = PasdBusRequestProvider(
             int(device_polling_rate / polling_rate),
             self._logger,
@@ -214,6 +301,16 @@ class PasdBusComponentManager(PollingComponentManager[PasdBusRequest, PasdBusRes
             self._port_power_delay,
             smartbox_ids,
             smartbox_startup_delay,
+            read_cycles=self._read_cycles,
+            periodic_reads=periodic_reads,
+            max_ages=max_ages,
+            failure_backoff=poll_delay_after_failure,
+            max_failure_backoff=max_failure_backoff,
+            bus_failure_device_count=bus_failure_device_count,
+            port_power_current_limit=port_power_current_limit,
+            port_power_current=port_power_current,
+            port_power_min_voltage=port_power_min_voltage,
+            port_power_max_hold_time=port_power_max_hold_time,
         )
         self._poll_failure_tracker = PollFailureTracker(
             failed_poll_window,
@@ -225,6 +322,9 @@ class PasdBusComponentManager(PollingComponentManager[PasdBusRequest, PasdBusRes
         self._connection_reset_count = 0
         self._poll_delay_event = threading.Event()
         self._current_poll_device: int = 0
+        self._current_poll_kind = ""
+        self._current_poll_timestamp = 0.0
+        self._current_poll_latency = 0.0
 
         super().__init__(
             logger,
@@ -237,6 +337,184 @@ class PasdBusComponentManager(PollingComponentManager[PasdBusRequest, PasdBusRes
         # race in upstream poller implementation (ska-tango-base 1.4.2).
         time.sleep(_POLL_THREAD_STARTUP_DELAY)
 
+    def _create_read_planners(
+        self: PasdBusComponentManager,
+        max_gap: int,
+        poll_schedules: dict[str, PollSchedule],
+    ) -> dict[str, PasdBusReadPlanner]:
+        """
+        Create a read planner for each type of PaSD device, and plan its reads.
+
+        Each cycle of a device type's poll schedule is planned separately,
+        and the block reads of all the cycles make up its read plan. In its
+        read cycle, a cycle with nothing to read is replaced by an empty
+        read, so that the device gives up its turn to be polled.
+
+        :param max_gap: the maximum number of unused registers between
+            attribute groups for them to be merged into a single block read.
+        :param poll_schedules: the compiled poll schedule of each type of
+            PaSD device.
+
+        :return: a dictionary of read planners, keyed by controller type.
+        """
+        groups: dict[str, dict[str, list[str]]] = {
+            "FNCC": {
+                "INFO": self.STATIC_INFO_ATTRIBUTES,
+                "STATUS": self.FNCC_STATUS_ATTRIBUTES,
+            },
+            "FNPC": {
+                "INFO": self.STATIC_INFO_ATTRIBUTES,
+                "STATUS": self.FNDH_STATUS_ATTRIBUTES,
+                "PORTS": self.FNDH_PORTS_STATUS_ATTRIBUTES,
+                "THRESHOLDS": self.FNDH_THRESHOLD_ATTRIBUTES,
+                "WARNING_FLAGS": [self.WARNING_FLAGS_ATTRIBUTE],
+                "ALARM_FLAGS": [self.ALARM_FLAGS_ATTRIBUTE],
+            },
+            "FNSC": {
+                "INFO": self.STATIC_INFO_ATTRIBUTES,
+                "STATUS": self.SMARTBOX_STATUS_ATTRIBUTES,
+                "PORTS": self.SMARTBOX_PORTS_STATUS_ATTRIBUTES,
+                "THRESHOLDS": self.SMARTBOX_THRESHOLD_ATTRIBUTES,
+                "CURRENT_TRIP_THRESHOLDS": (
+                    self.SMARTBOX_CURRENT_TRIP_THRESHOLD_ATTRIBUTES
+                ),
+                "WARNING_FLAGS": [self.WARNING_FLAGS_ATTRIBUTE],
+                "ALARM_FLAGS": [self.ALARM_FLAGS_ATTRIBUTE],
+            },
+        }
+        read_planners = {}
+        for controller, controller_groups in groups.items():
+            read_planners[controller] = PasdBusReadPlanner(
+                PasdData.CONTROLLERS_CONFIG[controller]["registers"],
+                controller_groups,
+                max_gap,
+                self._logger,
+            )
+            cycle_plans = [
+                read_planners[controller].plan_cycle(cycle)
+                for cycle in poll_schedules[controller].cycles
+            ]
+            self._read_plan[controller] = [
+                block for cycle_plan in cycle_plans for block in cycle_plan
+            ]
+            self._read_cycles[controller] = [
+                name
+                for cycle_plan in cycle_plans
+                for name in ([block.name for block in cycle_plan] or [""])
+            ]
+        return read_planners
+
+    def _get_read_planner(
+        self: PasdBusComponentManager, device_id: int
+    ) -> PasdBusReadPlanner:
+        match device_id:
+            case PasdData.FNDH_DEVICE_ID:
+                return self._read_planners["FNPC"]
+            case PasdData.FNCC_DEVICE_ID:
+                return self._read_planners["FNCC"]
+            case _:
+                return self._read_planners["FNSC"]
+
+    @property
+    def read_plan(self: PasdBusComponentManager) -> dict[str, list[dict[str, Any]]]:
+        """
+        Return the block reads that make up each device's poll cycle.
+
+        Groups that are read on a timer, or according to their staleness,
+        rather than in the poll cycle, are listed after the poll cycle, along
+        with their period or maximum age in seconds.
+
+        :return: a dictionary, keyed by device prefix, of lists of block
+            read descriptions.
+        """
+        read_plan = {}
+        for controller, blocks in self._read_plan.items():
+            planner = self._read_planners[controller]
+            read_plan[PasdData.CONTROLLERS_CONFIG[controller]["prefix"]] = (
+                [block.to_dict() for block in blocks]
+                + [
+                    {**block.to_dict(), "period": period}
+                    for group, period in self._poll_schedules[
+                        controller
+                    ].periodic.items()
+                    for block in planner.plan_cycle([group])
+                ]
+                + [
+                    {**block.to_dict(), "max_age": max_age}
+                    for group, max_age in self._poll_schedules[
+                        controller
+                    ].max_ages.items()
+                    for block in planner.plan_cycle([group])
+                ]
+            )
+        return read_plan
+
+    def _get_rtt_estimator(
+        self: PasdBusComponentManager, device_id: int, kind: str
+    ) -> RttEstimator:
+        if (device_id, kind) not in self._rtt_estimators:
+            self._rtt_estimators[(device_id, kind)] = RttEstimator()
+        return self._rtt_estimators[(device_id, kind)]
+
+    @property
+    def rtt_estimates(
+        self: PasdBusComponentManager,
+    ) -> dict[str, dict[str, dict[str, Any]]]:
+        """
+        Return the estimated round-trip time of each kind of request to each device.
+
+        :return: a dictionary, keyed by device ID and then kind of request, of
+            the smoothed round-trip time, its mean deviation, and the number
+            of measurements.
+        """
+        rtt_estimates: dict[str, dict[str, dict[str, Any]]] = {}
+        for (device_id, kind), rtt_estimator in list(self._rtt_estimators.items()):
+            rtt_estimates.setdefault(str(device_id), {})[kind] = rtt_estimator.to_dict()
+        return rtt_estimates
+
+    @property
+    def state_publisher(self: PasdBusComponentManager) -> PasdStatePublisher:
+        """
+        Return the publisher of PaSD device state updates.
+
+        :return: the state publisher, which reports how many updates are
+            queued for publishing, and how many have been superseded or dropped.
+        """
+        return self._state_publisher
+
+    @property
+    def latency_monitor(self: PasdBusComponentManager) -> LatencyMonitor:
+        """
+        Return the monitor of the latency of transactions on the bus.
+
+        :return: the latency monitor, which has histograms of the latency
+            of every transaction, and of transactions with each device and of
+            each kind of request.
+        """
+        return self._latency_monitor
+
+    @property
+    def poll_sla_statistics(
+        self: PasdBusComponentManager,
+    ) -> dict[str, dict[str, dict[str, float]]]:
+        """
+        Return how well the maximum age of each attribute group is being met.
+
+        This is only populated when the poll schedule is scheduling reads
+        according to their staleness.
+
+        :return: a dictionary, keyed by device prefix and then attribute
+            group, of the number of reads and SLA misses, the miss rate, and
+            the worst age at which the group was read.
+        """
+        return {
+            PasdData.CONTROLLERS_CONFIG[controller]["prefix"]: statistics
+            for controller, statistics in (
+                self._request_provider.get_sla_statistics().items()
+            )
+            if statistics
+        }
+
     def off(
         self: PasdBusComponentManager, task_callback: Optional[Callable] = None
     ) -> tuple[TaskStatus, str]:
@@ -308,7 +586,7 @@ class PasdBusComponentManager(PollingComponentManager[PasdBusRequest, PasdBusRes
         self._pasd_bus_api_client.reset_connection()
 
     # TODO: None return is reasonable and should be supported by ska-tango-base
-    def get_request(  # type: ignore[override]
+    def get_request(  # type: ignore[override] # pylint: disable=too-many-locals
         self: PasdBusComponentManager,
     ) -> PasdBusRequest | None:
         """
@@ -375,80 +653,30 @@ class PasdBusComponentManager(PollingComponentManager[PasdBusRequest, PasdBusRes
                         self._pasd_bus_device_state_callback(
                             smartbox_id, stopped_polling=True
                         )
-            case (device_id, "INFO", None):
-                request = PasdBusRequest(
-                    device_id, None, None, self.STATIC_INFO_ATTRIBUTES
-                )
             case (device_id, "RESET_ALARMS", None):
                 request = PasdBusRequest(device_id, "reset_alarms", None, [])
             case (device_id, "RESET_WARNINGS", None):
                 request = PasdBusRequest(device_id, "reset_warnings", None, [])
-            case (PasdData.FNDH_DEVICE_ID, "STATUS", None):
-                request = PasdBusRequest(
-                    PasdData.FNDH_DEVICE_ID, None, None, self.FNDH_STATUS_ATTRIBUTES
-                )
-            case (PasdData.FNDH_DEVICE_ID, "PORTS", None):
-                request = PasdBusRequest(
-                    PasdData.FNDH_DEVICE_ID,
-                    None,
-                    None,
-                    self.FNDH_PORTS_STATUS_ATTRIBUTES,
-                )
-            case (PasdData.FNDH_DEVICE_ID, "THRESHOLDS", None):
-                request = PasdBusRequest(
-                    PasdData.FNDH_DEVICE_ID, None, None, self.FNDH_THRESHOLD_ATTRIBUTES
-                )
-            case (PasdData.FNDH_DEVICE_ID, "ALARM_FLAGS", None):
-                request = PasdBusRequest(
-                    PasdData.FNDH_DEVICE_ID, None, None, [self.ALARM_FLAGS_ATTRIBUTE]
-                )
-            case (PasdData.FNDH_DEVICE_ID, "WARNING_FLAGS", None):
-                request = PasdBusRequest(
-                    PasdData.FNDH_DEVICE_ID, None, None, [self.WARNING_FLAGS_ATTRIBUTE]
-                )
-
-            case (PasdData.FNCC_DEVICE_ID, "STATUS", None):
-                request = PasdBusRequest(
-                    PasdData.FNCC_DEVICE_ID, None, None, self.FNCC_STATUS_ATTRIBUTES
-                )
-
             case (PasdData.FNCC_DEVICE_ID, "RESET_STATUS", None):
                 request = PasdBusRequest(
                     PasdData.FNCC_DEVICE_ID, "reset_status", None, []
                 )
-
-            case (smartbox_id, "STATUS", None):
-                request = PasdBusRequest(
-                    smartbox_id, None, None, self.SMARTBOX_STATUS_ATTRIBUTES
-                )
-            case (smartbox_id, "PORTS", None):
-                request = PasdBusRequest(
-                    smartbox_id, None, None, self.SMARTBOX_PORTS_STATUS_ATTRIBUTES
-                )
-            case (smartbox_id, "THRESHOLDS", None):
+            case (device_id, str(group), None) if (
+                read_block := self._get_read_planner(device_id).get_block(group)
+            ) is not None:
                 request = PasdBusRequest(
-                    smartbox_id, None, None, self.SMARTBOX_THRESHOLD_ATTRIBUTES
-                )
-            case (smartbox_id, "CURRENT_TRIP_THRESHOLDS", None):
-                request = PasdBusRequest(
-                    smartbox_id,
+                    device_id,
                     None,
                     None,
-                    self.SMARTBOX_CURRENT_TRIP_THRESHOLD_ATTRIBUTES,
-                )
-            case (smartbox_id, "ALARM_FLAGS", None):
-                request = PasdBusRequest(
-                    smartbox_id, None, None, [self.ALARM_FLAGS_ATTRIBUTE]
-                )
-            case (smartbox_id, "WARNING_FLAGS", None):
-                request = PasdBusRequest(
-                    smartbox_id, None, None, [self.WARNING_FLAGS_ATTRIBUTE]
+                    self._get_read_planner(device_id).get_attributes(group),
+                    read_block.group_attributes,
                 )
             case _:
                 message = f"Unrecognised poll request {repr(request_spec)}"
                 self._logger.error(message)
                 raise AssertionError(message)
 
+        request.kind = request_spec[1]
         return request
 
     def poll(
@@ -465,34 +693,89 @@ class PasdBusComponentManager(PollingComponentManager[PasdBusRequest, PasdBusRes
         :return: responses to queries in this poll
         """
         self._current_poll_device = poll_request.device_id
-        if poll_request.command is not None:
-            response_data = self._pasd_bus_api_client.execute_command(
-                poll_request.device_id,
-                poll_request.command,
-                *poll_request.arguments,
-            )
-        elif poll_request.attribute_to_write is not None:
-            if isinstance(poll_request.arguments, int):
-                response_data = self._pasd_bus_api_client.write_attribute(
+        self._current_poll_kind = poll_request.kind
+        self._current_poll_timestamp = time.time()
+        start_time = time.perf_counter()
+        try:
+            if poll_request.command is not None:
+                response_data = self._pasd_bus_api_client.execute_command(
                     poll_request.device_id,
-                    poll_request.attribute_to_write,
-                    poll_request.arguments,
+                    poll_request.command,
+                    *poll_request.arguments,
                 )
+            elif poll_request.attribute_to_write is not None:
+                if isinstance(poll_request.arguments, int):
+                    response_data = self._pasd_bus_api_client.write_attribute(
+                        poll_request.device_id,
+                        poll_request.attribute_to_write,
+                        poll_request.arguments,
+                    )
+                else:
+                    response_data = self._pasd_bus_api_client.write_attribute(
+                        poll_request.device_id,
+                        poll_request.attribute_to_write,
+                        *poll_request.arguments,
+                    )
             else:
-                response_data = self._pasd_bus_api_client.write_attribute(
-                    poll_request.device_id,
-                    poll_request.attribute_to_write,
-                    *poll_request.arguments,
+                response_data = self._pasd_bus_api_client.read_attributes(
+                    poll_request.device_id, *poll_request.arguments
                 )
-        else:
-            response_data = self._pasd_bus_api_client.read_attributes(
-                poll_request.device_id, *poll_request.arguments
+        finally:
+            latency = time.perf_counter() - start_time
+            self._current_poll_latency = latency
+            self._latency_monitor.record(
+                poll_request.device_id, poll_request.kind, latency
+            )
+        if "error" not in response_data:
+            self._get_rtt_estimator(
+                poll_request.device_id, poll_request.kind
+            ).record_rtt(latency)
+            self._port_power_timing.record_transaction(
+                poll_request.device_id,
+                poll_request.kind,
+                (
+                    poll_request.attribute_to_write
+                    if poll_request.attribute_to_write is not None
+                    else poll_request.arguments
+                ),
+                self._current_poll_timestamp,
             )
 
         return PasdBusResponse(
-            poll_request.device_id, poll_request.command, response_data
+            poll_request.device_id,
+            poll_request.command,
+            response_data,
+            poll_request.groups,
         )
 
+    def _record_port_and_psu_readings(
+        self: PasdBusComponentManager, poll_response: PasdBusResponse
+    ) -> None:
+        """
+        Pass the port power states and PSU readings read during a poll on.
+
+        :param poll_response: response to the poll, including any values
+            read.
+        """
+        if "ports_power_sensed" in poll_response.data:
+            if poll_response.device_id == PasdData.FNDH_DEVICE_ID:
+                # Update the smartbox polling list here on the poll thread,
+                # rather than when the new port power states are published.
+                self.update_port_power_states(poll_response.data["ports_power_sensed"])
+            self._port_power_timing.record_ports_sensed(
+                poll_response.device_id, poll_response.data["ports_power_sensed"]
+            )
+
+        if (
+            poll_response.device_id == PasdData.FNDH_DEVICE_ID
+            and "psu48v_current" in poll_response.data
+        ):
+            # The PSU readings plan the batches in which FNDH ports are powered on.
+            self._request_provider.update_psu_readings(
+                poll_response.data["psu48v_current"],
+                poll_response.data.get("psu48v_voltage_1"),
+            )
+
     def poll_succeeded(
         self: PasdBusComponentManager, poll_response: PasdBusResponse
     ) -> None:
@@ -508,23 +791,52 @@ class PasdBusComponentManager(PollingComponentManager[PasdBusRequest, PasdBusRes
         super().poll_succeeded(poll_response)
 
         if "error" in poll_response.data:
-            # Set the event to delay the next poll
+            self._record_transaction(
+                TransactionOutcome.ERROR_RESPONSE,
+                str(poll_response.data["error"].get("code", "")),
+            )
             command_info = (
                 f" for command {poll_response.command}" if poll_response.command else ""
             )
             self._logger.error(
                 f"Error response from device {poll_response.device_id}{command_info}: "
-                f"{poll_response.data['error']['detail']}. Delaying next poll..."
+                f"{poll_response.data['error']['detail']}."
             )
-            self._poll_delay_event.set()
+            if self._request_provider.record_poll_failure(poll_response.device_id):
+                # Several devices have failed in a row,
+                # so set the event to delay the next poll
+                self._logger.error("Several devices failing. Delaying next poll...")
+                self._poll_delay_event.set()
+        else:
+            self._record_transaction(TransactionOutcome.OK)
+            self._request_provider.record_poll_success(poll_response.device_id)
 
         self._update_component_state(power=PowerState.ON, fault=False)
+        self._record_port_and_psu_readings(poll_response)
 
         if poll_response.command is None:
-            self._pasd_bus_device_state_callback(
-                poll_response.device_id,
-                **(poll_response.data),
-            )
+            if len(poll_response.groups) > 1 and "error" not in poll_response.data:
+                # Split a merged block read back into its attribute groups,
+                # so that each group is reported just as if read on its own.
+                remaining = dict(poll_response.data)
+                for group in poll_response.groups:
+                    group_data = {
+                        name: remaining.pop(name) for name in group if name in remaining
+                    }
+                    if group_data:
+                        self._pasd_bus_device_state_callback(
+                            poll_response.device_id, **group_data
+                        )
+                if remaining:
+                    self._pasd_bus_device_state_callback(
+                        poll_response.device_id, **remaining
+                    )
+            else:
+                self._pasd_bus_device_state_callback(
+                    poll_response.device_id,
+                    **(poll_response.data),
+                )
+            self._state_publisher.end_response(poll_response.device_id)
 
     def poll_failed(self: PasdBusComponentManager, exception: Exception) -> None:
         """
@@ -536,19 +848,56 @@ class PasdBusComponentManager(PollingComponentManager[PasdBusRequest, PasdBusRes
             attempt.
         """
         super().poll_failed(exception)
+        self._record_transaction(TransactionOutcome.FAILED, type(exception).__name__)
         if not isinstance(exception, ValueError):
             # Some kind of Modbus error or network interruption must have occurred
-            # so attempt to reset the connection
-            self.reset_connection()
-            # Set the event to delay the next poll
             self._logger.error(
                 f"Problem communicating with device {self._current_poll_device}."
             )
-            self._poll_delay_event.set()
             self.record_poll_failure(self._current_poll_device)
-            # Request the FNPC SYS_STATUS register next which can help
-            # to re-establish comms
-            self.request_status_read()
+            # Back off from the failing device. Only if several devices have
+            # failed in a row is the connection itself likely to be at fault.
+            if self._request_provider.record_poll_failure(self._current_poll_device):
+                self.reset_connection()
+                # Set the event to delay the next poll
+                self._poll_delay_event.set()
+                # Request the FNPC SYS_STATUS register next which can help
+                # to re-establish comms
+                self.request_status_read()
+
+    def _record_transaction(
+        self: PasdBusComponentManager, outcome: TransactionOutcome, error: str = ""
+    ) -> None:
+        self._flight_recorder.record(
+            self._current_poll_timestamp,
+            self._current_poll_device,
+            self._current_poll_kind,
+            self._current_poll_latency,
+            outcome,
+            error,
+        )
+
+    def dump_flight_recorder(self: PasdBusComponentManager) -> dict[str, Any]:
+        """
+        Return the most recent transactions recorded by the flight recorder.
+
+        :return: a compact, JSON-serialisable description of the recorded
+            transactions, oldest first.
+        """
+        return self._flight_recorder.dump()
+
+    def command_timing_reports(
+        self: PasdBusComponentManager, command_id: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Return the timing reports of the most recent port power commands.
+
+        :param command_id: only return the reports of the port power
+            commands made as part of the command with this ID.
+
+        :return: a list of timing reports, oldest first.
+        """
+        return self._port_power_timing.reports(command_id)
 
     def record_poll_failure(self, device_id: int) -> None:
         """Record a poll failure.
@@ -638,6 +987,7 @@ class PasdBusComponentManager(PollingComponentManager[PasdBusRequest, PasdBusRes
         self: PasdBusComponentManager,
         port_powers: list[bool | None],
         stay_on_when_offline: bool,
+        command_id: Optional[str] = None,
     ) -> None:
         """
         Set the FNDH port powers.
@@ -646,7 +996,12 @@ class PasdBusComponentManager(PollingComponentManager[PasdBusRequest, PasdBusRes
             True means on, False means off, None means no change desired.
         :param stay_on_when_offline: whether any ports being turned on
             should remain on if MCCS loses its connection with the PaSD.
+        :param command_id: the ID of the command that this is part of,
+            to correlate its timing report with.
         """
+        self._port_power_timing.start(
+            "SetFndhPortPowers", PasdData.FNDH_DEVICE_ID, port_powers, command_id
+        )
         self._request_provider.desire_port_powers(
             PasdData.FNDH_DEVICE_ID, port_powers, stay_on_when_offline
         )
@@ -665,6 +1020,7 @@ class PasdBusComponentManager(PollingComponentManager[PasdBusRequest, PasdBusRes
         if task_callback is not None:
             task_callback(status=TaskStatus.IN_PROGRESS)
         self._request_provider.abort()
+        self._port_power_timing.abort()
         if task_callback is not None:
             task_callback(
                 status=TaskStatus.COMPLETED,
@@ -736,6 +1092,7 @@ class PasdBusComponentManager(PollingComponentManager[PasdBusRequest, PasdBusRes
         smartbox_id: int,
         port_powers: list[bool | None],
         stay_on_when_offline: bool,
+        command_id: Optional[str] = None,
     ) -> None:
         """
         Set the smartbox's port powers.
@@ -745,7 +1102,12 @@ class PasdBusComponentManager(PollingComponentManager[PasdBusRequest, PasdBusRes
             True means on, False means off, None means no change desired.
         :param stay_on_when_offline: whether any ports being turned on
             should remain on if MCCS loses its connection with the PaSD.
+        :param command_id: the ID of the command that this is part of,
+            to correlate its timing report with.
         """
+        self._port_power_timing.start(
+            "SetSmartboxPortPowers", smartbox_id, port_powers, command_id
+        )
         self._request_provider.desire_port_powers(
             smartbox_id, port_powers, stay_on_when_offline
         )
@@ -839,6 +1201,7 @@ class PasdBusComponentManager(PollingComponentManager[PasdBusRequest, PasdBusRes
         """Delete and clean up any remaining processes."""
         self.stop_communicating()
         self._poll_failure_tracker.cleanup()
+        self._state_publisher.stop()
         # Stop communicating will not actually stop the polling thread, but it pauses
         # it. If we set the state to killed this will exit the while loop and stops it.
         with self._poller._condition:
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+This module implements deadband filtering of PaSD attribute values.
+
+Most PaSD registers are polled continually, but their values hardly change
+in steady-state operation. A register may be configured with an absolute
+deadband (``abs_deadband``) and a relative deadband in percent
+(``rel_deadband``) in the PaSD controllers' configuration. A newly polled
+value that is within the deadbands of the last published value is not
+published at all.
+"""
+from __future__ import annotations
+
+from typing import Any, Optional
+
+__all__ = ["within_deadband"]
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _within(
+    old: Any,
+    new: Any,
+    abs_deadband: Optional[float],
+    rel_deadband: Optional[float],
+) -> bool:
+    if not (_is_number(old) and _is_number(new)):
+        return old == new
+    change = abs(new - old)
+    if abs_deadband is not None and change > abs_deadband:
+        return False
+    if rel_deadband is not None and change > abs(old) * rel_deadband / 100:
+        return False
+    return True
+
+
+def within_deadband(
+    old: Any,
+    new: Any,
+    abs_deadband: Optional[float],
+    rel_deadband: Optional[float],
+) -> bool:
+    """
+    Return whether a new value is within the deadband of an old value.
+
+    Numeric values are within the deadband if they differ by no more than
+    each of the deadbands that are set. Other values, such as strings and
+    flags, are only within the deadband if they are equal. A list is within
+    the deadband if every element is.
+
+    :param old: the last published value.
+    :param new: the newly polled value.
+    :param abs_deadband: the absolute deadband, or None.
+    :param rel_deadband: the relative deadband in percent of the old value,
+        or None.
+
+    :return: whether the new value is within the deadband, and so need not
+        be published. If neither deadband is set, this is always False.
+    """
+    if abs_deadband is None and rel_deadband is None:
+        return False
+    if isinstance(old, (list, tuple)) and isinstance(new, (list, tuple)):
+        return len(old) == len(new) and all(
+            _within(old_element, new_element, abs_deadband, rel_deadband)
+            for old_element, new_element in zip(old, new)
+        )
+    return _within(old, new, abs_deadband, rel_deadband)
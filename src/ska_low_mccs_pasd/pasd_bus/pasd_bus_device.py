@@ -13,9 +13,9 @@ import importlib.resources
 import json
 import logging
 import sys
-from dataclasses import dataclass
+import time
 from datetime import datetime, timezone
-from typing import Any, Final, Optional, cast
+from typing import Any, Final, Optional
 
 import ska_tango_base as stb
 import tango.server
@@ -37,8 +37,23 @@ from tango.server import command
 
 from ska_low_mccs_pasd.pasd_data import PasdData
 
+from ..device_server import STARTUP_PROFILER
 from ..pasd_controllers_configuration import ControllerDict
+from .pasd_bus_attribute_index import PasdAttributeIndex
+from .pasd_bus_attribute_template import (
+    PasdAttributeTemplate,
+    build_attribute_templates,
+)
 from .pasd_bus_component_manager import PasdBusComponentManager
+from .pasd_bus_deadband import within_deadband
+from .pasd_bus_latency_histogram import LATENCY_BUCKET_EDGES, LATENCY_PERCENTILES
+from .pasd_bus_snapshot import (
+    SNAPSHOT_ATTRIBUTE_SUFFIX,
+    PasdSnapshot,
+    encode_snapshot,
+    encode_state_snapshot,
+)
+from .pasd_bus_state_store import PasdStateStore
 from .poll_failure_tracker import PollFailureSnapshot
 
 __all__ = ["MccsPasdBus"]
@@ -47,18 +62,7 @@ __all__ = ["MccsPasdBus"]
 DevVarLongStringArrayType = tuple[list[ResultCode], list[Optional[str]]]
 
 
-@dataclass
-class PasdAttribute:
-    """Class representing the internal state of a PaSD attribute."""
-
-    tango_attribute_name: str
-    value: Any
-    quality: AttrQuality
-    timestamp: float
-    read_once: bool
-
-
-# pylint: disable=too-many-lines, too-many-instance-attributes
+# pylint: disable=too-many-lines, too-many-instance-attributes, too-many-public-methods
 class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
     """An implementation of a PaSD bus Tango device for MCCS."""
 
@@ -79,6 +83,16 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
     PollDelayAfterFailure: Final = tango.server.device_property(
         dtype=float, default_value=5.0
     )
+    # The delay before polling a device again after a failure doubles with each
+    # consecutive failure of that device, up to this maximum.
+    MaxPollDelayAfterFailure: Final = tango.server.device_property(
+        dtype=float, default_value=60.0
+    )
+    # The number of different devices that must fail in a row for the failure
+    # to be attributed to the bus, rather than to the devices themselves.
+    BusFailureDeviceCount: Final = tango.server.device_property(
+        dtype=int, default_value=2
+    )
     Timeout: Final = tango.server.device_property(dtype=float)
     # Default low-pass filtering cut-off frequency for sensor readings.
     # It is automatically written to all sensor registers of the FNDH and smartboxes
@@ -130,6 +144,29 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
         dtype=float, default_value=5.0
     )
 
+    # FNDH PSU current (A) that powering on FNDH ports should not exceed.
+    # If positive, ports are powered on in batches planned from the PSU readings,
+    # rather than one at a time PortPowerDelay apart.
+    PortPowerCurrentLimit: Final[float] = tango.server.device_property(
+        dtype=float, default_value=0.0
+    )
+
+    # Estimated current (A) drawn by each FNDH port once it is powered on.
+    PortPowerCurrent: Final[float] = tango.server.device_property(
+        dtype=float, default_value=0.5
+    )
+
+    # FNDH PSU voltage (V) below which no more FNDH ports are powered on.
+    PortPowerMinVoltage: Final[float] = tango.server.device_property(
+        dtype=float, default_value=0.0
+    )
+
+    # Time in seconds for which FNDH port power-on is held for lack of PSU
+    # headroom before the pending ports are dropped. Zero holds indefinitely.
+    PortPowerMaxHoldTime: Final[float] = tango.server.device_property(
+        dtype=float, default_value=60.0
+    )
+
     # Time in seconds to wait after a smartbox is powered on before polling it.
     SmartboxStartupDelay: Final[float] = tango.server.device_property(
         dtype=float, default_value=5.0
@@ -150,6 +187,31 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
         dtype=int, default_value=60
     )
 
+    # Maximum number of unused registers between two attribute groups that are
+    # polled one after the other, for them to be merged into a single Modbus
+    # block read. A negative value disables merging.
+    ReadCoalescingMaxGap: Final[int] = tango.server.device_property(
+        dtype=int, default_value=32
+    )
+
+    # YAML or JSON specification of how often each attribute group is polled,
+    # e.g. "{FNPC: {WARNING_FLAGS: {every: 4}}, FNCC: {STATUS: {period: 60}}}".
+    # By default every group is polled in every poll cycle.
+    PollSchedule: Final[str] = tango.server.device_property(dtype=str, default_value="")
+
+    # Number of most recent Modbus transactions kept by the flight recorder,
+    # which can be dumped with the DumpFlightRecorder command. Zero disables it.
+    FlightRecorderSize: Final[int] = tango.server.device_property(
+        dtype=int, default_value=1000
+    )
+
+    # Whether to add a snapshot attribute for each PaSD device, e.g.
+    # smartbox5Snapshot, which carries all of the values of each state update
+    # of the device, so that clients need only subscribe to one attribute.
+    SnapshotAttributes: Final[bool] = tango.server.device_property(
+        dtype=bool, default_value=False
+    )
+
     # ---------
     # Constants
     # ---------
@@ -242,6 +304,195 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
         doc="Health report for the PaSD communications bus",
     )
 
+    read_plan_signal = AttrSignal[str]()
+    readPlan = attribute_from_signal(  # noqa: N815
+        read_plan_signal,
+        dtype=str,
+        doc="JSON description of the Modbus block reads that make up the poll "
+        "cycle of each type of PaSD device, showing which attribute groups have "
+        "been merged into a single read.",
+    )
+
+    @tango.server.attribute(dtype=str)
+    def pollSlaStatistics(self: MccsPasdBus) -> str:  # noqa: N802
+        """
+        Return how well the maximum age of each attribute group is being met.
+
+        When the poll schedule is scheduling reads according to their
+        staleness, this reports, for each type of PaSD device and attribute
+        group, how many reads there have been, how many of them were later
+        than the group's maximum age, and the worst age at which it was read.
+
+        :return: a JSON string of SLA statistics.
+        """
+        return json.dumps(self.component_manager.poll_sla_statistics)
+
+    @tango.server.attribute(dtype=str)
+    def rttEstimates(self: MccsPasdBus) -> str:  # noqa: N802
+        """
+        Return the estimated round-trip time of each kind of request to each device.
+
+        For each device ID and kind of request (e.g. "INFO" or
+        "STATUS+PORTS"), this reports the smoothed round-trip time and its
+        mean deviation in seconds, and the number of measurements.
+
+        :return: a JSON string of round-trip time estimates.
+        """
+        return json.dumps(self.component_manager.rtt_estimates)
+
+    @tango.server.attribute(dtype=str)
+    def commandTimingReports(self: MccsPasdBus) -> str:  # noqa: N802
+        """
+        Return the timing reports of the most recent port power commands.
+
+        Each SetFndhPortPowers and SetSmartboxPortPowers command is timed
+        from when it is requested, through the Modbus writes to the device,
+        including any INITIALIZE and threshold writes, to when its ports are
+        read back in their desired states. Each report carries the command
+        ID it was given, if any.
+
+        :return: a JSON list of timing reports, oldest first.
+        """
+        return json.dumps(self.component_manager.command_timing_reports())
+
+    @tango.server.attribute(dtype=int)
+    def deadbandSuppressedUpdates(self: MccsPasdBus) -> int:  # noqa: N802
+        """
+        Return the number of polled values not published, being within deadband.
+
+        :return: the cumulative number of polled values that were within the
+            deadband of the last published value.
+        """
+        return self._deadband_suppressed_count
+
+    @tango.server.attribute(dtype=int)
+    def stateUpdateQueueDepth(self: MccsPasdBus) -> int:  # noqa: N802
+        """
+        Return the number of PaSD state updates waiting to be published.
+
+        :return: the number of queued state updates.
+        """
+        return self.component_manager.state_publisher.queue_depth
+
+    @tango.server.attribute(dtype=int)
+    def stateUpdatesSuperseded(self: MccsPasdBus) -> int:  # noqa: N802
+        """
+        Return the number of PaSD state updates superseded before publishing.
+
+        An update is superseded when the same attributes are read again
+        before it has been published, so only the newer values are published.
+
+        :return: the cumulative number of superseded state updates.
+        """
+        return self.component_manager.state_publisher.superseded_count
+
+    @tango.server.attribute(dtype=int)
+    def stateUpdatesDropped(self: MccsPasdBus) -> int:  # noqa: N802
+        """
+        Return the number of PaSD state updates dropped because the queue was full.
+
+        :return: the cumulative number of dropped state updates.
+        """
+        return self.component_manager.state_publisher.dropped_count
+
+    @tango.server.attribute(
+        dtype=(float,), max_dim_x=len(LATENCY_BUCKET_EDGES), unit="s"
+    )
+    def pollLatencyBucketEdges(self: MccsPasdBus) -> list[float]:  # noqa: N802
+        """
+        Return the upper edges of the poll latency histogram buckets.
+
+        :return: the bucket edges in seconds. The histogram has a final
+            bucket for latencies greater than the last edge.
+        """
+        return list(LATENCY_BUCKET_EDGES)
+
+    @tango.server.attribute(dtype=(int,), max_dim_x=len(LATENCY_BUCKET_EDGES) + 1)
+    def pollLatencyHistogram(self: MccsPasdBus) -> list[int]:  # noqa: N802
+        """
+        Return the histogram of the latency of every transaction on the bus.
+
+        :return: the number of transactions in each latency bucket.
+        """
+        return self.component_manager.latency_monitor.bus_histogram.counts
+
+    @tango.server.attribute(
+        dtype=(float,), max_dim_x=len(LATENCY_PERCENTILES), unit="s"
+    )
+    def pollLatencyPercentiles(self: MccsPasdBus) -> list[float]:  # noqa: N802
+        """
+        Return the p50, p95 and p99 latency of transactions on the bus.
+
+        :return: the estimated percentiles in seconds.
+        """
+        return self.component_manager.latency_monitor.bus_histogram.percentiles()
+
+    @tango.server.attribute(
+        dtype=(float,), max_dim_x=len(LATENCY_PERCENTILES), unit="s"
+    )
+    def fndhPollLatencyPercentiles(self: MccsPasdBus) -> list[float]:  # noqa: N802
+        """
+        Return the p50, p95 and p99 latency of transactions with the FNDH.
+
+        :return: the estimated percentiles in seconds.
+        """
+        return self.component_manager.latency_monitor.get_device_histogram(
+            PasdData.FNDH_DEVICE_ID
+        ).percentiles()
+
+    @tango.server.attribute(
+        dtype=(float,), max_dim_x=len(LATENCY_PERCENTILES), unit="s"
+    )
+    def fnccPollLatencyPercentiles(self: MccsPasdBus) -> list[float]:  # noqa: N802
+        """
+        Return the p50, p95 and p99 latency of transactions with the FNCC.
+
+        :return: the estimated percentiles in seconds.
+        """
+        return self.component_manager.latency_monitor.get_device_histogram(
+            PasdData.FNCC_DEVICE_ID
+        ).percentiles()
+
+    @tango.server.attribute(
+        dtype=(float,),
+        max_dim_x=PasdData.MAX_NUMBER_OF_SMARTBOXES_PER_STATION,
+        unit="s",
+    )
+    def smartboxPollLatencyP95(self: MccsPasdBus) -> list[float]:  # noqa: N802
+        """
+        Return the p95 latency of transactions with each smartbox.
+
+        :return: the estimated p95 latency in seconds, indexed by smartbox
+            id - 1.
+        """
+        latency_monitor = self.component_manager.latency_monitor
+        return [
+            latency_monitor.get_device_histogram(smartbox_id).percentile(95.0)
+            for smartbox_id in range(
+                1, PasdData.MAX_NUMBER_OF_SMARTBOXES_PER_STATION + 1
+            )
+        ]
+
+    @tango.server.attribute(dtype=str)
+    def pollLatencyHistograms(self: MccsPasdBus) -> str:  # noqa: N802
+        """
+        Return the poll latency histograms, by device and by kind of request.
+
+        :return: a JSON string of the bucket edges, and of the bucket counts,
+            mean, maximum and percentiles of the latency of transactions on
+            the bus, with each device, and of each kind of request.
+        """
+        return json.dumps(self.component_manager.latency_monitor.to_dict())
+
+    @tango.server.attribute(dtype=float, unit="%", max_warning=80.0)
+    def busUtilisation(self: MccsPasdBus) -> float:  # noqa: N802
+        """
+        Return the percentage of time for which the bus is busy.
+
+        :return: the percentage of time spent in Modbus transactions.
+        """
+        return self.component_manager.latency_monitor.utilisation
+
     # ---------------
     # Initialisation
     # ---------------
@@ -272,20 +523,52 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
             if smartbox_id != 0:
                 self.connected_smartboxes.append(smartbox_id)
 
-        self._pasd_state: dict[str, PasdAttribute] = {}
+        self._pasd_state = PasdStateStore(
+            sum(
+                len(controller["registers"])
+                * (len(self.connected_smartboxes) if key == "FNSC" else 1)
+                for key, controller in PasdData.CONTROLLERS_CONFIG.items()
+            )
+        )
+        self._deadband_suppressed_count = 0
         self._pasd_signals: dict[str, AttrSignal] = {}
-        for key, controller in PasdData.CONTROLLERS_CONFIG.items():
-            if key == "FNSC":
-                for smartbox_number in self.connected_smartboxes:
-                    self._setup_controller_attributes(controller, str(smartbox_number))
-            else:
-                self._setup_controller_attributes(controller)
+        self._snapshot_attribute_names: dict[int, str] = {}
+        self._snapshot_device_ids: dict[str, int] = {}
+        # The values updated by the poll response being published, if any,
+        # with the time of the latest update, keyed by device ID.
+        self._pending_snapshots: dict[int, tuple[float, dict[str, Any]]] = {}
+        with STARTUP_PROFILER.measure("dynamic attributes", self.get_name()):
+            start = time.perf_counter()
+            for key, controller in PasdData.CONTROLLERS_CONFIG.items():
+                # Only the smartboxes that are configured get attributes
+                prefixes = (
+                    [
+                        controller["prefix"] + str(smartbox_number)
+                        for smartbox_number in self.connected_smartboxes
+                    ]
+                    if key == "FNSC"
+                    else [controller["prefix"]]
+                )
+                self._setup_controller_attributes(controller, prefixes)
+            # Built after the attributes are set up, as that renames some of them
+            self._attribute_index = PasdAttributeIndex(
+                PasdData.CONTROLLERS_CONFIG, self.connected_smartboxes
+            )
+            if self.SnapshotAttributes:
+                for device_id in self._attribute_index.device_ids:
+                    self._setup_snapshot_attribute(device_id)
+            self.logger.info(
+                f"Created {len(self._pasd_signals)} PaSD attributes in "
+                f"{time.perf_counter() - start:.3f} s"
+            )
+
+        self.read_plan_signal = json.dumps(self.component_manager.read_plan)
 
         # Maintain a list of attributes which are normally only read once, on startup
         self._one_time_read_list = [
-            attribute.tango_attribute_name
-            for attribute in self._pasd_state.values()
-            if attribute.read_once
+            self._pasd_state.name(handle)
+            for handle in range(len(self._pasd_state))
+            if self._pasd_state.is_read_once(handle)
         ]
 
         self._build_state = sys.modules["ska_low_mccs_pasd"].__version_info__
@@ -298,6 +581,8 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
             f"\tPort: {self.Port}\n"
             f"\tPollingRate: {self.PollingRate}\n"
             f"\tPollDelayAfterFailure: {self.PollDelayAfterFailure}\n"
+            f"\tMaxPollDelayAfterFailure: {self.MaxPollDelayAfterFailure}\n"
+            f"\tBusFailureDeviceCount: {self.BusFailureDeviceCount}\n"
             f"\tDevicePollingRate: {self.DevicePollingRate}\n"
             f"\tTimeout: {self.Timeout}\n"
             f"\tLowPassFilterCutoff: {self.LowPassFilterCutoff}\n"
@@ -310,9 +595,17 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
             f"\tAttributeReadDelay: {self.AttributeReadDelay}\n"
             f"\tPortStatusReadDelay: {self.PortStatusReadDelay}\n"
             f"\tPortPowerDelay: {self.PortPowerDelay}\n"
+            f"\tPortPowerCurrentLimit: {self.PortPowerCurrentLimit}\n"
+            f"\tPortPowerCurrent: {self.PortPowerCurrent}\n"
+            f"\tPortPowerMinVoltage: {self.PortPowerMinVoltage}\n"
+            f"\tPortPowerMaxHoldTime: {self.PortPowerMaxHoldTime}\n"
             f"\tSmartboxStartupDelay: {self.SmartboxStartupDelay}\n"
             f"\tFailedPollWindow: {self.FailedPollWindow}\n"
             f"\tFailedPollPruneInterval: {self.FailedPollPruneInterval}\n"
+            f"\tReadCoalescingMaxGap: {self.ReadCoalescingMaxGap}\n"
+            f"\tPollSchedule: {self.PollSchedule}\n"
+            f"\tFlightRecorderSize: {self.FlightRecorderSize}\n"
+            f"\tSnapshotAttributes: {self.SnapshotAttributes}\n"
         )
         self.logger.info(
             "\n%s\n%s\n%s", str(self.GetVersionInfo()), version, properties
@@ -320,115 +613,143 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
         self.init_completed()
 
     def _setup_controller_attributes(
-        self: MccsPasdBus, controller_config: ControllerDict, id_no: str = ""
+        self: MccsPasdBus, controller_config: ControllerDict, prefixes: list[str]
     ) -> None:
         for register in controller_config["registers"].values():
-            data_type = self.TYPES[register["data_type"]]
             if register["tango_attr_name"] == "PasdStatus":
                 register["tango_attr_name"] = "Status"
-            self._setup_pasd_attribute(
-                controller_config["prefix"] + id_no + register["tango_attr_name"],
-                cast(
-                    type | tuple[type],
-                    (data_type if register["tango_dim_x"] == 1 else (data_type,)),
-                ),
-                max_dim_x=register["tango_dim_x"],
-                access=(
-                    tango.AttrWriteType.READ_WRITE
-                    if register["writable"]
-                    else tango.AttrWriteType.READ
-                ),
-                read_once=register["read_once"],
-            )
+        templates = build_attribute_templates(controller_config, self.TYPES)
+        for prefix in prefixes:
+            for template in templates:
+                self._setup_pasd_attribute(prefix + template.name, template)
 
     def _read_pasd_attribute(self, pasd_attribute: tango.Attribute) -> None:
-        attr_name = pasd_attribute.get_name()
-        attr_value = self._pasd_state[attr_name].value
+        handle = self._pasd_state.handle(pasd_attribute.get_name())
+        attr_value = self._pasd_state.value(handle)
         if attr_value is not None:
             pasd_attribute.set_value_date_quality(
                 attr_value,
-                self._pasd_state[attr_name].timestamp,
-                self._pasd_state[attr_name].quality,
+                self._pasd_state.timestamp(handle),
+                self._pasd_state.quality(handle),
             )
 
     def _write_pasd_attribute(self, pasd_attribute: tango.Attribute) -> None:
-        # Register the request with the component manager
-        tango_attr_name: str = pasd_attribute.get_name()
-        if tango_attr_name.startswith("fndh"):
-            tango_attr_name = tango_attr_name.removeprefix("fndh")
-            device_id = PasdData.FNDH_DEVICE_ID
-            controller_config = PasdData.CONTROLLERS_CONFIG["FNPC"]
-        elif tango_attr_name.startswith("fncc"):
-            tango_attr_name = tango_attr_name.removeprefix("fncc")
-            device_id = PasdData.FNCC_DEVICE_ID
-            controller_config = PasdData.CONTROLLERS_CONFIG["FNCC"]
-        else:
-            # Obtain smartbox number after 'smartbox' prefix
-            # This could be 1 or 2 digits
-            tango_attr_name = tango_attr_name.removeprefix("smartbox")
-            device_id = (
-                int(tango_attr_name[0:2])
-                if tango_attr_name[0:2].isdigit()
-                else int(tango_attr_name[0])
+        # Get the device and the name of the attribute (dict key) as
+        # understood by the Modbus API
+        pasd_attribute_key = self._attribute_index.get_pasd_attribute(
+            pasd_attribute.get_name()
+        )
+        if pasd_attribute_key is None:
+            self.logger.error(
+                f"Can't write unknown PaSD attribute {pasd_attribute.get_name()}."
             )
-            tango_attr_name = tango_attr_name.lstrip("0123456789")
-            controller_config = PasdData.CONTROLLERS_CONFIG["FNSC"]
+            return
+        device_id, key = pasd_attribute_key
 
         self.logger.debug(
             f"Requesting to write attribute: {pasd_attribute.get_name()} with value"
             f" {pasd_attribute.get_write_value()} for device {device_id}"
         )
-        # Get the name of the attribute (dict key) as understood by the Modbus API
-        for key, register in controller_config["registers"].items():
-            if register["tango_attr_name"] == tango_attr_name:
-                self.component_manager.write_attribute(
-                    device_id,
-                    key,
-                    pasd_attribute.get_write_value(ExtractAs.List),
-                )
-                break
+        # Register the request with the component manager
+        self.component_manager.write_attribute(
+            device_id,
+            key,
+            pasd_attribute.get_write_value(ExtractAs.List),
+        )
 
-    # pylint: disable=too-many-arguments,too-many-positional-arguments
     def _setup_pasd_attribute(
-        self: MccsPasdBus,
-        attribute_name: str,
-        data_type: type | tuple[type],
-        max_dim_x: Optional[int] = None,
-        access: tango.AttrWriteType = tango.AttrWriteType.READ,
-        read_once: bool = False,
+        self: MccsPasdBus, attribute_name: str, template: PasdAttributeTemplate
     ) -> None:
         # Initialize all attributes as INVALID until read from the h/w
-        self._pasd_state[attribute_name] = PasdAttribute(
-            value=None,
-            timestamp=0,
-            quality=AttrQuality.ATTR_INVALID,
-            read_once=read_once,
-            tango_attribute_name=attribute_name,
+        self._pasd_state.add(
+            attribute_name,
+            template.read_once,
+            template.abs_deadband,
+            template.rel_deadband,
         )
         signal: AttrSignal = AttrSignal(name=attribute_name)
         self._pasd_signals[attribute_name] = signal
-        # rel_change/archive_rel_change are only valid for numeric attributes
-        base_type = data_type[0] if isinstance(data_type, tuple) else data_type
-        change_event_kwargs: dict[str, Any] = (
-            {"rel_change": 1, "archive_rel_change": 1}
-            if base_type in (int, float)
-            else {}
-        )
         attr = attribute_from_signal(
             signal,
             name=attribute_name,
-            dtype=data_type,
-            access=access,
+            dtype=template.dtype,
+            access=template.access,
             label=attribute_name,
-            max_dim_x=max_dim_x,
+            max_dim_x=template.max_dim_x,
             fget=self._read_pasd_attribute,
             fset=self._write_pasd_attribute,
-            **change_event_kwargs,
+            **template.event_kwargs,
         )
         self.add_attribute(attr)
         self.set_change_event(attribute_name, True, self.VerifyEvents)
         self.set_archive_event(attribute_name, True, self.VerifyEvents)
 
+    def _setup_snapshot_attribute(self: MccsPasdBus, device_id: int) -> None:
+        attribute_name = (
+            self._attribute_index.get_prefix(device_id) + SNAPSHOT_ATTRIBUTE_SUFFIX
+        )
+        self._snapshot_attribute_names[device_id] = attribute_name
+        self._snapshot_device_ids[attribute_name] = device_id
+        signal: AttrSignal = AttrSignal(name=attribute_name)
+        self._pasd_signals[attribute_name] = signal
+        attr = attribute_from_signal(
+            signal,
+            name=attribute_name,
+            dtype=str,
+            label=attribute_name,
+            fget=self._read_snapshot_attribute,
+        )
+        self.add_attribute(attr)
+        self.set_change_event(attribute_name, True, self.VerifyEvents)
+
+    def _read_snapshot_attribute(self, snapshot_attribute: tango.Attribute) -> None:
+        device_id = self._snapshot_device_ids[snapshot_attribute.get_name()]
+        prefix_length = len(self._attribute_index.get_prefix(device_id))
+        values = {}
+        invalid = {}
+        timestamp = 0.0
+        tango_attribute_names = self._attribute_index.get_tango_attribute_names(
+            device_id
+        )
+        for tango_attribute_name, (value, quality, attr_timestamp) in zip(
+            tango_attribute_names,
+            self._pasd_state.copy(
+                self._pasd_state.handle(name) for name in tango_attribute_names
+            ),
+        ):
+            if value is None:
+                continue
+            timestamp = max(timestamp, attr_timestamp)
+            if quality == AttrQuality.ATTR_INVALID:
+                invalid[tango_attribute_name[prefix_length:]] = value
+            else:
+                values[tango_attribute_name[prefix_length:]] = value
+        snapshot_attribute.set_value(
+            encode_snapshot(PasdSnapshot(timestamp, values, invalid))
+        )
+
+    def _push_snapshot(
+        self: MccsPasdBus,
+        device_id: int,
+        timestamp: float,
+        values: dict[str, Any],
+        invalid: dict[str, Any],
+    ) -> None:
+        attribute_name = self._snapshot_attribute_names.get(device_id)
+        if attribute_name is None:
+            return
+        prefix_length = len(self._attribute_index.get_prefix(device_id))
+        encoded = encode_snapshot(
+            PasdSnapshot(
+                timestamp,
+                {name[prefix_length:]: value for name, value in values.items()},
+                {name[prefix_length:]: value for name, value in invalid.items()},
+            )
+        )
+        self.shared_bus.emit(
+            attribute_name, (encoded, timestamp, AttrQuality.ATTR_VALID)
+        )
+
     def _init_state_model(self: MccsPasdBus) -> None:
         super()._init_state_model()
         self._health_state = HealthState.UNKNOWN
@@ -518,6 +839,16 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
             self.SmartboxIDs,
             self.EnablePyModbusLogging,
             self.PyModbusLogDir,
+            read_coalescing_max_gap=self.ReadCoalescingMaxGap,
+            poll_schedule=self.PollSchedule,
+            max_failure_backoff=self.MaxPollDelayAfterFailure,
+            bus_failure_device_count=self.BusFailureDeviceCount,
+            flight_recorder_size=self.FlightRecorderSize,
+            port_power_current_limit=self.PortPowerCurrentLimit,
+            port_power_current=self.PortPowerCurrent,
+            port_power_min_voltage=self.PortPowerMinVoltage,
+            port_power_max_hold_time=self.PortPowerMaxHoldTime,
+            pasd_device_response_callback=self._pasd_device_response_callback,
         )
 
     def delete_device(self) -> None:
@@ -626,54 +957,35 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
     def _get_tango_attribute_name(
         self: MccsPasdBus, pasd_device_number: int, pasd_attribute_name: str
     ) -> str:
-        for controller in PasdData.CONTROLLERS_CONFIG.values():
-            if controller.get("modbus_address") == pasd_device_number:
-                for key, register in controller["registers"].items():
-                    if key == pasd_attribute_name:
-                        return controller["prefix"] + register["tango_attr_name"]
-        for key, register in PasdData.CONTROLLERS_CONFIG["FNSC"]["registers"].items():
-            if key == pasd_attribute_name:
-                return (
-                    PasdData.CONTROLLERS_CONFIG["FNSC"]["prefix"]
-                    + str(pasd_device_number)
-                    + register["tango_attr_name"]
-                )
-        return ""
+        return self._attribute_index.get_tango_attribute_name(
+            pasd_device_number, pasd_attribute_name
+        )
 
     def _mark_attributes_invalid(
         self: MccsPasdBus, device_id: int, attr_list: list[str], timestamp: float
     ) -> None:
-        attributes_marked_invalid = []
-        for pasd_attribute_name in attr_list:
-            tango_attribute_name = self._get_tango_attribute_name(
-                device_id, pasd_attribute_name
+        handles = [
+            self._pasd_state.handle(
+                self._get_tango_attribute_name(device_id, pasd_attribute_name)
+            )
+            for pasd_attribute_name in attr_list
+        ]
+        attributes_marked_invalid = {}
+        # Only push out a change event and log message
+        # for the attributes that were previously valid
+        for handle in self._pasd_state.mark_invalid(handles, timestamp):
+            tango_attribute_name = self._pasd_state.name(handle)
+            value = self._pasd_state.value(handle)
+            attributes_marked_invalid[tango_attribute_name] = value
+            self.shared_bus.emit(
+                tango_attribute_name,
+                (value, timestamp, AttrQuality.ATTR_INVALID),
             )
-            # Only push out a change event and log message
-            # if the attribute was previously valid
-            if (
-                self._pasd_state[tango_attribute_name].quality
-                != AttrQuality.ATTR_INVALID
-            ):
-                self._pasd_state[tango_attribute_name].timestamp = timestamp
-                self._pasd_state[
-                    tango_attribute_name
-                ].quality = AttrQuality.ATTR_INVALID
-                attributes_marked_invalid.append(tango_attribute_name)
-                self.shared_bus.emit(
-                    tango_attribute_name,
-                    (
-                        self._pasd_state[tango_attribute_name].value,
-                        timestamp,
-                        AttrQuality.ATTR_INVALID,
-                    ),
-                )
-                self._pasd_signals[tango_attribute_name] = self._pasd_state[
-                    tango_attribute_name
-                ].value
         if attributes_marked_invalid:
             self.logger.debug(
-                f"Marking attributes invalid: {attributes_marked_invalid}"
+                f"Marking attributes invalid: {list(attributes_marked_invalid)}"
             )
+            self._push_snapshot(device_id, timestamp, {}, attributes_marked_invalid)
 
     # pylint: disable=too-many-branches
     def _pasd_device_state_callback(  # noqa: C901
@@ -722,7 +1034,10 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
             self._mark_attributes_invalid(device_id, attr_list, timestamp)
             return
 
+        STARTUP_PROFILER.mark("first successful poll", self.get_name())
         updated_attributes = {}
+        updated_handles = []
+        end_of_poll_cycle = False
         for pasd_attribute_name, pasd_attribute_value in kwargs.items():
             tango_attribute_name = self._get_tango_attribute_name(
                 device_id, pasd_attribute_name
@@ -737,9 +1052,8 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
             if device_id == PasdData.FNDH_DEVICE_ID and tango_attribute_name.endswith(
                 "PortsPowerSensed"
             ):
-                # Inform the component manager of the new power states so that
-                # we can update the smartbox polling list
-                self.component_manager.update_port_power_states(pasd_attribute_value)
+                # The component manager has already updated the smartbox polling
+                # list from the new power states.
                 # Mark attributes invalid for any smartbox which we have stopped polling
                 new_polled_smartbox_ids = set(
                     self.component_manager.get_polled_smartbox_ids()
@@ -750,12 +1064,28 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
                     )
                 self._polled_smartbox_ids = new_polled_smartbox_ids
 
-            # Update the timestamp
-            self._pasd_state[tango_attribute_name].timestamp = timestamp
+            handle = self._pasd_state.handle(tango_attribute_name)
+            if self._pasd_state.is_valid(handle) and within_deadband(
+                self._pasd_state.value(handle),
+                pasd_attribute_value,
+                *self._pasd_state.deadbands(handle),
+            ):
+                # Nothing meaningful has changed, so don't publish anything
+                self._deadband_suppressed_count += 1
+            else:
+                updated_attributes[tango_attribute_name] = pasd_attribute_value
+                updated_handles.append(handle)
+            if tango_attribute_name.endswith("AlarmFlags") or (
+                device_id == PasdData.FNCC_DEVICE_ID
+                and tango_attribute_name.endswith("FieldNodeNumber")
+            ):
+                end_of_poll_cycle = True
 
-            self._pasd_state[tango_attribute_name].value = pasd_attribute_value
-            self._pasd_state[tango_attribute_name].quality = AttrQuality.ATTR_VALID
-            updated_attributes[tango_attribute_name] = pasd_attribute_value
+        # Update the whole response at once, before publishing any of it
+        self._pasd_state.update(
+            updated_handles, list(updated_attributes.values()), timestamp
+        )
+        for tango_attribute_name, pasd_attribute_value in updated_attributes.items():
             self.shared_bus.emit(
                 tango_attribute_name,
                 (
@@ -764,47 +1094,67 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
                     AttrQuality.ATTR_VALID,
                 ),
             )
-            self._pasd_signals[tango_attribute_name] = pasd_attribute_value
-            if tango_attribute_name.endswith("AlarmFlags") or (
-                device_id == PasdData.FNCC_DEVICE_ID
-                and tango_attribute_name.endswith("FieldNodeNumber")
-            ):
-                # This is the last register in the poll cycle, so at this point
-                # we check to see if any of the static 'read once' information has
-                # not yet been read successfully
-                match device_id:
-                    case PasdData.FNCC_DEVICE_ID:
-                        prefix = PasdData.FNCC_PREFIX
-                    case PasdData.FNDH_DEVICE_ID:
-                        prefix = PasdData.FNDH_PREFIX
-                    case _:
-                        prefix = PasdData.SMARTBOX_PREFIX + str(device_id)
-                filtered_list = [
-                    attr for attr in self._one_time_read_list if attr.startswith(prefix)
-                ]
-                if any(
-                    self._pasd_state[attribute].quality is AttrQuality.ATTR_INVALID
-                    for attribute in filtered_list
-                ):
-                    self.logger.debug(f"Re-requesting startup info for {prefix})")
-                    self.component_manager.request_startup_info(device_id)
-                    # Set the device's low-pass filter constants
-                    if self._simulation_mode == SimulationMode.FALSE:
-                        self._set_all_low_pass_filters_of_device(device_id)
-                    # Set the threshold overrides
-                    if device_id not in self.connected_smartboxes:
-                        continue
-                    if self.FEMCurrentTripThreshold is not None:
-                        self.component_manager.initialize_fem_current_trip_thresholds(
-                            device_id, self.FEMCurrentTripThreshold
-                        )
-                    if self.SBInputVoltageThresholds is not None:
-                        self.component_manager.initialize_sb_input_voltage_thresholds(
-                            device_id, self.SBInputVoltageThresholds
-                        )
+        if end_of_poll_cycle:
+            # This is the last register in the poll cycle, so at this point
+            # we check to see if any of the static 'read once' information has
+            # not yet been read successfully
+            self._check_startup_info(device_id)
 
         if updated_attributes:
             self.logger.debug(f"Updated PaSD state with values: {updated_attributes}")
+            if device_id in self._snapshot_attribute_names:
+                # A merged read is reported group by group, so the snapshot
+                # is pushed once the whole response has been reported.
+                _, pending = self._pending_snapshots.get(device_id, (timestamp, {}))
+                pending.update(updated_attributes)
+                self._pending_snapshots[device_id] = (timestamp, pending)
+
+    def _pasd_device_response_callback(self: MccsPasdBus, device_id: int) -> None:
+        """
+        Handle the end of the state changes of a poll response of a PaSD device.
+
+        This is a callback hook, called by the component manager once all of
+        the state changes read in a poll response have been handled by
+        :py:meth:`_pasd_device_state_callback`. It pushes a single snapshot
+        of all of the values that were updated.
+
+        :param device_id: id of the device that responded.
+        """
+        if device_id in self._pending_snapshots:
+            timestamp, values = self._pending_snapshots.pop(device_id)
+            self._push_snapshot(device_id, timestamp, values, {})
+
+    def _check_startup_info(self: MccsPasdBus, device_id: int) -> None:
+        match device_id:
+            case PasdData.FNCC_DEVICE_ID:
+                prefix = PasdData.FNCC_PREFIX
+            case PasdData.FNDH_DEVICE_ID:
+                prefix = PasdData.FNDH_PREFIX
+            case _:
+                prefix = PasdData.SMARTBOX_PREFIX + str(device_id)
+        filtered_list = [
+            attr for attr in self._one_time_read_list if attr.startswith(prefix)
+        ]
+        if any(
+            not self._pasd_state.is_valid(self._pasd_state.handle(attribute))
+            for attribute in filtered_list
+        ):
+            self.logger.debug(f"Re-requesting startup info for {prefix})")
+            self.component_manager.request_startup_info(device_id)
+            # Set the device's low-pass filter constants
+            if self._simulation_mode == SimulationMode.FALSE:
+                self._set_all_low_pass_filters_of_device(device_id)
+            # Set the threshold overrides
+            if device_id not in self.connected_smartboxes:
+                return
+            if self.FEMCurrentTripThreshold is not None:
+                self.component_manager.initialize_fem_current_trip_thresholds(
+                    device_id, self.FEMCurrentTripThreshold
+                )
+            if self.SBInputVoltageThresholds is not None:
+                self.component_manager.initialize_sb_input_voltage_thresholds(
+                    device_id, self.SBInputVoltageThresholds
+                )
 
     def _health_changed(
         self: MccsPasdBus, health: HealthState, health_report: str
@@ -897,7 +1247,10 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
     @stb.validators.validate_json_args
     @command(dtype_in=str, dtype_out="DevVarLongStringArray")
     def SetFndhPortPowers(
-        self: MccsPasdBus, port_powers: list[bool], stay_on_when_offline: bool
+        self: MccsPasdBus,
+        port_powers: list[bool],
+        stay_on_when_offline: bool,
+        command_id: Optional[str] = None,
     ) -> DevVarLongStringArrayType:
         # pylint: disable=line-too-long
         """
@@ -913,9 +1266,13 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
             False means off, True means on, None means no desired change.
         :param stay_on_when_offline: whether any ports being turned on
             should remain on if communication with the MCCS is lost.
+        :param command_id: the ID of the command that this is part of,
+            which is reported in its timing report.
         :return: A tuple containing a result code and a human-readable status message.
         """  # noqa: E501
-        self.component_manager.set_fndh_port_powers(port_powers, stay_on_when_offline)
+        self.component_manager.set_fndh_port_powers(
+            port_powers, stay_on_when_offline, command_id
+        )
         return ([ResultCode.OK], ["SetFndhPortPowers command requested."])
 
     SetFndhLedPattern_SCHEMA: Final = json.loads(
@@ -1052,6 +1409,7 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
         smartbox_number: int,
         port_powers: list[bool | None],
         stay_on_when_offline: bool,
+        command_id: Optional[str] = None,
     ) -> DevVarLongStringArrayType:
         # pylint: disable=line-too-long
         """
@@ -1063,6 +1421,8 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
             None means no desired change
         :param stay_on_when_offline: whether any ports being turned on
             should remain on if communication with the MCCS is lost.
+        :param command_id: the ID of the command that this is part of,
+            which is reported in its timing report.
 
         This command takes as input a JSON string that conforms to the
         following schema:
@@ -1073,7 +1433,7 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
         :return: A tuple containing a result code and a human-readable status message.
         """  # noqa: E501
         self.component_manager.set_smartbox_port_powers(
-            smartbox_number, port_powers, stay_on_when_offline
+            smartbox_number, port_powers, stay_on_when_offline, command_id
         )
         return ([ResultCode.OK], ["SetSmartboxPortPowers command requested."])
 
@@ -1223,6 +1583,74 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
         self.component_manager.reset_fncc_status()
         return ([ResultCode.OK], ["ResetFnccStatus command requested."])
 
+    @command(dtype_out=str)
+    def DumpFlightRecorder(self: MccsPasdBus) -> str:
+        """
+        Dump the most recent Modbus transactions from the flight recorder.
+
+        The transactions are returned oldest first, each as a list of the
+        values of the fields named in "fields": the time at which it
+        started, the device ID, the kind of request, its duration in
+        seconds, the index of its outcome in "outcomes", and the class of
+        error if it did not succeed.
+
+        :return: a JSON string of the recorded transactions.
+        """
+        return json.dumps(self.component_manager.dump_flight_recorder())
+
+    GetPasdSnapshot_SCHEMA: Final = json.loads(
+        importlib.resources.read_text(
+            "ska_low_mccs_pasd.schemas.pasd_bus",
+            "MccsPasdBus_GetPasdSnapshot.json",
+        )
+    )
+
+    @stb.validators.validate_json_args
+    @command(dtype_in=str, dtype_out=str)
+    def GetPasdSnapshot(
+        self: MccsPasdBus,
+        device_ids: Optional[list[int]] = None,
+        prefix: str = "",
+    ) -> str:
+        # pylint: disable=line-too-long
+        """
+        Get the state of the PaSD attributes in a single call.
+
+        This command takes as input a JSON string that conforms to the
+        following schema:
+
+        .. literalinclude:: /../../src/ska_low_mccs_pasd/schemas/pasd_bus/MccsPasdBus_GetPasdSnapshot.json
+           :language: json
+
+        The result is laid out in columns: the names of the attributes, and
+        their values, the integer values of their qualities, and their
+        timestamps. The qualities and timestamps, and the values that are
+        numeric arrays, are packed into their raw bytes, so use
+        :py:func:`~ska_low_mccs_pasd.pasd_bus.pasd_bus_snapshot.decode_state_snapshot`
+        to decode it.
+
+        :param device_ids: the IDs of the PaSD devices to get the attributes
+            of. Defaults to all of them.
+        :param prefix: only get the attributes whose names start with this.
+
+        :return: a JSON string of the state of the attributes.
+        """  # noqa: E501
+        if device_ids is None:
+            attribute_names = self._pasd_state.names
+        else:
+            attribute_names = [
+                attribute_name
+                for device_id in device_ids
+                for attribute_name in self._attribute_index.get_tango_attribute_names(
+                    device_id
+                )
+            ]
+        attribute_names = [name for name in attribute_names if name.startswith(prefix)]
+        state = self._pasd_state.copy(
+            self._pasd_state.handle(name) for name in attribute_names
+        )
+        return encode_state_snapshot(dict(zip(attribute_names, state)))
+
     @command(dtype_in="DevShort", dtype_out="DevVarStringArray")
     def GetPasdDeviceSubscriptions(
         self: MccsPasdBus,
@@ -1234,8 +1662,12 @@ class MccsPasdBus(MccsBaseDevice[PasdBusComponentManager]):
         :param device_id: the id of the device
             we want to get subscriptions for.
 
-        :return: The subscriptions for this device.
+        :return: The subscriptions for this device: its snapshot attribute
+            if snapshot attributes are enabled, otherwise all of its
+            attributes.
         """
+        if device_id in self._snapshot_attribute_names:
+            return [self._snapshot_attribute_names[device_id]]
         for controller in PasdData.CONTROLLERS_CONFIG.values():
             if controller.get("modbus_address") == device_id:
                 return [
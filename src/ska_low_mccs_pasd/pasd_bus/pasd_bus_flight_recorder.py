@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+This module implements a flight recorder for a PaSD bus.
+
+The flight recorder keeps a record of the most recent Modbus transactions
+in a fixed-size ring buffer, which is allocated up front and overwritten
+in place, so that it can be left running in production and dumped after
+communications have gone bad.
+"""
+from __future__ import annotations
+
+import enum
+import threading
+from typing import Any, Final, Optional
+
+__all__ = ["FlightRecorder", "TransactionOutcome", "FLIGHT_RECORDER_FIELDS"]
+
+FLIGHT_RECORDER_FIELDS: Final = (
+    "timestamp",
+    "device_id",
+    "kind",
+    "duration",
+    "outcome",
+    "error",
+)
+"""The fields of each flight recorder entry, in order."""
+
+
+class TransactionOutcome(enum.IntEnum):
+    """The outcome of a Modbus transaction."""
+
+    OK = 0
+    """The device responded to the request."""
+
+    ERROR_RESPONSE = 1
+    """The device responded with an error."""
+
+    FAILED = 2
+    """The request raised an exception, e.g. because the device timed out."""
+
+
+class FlightRecorder:
+    """A fixed-size ring buffer of the most recent transactions on the bus."""
+
+    def __init__(self: FlightRecorder, capacity: int) -> None:
+        """
+        Initialise a new instance.
+
+        :param capacity: the number of transactions to keep. Zero disables
+            recording.
+        """
+        self._capacity = max(capacity, 0)
+        self._entries: list[Optional[tuple[Any, ...]]] = [None] * self._capacity
+        self._next = 0
+        self._total = 0
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self: FlightRecorder) -> int:
+        """
+        Return the number of transactions kept.
+
+        :return: the capacity of the ring buffer.
+        """
+        return self._capacity
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def record(
+        self: FlightRecorder,
+        timestamp: float,
+        device_id: int,
+        kind: str,
+        duration: float,
+        outcome: TransactionOutcome,
+        error: str = "",
+    ) -> None:
+        """
+        Record a transaction, overwriting the oldest if the buffer is full.
+
+        :param timestamp: the time.time() at which the transaction started.
+        :param device_id: the ID of the device the transaction was with.
+        :param kind: the kind of request.
+        :param duration: the duration of the transaction, in seconds.
+        :param outcome: the outcome of the transaction.
+        :param error: the class of error, if the transaction did not succeed.
+        """
+        if not self._capacity:
+            return
+        with self._lock:
+            self._entries[self._next] = (
+                timestamp,
+                device_id,
+                kind,
+                duration,
+                int(outcome),
+                error,
+            )
+            self._next = (self._next + 1) % self._capacity
+            self._total += 1
+
+    def dump(self: FlightRecorder) -> dict[str, Any]:
+        """
+        Return the recorded transactions in a compact, JSON-serialisable form.
+
+        Each entry is a list of values, in the order given by "fields", and
+        entries are ordered from oldest to newest.
+
+        :return: a dictionary of the field names, the outcome names, the
+            total number of transactions recorded and the recorded entries.
+        """
+        with self._lock:
+            entries = self._entries[self._next :] + self._entries[: self._next]
+            total = self._total
+        return {
+            "fields": list(FLIGHT_RECORDER_FIELDS),
+            "outcomes": [outcome.name for outcome in TransactionOutcome],
+            "total": total,
+            "entries": [list(entry) for entry in entries if entry is not None],
+        }
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+This module implements latency histograms for a PaSD bus.
+
+The duration of each Modbus transaction is counted into a histogram with
+fixed, roughly logarithmically spaced buckets, so that the distribution
+of latencies can be monitored in constant memory however long the device
+runs. Percentiles are estimated from the bucket counts, and the fraction
+of time for which the bus is busy is measured over a fixed window.
+"""
+from __future__ import annotations
+
+import bisect
+import time
+from typing import Any, Final, Hashable
+
+__all__ = ["LatencyHistogram", "LatencyMonitor", "LATENCY_BUCKET_EDGES"]
+
+LATENCY_BUCKET_EDGES: Final = (
+    0.001,
+    0.002,
+    0.005,
+    0.01,
+    0.02,
+    0.05,
+    0.1,
+    0.2,
+    0.5,
+    1.0,
+    2.0,
+    5.0,
+    10.0,
+)
+"""
+The upper edges of the latency histogram buckets, in seconds.
+
+A latency equal to an edge is counted in the bucket below it, and there is
+a final bucket for latencies greater than the last edge.
+"""
+
+LATENCY_PERCENTILES: Final = (50.0, 95.0, 99.0)
+"""The percentiles reported for each histogram."""
+
+UTILISATION_WINDOW: Final = 10.0
+"""The time in seconds over which bus utilisation is measured."""
+
+
+class LatencyHistogram:
+    """A histogram of transaction latencies, with fixed buckets."""
+
+    def __init__(self: LatencyHistogram) -> None:
+        """Initialise a new instance."""
+        self._counts = [0] * (len(LATENCY_BUCKET_EDGES) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    @property
+    def counts(self: LatencyHistogram) -> list[int]:
+        """
+        Return the number of latencies counted in each bucket.
+
+        :return: a list with one more element than ``LATENCY_BUCKET_EDGES``.
+        """
+        return list(self._counts)
+
+    @property
+    def count(self: LatencyHistogram) -> int:
+        """
+        Return the total number of latencies recorded.
+
+        :return: the number of latencies recorded.
+        """
+        return self._count
+
+    def record(self: LatencyHistogram, latency: float) -> None:
+        """
+        Count a latency into the histogram.
+
+        :param latency: the duration of a transaction, in seconds.
+        """
+        self._counts[bisect.bisect_left(LATENCY_BUCKET_EDGES, latency)] += 1
+        self._count += 1
+        self._total += latency
+        self._max = max(self._max, latency)
+
+    def percentile(self: LatencyHistogram, percentile: float) -> float:
+        """
+        Estimate a latency percentile from the histogram.
+
+        The estimate is the upper edge of the bucket containing the
+        percentile, so it is never less than the true value. For the final,
+        unbounded bucket, the largest latency recorded is used instead.
+
+        :param percentile: the percentile to estimate, from 0 to 100.
+
+        :return: the estimated percentile in seconds, or NaN if no latencies
+            have been recorded.
+        """
+        if not self._count:
+            return float("nan")
+        target = percentile / 100 * self._count
+        cumulative = 0
+        for edge, count in zip(LATENCY_BUCKET_EDGES, self._counts):
+            cumulative += count
+            if count and cumulative >= target:
+                return min(edge, self._max)
+        return self._max
+
+    def percentiles(self: LatencyHistogram) -> list[float]:
+        """
+        Return the reported latency percentiles.
+
+        :return: the estimated p50, p95 and p99 latencies, in seconds.
+        """
+        return [self.percentile(percentile) for percentile in LATENCY_PERCENTILES]
+
+    def to_dict(self: LatencyHistogram) -> dict[str, Any]:
+        """
+        Return a JSON-serialisable description of the histogram.
+
+        :return: a dictionary describing the histogram.
+        """
+        p50, p95, p99 = self.percentiles() if self._count else (None, None, None)
+        return {
+            "counts": self.counts,
+            "count": self._count,
+            "mean": self._total / self._count if self._count else None,
+            "max": self._max if self._count else None,
+            "p50": p50,
+            "p95": p95,
+            "p99": p99,
+        }
+
+
+class LatencyMonitor:
+    """
+    A monitor of the transaction latencies and utilisation of a bus.
+
+    Latencies are counted into a histogram for the bus as a whole, and
+    into histograms for each device and for each kind of request. The
+    number of histograms is bounded by the number of devices on the bus
+    and the number of kinds of request, so memory use does not grow.
+    """
+
+    def __init__(
+        self: LatencyMonitor, utilisation_window: float = UTILISATION_WINDOW
+    ) -> None:
+        """
+        Initialise a new instance.
+
+        :param utilisation_window: the time in seconds over which bus
+            utilisation is measured.
+        """
+        self._utilisation_window = utilisation_window
+        self._bus_histogram = LatencyHistogram()
+        self._device_histograms: dict[Hashable, LatencyHistogram] = {}
+        self._kind_histograms: dict[Hashable, LatencyHistogram] = {}
+        self._window_start = time.monotonic()
+        self._window_busy = 0.0
+        self._utilisation: float | None = None
+
+    @property
+    def bus_histogram(self: LatencyMonitor) -> LatencyHistogram:
+        """
+        Return the histogram of all transactions on the bus.
+
+        :return: the histogram of all transactions on the bus.
+        """
+        return self._bus_histogram
+
+    def get_device_histogram(
+        self: LatencyMonitor, device_id: Hashable
+    ) -> LatencyHistogram:
+        """
+        Return the histogram of transactions with a device.
+
+        :param device_id: the ID of the device.
+
+        :return: the histogram of transactions with the device, which is
+            empty if there have been none.
+        """
+        return self._device_histograms.get(device_id) or LatencyHistogram()
+
+    def record(
+        self: LatencyMonitor, device_id: Hashable, kind: Hashable, latency: float
+    ) -> None:
+        """
+        Record the latency of a transaction.
+
+        :param device_id: the ID of the device the transaction was with.
+        :param kind: the kind of request.
+        :param latency: the duration of the transaction, in seconds.
+        """
+        self._bus_histogram.record(latency)
+        histogram = self._device_histograms.get(device_id)
+        if histogram is None:
+            histogram = self._device_histograms[device_id] = LatencyHistogram()
+        histogram.record(latency)
+        histogram = self._kind_histograms.get(kind)
+        if histogram is None:
+            histogram = self._kind_histograms[kind] = LatencyHistogram()
+        histogram.record(latency)
+
+        self._window_busy += latency
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed >= self._utilisation_window:
+            self._utilisation = min(self._window_busy / elapsed, 1.0)
+            self._window_start = now
+            self._window_busy = 0.0
+
+    @property
+    def utilisation(self: LatencyMonitor) -> float:
+        """
+        Return the percentage of time for which the bus was busy.
+
+        This is measured over the last complete window, or over the
+        current window until the first one is complete.
+
+        :return: the bus utilisation, as a percentage.
+        """
+        if self._utilisation is not None:
+            return self._utilisation * 100
+        elapsed = time.monotonic() - self._window_start
+        if elapsed <= 0:
+            return 0.0
+        return min(self._window_busy / elapsed, 1.0) * 100
+
+    def to_dict(self: LatencyMonitor) -> dict[str, Any]:
+        """
+        Return a JSON-serialisable description of the latencies.
+
+        :return: a dictionary describing the latency histograms.
+        """
+        return {
+            "bucket_edges": list(LATENCY_BUCKET_EDGES),
+            "bus": self._bus_histogram.to_dict(),
+            "device": {
+                str(device_id): histogram.to_dict()
+                for device_id, histogram in list(self._device_histograms.items())
+            },
+            "kind": {
+                str(kind): histogram.to_dict()
+                for kind, histogram in list(self._kind_histograms.items())
+            },
+            "utilisation": self.utilisation,
+        }
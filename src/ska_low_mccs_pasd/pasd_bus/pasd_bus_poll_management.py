@@ -5,18 +5,77 @@
 #
 # Distributed under the terms of the BSD 3-clause new license.
 # See LICENSE for more info.
+# pylint: disable=too-many-lines
 """This module implements polling management for a PaSD bus."""
 
+import heapq
+import itertools
 import logging
+import math
+import threading
 import time
 from collections import OrderedDict
-from dataclasses import dataclass
-from typing import Any, Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+from functools import partial, wraps
+from typing import Any, Callable, Final, Iterator, Mapping, Sequence, TypeVar, cast
 
 from ska_low_mccs_pasd.pasd_data import PasdData
 
+from .pasd_bus_circuit_breaker import DeviceCircuitBreaker
+from .pasd_bus_power_sequencer import PowerSequencingPlanner
 
-def fndh_read_request_iterator() -> Iterator[str]:
+FNDH_READ_CYCLE: Final[tuple[str, ...]] = (
+    "STATUS",
+    "PORTS",
+    "WARNING_FLAGS",
+    "ALARM_FLAGS",
+)
+"""The attribute groups that are read from the FNDH in each poll cycle."""
+
+FNCC_READ_CYCLE: Final[tuple[str, ...]] = ("STATUS",)
+"""The attribute groups that are read from the FNCC in each poll cycle."""
+
+SMARTBOX_READ_CYCLE: Final[tuple[str, ...]] = (
+    "STATUS",
+    "PORTS",
+    "WARNING_FLAGS",
+    "ALARM_FLAGS",
+)
+"""The attribute groups that are read from a smartbox in each poll cycle."""
+
+
+def _read_cycle_iterator(
+    cycle: Sequence[str], periodic: Mapping[str, float] | None
+) -> Iterator[str]:
+    """
+    Loop forever over a read cycle, interleaving any periodic reads that are due.
+
+    Periodic reads are due as soon as the loop starts. If there is nothing
+    in the cycle, an empty string is yielded to skip the device's turn.
+
+    :param cycle: the names of the attribute groups (or block reads)
+        to be read in each poll cycle.
+    :param periodic: a mapping from the names of attribute groups that are
+        read on a timer to their period in seconds.
+
+    :yields: the name of an attribute group to be read from the device.
+    """
+    periodic = periodic or {}
+    next_due = dict.fromkeys(periodic, 0.0)
+    while True:
+        for read in cycle or ("",):
+            now = time.monotonic()
+            for group, due in next_due.items():
+                if due <= now:
+                    next_due[group] = now + periodic[group]
+                    yield group
+            yield read
+
+
+def fndh_read_request_iterator(
+    cycle: Sequence[str] = FNDH_READ_CYCLE,
+    periodic: Mapping[str, float] | None = None,
+) -> Iterator[str]:
     """
     Return an iterator that says what attributes should be read next on the FNDH.
 
@@ -24,35 +83,46 @@ def fndh_read_request_iterator() -> Iterator[str]:
     then moves on to writable attributes that are otherwise static,
     and then loops forever, alternating between status attributes and port attributes.
 
+    :param cycle: the names of the attribute groups (or block reads)
+        to be read in each poll cycle.
+    :param periodic: a mapping from the names of attribute groups that are
+        read on a timer to their period in seconds.
+
     :yields: the name of an attribute group to be read from the device.
     """
     yield "INFO"
     yield "THRESHOLDS"
-    while True:
-        yield "STATUS"
-        yield "PORTS"
-        yield "WARNING_FLAGS"
-        yield "ALARM_FLAGS"
+    yield from _read_cycle_iterator(cycle, periodic)
 
 
-def fncc_read_request_iterator() -> Iterator[str]:
+def fncc_read_request_iterator(
+    cycle: Sequence[str] = FNCC_READ_CYCLE,
+    periodic: Mapping[str, float] | None = None,
+) -> Iterator[str]:
     """
     Return an iterator that says what attributes should be read next on the FNCC.
 
     It starts by reading static information attributes
     and then loops forever to read the status.
 
+    :param cycle: the names of the attribute groups (or block reads)
+        to be read in each poll cycle.
+    :param periodic: a mapping from the names of attribute groups that are
+        read on a timer to their period in seconds.
+
     :yields: the name of an attribute group to be read from the device.
     """
     yield "INFO"
     # Delay starting the status loop until all other info has been read
     for _ in range(6):
         yield ""
-    while True:
-        yield "STATUS"
+    yield from _read_cycle_iterator(cycle, periodic)
 
 
-def smartbox_read_request_iterator() -> Iterator[str]:
+def smartbox_read_request_iterator(
+    cycle: Sequence[str] = SMARTBOX_READ_CYCLE,
+    periodic: Mapping[str, float] | None = None,
+) -> Iterator[str]:
     """
     Return an iterator that says what attributes should be read next on a smartbox.
 
@@ -60,16 +130,22 @@ def smartbox_read_request_iterator() -> Iterator[str]:
     then moves on to writable attributes that are otherwise static,
     and then loops forever, alternating between status attributes and port attributes.
 
+    :param cycle: the names of the attribute groups (or block reads)
+        to be read in each poll cycle.
+    :param periodic: a mapping from the names of attribute groups that are
+        read on a timer to their period in seconds.
+
     :yields: the name of an attribute group to be read from the device.
     """
     yield "INFO"
     yield "THRESHOLDS"
     yield "CURRENT_TRIP_THRESHOLDS"
-    while True:
-        yield "STATUS"
-        yield "PORTS"
-        yield "WARNING_FLAGS"
-        yield "ALARM_FLAGS"
+    yield from _read_cycle_iterator(cycle, periodic)
+
+
+# Monotonic sequence numbers used to break ties between delayed requests
+# with the same 'not before' time, so that they are actioned in FIFO order.
+_delayed_request_sequence = itertools.count()
 
 
 @dataclass
@@ -80,16 +156,76 @@ class DelayedRequest:
     Encapsulates data about a delayed request including a
     'not before' timestamp before which the request should
     not be actioned.
+
+    Delayed requests are ordered by their 'not before' time, with ties
+    broken by order of creation, so that they can be held in a heap.
     """
 
     device_id: int
     request_description: tuple[str, Any]
     not_before: float
+    sequence: int = field(
+        default_factory=lambda: next(_delayed_request_sequence),
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     def __post_init__(self) -> None:
         """Post init method to record the request timestamp."""
         self.timestamp = time.time()
 
+    def __lt__(self, other: "DelayedRequest") -> bool:
+        """
+        Return whether this request should be actioned before another.
+
+        :param other: the request to compare against.
+
+        :return: whether this request is due before the other, or is due
+            at the same time but was created first.
+        """
+        return (self.not_before, self.sequence) < (other.not_before, other.sequence)
+
+
+@dataclass
+class GroupSlaStatistics:
+    """
+    Class to record how well an attribute group's maximum age is being met.
+
+    An SLA miss is recorded whenever the group is read after its values
+    have become older than its maximum age.
+    """
+
+    max_age: float
+    reads: int = 0
+    misses: int = 0
+    worst_age: float = 0.0
+
+    def record_read(self, age: float) -> None:
+        """
+        Record a read of the group.
+
+        :param age: the age of the group's values when it was read.
+        """
+        self.reads += 1
+        self.worst_age = max(self.worst_age, age)
+        if age > self.max_age:
+            self.misses += 1
+
+    def to_dict(self) -> dict[str, float]:
+        """
+        Return a JSON-serialisable description of these statistics.
+
+        :return: a dictionary of the statistics.
+        """
+        return {
+            "max_age": self.max_age,
+            "reads": self.reads,
+            "misses": self.misses,
+            "miss_rate": self.misses / self.reads if self.reads else 0.0,
+            "worst_age": round(self.worst_age, 3),
+        }
+
 
 class DeviceRequestProvider:
     """
@@ -275,7 +411,7 @@ class DeviceRequestProvider:
                 self._port_breaker_resets[port - 1] = False
                 return "BREAKER_RESET", port
 
-        if any(change is not None for change in self._port_power_changes):
+        if self._has_port_power_writes():
             requested_powers = self._get_requested_port_powers()
             return "SET_PORT_POWERS", requested_powers
 
@@ -295,6 +431,9 @@ class DeviceRequestProvider:
 
         return "NONE", None
 
+    def _has_port_power_writes(self) -> bool:
+        return any(change is not None for change in self._port_power_changes)
+
     def _get_requested_port_powers(self) -> list[tuple[bool, bool] | None]:
         requested_powers = self._port_power_changes
         self._port_power_changes = [None] * len(requested_powers)
@@ -354,6 +493,9 @@ class FndhRequestProvider(DeviceRequestProvider):
     A class to handle staggered powering of Fndh ports.
 
     A request for powering N ports becomes N requests for powering 1 port.
+    With a power sequencing planner, ports are instead powered on in
+    batches whose size is planned from the PSU readings, and powered off
+    all at once.
     """
 
     def __init__(
@@ -364,6 +506,7 @@ class FndhRequestProvider(DeviceRequestProvider):
         port_status_read_delay: float,
         port_power_delay: float,
         logger: logging.Logger,
+        power_sequencer: PowerSequencingPlanner | None = None,
     ) -> None:
         """
         Initialise a new instance.
@@ -378,8 +521,15 @@ class FndhRequestProvider(DeviceRequestProvider):
         :param port_power_delay: time in seconds to wait between setting
             each FNDH port power.
         :param logger: a logger.
+        :param power_sequencer: an optional planner of the batches in which
+            ports are powered on. If not provided, ports are powered on one
+            at a time, ``port_power_delay`` apart.
         """
         self._port_power_delay = port_power_delay
+        self._power_sequencer = power_sequencer
+        # The time before which no PSU reading need be requested while
+        # ports wait for headroom to be powered on.
+        self._next_headroom_read = 0.0
         super().__init__(
             number_of_ports,
             read_request_iterator_factory,
@@ -388,6 +538,17 @@ class FndhRequestProvider(DeviceRequestProvider):
             logger,
         )
 
+    def _has_port_power_writes(self) -> bool:
+        """
+        Return whether port powers are to be written straight away.
+
+        FNDH port powers are only ever written through write-read sequences,
+        which may leave some changes pending while earlier ports settle.
+
+        :returns: False.
+        """
+        return False
+
     def _get_requested_port_powers(self) -> list[tuple[bool, bool] | None]:
         """
         Get requested FNDH port powers.
@@ -410,6 +571,10 @@ class FndhRequestProvider(DeviceRequestProvider):
 
         :returns: a list of DelayedRequests.
         """
+        if self._power_sequencer is not None:
+            return self._get_sequenced_write_read_sequence(
+                device_id, self._power_sequencer
+            )
         write_read_sequence = []
         offset = 0
         for requested_port, port_power in enumerate(self._port_power_changes):
@@ -440,6 +605,113 @@ class FndhRequestProvider(DeviceRequestProvider):
             return write_read_sequence
         return super().get_write_read_sequence(device_id)
 
+    def _get_sequenced_write_read_sequence(
+        self, device_id: int, power_sequencer: PowerSequencingPlanner
+    ) -> list[DelayedRequest] | None:
+        """
+        Get the next batch of port power changes planned from the PSU readings.
+
+        Ports to be powered off are all written at once. Ports to be powered
+        on are written in the batch size planned by the power sequencer,
+        followed by a read of the port states, and of the PSU readings that
+        plan the next batch. Ports that are not yet written stay pending.
+
+        :param device_id: The id of the device requiring the request.
+        :param power_sequencer: the planner of the port power-on batches.
+
+        :returns: a list of DelayedRequests, or None if no port power
+            changes are to be written yet.
+        """
+        now = time.time()
+        power_offs = [
+            port
+            for port, port_power in enumerate(self._port_power_changes)
+            if port_power is not None and not port_power[0]
+        ]
+        if power_offs:
+            batch = power_offs
+            power_sequencer.record_batch(0, now)
+        else:
+            power_ons = [
+                port
+                for port, port_power in enumerate(self._port_power_changes)
+                if port_power is not None
+            ]
+            batch_size = power_sequencer.get_batch_size(len(power_ons), now)
+            if not batch_size:
+                if power_sequencer.is_hold_expired(now):
+                    self._logger.error(
+                        "Dropping power-on of FNDH ports "
+                        f"{[port + 1 for port in power_ons]}: "
+                        "the PSU has had no headroom for them"
+                    )
+                    for port in power_ons:
+                        self._port_power_changes[port] = None
+                    power_sequencer.end_hold()
+                    return None
+                if power_ons and now >= self._next_headroom_read:
+                    # Keep the PSU readings fresh while waiting for headroom.
+                    self._next_headroom_read = now + self._port_power_delay
+                    return [
+                        DelayedRequest(
+                            device_id, ("STATUS", None), self._next_headroom_read
+                        )
+                    ]
+                return None
+            batch = power_ons[:batch_size]
+            power_sequencer.record_batch(batch_size, now)
+
+        requested_powers: list[tuple[bool, bool] | None] = [None] * len(
+            self._port_power_changes
+        )
+        for port in batch:
+            requested_powers[port] = self._port_power_changes[port]
+            self._port_power_changes[port] = None
+        read_time = now + self._port_status_read_delay
+        self._next_headroom_read = read_time
+        return [
+            DelayedRequest(device_id, ("SET_PORT_POWERS", requested_powers), now),
+            DelayedRequest(device_id, ("PORTS", None), read_time),
+            DelayedRequest(device_id, ("STATUS", None), read_time),
+        ]
+
+    def update_psu_readings(
+        self, current: float, voltage: float | None, timestamp: float
+    ) -> None:
+        """
+        Pass new PSU readings to the power sequencer, if there is one.
+
+        :param current: the PSU current, in amps.
+        :param voltage: the PSU voltage, in volts, if it was read.
+        :param timestamp: the time at which the readings were taken.
+        """
+        if self._power_sequencer is not None:
+            self._power_sequencer.update_readings(current, voltage, timestamp)
+
+
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+
+def _synchronised(method: _Method) -> _Method:
+    """
+    Make a method of a PasdBusRequestProvider hold the provider's lock.
+
+    The request provider is iterated on the poll thread, but requests are
+    also made of it from Tango command threads and from the thread that
+    publishes the PaSD device states.
+
+    :param method: the method to wrap.
+
+    :return: the wrapped method.
+    """
+
+    @wraps(method)
+    def _wrapper(self: "PasdBusRequestProvider", *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return cast(_Method, _wrapper)
+
 
 class PasdBusRequestProvider:
     """
@@ -454,10 +726,13 @@ class PasdBusRequestProvider:
 
     * device attributes are polled as frequently as possible,
       given the above constraints
+
+    * a device that stops responding is polled less and less often,
+      without holding up communications with the other devices
     """
 
     # pylint: disable=too-many-instance-attributes, too-many-arguments
-    # pylint: disable=too-many-positional-arguments
+    # pylint: disable=too-many-positional-arguments, too-many-locals
     def __init__(
         self,
         min_ticks: int,
@@ -467,6 +742,16 @@ class PasdBusRequestProvider:
         port_power_delay: float,
         smartbox_ids: list[int],
         smartbox_startup_delay: float = 0.0,
+        read_cycles: Mapping[str, Sequence[str]] | None = None,
+        periodic_reads: Mapping[str, Mapping[str, float]] | None = None,
+        max_ages: Mapping[str, Mapping[str, float]] | None = None,
+        failure_backoff: float = 0.0,
+        max_failure_backoff: float = 60.0,
+        bus_failure_device_count: int = 2,
+        port_power_current_limit: float = 0.0,
+        port_power_current: float = 0.5,
+        port_power_min_voltage: float = 0.0,
+        port_power_max_hold_time: float = 60.0,
     ) -> None:
         """
         Initialise a new instance.
@@ -484,6 +769,36 @@ class PasdBusRequestProvider:
             each FNDH port
         :param smartbox_startup_delay: time in seconds to wait after a smartbox
             is powered on before starting to poll it.
+        :param read_cycles: optional mapping from controller type ("FNCC",
+            "FNPC" or "FNSC") to the attribute groups, or merged block reads,
+            to be read from devices of that type in each poll cycle. An
+            empty string gives up the device's turn to be polled. Controller
+            types that are not specified use the default cycle.
+        :param periodic_reads: optional mapping from controller type to the
+            attribute groups that are read on a timer rather than every cycle,
+            and their periods in seconds.
+        :param max_ages: optional mapping from controller type to the
+            attribute groups that are read according to their staleness,
+            and their maximum ages in seconds.
+        :param failure_backoff: time in seconds for which a device is not
+            communicated with after a failed poll. This doubles with each
+            consecutive failure.
+        :param max_failure_backoff: the maximum time in seconds for which a
+            failing device is not communicated with.
+        :param bus_failure_device_count: the number of different devices
+            that must fail, with no successful polls in between, for the
+            failure to be attributed to the bus rather than the devices.
+        :param port_power_current_limit: the FNDH PSU current, in amps, that
+            powering on FNDH ports should not exceed. If positive, ports are
+            powered on in batches planned from the PSU readings, rather than
+            one at a time ``port_power_delay`` apart.
+        :param port_power_current: the estimated current, in amps, drawn by
+            each FNDH port once it is powered on.
+        :param port_power_min_voltage: the FNDH PSU voltage below which no
+            more FNDH ports are powered on. Zero disables the voltage check.
+        :param port_power_max_hold_time: the time in seconds for which FNDH
+            port power-on is held for lack of PSU headroom before the pending
+            ports are dropped. Zero holds them indefinitely.
         """
         if port_status_read_delay >= port_power_delay:
             logger.warning(
@@ -497,6 +812,43 @@ class PasdBusRequestProvider:
         self._attribute_read_delay = attribute_read_delay
         self._port_status_read_delay = port_status_read_delay
         self._port_power_delay = port_power_delay
+        self._port_power_current_limit = port_power_current_limit
+        self._port_power_current = port_power_current
+        self._port_power_min_voltage = port_power_min_voltage
+        self._port_power_max_hold_time = port_power_max_hold_time
+        read_cycles = read_cycles or {}
+        periodic_reads = periodic_reads or {}
+        self._fndh_read_request_iterator = partial(
+            fndh_read_request_iterator,
+            read_cycles.get("FNPC", FNDH_READ_CYCLE),
+            periodic_reads.get("FNPC"),
+        )
+        self._fncc_read_request_iterator = partial(
+            fncc_read_request_iterator,
+            read_cycles.get("FNCC", FNCC_READ_CYCLE),
+            periodic_reads.get("FNCC"),
+        )
+        self._smartbox_read_request_iterator = partial(
+            smartbox_read_request_iterator,
+            read_cycles.get("FNSC", SMARTBOX_READ_CYCLE),
+            periodic_reads.get("FNSC"),
+        )
+        self._failure_backoff = failure_backoff
+        self._max_failure_backoff = max_failure_backoff
+        self._bus_failure_device_count = bus_failure_device_count
+        self._circuit_breakers: dict[int, DeviceCircuitBreaker] = {}
+        # Devices that have failed since the last successful poll of any device
+        self._failing_device_ids: set[int] = set()
+        self._max_ages = max_ages or {}
+        # Time of the last staleness-scheduled read of each group, by device
+        self._last_reads: dict[int, dict[str, float]] = {}
+        self._sla_statistics = {
+            controller: {
+                group: GroupSlaStatistics(max_age)
+                for group, max_age in controller_max_ages.items()
+            }
+            for controller, controller_max_ages in self._max_ages.items()
+        }
 
         # Create a dict mapping FNDH ports to smartbox Modbus IDs
         self._smartboxIDs = {}
@@ -506,6 +858,8 @@ class PasdBusRequestProvider:
         self._available_smartboxes = list(self._smartboxIDs.values())
 
         self._smartbox_startup_delay = smartbox_startup_delay
+        self._lock = threading.RLock()
+        # Heap of delayed requests, ordered by 'not before' time.
         self._delayed_requests: list[DelayedRequest] = []
         # Maps FNDH port to the time until which a stale "still on" port
         # reading should be ignored following a power-off request
@@ -513,6 +867,7 @@ class PasdBusRequestProvider:
         self._pending_smartbox_startups: dict[int, float] = {}
         self.initialise()
 
+    @_synchronised
     def initialise(self) -> None:
         """Initialise the PasdBusRequestProvider.
 
@@ -527,17 +882,29 @@ class PasdBusRequestProvider:
             PasdData.FNCC_DEVICE_ID: self._min_ticks,
         }
 
-        fndh_request_provider = FndhRequestProvider(
+        power_sequencer = None
+        if self._port_power_current_limit > 0:
+            power_sequencer = PowerSequencingPlanner(
+                self._port_power_current_limit,
+                self._port_power_current,
+                self._port_status_read_delay,
+                self._port_power_delay,
+                self._logger,
+                min_voltage=self._port_power_min_voltage,
+                max_hold_time=self._port_power_max_hold_time,
+            )
+        self._fndh_request_provider = FndhRequestProvider(
             PasdData.NUMBER_OF_FNDH_PORTS,
-            fndh_read_request_iterator,
+            self._fndh_read_request_iterator,
             self._attribute_read_delay,
             self._port_status_read_delay,
             self._port_power_delay,
             logger=self._logger,
+            power_sequencer=power_sequencer,
         )
         fncc_request_provider = DeviceRequestProvider(
             0,
-            fncc_read_request_iterator,
+            self._fncc_read_request_iterator,
             attribute_read_delay=self._attribute_read_delay,
             port_status_read_delay=self._port_status_read_delay,
             logger=self._logger,
@@ -545,18 +912,129 @@ class PasdBusRequestProvider:
         self._device_request_providers: dict[int, DeviceRequestProvider] = {
             smartbox_id: DeviceRequestProvider(
                 PasdData.NUMBER_OF_SMARTBOX_PORTS,
-                smartbox_read_request_iterator,
+                self._smartbox_read_request_iterator,
                 self._attribute_read_delay,
                 self._port_status_read_delay,
                 self._logger,
             )
             for smartbox_id in self._available_smartboxes
         }
-        self._device_request_providers[PasdData.FNDH_DEVICE_ID] = fndh_request_provider
+        self._device_request_providers[
+            PasdData.FNDH_DEVICE_ID
+        ] = self._fndh_request_provider
         self._device_request_providers[PasdData.FNCC_DEVICE_ID] = fncc_request_provider
         self._pending_power_off_ports.clear()
         self._pending_smartbox_startups.clear()
+        self._last_reads.clear()
+        self._circuit_breakers.clear()
+        self._failing_device_ids.clear()
+
+    def _get_circuit_breaker(self, device_id: int) -> DeviceCircuitBreaker:
+        if device_id not in self._circuit_breakers:
+            self._circuit_breakers[device_id] = DeviceCircuitBreaker(
+                device_id,
+                self._failure_backoff,
+                self._max_failure_backoff,
+                self._logger,
+            )
+        return self._circuit_breakers[device_id]
+
+    @_synchronised
+    def record_poll_success(self, device_id: int) -> None:
+        """
+        Record that a device responded to a poll.
 
+        :param device_id: the device number.
+        """
+        self._get_circuit_breaker(device_id).record_success()
+        self._failing_device_ids.clear()
+
+    @_synchronised
+    def record_poll_failure(self, device_id: int) -> bool:
+        """
+        Record that a device failed to respond to a poll.
+
+        The device is then backed off, so that it doesn't hold up
+        communications with the other devices.
+
+        :param device_id: the device number.
+
+        :return: whether enough different devices have failed in a row for
+            the bus itself to be the likely problem.
+        """
+        self._get_circuit_breaker(device_id).record_failure()
+        self._failing_device_ids.add(device_id)
+        if len(self._failing_device_ids) >= self._bus_failure_device_count:
+            self._failing_device_ids.clear()
+            return True
+        return False
+
+    @staticmethod
+    def _get_controller_type(device_id: int) -> str:
+        match device_id:
+            case PasdData.FNDH_DEVICE_ID:
+                return "FNPC"
+            case PasdData.FNCC_DEVICE_ID:
+                return "FNCC"
+            case _:
+                return "FNSC"
+
+    @_synchronised
+    def get_sla_statistics(self) -> dict[str, dict[str, dict[str, float]]]:
+        """
+        Return statistics on how well each group's maximum age is being met.
+
+        :return: a dictionary, keyed by controller type and then group name,
+            of SLA statistics. Smartbox statistics are aggregated across all
+            smartboxes.
+        """
+        return {
+            controller: {
+                group: statistics.to_dict()
+                for group, statistics in controller_statistics.items()
+            }
+            for controller, controller_statistics in self._sla_statistics.items()
+        }
+
+    def _get_stalest_read(self) -> tuple[int, str] | None:
+        """
+        Return the staleness-scheduled read that is most overdue.
+
+        Only devices that haven't been communicated with for at least
+        ``min_ticks`` ticks are considered. A group that has never been read
+        is the stalest of all.
+
+        :return: the device ID and the name of the attribute group to read,
+            or None if there is nothing to read.
+        """
+        now = time.monotonic()
+        stalest: tuple[int, str] | None = None
+        stalest_ratio = -math.inf
+        for device_id, tick in self._ticks.items():
+            if tick < self._min_ticks:
+                break
+            if not self._get_circuit_breaker(device_id).allow_request():
+                continue
+            max_ages = self._max_ages.get(self._get_controller_type(device_id), {})
+            last_reads = self._last_reads.get(device_id, {})
+            for group, max_age in max_ages.items():
+                last_read = last_reads.get(group)
+                ratio = math.inf if last_read is None else (now - last_read) / max_age
+                if ratio > stalest_ratio:
+                    stalest, stalest_ratio = (device_id, group), ratio
+        if stalest is None:
+            return None
+
+        device_id, group = stalest
+        last_reads = self._last_reads.setdefault(device_id, {})
+        if group in last_reads:
+            self._sla_statistics[self._get_controller_type(device_id)][
+                group
+            ].record_read(now - last_reads[group])
+        last_reads[group] = now
+        return stalest
+
+    @_synchronised
     def update_port_power_states(self, port_power_states: list[bool]) -> None:
         """
         Use the new power states to update the smartbox polling list.
@@ -585,10 +1063,22 @@ class PasdBusRequestProvider:
             elif not power_state:
                 self._pending_power_off_ports.pop(fndh_port, None)
                 self._pending_smartbox_startups.pop(smartbox_id, None)
+                self._last_reads.pop(smartbox_id, None)
                 if smartbox_id in self._ticks:
                     self._logger.info(f"Stopping polling smartbox {smartbox_id}")
                     self._ticks.pop(smartbox_id, None)
 
+    @_synchronised
+    def update_psu_readings(self, current: float, voltage: float | None) -> None:
+        """
+        Use new FNDH PSU readings to plan the powering on of FNDH ports.
+
+        :param current: the FNDH PSU current, in amps.
+        :param voltage: the FNDH PSU voltage, in volts, if it was read.
+        """
+        self._fndh_request_provider.update_psu_readings(current, voltage, time.time())
+
+    @_synchronised
     def stop_polling_smartboxes(
         self, port_power_requests: list[tuple[bool, bool] | None]
     ) -> list[int]:
@@ -609,6 +1099,7 @@ class PasdBusRequestProvider:
                         self._port_status_read_delay, 0.0
                     )
                     self._pending_smartbox_startups.pop(smartbox_id, None)
+                    self._last_reads.pop(smartbox_id, None)
                     if smartbox_id in self._ticks:
                         self._logger.info(
                             f"Stopping polling smartbox {smartbox_id} as port "
@@ -618,6 +1109,7 @@ class PasdBusRequestProvider:
                         stopped_smartbox_ids.append(smartbox_id)
         return stopped_smartbox_ids
 
+    @_synchronised
     def get_smartbox_poll_list(self) -> list[int]:
         """
         Return a list of device IDs for smartboxes currently being polled.
@@ -629,6 +1121,7 @@ class PasdBusRequestProvider:
         device_ids.remove(PasdData.FNCC_DEVICE_ID)
         return device_ids
 
+    @_synchronised
     def desire_read_startup_info(self, device_id: int) -> None:
         """
         Register a request to read the information usually just read at startup.
@@ -637,6 +1130,7 @@ class PasdBusRequestProvider:
         """
         self._device_request_providers[device_id].desire_read_startup_info()
 
+    @_synchronised
     def desire_initialize(self, device_id: int) -> None:
         """
         Register a request to initialize a device.
@@ -645,6 +1139,7 @@ class PasdBusRequestProvider:
         """
         self._device_request_providers[device_id].desire_initialize()
 
+    @_synchronised
     def desire_attribute_write(
         self, device_id: int, name: str, values: list[Any]
     ) -> None:
@@ -657,6 +1152,7 @@ class PasdBusRequestProvider:
         """
         self._device_request_providers[device_id].desire_attribute_write(name, values)
 
+    @_synchronised
     def desire_alarm_reset(self, device_id: int) -> None:
         """
         Register a request to reset an alarm.
@@ -665,6 +1161,7 @@ class PasdBusRequestProvider:
         """
         self._device_request_providers[device_id].desire_alarm_reset()
 
+    @_synchronised
     def desire_warning_reset(self, device_id: int) -> None:
         """
         Register a request to reset a warning.
@@ -673,6 +1170,7 @@ class PasdBusRequestProvider:
         """
         self._device_request_providers[device_id].desire_warning_reset()
 
+    @_synchronised
     def desire_status_reset(self, device_id: int) -> None:
         """
         Register a request to reset the status register.
@@ -681,6 +1179,7 @@ class PasdBusRequestProvider:
         """
         self._device_request_providers[device_id].desire_status_reset()
 
+    @_synchronised
     def desire_status_read(self, device_id: int) -> None:
         """
         Register a request to read the status register.
@@ -689,6 +1188,7 @@ class PasdBusRequestProvider:
         """
         self._device_request_providers[device_id].desire_status_read()
 
+    @_synchronised
     def desire_port_powers(
         self,
         device_id: int,
@@ -710,6 +1210,7 @@ class PasdBusRequestProvider:
             port_powers, stay_on_when_offline
         )
 
+    @_synchronised
     def desire_port_breaker_reset(self, device_id: int, port_number: int) -> None:
         """
         Register a request to reset a port breaker.
@@ -720,6 +1221,7 @@ class PasdBusRequestProvider:
         """
         self._device_request_providers[device_id].desire_port_breaker_reset(port_number)
 
+    @_synchronised
     def desire_led_pattern(self, device_id: int, pattern: str) -> None:
         """
         Register a request to set a device's LED pattern.
@@ -729,12 +1231,14 @@ class PasdBusRequestProvider:
         """
         self._device_request_providers[device_id].desire_led_pattern(pattern)
 
+    @_synchronised
     def abort(self) -> None:
         """Clear all delayed requests and any pending port power changes."""
         self._delayed_requests.clear()
         for provider in self._device_request_providers.values():
             provider._port_power_changes = [None] * len(provider._port_power_changes)
 
+    @_synchronised
     def desire_set_low_pass_filter(
         self, device_id: int, cutoff: float, extra_sensors: bool
     ) -> None:
@@ -750,7 +1254,8 @@ class PasdBusRequestProvider:
             cutoff, extra_sensors
         )
 
-    # pylint: disable=too-many-branches
+    # pylint: disable=too-many-branches, too-many-return-statements, too-many-locals
+    @_synchronised
     def get_request(  # noqa: C901
         self, tick_increment: int
     ) -> tuple[int, str, Any] | None:
@@ -789,20 +1294,21 @@ class PasdBusRequestProvider:
             return PasdData.FNDH_DEVICE_ID, *("READ", "status")
 
         # Check if any expedited attribute reads or write-read sequences
-        # need to be added to the list for future polls. These are actioned
-        # after a delay, so we maintain a list rather than executing them
+        # need to be added to the queue for future polls. These are actioned
+        # after a delay, so we maintain a queue rather than executing them
         # immediately, so as not to hold up other requests.
         for device_id, _ in self._ticks.items():
             expedited_read_request = self._device_request_providers[
                 device_id
             ].get_expedited_read(device_id)
             if expedited_read_request is not None:
-                self._delayed_requests.append(expedited_read_request)
+                heapq.heappush(self._delayed_requests, expedited_read_request)
             write_read_sequence = self._device_request_providers[
                 device_id
             ].get_write_read_sequence(device_id)
             if write_read_sequence is not None:
-                self._delayed_requests.extend(write_read_sequence)
+                for delayed_request in write_read_sequence:
+                    heapq.heappush(self._delayed_requests, delayed_request)
 
         # Promote any pending smartbox startups whose delay has elapsed.
         ready_smartboxes = [
@@ -815,18 +1321,28 @@ class PasdBusRequestProvider:
             self._logger.info(f"Starting to poll smartbox {smartbox_id}")
             self._ticks[smartbox_id] = self._min_ticks
 
-        # Now see if any delayed requests are ready to be executed.
+        # Now see if the earliest delayed request is ready to be executed.
         # These takes priority over writes so that we can update the polling
         # list if the port power states have changed.
-        for delayed_request in self._delayed_requests:
-            if delayed_request.not_before < time.time():
-                self._delayed_requests.remove(delayed_request)
-                return delayed_request.device_id, *delayed_request.request_description
+        while (
+            self._delayed_requests
+            and self._delayed_requests[0].not_before < time.time()
+        ):
+            delayed_request = heapq.heappop(self._delayed_requests)
+            circuit_breaker = self._get_circuit_breaker(delayed_request.device_id)
+            if not circuit_breaker.allow_request():
+                # Hold the request back until the device can be probed again
+                delayed_request.not_before = circuit_breaker.retry_time
+                heapq.heappush(self._delayed_requests, delayed_request)
+                continue
+            return delayed_request.device_id, *delayed_request.request_description
 
         # Next we check for any write requests.
         for device_id, tick in self._ticks.items():
             if tick < self._min_ticks:
                 break
+            if not self._get_circuit_breaker(device_id).allow_request():
+                continue
             write_request = self._device_request_providers[device_id].get_write()
             if write_request != ("NONE", None):
                 del self._ticks[device_id]
@@ -834,19 +1350,32 @@ class PasdBusRequestProvider:
                 return device_id, *write_request
 
         # No outstanding reads/writes remaining, so cycle through the polling list.
-        fncc_skip = False
+        # A device with nothing to read this time round (e.g. the FNCC while
+        # it waits for the startup info to be read, or a device whose reads
+        # are all periodic or scheduled by staleness) gives up its turn.
+        skipped_device_ids = []
         for device_id, tick in self._ticks.items():
             if tick < self._min_ticks:
                 break
+            if not self._get_circuit_breaker(device_id).allow_request():
+                continue
             read_request = self._device_request_providers[device_id].get_read()
             if read_request == "":
-                fncc_skip = True
+                skipped_device_ids.append(device_id)
                 continue
             del self._ticks[device_id]  # see comment above
             self._ticks[device_id] = 0
-            if fncc_skip:
-                del self._ticks[PasdData.FNCC_DEVICE_ID]
-                self._ticks[PasdData.FNCC_DEVICE_ID] = 0
+            for skipped_device_id in skipped_device_ids:
+                del self._ticks[skipped_device_id]
+                self._ticks[skipped_device_id] = 0
             return device_id, read_request, None
 
+        # Finally, read the stalest of any groups that are scheduled by staleness.
+        stalest_read = self._get_stalest_read()
+        if stalest_read is not None:
+            device_id, group = stalest_read
+            del self._ticks[device_id]  # see comment above
+            self._ticks[device_id] = 0
+            return device_id, group, None
+
         return None
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+This module implements configurable poll schedules for a PaSD bus.
+
+By default, every attribute group in a device's poll cycle is read once
+per cycle. A poll schedule specification allows the relative frequency
+of each group to be tuned per deployment, for example:
+
+.. code-block:: yaml
+
+    FNPC:
+      PORTS: {every: 1}
+      WARNING_FLAGS: {every: 4}
+    FNCC:
+      STATUS: {period: 60}
+
+A group with ``every: N`` is read once every N cycles. A group with
+``period: T`` is read at most once every T seconds, whenever the device's
+turn to be polled comes round, independently of the cycle. Groups and
+controller types that are not specified are read every cycle.
+
+Alternatively, with ``mode: staleness``, there is no poll cycle. Instead
+each group declares the maximum age, in seconds, that its values should
+reach (``max_age: T``), and the group whose age is the largest fraction of
+its maximum age is always read next.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Final, Mapping, Sequence
+
+import yaml
+from cerberus import Validator  # type: ignore[import-untyped]
+
+from .pasd_bus_poll_management import (
+    FNCC_READ_CYCLE,
+    FNDH_READ_CYCLE,
+    SMARTBOX_READ_CYCLE,
+)
+
+__all__ = ["PollSchedule", "compile_poll_schedule", "load_poll_schedules"]
+
+POLL_SCHEDULE_MODES: Final = ("cycle", "staleness")
+"""The ways in which attribute groups can be scheduled for reading."""
+
+DEFAULT_MAX_AGE: Final = 10.0
+"""The maximum age of groups without one, when scheduling by staleness."""
+
+DEFAULT_READ_CYCLES: Final[dict[str, tuple[str, ...]]] = {
+    "FNCC": FNCC_READ_CYCLE,
+    "FNPC": FNDH_READ_CYCLE,
+    "FNSC": SMARTBOX_READ_CYCLE,
+}
+"""The attribute groups in each controller type's poll cycle, in read order."""
+
+MAX_SCHEDULE_CYCLES: Final = 1024
+"""The maximum number of cycles after which a compiled schedule must repeat."""
+
+GROUP_SCHEDULE_SCHEMA: Final = {
+    "type": "dict",
+    "schema": {
+        "every": {
+            "type": "integer",
+            "min": 1,
+            "required": True,
+            "excludes": ["period", "max_age"],
+        },
+        "period": {
+            "type": "number",
+            "min": 0,
+            "required": True,
+            "excludes": ["every", "max_age"],
+        },
+        "max_age": {
+            "type": "number",
+            "min": 0.1,
+            "required": True,
+            "excludes": ["every", "period"],
+        },
+    },
+}
+
+POLL_SCHEDULE_SCHEMA: Final = {
+    "mode": {"type": "string", "allowed": list(POLL_SCHEDULE_MODES)},
+    **{
+        controller: {
+            "type": "dict",
+            "keysrules": {"type": "string", "allowed": list(cycle)},
+            "valuesrules": GROUP_SCHEDULE_SCHEMA,
+        }
+        for controller, cycle in DEFAULT_READ_CYCLES.items()
+    },
+}
+
+
+@dataclass(frozen=True)
+class PollSchedule:
+    """
+    Class representing a compiled poll schedule for one controller type.
+
+    ``cycles`` holds the attribute groups to be read in each successive
+    poll cycle, after which the schedule repeats. A cycle may be empty, in
+    which case nothing is read from the device in that cycle. ``periodic`` maps the
+    names of groups that are read on a timer to their period in seconds.
+    ``max_ages`` maps the names of groups that are read according to their
+    staleness to their maximum age in seconds.
+    """
+
+    cycles: tuple[tuple[str, ...], ...]
+    periodic: dict[str, float] = field(default_factory=dict)
+    max_ages: dict[str, float] = field(default_factory=dict)
+
+
+def compile_poll_schedule(
+    groups: Sequence[str],
+    specification: Mapping[str, Mapping[str, Any]],
+    mode: str = "cycle",
+) -> PollSchedule:
+    """
+    Compile a schedule specification into a repeating sequence of poll cycles.
+
+    The schedule repeats after the lowest common multiple of the groups'
+    ``every`` values. Groups are read in the order given in ``groups``, so
+    that the read planner can still merge neighbouring groups. Cycles in
+    which no groups are due are kept, so that the device gives up its turn
+    to be polled in them: scaling up every group's ``every`` lowers the
+    rate at which the device is read, not just the rates of its groups
+    relative to one another.
+
+    When scheduling by staleness there is no poll cycle, and every group
+    that is not read on a timer has a maximum age instead.
+
+    :param groups: the attribute groups in the poll cycle, in read order.
+    :param specification: a mapping from group name to one of
+        ``{"every": N}``, ``{"period": T}`` or ``{"max_age": T}``.
+    :param mode: "cycle" or "staleness".
+
+    :raises ValueError: if the specification does not suit the mode, or
+        the schedule would not repeat within ``MAX_SCHEDULE_CYCLES`` cycles.
+
+    :return: the compiled poll schedule.
+    """
+    periodic = {
+        group: float(specification[group]["period"])
+        for group in groups
+        if "period" in specification.get(group, {})
+    }
+    unexpected = "every" if mode == "staleness" else "max_age"
+    for group, group_specification in specification.items():
+        if unexpected in group_specification:
+            raise ValueError(
+                f"Poll schedule for {group} can't use {unexpected} in {mode} mode."
+            )
+    if mode == "staleness":
+        max_ages = {
+            group: float(specification.get(group, {}).get("max_age", DEFAULT_MAX_AGE))
+            for group in groups
+            if group not in periodic
+        }
+        return PollSchedule((), periodic, max_ages)
+
+    every = {
+        group: int(specification.get(group, {}).get("every", 1))
+        for group in groups
+        if group not in periodic
+    }
+    if not every:
+        return PollSchedule((), periodic)
+    length = math.lcm(*every.values())
+    if length > MAX_SCHEDULE_CYCLES:
+        raise ValueError(
+            f"Poll schedule {every} only repeats after {length} cycles "
+            f"(maximum {MAX_SCHEDULE_CYCLES})."
+        )
+    cycles = [
+        tuple(group for group in every if index % every[group] == 0)
+        for index in range(length)
+    ]
+    return PollSchedule(tuple(cycles), periodic)
+
+
+def load_poll_schedules(specification: str) -> dict[str, PollSchedule]:
+    """
+    Load, validate and compile a poll schedule specification.
+
+    :param specification: a YAML (or JSON) string, mapping controller type
+        ("FNCC", "FNPC" or "FNSC") to the schedule of its attribute groups,
+        along with an optional scheduling "mode". An empty string gives the
+        default schedule.
+
+    :raises ValueError: if the specification is invalid.
+
+    :return: a dictionary of compiled poll schedules, keyed by controller type.
+    """
+    try:
+        loaded = yaml.safe_load(specification) or {}
+    except yaml.YAMLError as error:
+        raise ValueError(f"Poll schedule is not valid YAML: {error}") from error
+    if not isinstance(loaded, dict):
+        raise ValueError(f"Poll schedule must be a mapping, not {loaded!r}")
+    validator = Validator(POLL_SCHEDULE_SCHEMA)
+    if not validator.validate(loaded):
+        raise ValueError(f"Poll schedule validation errors: {validator.errors}")
+    mode = loaded.get("mode", "cycle")
+    return {
+        controller: compile_poll_schedule(cycle, loaded.get(controller, {}), mode)
+        for controller, cycle in DEFAULT_READ_CYCLES.items()
+    }
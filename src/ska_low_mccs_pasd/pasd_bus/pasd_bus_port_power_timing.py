@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+This module implements timing of port power commands on a PaSD bus.
+
+A request to set the port powers of a PaSD device is not written straight
+away: FNDH ports are staggered, and a smartbox that has just been powered
+on is not polled until its startup delay has passed, and is then
+initialised. A ``PortPowerTimingTracker`` times each request from when it
+is made, through the Modbus writes to the device, to when the ports are
+read back in their desired states, so that the time spent waiting on the
+bus can be told apart from the time spent by the hardware.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Final, Optional, Sequence
+
+from ska_low_mccs_pasd.command_timing import CommandTimer, CommandTimingLog
+
+__all__ = ["PortPowerTimingTracker"]
+
+TIMED_WRITE_KINDS: Final = frozenset(
+    ["INITIALIZE", "WRITE", "SET_LOW_PASS_FILTER", "SET_PORT_POWERS"]
+)
+"""The kinds of request that are marked in the reports of port power commands."""
+
+
+class _PortPowerRequest:
+    """A port power request that is waiting to be fulfilled."""
+
+    def __init__(
+        self: _PortPowerRequest,
+        timer: CommandTimer,
+        device_id: int,
+        port_powers: Sequence[bool | None],
+    ) -> None:
+        self.timer = timer
+        self.device_id = device_id
+        self.desired = {
+            port: power for port, power in enumerate(port_powers) if power is not None
+        }
+        self.first_write: Optional[float] = None
+        self.last_write: Optional[float] = None
+        self.responded = False
+
+
+class PortPowerTimingTracker:
+    """Times port power requests from when they are made until they are sensed."""
+
+    def __init__(
+        self: PortPowerTimingTracker, capacity: int = 100, max_age: float = 600.0
+    ) -> None:
+        """
+        Initialise a new instance.
+
+        :param capacity: the number of requests whose reports are kept.
+        :param max_age: time in seconds after which a request whose ports
+            have not been sensed in their desired states is given up on.
+        """
+        self._log = CommandTimingLog(capacity)
+        self._max_age = max_age
+        self._pending: list[_PortPowerRequest] = []
+        self._lock = threading.Lock()
+
+    def start(
+        self: PortPowerTimingTracker,
+        command_name: str,
+        device_id: int,
+        port_powers: Sequence[bool | None],
+        command_id: Optional[str] = None,
+    ) -> None:
+        """
+        Start timing a port power request.
+
+        :param command_name: the name of the command that made the request.
+        :param device_id: the ID of the device whose ports are to be set.
+        :param port_powers: the desired power of each port, or None for
+            no change.
+        :param command_id: the ID of the command that the request is part
+            of, if any.
+        """
+        timer = self._log.start(command_name, command_id)
+        timer.mark("requested", timer.start_time, device_id=device_id)
+        request = _PortPowerRequest(timer, device_id, port_powers)
+        with self._lock:
+            for stale in [
+                pending
+                for pending in self._pending
+                if timer.start_time - pending.timer.start_time > self._max_age
+            ]:
+                self._finish(stale, "TIMED_OUT", timer.start_time)
+            if request.desired:
+                self._pending.append(request)
+            else:
+                timer.finish("OK", timer.start_time)
+
+    def record_transaction(
+        self: PortPowerTimingTracker,
+        device_id: int,
+        kind: str,
+        arguments: Any,
+        timestamp: float,
+    ) -> None:
+        """
+        Record a successful transaction with a device.
+
+        The first transaction with the device after a request is marked,
+        as are writes of the kinds in ``TIMED_WRITE_KINDS``.
+
+        :param device_id: the ID of the device.
+        :param kind: the kind of request, e.g. "SET_PORT_POWERS".
+        :param arguments: the arguments of the request. For a port power
+            write, the power to set each port to, or None; for an attribute
+            write, the name of the attribute.
+        :param timestamp: the time.time() at which the transaction started.
+        """
+        with self._lock:
+            for request in self._pending:
+                if request.device_id != device_id:
+                    continue
+                if not request.responded:
+                    request.responded = True
+                    request.timer.mark("first_response", timestamp)
+                if kind not in TIMED_WRITE_KINDS:
+                    continue
+                if kind == "SET_PORT_POWERS":
+                    ports = [
+                        port
+                        for port in request.desired
+                        if port < len(arguments) and arguments[port] is not None
+                    ]
+                    if not ports:
+                        continue
+                    if request.first_write is None:
+                        request.first_write = timestamp
+                    request.last_write = timestamp
+                    request.timer.mark(
+                        kind, timestamp, ports=[port + 1 for port in ports]
+                    )
+                elif kind == "WRITE":
+                    request.timer.mark(kind, timestamp, attribute=arguments)
+                else:
+                    request.timer.mark(kind, timestamp)
+
+    def record_ports_sensed(
+        self: PortPowerTimingTracker,
+        device_id: int,
+        ports_power_sensed: Sequence[bool],
+    ) -> None:
+        """
+        Record that the port powers of a device have been read.
+
+        Requests whose ports are all in their desired states are finished.
+
+        :param device_id: the ID of the device.
+        :param ports_power_sensed: whether each port of the device is on.
+        """
+        timestamp = time.time()
+        with self._lock:
+            for request in [
+                request
+                for request in self._pending
+                if request.device_id == device_id
+                and request.last_write is not None
+                and all(
+                    port < len(ports_power_sensed)
+                    and bool(ports_power_sensed[port]) == power
+                    for port, power in request.desired.items()
+                )
+            ]:
+                self._finish(request, "OK", timestamp)
+
+    def abort(self: PortPowerTimingTracker) -> None:
+        """Give up on all of the requests that have not been fulfilled."""
+        timestamp = time.time()
+        with self._lock:
+            for request in list(self._pending):
+                self._finish(request, "ABORTED", timestamp)
+
+    def _finish(
+        self: PortPowerTimingTracker,
+        request: _PortPowerRequest,
+        result: str,
+        timestamp: float,
+    ) -> None:
+        timer = request.timer
+        if request.first_write is not None:
+            assert request.last_write is not None
+            timer.add_phase("wait_for_write", timer.start_time, request.first_write)
+            if request.last_write > request.first_write:
+                timer.add_phase("port_stagger", request.first_write, request.last_write)
+            if result == "OK":
+                timer.add_phase("wait_for_sense", request.last_write, timestamp)
+        timer.finish(result, timestamp)
+        self._pending.remove(request)
+
+    def reports(
+        self: PortPowerTimingTracker, command_id: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Return the reports of the most recent port power requests, oldest first.
+
+        :param command_id: only return the reports of requests made as
+            part of the command with this ID.
+
+        :return: a list of timing reports.
+        """
+        return self._log.reports(command_id)
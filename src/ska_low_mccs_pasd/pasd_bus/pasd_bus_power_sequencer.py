@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+This module implements adaptive sequencing of FNDH port power-on.
+
+Powering on the FNDH ports one at a time, a fixed delay apart, keeps the
+inrush current of the smartboxes from tripping the 48V PSU, but powering
+on a whole station then takes the number of ports times that delay, however
+much headroom the PSU has. A ``PowerSequencingPlanner`` instead decides how
+many ports to power on at once from the PSU current and voltage read from
+the FNDH after each batch has settled. The batch size doubles while the
+current stays within its limit, and is halved when the limit is exceeded
+or the voltage sags. The current drawn by each newly powered port is
+learnt from the rise in the PSU current, so that no batch is larger than
+the headroom left under the limit.
+"""
+from __future__ import annotations
+
+import logging
+import math
+
+from ska_low_mccs_pasd.pasd_data import PasdData
+
+__all__ = ["PowerSequencingPlanner"]
+
+
+# pylint: disable=too-many-instance-attributes
+class PowerSequencingPlanner:
+    """
+    Plans the batches in which FNDH ports are powered on.
+
+    Each batch is only planned once the PSU reading that follows the
+    previous batch has settled. If no such reading arrives within the
+    fallback time, ports are powered on one at a time, a fallback time
+    apart, as they would be without a planner. If a settled reading leaves
+    no headroom for another port, power-on is held until the current falls,
+    for at most the maximum hold time, after which the pending ports should
+    be given up on.
+    """
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def __init__(
+        self: PowerSequencingPlanner,
+        current_limit: float,
+        port_current: float,
+        settle_time: float,
+        fallback_time: float,
+        logger: logging.Logger,
+        min_voltage: float = 0.0,
+        max_batch_size: int = PasdData.NUMBER_OF_FNDH_PORTS,
+        max_hold_time: float = 60.0,
+    ) -> None:
+        """
+        Initialise a new instance.
+
+        :param current_limit: the PSU current, in amps, that powering on
+            ports should not take the FNDH over.
+        :param port_current: the estimated current, in amps, drawn by each
+            port once it is powered on. The estimate learnt from the PSU
+            readings is never less than this.
+        :param settle_time: time in seconds after a batch is powered on
+            before the PSU readings reflect it.
+        :param fallback_time: time in seconds after which the next port is
+            powered on regardless, if no settled PSU reading has arrived.
+        :param logger: a logger.
+        :param min_voltage: the PSU voltage below which no more ports are
+            powered on. Zero disables the voltage check.
+        :param max_batch_size: the largest number of ports to power on at
+            once. Defaults to all of the FNDH ports.
+        :param max_hold_time: the longest time in seconds for which power-on
+            is held for lack of headroom before it is given up on. Zero
+            holds it indefinitely.
+        """
+        self._current_limit = current_limit
+        self._min_port_current = port_current
+        self._port_current = port_current
+        self._settle_time = settle_time
+        self._fallback_time = fallback_time
+        self._logger = logger
+        self._min_voltage = min_voltage
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_hold_time = max_hold_time
+        # The time since which power-on has been held for lack of headroom.
+        self._hold_time: float | None = None
+        self._batch_size = 1
+        self._current: float | None = None
+        self._voltage: float | None = None
+        self._batch_ports = 0
+        self._batch_time = -math.inf
+        self._baseline_current: float | None = None
+        self._awaiting_reading = False
+
+    @property
+    def batch_size(self: PowerSequencingPlanner) -> int:
+        """
+        Return the number of ports that may be powered on at once.
+
+        :return: the current batch size, before it is limited by headroom.
+        """
+        return self._batch_size
+
+    @property
+    def port_current(self: PowerSequencingPlanner) -> float:
+        """
+        Return the estimated current drawn by each powered port.
+
+        :return: the estimated current per port, in amps.
+        """
+        return self._port_current
+
+    @property
+    def headroom(self: PowerSequencingPlanner) -> float | None:
+        """
+        Return the current that can still be drawn without exceeding the limit.
+
+        :return: the headroom in amps, or None if the PSU current has not
+            been read.
+        """
+        if self._current is None:
+            return None
+        return self._current_limit - self._current
+
+    def _is_overloaded(self: PowerSequencingPlanner) -> bool:
+        assert self._current is not None
+        if self._current > self._current_limit:
+            return True
+        return (
+            self._min_voltage > 0
+            and self._voltage is not None
+            and self._voltage < self._min_voltage
+        )
+
+    def update_readings(
+        self: PowerSequencingPlanner,
+        current: float,
+        voltage: float | None,
+        timestamp: float,
+    ) -> None:
+        """
+        Update the PSU readings of the FNDH.
+
+        The first reading taken once a batch has settled adapts the batch
+        size, and the estimated current drawn by each port.
+
+        :param current: the PSU current, in amps.
+        :param voltage: the PSU voltage, in volts, if it was read.
+        :param timestamp: the time at which the readings were taken.
+        """
+        self._current = current
+        if voltage is not None:
+            self._voltage = voltage
+        if (
+            not self._awaiting_reading
+            or timestamp < self._batch_time + self._settle_time
+        ):
+            return
+        self._awaiting_reading = False
+        if self._is_overloaded():
+            self._batch_size = max(1, self._batch_size // 2)
+            self._logger.warning(
+                f"FNDH PSU at {current}A, {self._voltage}V after powering on "
+                f"{self._batch_ports} ports; reducing the port power-on batch size "
+                f"to {self._batch_size}"
+            )
+            return
+        if self._baseline_current is not None and self._batch_ports:
+            observed = (current - self._baseline_current) / self._batch_ports
+            self._port_current = max(
+                self._min_port_current, (self._port_current + observed) / 2
+            )
+        if self._batch_ports:
+            self._batch_size = min(self._max_batch_size, 2 * self._batch_size)
+
+    def get_batch_size(self: PowerSequencingPlanner, pending: int, now: float) -> int:
+        """
+        Return how many ports to power on now.
+
+        :param pending: the number of ports waiting to be powered on.
+        :param now: the current time.
+
+        :return: the number of ports to power on, which is zero while the
+            previous batch settles, or while there is not enough headroom
+            for another port.
+        """
+        if pending <= 0:
+            self._hold_time = None
+            return 0
+        if self._awaiting_reading or self._current is None:
+            # Without a settled reading, fall back to a fixed stagger.
+            return 1 if now >= self._batch_time + self._fallback_time else 0
+        batch_size = 0
+        if not self._is_overloaded():
+            batch_size = min(pending, self._batch_size)
+            if self._port_current > 0:
+                headroom = self._current_limit - self._current
+                batch_size = max(
+                    0, min(batch_size, int(headroom // self._port_current))
+                )
+        if batch_size:
+            self._hold_time = None
+        elif self._hold_time is None:
+            self._hold_time = now
+            self._logger.warning(
+                f"Holding power-on of {pending} FNDH ports: the PSU is at "
+                f"{self._current}A, {self._voltage}V, which leaves no headroom "
+                f"under the {self._current_limit}A limit for another "
+                f"{self._port_current:.2f}A port"
+            )
+        return batch_size
+
+    def is_hold_expired(self: PowerSequencingPlanner, now: float) -> bool:
+        """
+        Return whether power-on has been held for lack of headroom for too long.
+
+        :param now: the current time.
+
+        :return: whether power-on has been held for longer than the maximum
+            hold time.
+        """
+        return (
+            self._hold_time is not None
+            and self._max_hold_time > 0
+            and now - self._hold_time >= self._max_hold_time
+        )
+
+    def end_hold(self: PowerSequencingPlanner) -> None:
+        """End the hold on power-on, once the pending ports are given up on."""
+        self._hold_time = None
+
+    def record_batch(self: PowerSequencingPlanner, ports: int, now: float) -> None:
+        """
+        Record that a batch of port power changes has been written.
+
+        :param ports: the number of ports powered on. Zero records ports
+            being powered off, which the next batch waits to settle.
+        :param now: the time at which the batch was written.
+        """
+        self._baseline_current = None if self._awaiting_reading else self._current
+        self._batch_ports = ports
+        self._batch_time = now
+        self._awaiting_reading = True
+        if ports:
+            self._logger.info(
+                f"Powering on {ports} FNDH ports (headroom {self.headroom}A, "
+                f"{self._port_current:.2f}A per port)"
+            )
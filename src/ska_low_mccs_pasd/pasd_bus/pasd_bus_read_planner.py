@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+This module implements read planning for a PaSD bus.
+
+Attributes are read from the PaSD devices in groups (status, ports,
+warning flags, etc.), each of which used to be a separate Modbus
+transaction. The read planner uses the register addresses and sizes in
+the PaSD controllers' configuration to merge groups that are read one
+after the other, and whose registers are adjacent or separated by only a
+small gap, into a single block read.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Final, Sequence
+
+from ..pasd_controllers_configuration import RegisterDict
+
+__all__ = ["PasdBusReadPlanner", "ReadBlock", "MAX_REGISTERS_PER_READ"]
+
+MAX_REGISTERS_PER_READ: Final = 125
+"""The maximum number of registers in a Modbus 'read holding registers' request."""
+
+BLOCK_NAME_SEPARATOR: Final = "+"
+"""The separator between group names in the name of a merged read block."""
+
+
+@dataclass(frozen=True)
+class ReadBlock:
+    """
+    Class representing a single Modbus block read.
+
+    A block comprises one or more attribute groups, whose attributes are
+    read in a single transaction spanning ``register_count`` registers from
+    ``start_address``.
+    """
+
+    groups: tuple[str, ...]
+    group_attributes: tuple[tuple[str, ...], ...]
+    start_address: int
+    register_count: int
+
+    @property
+    def name(self: ReadBlock) -> str:
+        """
+        Return the name of this block.
+
+        :return: the names of the groups in this block, joined by "+".
+        """
+        return BLOCK_NAME_SEPARATOR.join(self.groups)
+
+    @property
+    def attributes(self: ReadBlock) -> list[str]:
+        """
+        Return the names of all the attributes read by this block.
+
+        :return: a list of attribute names.
+        """
+        return [name for group in self.group_attributes for name in group]
+
+    def to_dict(self: ReadBlock) -> dict[str, Any]:
+        """
+        Return a JSON-serialisable description of this block.
+
+        :return: a dictionary describing this block.
+        """
+        return {
+            "name": self.name,
+            "groups": list(self.groups),
+            "start_address": self.start_address,
+            "register_count": self.register_count,
+        }
+
+
+class PasdBusReadPlanner:
+    """
+    A class that plans the block reads for one type of PaSD device.
+
+    It knows the register span of each attribute group, and merges
+    consecutive groups in a read cycle into a single block read when:
+
+    * the gap between their register spans is no more than ``max_gap``
+      registers; and
+    * the merged span fits in a single Modbus read request.
+
+    Register addresses are taken from the base register map. The Modbus
+    API maps attribute names onto the register map revision in use by the
+    device, so the plan remains valid across revisions that only append
+    registers.
+    """
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def __init__(
+        self: PasdBusReadPlanner,
+        registers: dict[str, RegisterDict],
+        groups: dict[str, list[str]],
+        max_gap: int,
+        logger: logging.Logger,
+        max_registers: int = MAX_REGISTERS_PER_READ,
+    ) -> None:
+        """
+        Initialise a new instance.
+
+        :param registers: the register configuration of the device type.
+        :param groups: a mapping from attribute group name (e.g. "STATUS")
+            to the names of the attributes in that group.
+        :param max_gap: the maximum number of unused registers allowed between
+            two groups for them to be merged. A negative value disables merging.
+        :param logger: a logger.
+        :param max_registers: the maximum number of registers in a block read.
+        """
+        self._logger = logger
+        self._max_gap = max_gap
+        self._max_registers = max_registers
+        self._blocks: dict[str, ReadBlock] = {}
+        for group, attributes in groups.items():
+            addresses = [
+                (registers[name]["address"], registers[name]["size"])
+                for name in attributes
+            ]
+            start = min((address for address, _ in addresses), default=0)
+            end = max((address + size for address, size in addresses), default=0)
+            self._blocks[group] = ReadBlock(
+                (group,),
+                (tuple(attributes),),
+                start,
+                end - start,
+            )
+        self._registers = registers
+
+    @staticmethod
+    def _by_address(
+        registers: dict[str, RegisterDict], attributes: Sequence[str]
+    ) -> list[str]:
+        # Python's sort is stable, so attributes which share registers
+        # (e.g. the port attributes) stay in their configured order.
+        return sorted(attributes, key=lambda name: registers[name]["address"])
+
+    def _merge(
+        self: PasdBusReadPlanner, first: ReadBlock, second: ReadBlock
+    ) -> ReadBlock:
+        start = min(first.start_address, second.start_address)
+        end = max(
+            first.start_address + first.register_count,
+            second.start_address + second.register_count,
+        )
+        return ReadBlock(
+            first.groups + second.groups,
+            first.group_attributes + second.group_attributes,
+            start,
+            end - start,
+        )
+
+    def _gap(self: PasdBusReadPlanner, first: ReadBlock, second: ReadBlock) -> int:
+        first_end = first.start_address + first.register_count
+        second_end = second.start_address + second.register_count
+        return max(
+            second.start_address - first_end, first.start_address - second_end, 0
+        )
+
+    def plan_cycle(self: PasdBusReadPlanner, cycle: Sequence[str]) -> list[ReadBlock]:
+        """
+        Plan the block reads for a cycle of attribute group reads.
+
+        Merged blocks are remembered, so that they can later be looked up by
+        name with :py:meth:`get_block`.
+
+        :param cycle: the names of the attribute groups, in the order in
+            which they are read.
+
+        :return: the block reads that make up the cycle.
+        """
+        plan: list[ReadBlock] = []
+        for group in cycle:
+            block = self._blocks[group]
+            if plan and self._max_gap >= 0:
+                merged = self._merge(plan[-1], block)
+                gap = self._gap(plan[-1], block)
+                if (
+                    gap <= self._max_gap
+                    and merged.register_count <= self._max_registers
+                ):
+                    self._logger.debug(
+                        f"Merging {group} read into {plan[-1].name} read: "
+                        f"gap of {gap} registers, "
+                        f"block of {merged.register_count} registers"
+                    )
+                    plan[-1] = merged
+                    continue
+                self._logger.debug(
+                    f"Not merging {group} read into {plan[-1].name} read: "
+                    f"gap of {gap} registers, "
+                    f"block of {merged.register_count} registers"
+                )
+            plan.append(block)
+
+        for block in plan:
+            if len(block.groups) > 1:
+                self._blocks[block.name] = block
+        return plan
+
+    def get_block(self: PasdBusReadPlanner, name: str) -> ReadBlock | None:
+        """
+        Return the block read with the given name.
+
+        :param name: the name of an attribute group, or of a merged block.
+
+        :return: the block read, or None if the name is not recognised.
+        """
+        return self._blocks.get(name)
+
+    def get_attributes(self: PasdBusReadPlanner, name: str) -> list[str]:
+        """
+        Return the names of the attributes to read for a group or block.
+
+        Attributes are ordered by register address.
+
+        :param name: the name of an attribute group, or of a merged block.
+
+        :return: a list of attribute names.
+        """
+        return self._by_address(self._registers, self._blocks[name].attributes)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+This module implements round-trip time estimation for a PaSD bus.
+
+The round-trip time of each kind of transaction with each device is
+estimated from measurements, using the smoothed mean and mean deviation
+estimator used for TCP retransmission timeouts (RFC 6298). The PaSD bus
+Modbus API client has a single timeout for all requests, so the estimates
+are only reported, for diagnosis.
+"""
+from __future__ import annotations
+
+from typing import Any, Final
+
+__all__ = ["RttEstimator"]
+
+RTT_GAIN: Final = 1 / 8
+"""The gain of the smoothed round-trip time estimate."""
+
+RTT_DEVIATION_GAIN: Final = 1 / 4
+"""The gain of the round-trip time mean deviation estimate."""
+
+
+class RttEstimator:
+    """A streaming estimator of the round-trip time of one kind of transaction."""
+
+    def __init__(self: RttEstimator) -> None:
+        """Initialise a new instance."""
+        self._smoothed_rtt: float | None = None
+        self._rtt_deviation = 0.0
+        self._samples = 0
+
+    @property
+    def smoothed_rtt(self: RttEstimator) -> float | None:
+        """
+        Return the smoothed round-trip time.
+
+        :return: the smoothed round-trip time in seconds, or None if no
+            round-trip time has been measured.
+        """
+        return self._smoothed_rtt
+
+    @property
+    def rtt_deviation(self: RttEstimator) -> float:
+        """
+        Return the mean deviation of the round-trip time.
+
+        :return: the mean deviation in seconds.
+        """
+        return self._rtt_deviation
+
+    def record_rtt(self: RttEstimator, rtt: float) -> None:
+        """
+        Update the estimate with a measured round-trip time.
+
+        :param rtt: the round-trip time of a successful transaction, in seconds.
+        """
+        if self._smoothed_rtt is None:
+            self._smoothed_rtt = rtt
+            self._rtt_deviation = rtt / 2
+        else:
+            self._rtt_deviation += RTT_DEVIATION_GAIN * (
+                abs(self._smoothed_rtt - rtt) - self._rtt_deviation
+            )
+            self._smoothed_rtt += RTT_GAIN * (rtt - self._smoothed_rtt)
+        self._samples += 1
+
+    def to_dict(self: RttEstimator) -> dict[str, Any]:
+        """
+        Return a JSON-serialisable description of the estimate.
+
+        :return: a dictionary describing the estimate.
+        """
+        return {
+            "smoothed_rtt": self._smoothed_rtt,
+            "rtt_deviation": self._rtt_deviation,
+            "samples": self._samples,
+        }
@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+This module implements aggregated snapshots of the state of a PaSD device.
+
+Instead of subscribing to a separate attribute of the PaSD bus device for
+each register of a PaSD device, a client may subscribe to a single
+snapshot attribute for the whole device, e.g. ``smartbox5Snapshot``. An
+event is pushed on it for each poll response of the device, carrying all
+of the values in the response that changed, and reading it gives the whole
+state of the device.
+
+A snapshot is a compact JSON object with a schema version, a timestamp,
+the valid values keyed by register (the name of the Tango attribute for
+the register, without the device prefix) and the values that are no
+longer valid. Values that are numeric arrays are packed into their raw
+bytes, base64 encoded along with their NumPy dtype and shape:
+
+.. code-block:: json
+
+    {"version": 2, "timestamp": 1760612345.1,
+     "values": {"InputVoltage": 48.1,
+                "PortsPowerSensed": {"dtype": "|b1", "shape": [2], "data": "AQA="}},
+     "invalid": {}}
+"""
+from __future__ import annotations
+
+import base64
+import enum
+import json
+from dataclasses import dataclass, field
+from typing import Any, Final, Mapping
+
+import numpy as np
+
+__all__ = [
+    "PasdSnapshot",
+    "SNAPSHOT_ATTRIBUTE_SUFFIX",
+    "SNAPSHOT_SCHEMA_VERSION",
+    "decode_snapshot",
+    "decode_state_snapshot",
+    "encode_snapshot",
+    "encode_state_snapshot",
+]
+
+SNAPSHOT_SCHEMA_VERSION: Final = 2
+"""The version of the snapshot schema."""
+
+SNAPSHOT_ATTRIBUTE_SUFFIX: Final = "Snapshot"
+"""The suffix of the snapshot attribute name, after the device prefix."""
+
+PACKED_DTYPE_KINDS: Final = "biuf"
+"""The NumPy dtype kinds of the array values that are packed in a snapshot."""
+
+
+@dataclass(frozen=True)
+class PasdSnapshot:
+    """
+    Class representing a snapshot of the state of a PaSD device.
+
+    ``values`` and ``invalid`` map register names, i.e. the Tango attribute
+    names without the device prefix, to valid and invalid values
+    respectively.
+    """
+
+    timestamp: float
+    values: dict[str, Any] = field(default_factory=dict)
+    invalid: dict[str, Any] = field(default_factory=dict)
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Can't encode {type(value).__name__} in a PaSD snapshot")
+
+
+def encode_snapshot(snapshot: PasdSnapshot) -> str:
+    """
+    Encode a snapshot for pushing in an attribute.
+
+    :param snapshot: the snapshot to encode.
+
+    :return: a compact JSON string.
+    """
+    return json.dumps(
+        {
+            "version": SNAPSHOT_SCHEMA_VERSION,
+            "timestamp": snapshot.timestamp,
+            "values": {
+                name: _pack_value(value) for name, value in snapshot.values.items()
+            },
+            "invalid": {
+                name: _pack_value(value) for name, value in snapshot.invalid.items()
+            },
+        },
+        separators=(",", ":"),
+        default=_to_json,
+    )
+
+
+def decode_snapshot(encoded: str) -> PasdSnapshot:
+    """
+    Decode a snapshot received from a snapshot attribute.
+
+    Values that were packed are unpacked into NumPy arrays.
+
+    :param encoded: the JSON string from the snapshot attribute.
+
+    :raises ValueError: if the snapshot is not valid, or has an unsupported
+        schema version.
+
+    :return: the snapshot.
+    """
+    try:
+        loaded = json.loads(encoded)
+    except json.JSONDecodeError as error:
+        raise ValueError(f"PaSD snapshot is not valid JSON: {error}") from error
+    if not isinstance(loaded, dict) or "version" not in loaded:
+        raise ValueError("PaSD snapshot has no schema version")
+    if loaded["version"] != SNAPSHOT_SCHEMA_VERSION:
+        raise ValueError(
+            f"Unsupported PaSD snapshot schema version {loaded['version']} "
+            f"(expected {SNAPSHOT_SCHEMA_VERSION})"
+        )
+    return PasdSnapshot(
+        loaded.get("timestamp", 0.0),
+        {
+            name: _unpack_value(value)
+            for name, value in loaded.get("values", {}).items()
+        },
+        {
+            name: _unpack_value(value)
+            for name, value in loaded.get("invalid", {}).items()
+        },
+    )
+
+
+def _pack_array(array: np.ndarray) -> dict[str, Any]:
+    """
+    Pack a numeric array into its raw bytes.
+
+    :param array: the array to pack.
+
+    :return: a JSON-serialisable description of the array, with its data
+        base64 encoded.
+    """
+    array = np.ascontiguousarray(array)
+    return {
+        "dtype": array.dtype.str,
+        "shape": list(array.shape),
+        "data": base64.b64encode(array.tobytes()).decode("ascii"),
+    }
+
+
+def _unpack_array(packed: Mapping[str, Any]) -> np.ndarray:
+    """
+    Unpack an array packed by :py:func:`_pack_array`.
+
+    :param packed: the packed array.
+
+    :return: the array.
+    """
+    return np.frombuffer(
+        base64.b64decode(packed["data"]), dtype=np.dtype(packed["dtype"])
+    ).reshape(packed["shape"])
+
+
+def _unpack_value(value: Any) -> Any:
+    """
+    Unpack a value packed by :py:func:`_pack_value`.
+
+    :param value: the value, as decoded from JSON.
+
+    :return: the unpacked array, or the value itself if it was not packed.
+    """
+    return _unpack_array(value) if isinstance(value, dict) else value
+
+
+def _pack_value(value: Any) -> Any:
+    """
+    Pack a value if it is a numeric array, in the smallest integer type that fits.
+
+    :param value: the value of an attribute.
+
+    :return: the packed array, or the value itself if it is not a numeric
+        array.
+    """
+    if isinstance(value, (list, tuple)) and value:
+        if any(item is None or isinstance(item, str) for item in value):
+            return value
+        value = np.asarray(value)
+    if not isinstance(value, np.ndarray) or value.dtype.kind not in PACKED_DTYPE_KINDS:
+        return value
+    if value.dtype.kind in "iu" and value.size:
+        low, high = int(value.min()), int(value.max())
+        value = value.astype(
+            np.min_scalar_type(min(low, -high - 1))
+            if low < 0
+            else np.min_scalar_type(high)
+        )
+    return _pack_array(value)
+
+
+def encode_state_snapshot(state: Mapping[str, tuple[Any, int, float]]) -> str:
+    """
+    Encode a snapshot of the state of many PaSD attributes.
+
+    Unlike the snapshot of a single PaSD device, this is keyed by the full
+    Tango attribute name, and has the quality and timestamp of each
+    attribute as well as its value. It is laid out in columns: the names
+    of the attributes, and their values, qualities and timestamps in the
+    same order. The quality and timestamp columns, and the values that are
+    numeric arrays, are packed into their raw bytes, base64 encoded along
+    with their NumPy dtype and shape:
+
+    .. code-block:: json
+
+        {"version": 2, "names": ["fndhUptime", "fndhPortsPowerSensed"],
+         "values": [1234, {"dtype": "|b1", "shape": [2], "data": "AQA="}],
+         "qualities": {"dtype": "|i1", "shape": [2], "data": "AAA="},
+         "timestamps": {"dtype": "<f8", "shape": [2], "data": "..."}}
+
+    Use :py:func:`decode_state_snapshot` to decode it.
+
+    :param state: the value, the integer value of the Tango quality, and
+        the timestamp of each attribute, keyed by attribute name.
+
+    :return: a compact JSON string.
+    """
+    return json.dumps(
+        {
+            "version": SNAPSHOT_SCHEMA_VERSION,
+            "names": list(state),
+            "values": [_pack_value(value) for value, _, _ in state.values()],
+            "qualities": _pack_array(
+                np.fromiter(
+                    (quality for _, quality, _ in state.values()),
+                    dtype=np.int8,
+                    count=len(state),
+                )
+            ),
+            "timestamps": _pack_array(
+                np.fromiter(
+                    (timestamp for _, _, timestamp in state.values()),
+                    dtype=np.float64,
+                    count=len(state),
+                )
+            ),
+        },
+        separators=(",", ":"),
+        default=_to_json,
+    )
+
+
+def decode_state_snapshot(encoded: str) -> dict[str, tuple[Any, int, float]]:
+    """
+    Decode a snapshot of the state of many PaSD attributes.
+
+    Values that were packed are unpacked into NumPy arrays.
+
+    :param encoded: the JSON string returned by the GetPasdSnapshot command.
+
+    :raises ValueError: if the snapshot is not valid, or has an unsupported
+        schema version.
+
+    :return: the value, the integer value of the Tango quality, and the
+        timestamp of each attribute, keyed by attribute name.
+    """
+    try:
+        loaded = json.loads(encoded)
+    except json.JSONDecodeError as error:
+        raise ValueError(f"PaSD state snapshot is not valid JSON: {error}") from error
+    if not isinstance(loaded, dict) or "version" not in loaded:
+        raise ValueError("PaSD state snapshot has no schema version")
+    if loaded["version"] != SNAPSHOT_SCHEMA_VERSION:
+        raise ValueError(
+            f"Unsupported PaSD state snapshot schema version {loaded['version']} "
+            f"(expected {SNAPSHOT_SCHEMA_VERSION})"
+        )
+    values = [_unpack_value(value) for value in loaded["values"]]
+    qualities = _unpack_array(loaded["qualities"]).tolist()
+    timestamps = _unpack_array(loaded["timestamps"]).tolist()
+    return {
+        name: (value, quality, timestamp)
+        for name, value, quality, timestamp in zip(
+            loaded["names"], values, qualities, timestamps
+        )
+    }
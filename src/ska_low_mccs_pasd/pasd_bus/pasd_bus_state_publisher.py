@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+This module implements the publishing of PaSD device state updates.
+
+Each update read from the PaSD bus has to be written into the Tango
+device's attributes, which pushes change and archive events to its
+clients. If that is done on the poll thread, slow clients slow down the
+polling of the bus. Instead, updates are put on a bounded queue and
+published by a dedicated thread. If the publisher falls behind, so that
+an attribute group is read again before its previous values have been
+published, the previous values are superseded and only the latest are
+published.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Final
+
+__all__ = ["PasdStatePublisher"]
+
+MAX_QUEUED_UPDATES: Final = 1024
+"""The maximum number of state updates waiting to be published."""
+
+STOP_TIMEOUT: Final = 5.0
+"""The time in seconds to wait for the publisher thread to stop."""
+
+
+# pylint: disable=too-many-instance-attributes
+class PasdStatePublisher:
+    """
+    A publisher of PaSD device state updates, on a dedicated thread.
+
+    Updates of the values of a device's attributes are coalesced with a
+    queued update of the same attributes of the same device: the queued
+    update is removed, and the new one is queued behind everything else, so
+    an update is never moved ahead of an earlier update of the same device.
+    Other updates, such as errors, are never coalesced. If the queue is
+    still full, the oldest update is dropped.
+
+    The end of the updates of each poll response can also be marked, so
+    that the response callback is called once all of them are published.
+    """
+
+    def __init__(
+        self: PasdStatePublisher,
+        callback: Callable[..., None],
+        logger: logging.Logger,
+        max_queued_updates: int = MAX_QUEUED_UPDATES,
+        response_callback: Callable[[int], None] | None = None,
+    ) -> None:
+        """
+        Initialise a new instance, and start its publisher thread.
+
+        :param callback: the callback to publish updates to. It is called
+            with the device ID as its positional argument, and the update as
+            keyword arguments.
+        :param logger: a logger.
+        :param max_queued_updates: the maximum number of updates waiting to
+            be published.
+        :param response_callback: an optional callback, called with the
+            device ID once the updates of a poll response of the device have
+            been published.
+        """
+        self._callback = callback
+        self._response_callback = response_callback
+        self._logger = logger
+        # Updates, and the ends of poll responses, which have no update.
+        self._queue: deque[tuple[int, dict[str, Any] | None]] = deque()
+        self._queued_ends = 0
+        self._max_queued_updates = max_queued_updates
+        # Queued value updates that can still be coalesced, keyed by device ID
+        # and then by the names of the updated attributes.
+        self._coalescable: dict[int, dict[frozenset[str], dict[str, Any]]] = {}
+        self._superseded = 0
+        self._dropped = 0
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name="PasdStatePublisher", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def queue_depth(self: PasdStatePublisher) -> int:
+        """
+        Return the number of updates waiting to be published.
+
+        :return: the number of updates waiting to be published.
+        """
+        return len(self._queue) - self._queued_ends
+
+    @property
+    def superseded_count(self: PasdStatePublisher) -> int:
+        """
+        Return the number of updates superseded before they were published.
+
+        :return: the number of superseded updates.
+        """
+        return self._superseded
+
+    @property
+    def dropped_count(self: PasdStatePublisher) -> int:
+        """
+        Return the number of updates dropped because the queue was full.
+
+        :return: the number of dropped updates.
+        """
+        return self._dropped
+
+    def publish(self: PasdStatePublisher, device_id: int, **kwargs: Any) -> None:
+        """
+        Queue a state update for publishing.
+
+        :param device_id: the ID of the PaSD device the update applies to.
+        :param kwargs: the update.
+        """
+        with self._condition:
+            if "error" in kwargs or "stopped_polling" in kwargs:
+                # Later updates must not be coalesced into updates ahead of this.
+                self._coalescable.pop(device_id, None)
+            else:
+                attributes = frozenset(kwargs)
+                queued = self._coalescable.setdefault(device_id, {}).get(attributes)
+                if queued is not None:
+                    self._remove(queued)
+                    self._superseded += 1
+                self._coalescable[device_id][attributes] = kwargs
+            if len(self._queue) - self._queued_ends >= self._max_queued_updates:
+                self._drop_oldest()
+            self._queue.append((device_id, kwargs))
+            self._condition.notify()
+
+    def end_response(self: PasdStatePublisher, device_id: int) -> None:
+        """
+        Mark the end of the updates of a poll response.
+
+        Once the updates queued so far have been published, the response
+        callback, if there is one, is called with the device ID.
+
+        :param device_id: the ID of the PaSD device that responded.
+        """
+        if self._response_callback is None:
+            return
+        with self._condition:
+            self._queue.append((device_id, None))
+            self._queued_ends += 1
+            self._condition.notify()
+
+    def _drop_oldest(self: PasdStatePublisher) -> None:
+        # Called with the condition held, when the queue is full.
+        while True:
+            device_id, update = self._queue.popleft()
+            if update is None:
+                # The end of a response is merged into the next one.
+                self._queued_ends -= 1
+                continue
+            self._forget(device_id, update)
+            self._dropped += 1
+            self._logger.warning(
+                f"State update queue full, dropping update of device {device_id}"
+            )
+            return
+
+    def _remove(self: PasdStatePublisher, update: dict[str, Any]) -> None:
+        # Called with the condition held, to remove a superseded update.
+        for index, (_, queued) in enumerate(self._queue):
+            if queued is update:
+                del self._queue[index]
+                return
+
+    def _forget(
+        self: PasdStatePublisher, device_id: int, update: dict[str, Any]
+    ) -> None:
+        # Called with the condition held, when an update leaves the queue.
+        coalescable = self._coalescable.get(device_id)
+        if coalescable is None:
+            return
+        attributes = frozenset(update)
+        if coalescable.get(attributes) is update:
+            del coalescable[attributes]
+            if not coalescable:
+                del self._coalescable[device_id]
+
+    def _run(self: PasdStatePublisher) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                device_id, update = self._queue.popleft()
+                if update is None:
+                    self._queued_ends -= 1
+                else:
+                    self._forget(device_id, update)
+            try:
+                if update is None:
+                    assert self._response_callback is not None
+                    self._response_callback(device_id)
+                else:
+                    self._callback(device_id, **update)
+            except Exception:  # pylint: disable=broad-except
+                self._logger.exception(
+                    f"Failed to publish state update of device {device_id}"
+                )
+
+    def stop(self: PasdStatePublisher, timeout: float = STOP_TIMEOUT) -> None:
+        """
+        Stop the publisher thread, discarding any unpublished updates.
+
+        Once this returns, no more updates are published, unless the update
+        being published when it was called takes longer than the timeout.
+
+        :param timeout: the time in seconds to wait for the update being
+            published, if any, to finish.
+        """
+        with self._condition:
+            self._stopped = True
+            self._queue.clear()
+            self._queued_ends = 0
+            self._coalescable.clear()
+            self._condition.notify()
+        if threading.current_thread() is self._thread:
+            return
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            self._logger.warning(
+                f"State update publisher still publishing after {timeout}s"
+            )
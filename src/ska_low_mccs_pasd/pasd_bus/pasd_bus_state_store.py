@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""
+This module implements a store of the state of the PaSD bus device's attributes.
+
+The PaSD bus device has an attribute for every register of every PaSD
+device on the bus, well over a thousand of them for a full station, and
+the value, quality and timestamp of each is updated whenever it is
+polled. Rather than keeping an object for each attribute, the store keeps
+each of these in a column: values in a list of slots, and timestamps and
+qualities in preallocated NumPy arrays. Each attribute is addressed by an
+integer handle, resolved from its name, and all of the attributes in a
+poll response are updated, or invalidated, together with a few array
+writes.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Any, Final, Iterable, Optional, Sequence
+
+import numpy as np
+from tango import AttrQuality
+
+__all__ = ["PasdStateStore"]
+
+INITIAL_CAPACITY: Final = 64
+"""The default number of attributes to preallocate the store for."""
+
+_VALID: Final = int(AttrQuality.ATTR_VALID)
+_INVALID: Final = int(AttrQuality.ATTR_INVALID)
+
+
+# pylint: disable=too-many-instance-attributes
+class PasdStateStore:
+    """
+    A columnar store of the value, quality and timestamp of PaSD attributes.
+
+    Every attribute is INVALID, with no value, until it is first updated.
+    The values, qualities and timestamps of the attributes in an update are
+    written together under a lock, so that copies of them are consistent.
+    """
+
+    def __init__(self: PasdStateStore, capacity: int = INITIAL_CAPACITY) -> None:
+        """
+        Initialise a new instance.
+
+        :param capacity: the number of attributes to preallocate the store
+            for. The store grows if more are added.
+        """
+        self._handles: dict[str, int] = {}
+        self._names: list[str] = []
+        self._values: list[Any] = []
+        self._timestamps = np.zeros(max(capacity, 1), dtype=np.float64)
+        self._qualities = np.full(max(capacity, 1), _INVALID, dtype=np.int8)
+        self._read_once = np.zeros(max(capacity, 1), dtype=np.bool_)
+        # Most attributes have no deadbands, so only those that do are kept.
+        self._deadbands: dict[int, tuple[Optional[float], Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self: PasdStateStore) -> int:
+        """
+        Return the number of attributes in the store.
+
+        :return: the number of attributes in the store.
+        """
+        return len(self._names)
+
+    def __contains__(self: PasdStateStore, name: object) -> bool:
+        """
+        Return whether an attribute is in the store.
+
+        :param name: the name of the attribute.
+
+        :return: whether the attribute is in the store.
+        """
+        return name in self._handles
+
+    @property
+    def names(self: PasdStateStore) -> list[str]:
+        """
+        Return the names of the attributes, in the order of their handles.
+
+        :return: the names of the attributes.
+        """
+        return list(self._names)
+
+    def add(
+        self: PasdStateStore,
+        name: str,
+        read_once: bool = False,
+        abs_deadband: Optional[float] = None,
+        rel_deadband: Optional[float] = None,
+    ) -> int:
+        """
+        Add an attribute to the store.
+
+        :param name: the name of the attribute.
+        :param read_once: whether the attribute is normally only read once,
+            on startup.
+        :param abs_deadband: the absolute deadband of the attribute, or None.
+        :param rel_deadband: the relative deadband of the attribute in
+            percent, or None.
+
+        :raises ValueError: if the attribute is already in the store.
+
+        :return: the handle of the attribute.
+        """
+        if name in self._handles:
+            raise ValueError(f"Attribute {name} is already in the store")
+        handle = len(self._names)
+        if handle == len(self._timestamps):
+            self._timestamps = np.concatenate(
+                [self._timestamps, np.zeros(handle, dtype=np.float64)]
+            )
+            self._qualities = np.concatenate(
+                [self._qualities, np.full(handle, _INVALID, dtype=np.int8)]
+            )
+            self._read_once = np.concatenate(
+                [self._read_once, np.zeros(handle, dtype=np.bool_)]
+            )
+        self._handles[name] = handle
+        self._names.append(name)
+        self._values.append(None)
+        self._read_once[handle] = read_once
+        if abs_deadband is not None or rel_deadband is not None:
+            self._deadbands[handle] = (abs_deadband, rel_deadband)
+        return handle
+
+    def handle(self: PasdStateStore, name: str) -> int:
+        """
+        Return the handle of an attribute.
+
+        :param name: the name of the attribute.
+
+        :return: the handle of the attribute.
+        """
+        return self._handles[name]
+
+    def name(self: PasdStateStore, handle: int) -> str:
+        """
+        Return the name of an attribute.
+
+        :param handle: the handle of the attribute.
+
+        :return: the name of the attribute.
+        """
+        return self._names[handle]
+
+    def value(self: PasdStateStore, handle: int) -> Any:
+        """
+        Return the value of an attribute.
+
+        :param handle: the handle of the attribute.
+
+        :return: the value of the attribute, or None if it has never been
+            updated.
+        """
+        return self._values[handle]
+
+    def timestamp(self: PasdStateStore, handle: int) -> float:
+        """
+        Return the timestamp of an attribute.
+
+        :param handle: the handle of the attribute.
+
+        :return: the timestamp of the attribute.
+        """
+        return float(self._timestamps[handle])
+
+    def quality(self: PasdStateStore, handle: int) -> AttrQuality:
+        """
+        Return the quality of an attribute.
+
+        :param handle: the handle of the attribute.
+
+        :return: the quality of the attribute.
+        """
+        return AttrQuality(self._qualities[handle])
+
+    def is_valid(self: PasdStateStore, handle: int) -> bool:
+        """
+        Return whether an attribute is valid.
+
+        :param handle: the handle of the attribute.
+
+        :return: whether the attribute is valid.
+        """
+        return bool(self._qualities[handle] == _VALID)
+
+    def is_read_once(self: PasdStateStore, handle: int) -> bool:
+        """
+        Return whether an attribute is normally only read once, on startup.
+
+        :param handle: the handle of the attribute.
+
+        :return: whether the attribute is normally only read once.
+        """
+        return bool(self._read_once[handle])
+
+    def deadbands(
+        self: PasdStateStore, handle: int
+    ) -> tuple[Optional[float], Optional[float]]:
+        """
+        Return the deadbands of an attribute.
+
+        :param handle: the handle of the attribute.
+
+        :return: the absolute deadband and the relative deadband in percent,
+            each of which is None if it is not set.
+        """
+        return self._deadbands.get(handle, (None, None))
+
+    def update(
+        self: PasdStateStore,
+        handles: Sequence[int],
+        values: Sequence[Any],
+        timestamp: float,
+    ) -> None:
+        """
+        Update the values of attributes, making them valid.
+
+        :param handles: the handles of the attributes.
+        :param values: the new value of each attribute.
+        :param timestamp: the time at which the values were read.
+        """
+        indices = np.asarray(handles, dtype=np.intp)
+        with self._lock:
+            for handle, value in zip(handles, values):
+                self._values[handle] = value
+            self._timestamps[indices] = timestamp
+            self._qualities[indices] = _VALID
+
+    def mark_invalid(
+        self: PasdStateStore, handles: Sequence[int], timestamp: float
+    ) -> list[int]:
+        """
+        Mark attributes invalid, keeping their last values.
+
+        :param handles: the handles of the attributes.
+        :param timestamp: the time at which the attributes became invalid.
+
+        :return: the handles of the attributes that were valid until now.
+            The timestamps of the others are left unchanged.
+        """
+        indices = np.asarray(handles, dtype=np.intp)
+        with self._lock:
+            indices = indices[self._qualities[indices] != _INVALID]
+            self._timestamps[indices] = timestamp
+            self._qualities[indices] = _INVALID
+        return indices.tolist()
+
+    def copy(
+        self: PasdStateStore, handles: Iterable[int]
+    ) -> list[tuple[Any, int, float]]:
+        """
+        Return a consistent copy of the state of some attributes.
+
+        :param handles: the handles of the attributes.
+
+        :return: the value, the integer value of the quality, and the
+            timestamp of each attribute, in the order of the handles.
+        """
+        # Only take shallow copies under the lock, so as not to hold up updates.
+        with self._lock:
+            values = self._values.copy()
+            qualities = self._qualities.copy()
+            timestamps = self._timestamps.copy()
+        indices = np.fromiter(handles, dtype=np.intp)
+        return list(
+            zip(
+                [values[index] for index in indices],
+                qualities[indices].tolist(),
+                timestamps[indices].tolist(),
+            )
+        )
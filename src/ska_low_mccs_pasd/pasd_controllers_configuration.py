@@ -5,10 +5,29 @@
 #
 # Distributed under the terms of the BSD 3-clause new license.
 # See LICENSE for more info.
-"""Module provides utilities to read and validate PaSD controllers configuration."""
+"""
+Module provides utilities to read and validate PaSD controllers configuration.
+
+The configuration is read from ``ska_low_pasd_driver``, validated and
+normalised once per process. If the ``PASD_CONTROLLERS_CONFIG_CACHE_DIR``
+environment variable names a directory, the validated configuration is
+also cached there, keyed by the versions of ``ska_low_pasd_driver`` and of
+this package, the contents of the configuration file, the schema and the
+code that normalises the configuration, so that later processes skip
+parsing and validating it altogether.
+"""
+import copy
+import hashlib
+import inspect
+import json
+import logging
+import os
+import tempfile
+import threading
+from importlib.metadata import PackageNotFoundError, version
 from importlib.resources import files
 from pprint import pprint
-from typing import Final, TypedDict
+from typing import Any, Final, Optional, TypedDict
 
 import yaml
 from cerberus import Validator  # type: ignore[import-untyped]
@@ -58,6 +77,12 @@ class RegisterDict(TypedDict, total=False):
         If True, the register is read only once at initialisation (except for thresholds
         which are re-requested if written to) NB: This is configured in the
         DeviceRequestProvider and just stored here for convenience.
+    abs_deadband (float):
+        The absolute change in value, below which a newly polled value is not
+        published. Optional key.
+    rel_deadband (float):
+        The relative change in value, in percent, below which a newly polled
+        value is not published. Optional key.
     """
 
     address: int
@@ -78,6 +103,8 @@ class RegisterDict(TypedDict, total=False):
     default_value: int
     default_thresholds: dict[str, int]
     read_once: bool
+    abs_deadband: float
+    rel_deadband: float
 
 
 REGISTER_SCHEMA: Final = {
@@ -164,6 +191,8 @@ REGISTER_SCHEMA: Final = {
                 "type": "boolean",
                 "default": False,
             },
+            "abs_deadband": {"type": "number", "min": 0, "nullable": True},
+            "rel_deadband": {"type": "number", "min": 0, "nullable": True},
         },
     },
 }
@@ -254,22 +283,43 @@ CONFIGURATION_SCHEMA: Final = {
 AllControllersDict = dict[str, ControllerDict]
 LoadedYaml = dict[str, dict[str, AllControllersDict]]
 
+CACHE_DIR_ENV_VAR: Final = "PASD_CONTROLLERS_CONFIG_CACHE_DIR"
+"""The environment variable naming the directory to cache the configuration in."""
+
+logger = logging.getLogger(__name__)
+
 
 class PasdControllersConfig:
     """Read and validate PaSD controller configuration from YAML."""
 
+    _validated: Optional[dict[str, Any]] = None
+    _lock: Final = threading.Lock()
+
     @staticmethod
-    def _load_configuration_yaml() -> LoadedYaml:
+    def _read_configuration_file() -> bytes:
+        """
+        Read the configuration YAML file from the PaSD driver package.
+
+        :returns: the contents of the file.
+        """
+        return (
+            files("ska_low_pasd_driver")
+            .joinpath("pasd_controllers_configuration.yaml")
+            .read_bytes()
+        )
+
+    @classmethod
+    def _load_configuration_yaml(cls, contents: Optional[bytes] = None) -> LoadedYaml:
         """
         Load and process the configuration YAML file.
 
+        :param contents: the contents of the file, if already read.
+
         :returns: unvalidated configuration dictionary.
         """
-        file_path = files("ska_low_pasd_driver").joinpath(
-            "pasd_controllers_configuration.yaml"
-        )
-        with file_path.open("r", encoding="UTF-8") as file:
-            config: LoadedYaml = yaml.safe_load(file)
+        if contents is None:
+            contents = cls._read_configuration_file()
+        config: LoadedYaml = yaml.safe_load(contents)
 
         def _snake_to_pascal_case(snake_string: str) -> str:
             return "".join(word.capitalize() for word in snake_string.split("_"))
@@ -298,6 +348,106 @@ class PasdControllersConfig:
             return v.normalized(config)["PaSD_controllers"]
         raise ValueError(f"PaSD controllers' config validation errors: {v.errors}")
 
+    @classmethod
+    def _cache_key(cls, contents: bytes) -> str:
+        """
+        Return the key of the cached configuration.
+
+        :param contents: the contents of the configuration file.
+
+        :return: a hash of the versions of the PaSD driver package and of
+            this package, the contents of the configuration file, the schema
+            and the source of the code that normalises the configuration.
+        """
+        key = hashlib.sha256()
+        for package in ["ska-low-pasd-driver", "ska-low-mccs-pasd"]:
+            try:
+                key.update(version(package).encode())
+            except PackageNotFoundError:
+                key.update(b"unknown")
+        key.update(contents)
+        key.update(repr(CONFIGURATION_SCHEMA).encode())
+        try:
+            key.update(inspect.getsource(cls._load_configuration_yaml).encode())
+        except OSError:
+            # The source isn't installed, so rely on the package version.
+            pass
+        return key.hexdigest()
+
+    @staticmethod
+    def _read_cache(cache_path: str) -> Optional[dict[str, Any]]:
+        """
+        Read the cached configuration, if there is one.
+
+        :param cache_path: the path of the cache file.
+
+        :return: the cached configuration, or None if it isn't cached.
+        """
+        try:
+            with open(cache_path, "r", encoding="UTF-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as error:
+            logger.warning(f"Ignoring unreadable PaSD configuration cache: {error}")
+            return None
+
+    @staticmethod
+    def _write_cache(cache_path: str, validated: dict[str, Any]) -> None:
+        """
+        Cache the configuration, replacing the cache file atomically.
+
+        :param cache_path: the path of the cache file.
+        :param validated: the validated configuration.
+        """
+        cache_dir = os.path.dirname(cache_path)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="UTF-8", dir=cache_dir, suffix=".tmp", delete=False
+            ) as file:
+                json.dump(validated, file)
+            os.replace(file.name, cache_path)
+        except OSError as error:
+            logger.warning(f"Failed to cache PaSD configuration: {error}")
+
+    @classmethod
+    def _get_validated(cls) -> dict[str, Any]:
+        """
+        Get the validated configuration, reading it on first use.
+
+        :return: the validated configuration dictionary, which callers must
+            not modify.
+        """
+        with cls._lock:
+            if cls._validated is not None:
+                return cls._validated
+            contents = cls._read_configuration_file()
+            cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+            cache_path = (
+                os.path.join(
+                    cache_dir,
+                    f"pasd_controllers_configuration-{cls._cache_key(contents)}.json",
+                )
+                if cache_dir
+                else None
+            )
+            validated = cls._read_cache(cache_path) if cache_path else None
+            if validated is None:
+                validated = cls._validate_configuration(
+                    cls._load_configuration_yaml(contents)
+                )
+                if cache_path:
+                    cls._write_cache(cache_path, validated)
+            cls._validated = validated
+            return validated
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget the configuration, so that it is read again on next use."""
+        with cls._lock:
+            cls._validated = None
+
     @classmethod
     def get_all(cls) -> AllControllersDict:
         """
@@ -305,9 +455,7 @@ class PasdControllersConfig:
 
         :return: validated configuration dictionary.
         """
-        config = cls._load_configuration_yaml()
-        validated = cls._validate_configuration(config)
-        return validated["base_register_maps"]
+        return copy.deepcopy(cls._get_validated()["base_register_maps"])
 
     @classmethod
     def get_fncc(cls) -> ControllerDict:
@@ -316,9 +464,7 @@ class PasdControllersConfig:
 
         :return: validated configuration dictionary.
         """
-        config = cls._load_configuration_yaml()
-        validated = cls._validate_configuration(config)
-        return validated["base_register_maps"]["FNCC"]
+        return copy.deepcopy(cls._get_validated()["base_register_maps"]["FNCC"])
 
     @classmethod
     def get_fndh(cls) -> ControllerDict:
@@ -327,9 +473,7 @@ class PasdControllersConfig:
 
         :return: validated configuration dictionary.
         """
-        config = cls._load_configuration_yaml()
-        validated = cls._validate_configuration(config)
-        return validated["base_register_maps"]["FNPC"]
+        return copy.deepcopy(cls._get_validated()["base_register_maps"]["FNPC"])
 
     @classmethod
     def get_smartbox(cls) -> ControllerDict:
@@ -338,9 +482,7 @@ class PasdControllersConfig:
 
         :return: validated configuration dictionary.
         """
-        config = cls._load_configuration_yaml()
-        validated = cls._validate_configuration(config)
-        return validated["base_register_maps"]["FNSC"]
+        return copy.deepcopy(cls._get_validated()["base_register_maps"]["FNSC"])
 
     @classmethod
     def get_register_map_revisions(cls) -> dict[str, AllControllersDict] | None:
@@ -349,9 +491,7 @@ class PasdControllersConfig:
 
         :return: validated configuration dictionary.
         """
-        config = cls._load_configuration_yaml()
-        validated = cls._validate_configuration(config)
-        return validated.get("register_map_revisions")  # type: ignore
+        return copy.deepcopy(cls._get_validated().get("register_map_revisions"))
 
 
 if __name__ == "__main__":
@@ -10,13 +10,25 @@
 
 from __future__ import annotations
 
-from typing import Any
+import enum
+import threading
+import time
+from typing import Any, Callable, Mapping, Optional, Sequence
 
+import numpy as np
+from ska_control_model import HealthState, PowerState
 from tango import Database
 
 from .pasd_controllers_configuration import ControllerDict
 
-__all__ = ["PasdThresholds"]
+__all__ = [
+    "MonitoringPointHealthCache",
+    "PasdAttributeKind",
+    "PasdThresholds",
+    "PortStateCondition",
+    "build_attribute_dispatch_table",
+    "get_pasd_attribute_kind",
+]
 
 
 def join_health_reports(messages: list[str]) -> str:
@@ -39,6 +51,57 @@ def join_health_reports(messages: list[str]) -> str:
     return "\n".join(unique_messages)
 
 
+class PasdAttributeKind(enum.Enum):
+    """The kind of a PaSD attribute, which determines how its changes are handled."""
+
+    THRESHOLD = enum.auto()
+    STATUS = enum.auto()
+    PORT_POWER = enum.auto()
+    BREAKER = enum.auto()
+    MONITORING_POINT = enum.auto()
+
+
+def get_pasd_attribute_kind(attribute_name: str) -> PasdAttributeKind:
+    """
+    Return the kind of a PaSD attribute.
+
+    :param attribute_name: the name of the attribute, e.g. "InputVoltage".
+
+    :returns: the kind of the attribute.
+    """
+    name = attribute_name.lower()
+    if name.endswith("thresholds"):
+        return PasdAttributeKind.THRESHOLD
+    if name.endswith("status"):
+        return PasdAttributeKind.STATUS
+    if "portbreakerstripped" in name:
+        return PasdAttributeKind.BREAKER
+    if name in ("portspowersensed", "portspowercontrol"):
+        return PasdAttributeKind.PORT_POWER
+    return PasdAttributeKind.MONITORING_POINT
+
+
+def build_attribute_dispatch_table(
+    config: ControllerDict,
+    handlers: Mapping[PasdAttributeKind, Callable[..., None]],
+) -> dict[str, Callable[..., None]]:
+    """
+    Build a table of the handler of changes to each PaSD attribute.
+
+    :param config: the PaSD controller configuration.
+    :param handlers: the handler of changes to each kind of attribute.
+
+    :returns: the handler of each attribute, keyed by lower-case attribute
+        name.
+    """
+    return {
+        register["tango_attr_name"].lower(): handlers[
+            get_pasd_attribute_kind(register["tango_attr_name"])
+        ]
+        for register in config["registers"].values()
+    }
+
+
 class PasdThresholds:
     """Pasd thresholds."""
 
@@ -75,6 +138,195 @@ class PasdThresholds:
         return self._thresholds
 
 
+def _snapshot(value: Any) -> Any:
+    """
+    Return a copy of a monitoring point value for comparison.
+
+    A value may be a list, which may be updated in place, or a numpy
+    array, which does not compare to a single truth value, so it is copied
+    into a tuple.
+
+    :param value: the value to take a snapshot of.
+
+    :return: the snapshot.
+    """
+    if isinstance(value, np.ndarray):
+        return tuple(value.tolist())
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+class MonitoringPointHealthCache:
+    """
+    A cache of the health of each monitoring point of a health model.
+
+    The health of a monitoring point depends only on its value and its
+    thresholds, so it is only recomputed when its value has changed since
+    it was last computed, or when its thresholds have been changed, which
+    the health model reports by invalidating it.
+    """
+
+    def __init__(
+        self: MonitoringPointHealthCache,
+        compute_health: Callable[[str, Any, Any], tuple[HealthState, str]],
+    ) -> None:
+        """
+        Initialise a new instance.
+
+        :param compute_health: a function that computes the health of a
+            monitoring point from its name, value and thresholds.
+        """
+        self._compute_health = compute_health
+        self._entries: dict[str, tuple[Any, tuple[HealthState, str]]] = {}
+        self.evaluations = 0
+
+    def get(
+        self: MonitoringPointHealthCache, name: str, value: Any, thresholds: Any
+    ) -> tuple[HealthState, str]:
+        """
+        Get the health of a monitoring point, computing it only if it has changed.
+
+        :param name: the name of the monitoring point.
+        :param value: the value of the monitoring point.
+        :param thresholds: the thresholds of the monitoring point.
+
+        :return: the health state and health report of the monitoring point.
+        """
+        snapshot = _snapshot(value)
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] == snapshot:
+            return entry[1]
+        health = self._compute_health(name, value, thresholds)
+        self.evaluations += 1
+        self._entries[name] = (snapshot, health)
+        return health
+
+    def invalidate(self: MonitoringPointHealthCache, *names: str) -> None:
+        """
+        Forget the health of monitoring points, e.g. as their thresholds changed.
+
+        :param names: the names of the monitoring points.
+        """
+        for name in names:
+            self._entries.pop(name, None)
+
+    def clear(self: MonitoringPointHealthCache) -> None:
+        """Forget the health of every monitoring point."""
+        self._entries.clear()
+
+
+class PortStateCondition:
+    """
+    The power states of the ports of a PaSD device, which threads can wait for.
+
+    The ports that are on and the ports that are off are held as bitmasks,
+    with bit ``n`` for port ``n + 1``. A thread waits for a desired state
+    of some of the ports, and is woken exactly when an update of the port
+    power states is delivered, or when it is interrupted, rather than
+    polling for changes.
+    """
+
+    # How often a waiter checks its abort event, if nothing interrupts it.
+    ABORT_POLL_PERIOD = 1.0
+
+    def __init__(self: PortStateCondition) -> None:
+        """Initialise a new instance, with the state of every port unknown."""
+        self._condition = threading.Condition()
+        self._on_mask = 0
+        self._off_mask = 0
+        self.wakeups = 0
+
+    @staticmethod
+    def desired_masks(
+        desired_port_powers: Sequence[Optional[bool]],
+    ) -> tuple[int, int]:
+        """
+        Return the bitmasks of the ports that are desired on and off.
+
+        :param desired_port_powers: whether each port is desired on, or
+            None if its state doesn't matter.
+
+        :return: the bitmasks of the ports desired on and desired off.
+        """
+        on_mask = 0
+        off_mask = 0
+        for port, desired in enumerate(desired_port_powers):
+            if desired is True:
+                on_mask |= 1 << port
+            elif desired is False:
+                off_mask |= 1 << port
+        return on_mask, off_mask
+
+    def update(self: PortStateCondition, port_powers: Sequence[PowerState]) -> None:
+        """
+        Update the power states of the ports, and wake any waiters.
+
+        :param port_powers: the power state of each port.
+        """
+        on_mask = 0
+        off_mask = 0
+        for port, power in enumerate(port_powers):
+            if power == PowerState.ON:
+                on_mask |= 1 << port
+            elif power == PowerState.OFF:
+                off_mask |= 1 << port
+        with self._condition:
+            self._on_mask = on_mask
+            self._off_mask = off_mask
+            self._condition.notify_all()
+
+    def interrupt(self: PortStateCondition) -> None:
+        """Wake any waiters, e.g. so that they see that they are aborted."""
+        with self._condition:
+            self._condition.notify_all()
+
+    def _matches(self: PortStateCondition, on_mask: int, off_mask: int) -> bool:
+        """
+        Return whether the ports are in a desired state.
+
+        :param on_mask: the bitmask of the ports desired on.
+        :param off_mask: the bitmask of the ports desired off.
+
+        :return: whether the ports are in the desired state.
+        """
+        return (self._on_mask & on_mask) == on_mask and (
+            self._off_mask & off_mask
+        ) == off_mask
+
+    def wait_for(
+        self: PortStateCondition,
+        desired_port_powers: Sequence[Optional[bool]],
+        timeout: float,
+        abort_event: Optional[threading.Event] = None,
+    ) -> bool:
+        """
+        Wait for ports to be in their desired power states.
+
+        :param desired_port_powers: whether each port is desired on, or
+            None if its state doesn't matter.
+        :param timeout: the maximum time to wait, in seconds.
+        :param abort_event: an event that stops the wait when set.
+
+        :return: whether the ports are in their desired states, rather than
+            the wait having timed out or been aborted.
+        """
+        on_mask, off_mask = self.desired_masks(desired_port_powers)
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while not self._matches(on_mask, off_mask):
+                if abort_event is not None and abort_event.is_set():
+                    return False
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                if abort_event is not None:
+                    remaining = min(remaining, self.ABORT_POLL_PERIOD)
+                self._condition.wait(remaining)
+                self.wakeups += 1
+        return True
+
+
 class PasdDatabase:
     """Wrapper around the tango database for testing purposes."""
 
@@ -27,10 +27,16 @@ from ska_tango_base.base import check_communicating
 from ska_tango_base.commands import ResultCode
 from ska_tango_base.executor import TaskExecutorComponentManager
 
+from ska_low_mccs_pasd.command_timing import CommandTimingLog
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_snapshot import decode_snapshot
 from ska_low_mccs_pasd.pasd_data import PasdData
+from ska_low_mccs_pasd.pasd_utils import PortStateCondition
 
 __all__ = ["SmartBoxComponentManager"]
 
+# 'smartbox' followed by 1 or 2 digits, followed by a string.
+_SMARTBOX_ATTRIBUTE_PATTERN = re.compile(r"smartbox(\d{1,2})(.*)")
+
 RESULT_TO_TASK = {
     ResultCode.OK: TaskStatus.COMPLETED,
     ResultCode.FAILED: TaskStatus.FAILED,
@@ -129,6 +135,9 @@ class _PasdBusProxy(DeviceComponentManager):
         self._attribute_change_callback = attribute_change_callback
         self._fndh_port_power_callback = fndh_port_power_callback
         self._smartbox_nr = smartbox_nr
+        # The smartbox attribute name for each PaSD bus attribute name, or None
+        # for an attribute that isn't this smartbox's. Filled in as events arrive.
+        self._attribute_names: dict[str, Optional[str]] = {}
         self._power_state = PowerState.UNKNOWN
         self._initialized = False
 
@@ -180,35 +189,74 @@ class _PasdBusProxy(DeviceComponentManager):
         :param attr_quality: The quality of the attribute.
         """
         # TODO: MCCS-1481: Update the MccsDeviceProxy to conserve attribute case.
-
         try:
-            # 'smartbox' followed by 1 or 2 digits, followed by a string.
-            smartbox_attribute_pattern = re.compile(r"smartbox(\d{1,2})(.*)")
+            tango_attribute_name = self._attribute_names[attr_name]
+        except KeyError:
+            tango_attribute_name = self._resolve_attribute_name(attr_name)
+            self._attribute_names[attr_name] = tango_attribute_name
 
-            # Use the pattern to match the input string
-            smartbox_attribute = smartbox_attribute_pattern.match(attr_name)
+        if tango_attribute_name is None:
+            self.logger.error(
+                f"Attribute subscription {attr_name} does not seem to belong "
+                f"to this smartbox (smartbox {self._smartbox_nr})"
+            )
+        elif tango_attribute_name == "snapshot":
+            self._on_snapshot_change(attr_value)
+        else:
+            timestamp = datetime.now(timezone.utc).timestamp()
+            self._attribute_change_callback(
+                tango_attribute_name, attr_value, timestamp, attr_quality
+            )
 
-            # Check if we got a match, this checks it starts with 'smartbox'
-            assert smartbox_attribute is not None
+    def _resolve_attribute_name(self: _PasdBusProxy, attr_name: str) -> Optional[str]:
+        """
+        Resolve the name of a PaSD bus attribute to that of this smartbox.
 
-            # Check we're looking at the correct smartbox
-            assert int(smartbox_attribute.group(1)) == self._smartbox_nr
+        :param attr_name: the name of the PaSD bus attribute.
 
-            # If there's a match, return the string after the number
-            tango_attribute_name = smartbox_attribute.group(2).lower()
+        :return: the lower-case name of the smartbox attribute, "snapshot"
+            for this smartbox's snapshot attribute, or None if the attribute
+            does not belong to this smartbox.
+        """
+        smartbox_attribute = _SMARTBOX_ATTRIBUTE_PATTERN.match(attr_name)
+        # Check it starts with 'smartbox' and we're looking at the correct smartbox
+        if (
+            smartbox_attribute is None
+            or int(smartbox_attribute.group(1)) != self._smartbox_nr
+        ):
+            return None
+        tango_attribute_name = smartbox_attribute.group(2).lower()
+        if tango_attribute_name == "status":
+            return "pasdstatus"
+        return tango_attribute_name
 
-            if tango_attribute_name == "status":
-                tango_attribute_name = "pasdstatus"
+    def _on_snapshot_change(self: _PasdBusProxy, encoded_snapshot: str) -> None:
+        """
+        Handle a change of this smartbox's snapshot attribute.
 
-            timestamp = datetime.now(timezone.utc).timestamp()
-            self._attribute_change_callback(
-                tango_attribute_name, attr_value, timestamp, attr_quality
-            )
-        except AssertionError:
+        Each value in the snapshot is handled as if it had been received in
+        a change event of its own attribute.
+
+        :param encoded_snapshot: the encoded snapshot.
+        """
+        try:
+            snapshot = decode_snapshot(encoded_snapshot)
+        except ValueError as error:
             self.logger.error(
-                f"Attribute subscription {attr_name} does not seem to belong "
-                f"to this smartbox (smartbox {self._smartbox_nr})"
+                f"Invalid snapshot of smartbox {self._smartbox_nr}: {error}"
             )
+            return
+        for values, attr_quality in [
+            (snapshot.values, tango.AttrQuality.ATTR_VALID),
+            (snapshot.invalid, tango.AttrQuality.ATTR_INVALID),
+        ]:
+            for name, value in values.items():
+                tango_attribute_name = name.lower()
+                if tango_attribute_name == "status":
+                    tango_attribute_name = "pasdstatus"
+                self._attribute_change_callback(
+                    tango_attribute_name, value, snapshot.timestamp, attr_quality
+                )
 
     def set_smartbox_port_powers(
         self: _PasdBusProxy, json_argument: str
@@ -253,6 +301,25 @@ class _PasdBusProxy(DeviceComponentManager):
         assert self._proxy
         return self._proxy.SetFndhPortPowers(json_argument)
 
+    def command_timing_reports(
+        self: _PasdBusProxy, command_id: str
+    ) -> list[dict[str, Any]]:
+        """
+        Return the timing reports of the PaSD bus commands made as part of a command.
+
+        :param command_id: the ID of the command.
+
+        :return: the timing reports of the PaSD bus commands that were
+            given the command ID, or an empty list if they can't be read.
+        """
+        assert self._proxy
+        try:
+            reports = json.loads(self._proxy.commandTimingReports)
+        except (tango.DevFailed, TypeError, ValueError) as error:
+            self.logger.debug(f"Couldn't read PaSD bus command timing reports: {error}")
+            return []
+        return [report for report in reports if report["command_id"] == command_id]
+
     def write_attribute(
         self: _PasdBusProxy, tango_attribute_name: str, value: Any
     ) -> None:
@@ -338,6 +405,7 @@ class SmartBoxComponentManager(TaskExecutorComponentManager):
         self._port_to_antenna_map: bidict[int, str] = bidict(
             zip(self._ports_with_antennas, self._antenna_names)
         )
+        self._command_timings = CommandTimingLog()
         self._port_mask = [True] * PasdData.NUMBER_OF_SMARTBOX_PORTS
         for idx in self._ports_with_antennas:
             self._port_mask[idx - 1] = False
@@ -346,8 +414,8 @@ class SmartBoxComponentManager(TaskExecutorComponentManager):
                 # pylint: disable-next=unsubscriptable-object
                 self._port_mask[self._port_to_antenna_map.inverse[name] - 1] = True
         self._attribute_change_callback = attribute_change_callback
-        self.fndh_ports_change = threading.Event()
-        self.smartbox_ports_change = threading.Event()
+        self.fndh_port_states = PortStateCondition()
+        self.smartbox_port_states = PortStateCondition()
 
         self._fndh_port_powers = [PowerState.UNKNOWN] * PasdData.NUMBER_OF_FNDH_PORTS
         self._smartbox_port_powers = [
@@ -422,7 +490,7 @@ class SmartBoxComponentManager(TaskExecutorComponentManager):
 
         for idx, attr in enumerate(attr_value):
             self._fndh_port_powers[idx] = PowerState.ON if attr else PowerState.OFF
-        self.fndh_ports_change.set()
+        self.fndh_port_states.update(self._fndh_port_powers)
         self._evaluate_power()
 
     def _on_smartbox_ports_power_changed(
@@ -447,7 +515,7 @@ class SmartBoxComponentManager(TaskExecutorComponentManager):
             self._component_state_callback(
                 antenna_powers=json.dumps(self._antenna_powers)
             )
-        self.smartbox_ports_change.set()
+        self.smartbox_port_states.update(self._smartbox_port_powers)
         self._evaluate_power()
 
     def _evaluate_power(self: SmartBoxComponentManager) -> None:
@@ -574,7 +642,11 @@ class SmartBoxComponentManager(TaskExecutorComponentManager):
         self.logger.info("Aborting PasdBus.")
         if self._pasd_bus_proxy._proxy is not None:
             self._pasd_bus_proxy._proxy.Abort()
-        return super().abort(task_callback)
+        result = super().abort(task_callback)
+        # Wake any commands waiting for port states, so that they see the abort.
+        self.fndh_port_states.interrupt()
+        self.smartbox_port_states.interrupt()
+        return result
 
     def _power_fndh_port(
         self: SmartBoxComponentManager,
@@ -582,16 +654,17 @@ class SmartBoxComponentManager(TaskExecutorComponentManager):
         fndh_port: int,
         timeout: float,
         task_abort_event: Optional[threading.Event] = None,
+        command_id: Optional[str] = None,
     ) -> tuple[ResultCode, float, str]:
         desired_port_powers: list[bool | None] = [None] * PasdData.NUMBER_OF_FNDH_PORTS
         desired_port_powers[fndh_port - 1] = power_state == PowerState.ON
-        json_argument = json.dumps(
-            {
-                "port_powers": desired_port_powers,
-                "stay_on_when_offline": True,
-            }
-        )
-        self._pasd_bus_proxy.set_fndh_port_powers(json_argument)
+        argument: dict[str, Any] = {
+            "port_powers": desired_port_powers,
+            "stay_on_when_offline": True,
+        }
+        if command_id is not None:
+            argument["command_id"] = command_id
+        self._pasd_bus_proxy.set_fndh_port_powers(json.dumps(argument))
         return self._wait_for_fndh_port_state(
             power_state, fndh_port, timeout, task_abort_event
         )
@@ -604,22 +677,19 @@ class SmartBoxComponentManager(TaskExecutorComponentManager):
         task_abort_event: Optional[threading.Event] = None,
     ) -> tuple[ResultCode, float, str]:
         deadline = time.monotonic() + timeout
-        poll = 0.1 if task_abort_event else timeout
-        while self._fndh_port_powers[fndh_port - 1] != power_state:
+        desired_port_powers: list[bool | None] = [None] * PasdData.NUMBER_OF_FNDH_PORTS
+        desired_port_powers[fndh_port - 1] = power_state == PowerState.ON
+        self.logger.debug(f"Waiting for FNDH port {self._fndh_port} to change state.")
+        if not self.fndh_port_states.wait_for(
+            desired_port_powers, timeout, task_abort_event
+        ):
             if task_abort_event and task_abort_event.is_set():
                 msg = "Aborted waiting for FNDH port to change state"
                 self.logger.info(msg)
                 return ResultCode.ABORTED, int(deadline - time.monotonic()), msg
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
-                msg = "Timeout reached waiting for FNDH port state"
-                self.logger.error(msg)
-                return ResultCode.FAILED, 0, msg
-            self.logger.debug(
-                f"Waiting for FNDH port {self._fndh_port} to change state."
-            )
-            self.fndh_ports_change.wait(min(remaining, poll))
-            self.fndh_ports_change.clear()
+            msg = "Timeout reached waiting for FNDH port state"
+            self.logger.error(msg)
+            return ResultCode.FAILED, 0, msg
         return (
             ResultCode.OK,
             deadline - time.monotonic(),
@@ -631,6 +701,7 @@ class SmartBoxComponentManager(TaskExecutorComponentManager):
         power_state: PowerState,
         timeout: float,
         task_abort_event: Optional[threading.Event] = None,
+        command_id: Optional[str] = None,
     ) -> tuple[ResultCode, float, str]:
         desired_port_powers: list[bool] = [
             power_state == PowerState.ON
@@ -638,13 +709,13 @@ class SmartBoxComponentManager(TaskExecutorComponentManager):
         for port, masked in enumerate(self._port_mask):
             if masked:
                 desired_port_powers[port] = False
-        json_argument = json.dumps(
-            {
-                "port_powers": desired_port_powers,
-                "stay_on_when_offline": True,
-            }
-        )
-        self._pasd_bus_proxy.set_smartbox_port_powers(json_argument)
+        argument: dict[str, Any] = {
+            "port_powers": desired_port_powers,
+            "stay_on_when_offline": True,
+        }
+        if command_id is not None:
+            argument["command_id"] = command_id
+        self._pasd_bus_proxy.set_smartbox_port_powers(json.dumps(argument))
         return self._wait_for_smartbox_ports_state(
             desired_port_powers, timeout, task_abort_event
         )
@@ -655,24 +726,18 @@ class SmartBoxComponentManager(TaskExecutorComponentManager):
         timeout: float,
         task_abort_event: Optional[threading.Event] = None,
     ) -> tuple[ResultCode, float, str]:
-        desired_port_power_states = [
-            PowerState.ON if power else PowerState.OFF for power in desired_port_powers
-        ]
         deadline = time.monotonic() + timeout
-        poll = 0.1 if task_abort_event else timeout
-        while not self._smartbox_port_powers == desired_port_power_states:
+        self.logger.debug("Waiting for unmasked smartbox ports to change state")
+        if not self.smartbox_port_states.wait_for(
+            desired_port_powers, timeout, task_abort_event
+        ):
             if task_abort_event and task_abort_event.is_set():
                 msg = "Aborted waiting for smartbox ports to change state"
                 self.logger.info(msg)
                 return ResultCode.ABORTED, int(deadline - time.monotonic()), msg
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
-                msg = "Timeout reached waiting for smartbox ports to change state"
-                self.logger.error(msg)
-                return ResultCode.FAILED, 0, msg
-            self.logger.debug("Waiting for unmasked smartbox ports to change state")
-            self.smartbox_ports_change.wait(min(remaining, poll))
-            self.smartbox_ports_change.clear()
+            msg = "Timeout reached waiting for smartbox ports to change state"
+            self.logger.error(msg)
+            return ResultCode.FAILED, 0, msg
         return (
             ResultCode.OK,
             deadline - time.monotonic(),
@@ -706,19 +771,32 @@ class SmartBoxComponentManager(TaskExecutorComponentManager):
         # So we can differentiate between ON and STANDBY when all ports are masked.
         self._desire_standby = False
 
+        # The PaSD bus commands are given the ID of this command, so that
+        # their timing reports can be nested in its report.
+        timer = self._command_timings.start("On")
         try:
             if self._fndh_port_powers[self._fndh_port - 1] != PowerState.ON:
-                result, time_left, msg = self._power_fndh_port(
-                    PowerState.ON, self._fndh_port, timeout, task_abort_event
-                )
+                with timer.phase("fndh_port_on", fndh_port=self._fndh_port):
+                    result, time_left, msg = self._power_fndh_port(
+                        PowerState.ON,
+                        self._fndh_port,
+                        timeout,
+                        task_abort_event,
+                        command_id=timer.command_id,
+                    )
 
             if result == ResultCode.OK:
-                result, time_left, msg = self._power_smartbox_ports(
-                    PowerState.ON, time_left, task_abort_event
-                )
+                with timer.phase("smartbox_ports_on"):
+                    result, time_left, msg = self._power_smartbox_ports(
+                        PowerState.ON,
+                        time_left,
+                        task_abort_event,
+                        command_id=timer.command_id,
+                    )
 
         except Exception as ex:  # pylint: disable=broad-except
             self.logger.error(f"error {ex}")
+            timer.finish(ResultCode.FAILED.name)
             if task_callback:
                 task_callback(
                     status=TaskStatus.FAILED,
@@ -726,6 +804,9 @@ class SmartBoxComponentManager(TaskExecutorComponentManager):
                 )
             return
 
+        timer.finish(result.name)
+        for report in self._pasd_bus_proxy.command_timing_reports(timer.command_id):
+            timer.add_child(report)
         if task_callback:
             time_taken = int(timeout - time_left)
             task_callback(
@@ -1058,6 +1139,15 @@ class SmartBoxComponentManager(TaskExecutorComponentManager):
         """
         self._pasd_bus_proxy.write_attribute(attribute_name, value)
 
+    @property
+    def command_timing_reports(self: SmartBoxComponentManager) -> list[dict[str, Any]]:
+        """
+        Return the timing reports of the most recent On commands.
+
+        :return: a list of timing reports, oldest first.
+        """
+        return self._command_timings.reports()
+
     @property
     def port_mask(self: SmartBoxComponentManager) -> list[bool]:
         """
@@ -40,7 +40,12 @@ from tango.server import attribute, command, device_property
 from ska_low_mccs_pasd.pasd_data import PasdData
 
 from ..pasd_controllers_configuration import ControllerDict, PasdControllersConfig
-from ..pasd_utils import PasdDatabase, PasdThresholds
+from ..pasd_utils import (
+    PasdAttributeKind,
+    PasdDatabase,
+    PasdThresholds,
+    build_attribute_dispatch_table,
+)
 from .smart_box_component_manager import SmartBoxComponentManager
 from .smartbox_health_model import SmartBoxHealthModel
 
@@ -153,6 +158,9 @@ class MccsSmartBox(MccsBaseDevice):
         self._thresholds_tango: PasdThresholds
         self._thresholds_pasd: PasdThresholds
         self.threshold_fault: Optional[bool] = None
+        self._attribute_handlers: dict[
+            str, Callable[[str, Any, float, tango.AttrQuality], None]
+        ] = {}
 
     def init_device(self: MccsSmartBox) -> None:
         """
@@ -164,6 +172,7 @@ class MccsSmartBox(MccsBaseDevice):
         self._readable_name = re.findall("sb[0-9]+", self.get_name())[0]
         super().init_device()
         self._setup_smartbox_attributes()
+        self._attribute_handlers = self._build_attribute_handlers()
 
         self._build_state = sys.modules["ska_low_mccs_pasd"].__version_info__
         self._version_id = sys.modules["ska_low_mccs_pasd"].__version__
@@ -892,8 +901,7 @@ class MccsSmartBox(MccsBaseDevice):
                     self.threshold_fault = True
                     self._component_state_callback()
 
-    # pylint: disable=too-many-branches
-    def _attribute_changed_callback(  # noqa: C901
+    def _attribute_changed_callback(
         self: MccsSmartBox,
         attr_name: str,
         attr_value: Any,
@@ -914,101 +922,153 @@ class MccsSmartBox(MccsBaseDevice):
         :param: timestamp: the timestamp for the current change
         :param: attr_quality: the quality factor for the attribute
         """
-        try:
-            assert (
-                len(
-                    [
-                        register["tango_attr_name"]
-                        for register in self.CONFIG["registers"].values()
-                        if register["tango_attr_name"].lower() == attr_name.lower()
-                    ]
-                )
-                > 0
+        handler = self._attribute_handlers.get(attr_name)
+        if handler is None:
+            self.logger.error(
+                f"""The attribute {attr_name} pushed from MccsPasdBus
+                device does not exist in MccsSmartBox"""
             )
-            if attr_value is None:
-                # This happens when the upstream attribute's quality factor has
-                # been set to INVALID. Pushing a change event with None
-                # triggers an exception so we change it to the last known value here
-                attr_value = self._smartbox_state[attr_name].value
-            else:
-                self._smartbox_state[attr_name].value = attr_value
-            if "portspowersensed" in attr_name.lower():
-                self.component_manager._on_smartbox_ports_power_changed(
-                    attr_name, attr_value, attr_quality
-                )
-            # Status register mapping to quality to health:
-            # UNINITIALISED -> ATTR_VALID -> OK
-            # OK -> ATTR_VALID -> OK
-            # WARNING -> ATTR_WARNING -> DEGRADED
-            # ALARM -> ATTR_ALARM -> FAILED
-            # RECOVERY -> ATTR_ALARM -> FAILED
-            # POWERDOWN -> ATTR_INVALID -> UNKNOWN (shouldn't be seen in operation)
-            if "pasdstatus" in attr_name.lower():
-                attr_quality = self._convert_status_to_quality(attr_value)
-                if (
-                    attr_quality
-                    in [
-                        tango.AttrQuality.ATTR_ALARM,
-                        tango.AttrQuality.ATTR_WARNING,
-                    ]
-                    and self.dev_state() == tango.DevState.ON
-                ):
-                    self.set_state(tango.DevState.ALARM)
-            self._smartbox_state[attr_name].quality = attr_quality
-            self._smartbox_state[attr_name].timestamp = timestamp
-
-            self.push_change_event(attr_name, attr_value, timestamp, attr_quality)
-            self.push_archive_event(attr_name, attr_value, timestamp, attr_quality)
-
-            # If we are reading alarm thresholds, update the alarm configuration
-            # for the corresponding Tango attribute
-            if attr_name.endswith("thresholds"):
-                try:
-                    attr_true = attr_name.removesuffix("thresholds")
-                    if self._health_model is not None:
-                        self._health_model.health_params = {attr_true: attr_value}
-                    self._thresholds_pasd.update({attr_name: attr_value})
-                    diff = self._threshold_differences()
-                    if diff:
-                        self.logger.error(
-                            f"Mismatch between firmware and tango thresholds: {diff}"
-                        )
-                        self.threshold_fault = True
-                    else:
-                        if self.op_state_model._op_state == tango.DevState.UNKNOWN:
-                            self.threshold_fault = None
-                        else:
-                            self.threshold_fault = False
-                    self._component_state_callback()
-                except DevFailed:
-                    # No corresponding attribute to update, continue
-                    pass
-            elif attr_name.endswith("status"):
-                if self._health_model is not None:
-                    self._health_model.update_state(status=attr_value)
-            elif "portbreakerstripped" in attr_name.lower():
-                self._nof_port_breakers_tripped = sum(attr_value)
-                self.push_change_event(
-                    "numberOfPortBreakersTripped", self._nof_port_breakers_tripped
-                )
-                self.push_archive_event(
-                    "numberOfPortBreakersTripped", self._nof_port_breakers_tripped
+            return
+        if attr_value is None:
+            # This happens when the upstream attribute's quality factor has
+            # been set to INVALID. Pushing a change event with None
+            # triggers an exception so we change it to the last known value here
+            attr_value = self._smartbox_state[attr_name].value
+        else:
+            self._smartbox_state[attr_name].value = attr_value
+        handler(attr_name, attr_value, timestamp, attr_quality)
+
+    def _build_attribute_handlers(
+        self: MccsSmartBox,
+    ) -> dict[str, Callable[[str, Any, float, tango.AttrQuality], None]]:
+        return build_attribute_dispatch_table(
+            self.CONFIG,
+            {
+                PasdAttributeKind.THRESHOLD: self._on_threshold_changed,
+                PasdAttributeKind.STATUS: self._on_status_changed,
+                PasdAttributeKind.PORT_POWER: self._on_port_power_changed,
+                PasdAttributeKind.BREAKER: self._on_port_breakers_changed,
+                PasdAttributeKind.MONITORING_POINT: self._on_monitoring_point_changed,
+            },
+        )
+
+    def _publish_attribute(
+        self: MccsSmartBox,
+        attr_name: str,
+        attr_value: Any,
+        timestamp: float,
+        attr_quality: tango.AttrQuality,
+    ) -> None:
+        self._smartbox_state[attr_name].quality = attr_quality
+        self._smartbox_state[attr_name].timestamp = timestamp
+
+        self.push_change_event(attr_name, attr_value, timestamp, attr_quality)
+        self.push_archive_event(attr_name, attr_value, timestamp, attr_quality)
+
+    def _on_threshold_changed(
+        self: MccsSmartBox,
+        attr_name: str,
+        attr_value: Any,
+        timestamp: float,
+        attr_quality: tango.AttrQuality,
+    ) -> None:
+        self._publish_attribute(attr_name, attr_value, timestamp, attr_quality)
+        # If we are reading alarm thresholds, update the alarm configuration
+        # for the corresponding Tango attribute
+        try:
+            attr_true = attr_name.removesuffix("thresholds")
+            if self._health_model is not None:
+                self._health_model.health_params = {attr_true: attr_value}
+            self._thresholds_pasd.update({attr_name: attr_value})
+            diff = self._threshold_differences()
+            if diff:
+                self.logger.error(
+                    f"Mismatch between firmware and tango thresholds: {diff}"
                 )
-                if self._health_model is not None:
-                    self._health_model.update_state(port_breakers_tripped=attr_value)
+                self.threshold_fault = True
             else:
-                self._health_monitor_points[attr_name] = attr_value
-                if self._health_model is not None:
-                    self._health_model.update_state(
-                        monitoring_points=self._health_monitor_points
-                    )
+                if self.op_state_model._op_state == tango.DevState.UNKNOWN:
+                    self.threshold_fault = None
+                else:
+                    self.threshold_fault = False
+            self._component_state_callback()
+        except DevFailed:
+            # No corresponding attribute to update, continue
+            pass
+
+    def _on_status_changed(
+        self: MccsSmartBox,
+        attr_name: str,
+        attr_value: Any,
+        timestamp: float,
+        attr_quality: tango.AttrQuality,
+    ) -> None:
+        # Status register mapping to quality to health:
+        # UNINITIALISED -> ATTR_VALID -> OK
+        # OK -> ATTR_VALID -> OK
+        # WARNING -> ATTR_WARNING -> DEGRADED
+        # ALARM -> ATTR_ALARM -> FAILED
+        # RECOVERY -> ATTR_ALARM -> FAILED
+        # POWERDOWN -> ATTR_INVALID -> UNKNOWN (shouldn't be seen in operation)
+        attr_quality = self._convert_status_to_quality(attr_value)
+        if (
+            attr_quality
+            in [
+                tango.AttrQuality.ATTR_ALARM,
+                tango.AttrQuality.ATTR_WARNING,
+            ]
+            and self.dev_state() == tango.DevState.ON
+        ):
+            self.set_state(tango.DevState.ALARM)
+        self._publish_attribute(attr_name, attr_value, timestamp, attr_quality)
+        if self._health_model is not None:
+            self._health_model.update_state(status=attr_value)
 
-        except AssertionError as e:
-            self.logger.debug(
-                f"""The attribute {attr_name} pushed from MccsPasdBus
-                device does not exist in MccsSmartBox"""
+    def _on_port_power_changed(
+        self: MccsSmartBox,
+        attr_name: str,
+        attr_value: Any,
+        timestamp: float,
+        attr_quality: tango.AttrQuality,
+    ) -> None:
+        self.component_manager._on_smartbox_ports_power_changed(
+            attr_name, attr_value, attr_quality
+        )
+        self._on_monitoring_point_changed(
+            attr_name, attr_value, timestamp, attr_quality
+        )
+
+    def _on_port_breakers_changed(
+        self: MccsSmartBox,
+        attr_name: str,
+        attr_value: Any,
+        timestamp: float,
+        attr_quality: tango.AttrQuality,
+    ) -> None:
+        self._publish_attribute(attr_name, attr_value, timestamp, attr_quality)
+        self._nof_port_breakers_tripped = sum(attr_value)
+        self.push_change_event(
+            "numberOfPortBreakersTripped", self._nof_port_breakers_tripped
+        )
+        self.push_archive_event(
+            "numberOfPortBreakersTripped", self._nof_port_breakers_tripped
+        )
+        if self._health_model is not None:
+            self._health_model.update_state(port_breakers_tripped=attr_value)
+
+    def _on_monitoring_point_changed(
+        self: MccsSmartBox,
+        attr_name: str,
+        attr_value: Any,
+        timestamp: float,
+        attr_quality: tango.AttrQuality,
+    ) -> None:
+        self._publish_attribute(attr_name, attr_value, timestamp, attr_quality)
+        self._health_monitor_points[attr_name] = attr_value
+        if self._health_model is not None:
+            self._health_model.update_state(
+                monitoring_points=self._health_monitor_points
             )
-            self.logger.error(repr(e))
 
     def _threshold_differences(self: MccsSmartBox) -> dict:
         """
@@ -1067,6 +1127,20 @@ class MccsSmartBox(MccsBaseDevice):
             case _:
                 return tango.AttrQuality.ATTR_INVALID
 
+    @attribute(dtype="DevString", label="CommandTimingReports")
+    def commandTimingReports(self: MccsSmartBox) -> str:
+        """
+        Return the timing reports of the most recent On commands.
+
+        Each report gives the start and duration of each phase of the
+        command: powering on the FNDH port, and then the smartbox ports.
+        It nests the reports of the MccsPasdBus commands that were made
+        with its command ID.
+
+        :return: a JSON list of timing reports, oldest first.
+        """
+        return json.dumps(self.component_manager.command_timing_reports)
+
     @attribute(dtype="DevString", label="FndhPort")
     def fndhPort(self: MccsSmartBox) -> str:
         """
@@ -1137,6 +1211,20 @@ class MccsSmartBox(MccsBaseDevice):
         """
         return self.AntennaNames
 
+    @attribute(
+        dtype=("int",),
+        label="PortsWithAntennas",
+        max_dim_x=12,
+    )
+    def portsWithAntennas(self: MccsSmartBox) -> list[int]:
+        """
+        Get the ports of this smartbox that have antennas.
+
+        :return: the ports of this smartbox that have antennas, in the same
+            order as the names of their antennas.
+        """
+        return self.PortsWithAntennas
+
     @attribute(
         dtype="DevString",
         format="%s",
@@ -14,6 +14,7 @@ from typing import Any, Optional
 from ska_control_model import HealthState
 from ska_low_mccs_common.health import BaseHealthModel, HealthChangedCallbackProtocol
 
+from ..pasd_utils import MonitoringPointHealthCache
 from .smartbox_health_rules import SmartboxHealthRules
 
 __all__ = ["SmartBoxHealthModel"]
@@ -42,6 +43,10 @@ class SmartBoxHealthModel(BaseHealthModel):
         self.logger = logger
         self._health_rules = SmartboxHealthRules(thresholds)
         self._use_new_health_rules = True
+        self._incremental = True
+        self._intermediate_health = MonitoringPointHealthCache(
+            self._health_rules.compute_intermediate_state
+        )
         super().__init__(health_changed_callback)
 
     @property
@@ -65,6 +70,29 @@ class SmartBoxHealthModel(BaseHealthModel):
             # force a re-evaluation
             self.evaluate_health()
 
+    @property
+    def incremental(self: SmartBoxHealthModel) -> bool:
+        """
+        A flag to represent if the health is evaluated incrementally.
+
+        When it is, the intermediate health of each monitoring point is
+        cached, and only recomputed when its value or its thresholds change.
+        Thresholds must therefore be changed through this model, not in place.
+
+        :returns: True if the health is evaluated incrementally.
+        """
+        return self._incremental
+
+    @incremental.setter
+    def incremental(self: SmartBoxHealthModel, val: bool) -> None:
+        """
+        Toggle incremental evaluation of the health.
+
+        :param val: True if we want to evaluate the health incrementally.
+        """
+        self._incremental = val
+        self._intermediate_health.clear()
+
     def evaluate_health(
         self: SmartBoxHealthModel,
     ) -> tuple[HealthState, str]:
@@ -112,11 +140,14 @@ class SmartBoxHealthModel(BaseHealthModel):
         """
         monitoring_points: dict[str, Any] = self._state.get("monitoring_points", {})
 
+        compute_intermediate_state = (
+            self._intermediate_health.get
+            if self._incremental
+            else self._health_rules.compute_intermediate_state
+        )
         intermediate_healths = {}
         for health_key, parameters in self.health_params.items():
-            intermediate_healths[
-                health_key
-            ] = self._health_rules.compute_intermediate_state(
+            intermediate_healths[health_key] = compute_intermediate_state(
                 health_key,
                 monitoring_points.get(health_key),
                 parameters,
@@ -151,3 +182,4 @@ class SmartBoxHealthModel(BaseHealthModel):
         self._health_rules._thresholds = self._merge_dicts(
             self._health_rules._thresholds, params
         )
+        self._intermediate_health.invalidate(*params)
@@ -14,7 +14,7 @@ import threading
 import time
 import unittest.mock
 from typing import Any, Iterator
-from unittest.mock import ANY, MagicMock, call, patch
+from unittest.mock import ANY, MagicMock, PropertyMock, call, patch
 
 import pytest
 import tango
@@ -55,6 +55,7 @@ def mock_smartboxes_fixture() -> unittest.mock.Mock:
         "PowerOffAntenna", ResultCode.OK, "power off antenna sb18-01 success."
     )
     builder.add_attribute("antennaNames", ["sb18-01"])
+    builder.add_attribute("portsWithAntennas", [1])
     return builder()
 
 
@@ -487,6 +488,83 @@ class TestFieldStationComponentManager:
             result=(ResultCode.OK, "Antenna masking updated."),
         )
 
+    @patch(
+        "ska_low_mccs_pasd.field_station."
+        "field_station_component_manager.MccsCommandProxy"
+    )
+    def test_set_antenna_powers(
+        self: TestFieldStationComponentManager,
+        mock_command_cls: unittest.mock.Mock,
+        field_station_component_manager: FieldStationComponentManager,
+        mock_callbacks: MockCallableGroup,
+    ) -> None:
+        """
+        Test that antenna powers are set with one command per smartbox.
+
+        The mock_smartbox fixture advertises antenna sb18-01 on port 1, so
+        its smartbox should be sent SetPortPowers for port 1 only, and the
+        result of each antenna should be reported.
+
+        :param mock_command_cls: a patched MccsCommandProxy class.
+        :param field_station_component_manager: a FieldStation component manager.
+        :param mock_callbacks: mock callables.
+        """
+        mock_command = unittest.mock.Mock(
+            return_value=(ResultCode.OK, "Set port powers success")
+        )
+        mock_command_cls.return_value = mock_command
+
+        field_station_component_manager.start_communicating()
+        mock_callbacks["communication_state"].assert_call(
+            CommunicationStatus.NOT_ESTABLISHED
+        )
+        mock_callbacks["communication_state"].assert_call(
+            CommunicationStatus.ESTABLISHED
+        )
+
+        field_station_component_manager.set_antenna_powers(
+            {"sb18-01": True, "sb99-01": False}, mock_callbacks["task"]
+        )
+
+        mock_command_cls.assert_called_once_with(
+            device_name=ANY,
+            command_name="SetPortPowers",
+            logger=ANY,
+        )
+        assert json.loads(mock_command.call_args[1]["arg"]) == {
+            "port_powers": [True] + [None] * (PasdData.NUMBER_OF_SMARTBOX_PORTS - 1),
+            "stay_on_when_offline": True,
+        }
+        mock_callbacks["task"].assert_call(status=TaskStatus.IN_PROGRESS)
+        mock_callbacks["task"].assert_call(
+            status=TaskStatus.FAILED,
+            result=(
+                ResultCode.FAILED,
+                json.dumps(
+                    {
+                        "sb18-01": {
+                            "result": "OK",
+                            "message": "Set port powers success",
+                        },
+                        "sb99-01": {
+                            "result": "REJECTED",
+                            "message": "Antenna not found on any smartbox",
+                        },
+                    }
+                ),
+            ),
+        )
+
+        field_station_component_manager.power_off_antennas(
+            ["sb18-01"], mock_callbacks["task"]
+        )
+        assert json.loads(mock_command.call_args[1]["arg"])["port_powers"][0] is False
+        mock_callbacks["task"].assert_call(status=TaskStatus.IN_PROGRESS)
+        mock_callbacks["task"].assert_call(
+            status=TaskStatus.COMPLETED,
+            result=(ResultCode.OK, ANY),
+        )
+
     def test_abort(
         self: TestFieldStationComponentManager,
         logger: logging.Logger,
@@ -669,3 +747,117 @@ class TestFieldStationComponentManager:
             status=TaskStatus.REJECTED,
             result=(ResultCode.REJECTED, ANY),
         )
+
+    def test_antenna_routes(
+        self: TestFieldStationComponentManager,
+        logger: logging.Logger,
+        mock_callbacks: MockCallableGroup,
+        station_label: str,
+    ) -> None:
+        """
+        Test that the antennas of each smartbox are only read when needed.
+
+        They are read the first time that they are needed, and then only
+        again once they have been invalidated.
+
+        :param logger: a logger for this command to use.
+        :param mock_callbacks: mock callables.
+        :param station_label: The label of the station under test.
+        """
+        smartbox_trls = [
+            get_smartbox_name(smartbox_id, station_label=station_label)
+            for smartbox_id in (1, 2)
+        ]
+        antenna_name_reads: list[str] = []
+        smartbox_proxys: dict[str, Any] = {}
+        for smartbox_id, smartbox_trl in enumerate(smartbox_trls, start=1):
+            smartbox_proxy = MagicMock()
+            type(smartbox_proxy._proxy).antennaNames = PropertyMock(
+                side_effect=lambda trl=smartbox_trl, sb=smartbox_id: (
+                    antenna_name_reads.append(trl)
+                    or [f"sb{sb:02d}-01", f"sb{sb:02d}-02"]
+                )
+            )
+            smartbox_proxy._proxy.portsWithAntennas = [3, 7]
+            smartbox_proxys[smartbox_trl] = smartbox_proxy
+
+        cm = FieldStationComponentManager(
+            logger,
+            "ci-1",
+            get_fndh_name(station_label=station_label),
+            smartbox_trls,
+            1,
+            mock_callbacks["communication_state"],
+            mock_callbacks["component_state"],
+            _fndh_proxy=MagicMock(),
+            _smartbox_proxys=smartbox_proxys,
+        )
+
+        expected_routes = {
+            "sb01-01": (smartbox_trls[0], 3),
+            "sb01-02": (smartbox_trls[0], 7),
+            "sb02-01": (smartbox_trls[1], 3),
+            "sb02-02": (smartbox_trls[1], 7),
+        }
+        for _ in range(3):
+            routes = cm._get_antenna_routes()
+            assert {
+                name: (route.smartbox_trl, route.port) for name, route in routes.items()
+            } == expected_routes
+        assert antenna_name_reads == smartbox_trls
+
+        cm._invalidate_antenna_routes(smartbox_trls[0])
+        assert set(cm._get_antenna_routes()) == set(expected_routes)
+        assert antenna_name_reads == smartbox_trls + smartbox_trls[:1]
+
+    def test_antenna_routes_invalidated_while_read(
+        self: TestFieldStationComponentManager,
+        logger: logging.Logger,
+        mock_callbacks: MockCallableGroup,
+        station_label: str,
+    ) -> None:
+        """
+        Test that a smartbox's antennas can be invalidated while they are read.
+
+        The antennas are read without holding the lock, so invalidating them
+        isn't held up by the read, and the antennas read are not used.
+
+        :param logger: a logger for this command to use.
+        :param mock_callbacks: mock callables.
+        :param station_label: The label of the station under test.
+        """
+        smartbox_trl = get_smartbox_name(1, station_label=station_label)
+        cm: FieldStationComponentManager | None = None
+        reads = 0
+
+        def _read_antenna_names() -> list[str]:
+            nonlocal reads
+            reads += 1
+            if reads == 1:
+                # Communication with the smartbox changes during the first read.
+                assert cm is not None
+                cm._invalidate_antenna_routes(smartbox_trl)
+            return ["sb01-01"]
+
+        smartbox_proxy = MagicMock()
+        type(smartbox_proxy._proxy).antennaNames = PropertyMock(
+            side_effect=_read_antenna_names
+        )
+        smartbox_proxy._proxy.portsWithAntennas = [3]
+        cm = FieldStationComponentManager(
+            logger,
+            "ci-1",
+            get_fndh_name(station_label=station_label),
+            [smartbox_trl],
+            1,
+            mock_callbacks["communication_state"],
+            mock_callbacks["component_state"],
+            _fndh_proxy=MagicMock(),
+            _smartbox_proxys={smartbox_trl: smartbox_proxy},
+        )
+
+        assert cm._get_antenna_routes() == {}
+        routes = cm._get_antenna_routes()
+        assert routes["sb01-01"].smartbox_trl == smartbox_trl
+        assert routes["sb01-01"].port == 3
+        assert reads == 2
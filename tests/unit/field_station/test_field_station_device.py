@@ -10,6 +10,7 @@
 from __future__ import annotations
 
 import gc
+import json
 import unittest.mock
 from typing import Any
 
@@ -176,6 +177,27 @@ def test_outside_temperature(
             None,
             id="Power off an antenna",
         ),
+        pytest.param(
+            "PowerOnAntennas",
+            "power_on_antennas",
+            json.dumps(["sb01-01", "sb02-03"]),
+            None,
+            id="Power on antennas",
+        ),
+        pytest.param(
+            "PowerOffAntennas",
+            "power_off_antennas",
+            json.dumps(["sb01-01", "sb02-03"]),
+            None,
+            id="Power off antennas",
+        ),
+        pytest.param(
+            "SetAntennaPowers",
+            "set_antenna_powers",
+            json.dumps({"sb01-01": True, "sb02-03": False}),
+            None,
+            id="Set antenna powers",
+        ),
     ],
 )
 def test_command(  # pylint: disable=too-many-arguments, too-many-positional-arguments
@@ -579,3 +579,51 @@ class TestFNDHHealthModel:
         final_health, final_report = health_model.evaluate_health()
         assert final_health == end_expected_health, final_report
         assert end_expected_report in final_report
+
+    def test_fndh_incremental_health(
+        self: TestFNDHHealthModel,
+        health_model: FndhHealthModel,
+        default_monitoring_point_thresholds: dict[str, list[float]],
+        healthy_monitoring_points: dict[str, Any],
+    ) -> None:
+        """
+        Test that only the monitoring points that change are re-evaluated.
+
+        :param health_model: Health model fixture.
+        :param default_monitoring_point_thresholds: a fixture containing
+            default monitoring point thresholds.
+        :param healthy_monitoring_points: a fixture containing monitoring points in
+            a healthy state.
+        """
+        cache = health_model._monitoring_point_health
+        health_model.health_params = default_monitoring_point_thresholds
+        monitoring_points = dict(
+            healthy_monitoring_points,
+            portspowercontrol=[True] * 28,
+            portspowersensed=[True] * 28,
+        )
+        health_model.update_state(
+            status=FndhStatusMap.OK.name,
+            ports_with_smartbox=[i + 1 for i in range(24)],
+            monitoring_points=monitoring_points,
+        )
+        assert health_model.evaluate_health()[0] == HealthState.OK
+        evaluations = cache.evaluations
+        assert health_model.evaluate_health()[0] == HealthState.OK
+        assert cache.evaluations == evaluations
+
+        # The device updates the dictionary it passed in place.
+        monitoring_points["psu48vvoltage1"] = 90.0
+        health_model.update_state(monitoring_points=monitoring_points)
+        assert health_model.evaluate_health()[0] == HealthState.DEGRADED
+        assert cache.evaluations == evaluations + 1
+
+        health_model.update_monitoring_point_threshold(
+            "psu48vvoltage1", np.array([100.0, 95.0, 2.0, 0.0])
+        )
+        incremental_health = health_model.evaluate_health()
+        assert incremental_health[0] == HealthState.OK
+        assert cache.evaluations == evaluations + 2
+
+        health_model.incremental = False
+        assert health_model.evaluate_health() == incremental_health
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the PaSD bus attribute index."""
+
+from __future__ import annotations
+
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_attribute_index import PasdAttributeIndex
+from ska_low_mccs_pasd.pasd_data import PasdData
+
+
+def test_attribute_index() -> None:
+    """Test that PaSD registers and Tango attributes are mapped both ways."""
+    attribute_index = PasdAttributeIndex(PasdData.CONTROLLERS_CONFIG, [1, 12])
+
+    for controller_type, device_id, prefix in [
+        ("FNPC", PasdData.FNDH_DEVICE_ID, PasdData.FNDH_PREFIX),
+        ("FNCC", PasdData.FNCC_DEVICE_ID, PasdData.FNCC_PREFIX),
+        ("FNSC", 1, PasdData.SMARTBOX_PREFIX + "1"),
+        ("FNSC", 12, PasdData.SMARTBOX_PREFIX + "12"),
+    ]:
+        registers = PasdData.CONTROLLERS_CONFIG[controller_type]["registers"]
+        for key, register in registers.items():
+            tango_name = prefix + register["tango_attr_name"]
+            assert attribute_index.get_tango_attribute_name(device_id, key) == (
+                tango_name
+            )
+            assert attribute_index.get_pasd_attribute(tango_name) == (device_id, key)
+
+
+def test_attribute_index_unknown_attributes() -> None:
+    """Test that unknown devices and attributes are not found."""
+    attribute_index = PasdAttributeIndex(PasdData.CONTROLLERS_CONFIG, [1, 12])
+    key, register = next(iter(PasdData.CONTROLLERS_CONFIG["FNSC"]["registers"].items()))
+
+    # Smartbox 2 is not on the bus
+    assert attribute_index.get_tango_attribute_name(2, key) == ""
+    assert (
+        attribute_index.get_pasd_attribute(
+            PasdData.SMARTBOX_PREFIX + "2" + register["tango_attr_name"]
+        )
+        is None
+    )
+    assert attribute_index.get_tango_attribute_name(1, "not_a_register") == ""
+    assert attribute_index.get_pasd_attribute("healthState") is None
+
+
+def test_attribute_index_devices() -> None:
+    """Test that the Tango attributes of each device are indexed."""
+    attribute_index = PasdAttributeIndex(PasdData.CONTROLLERS_CONFIG, [1, 12])
+    assert sorted(attribute_index.device_ids) == sorted(
+        [PasdData.FNDH_DEVICE_ID, PasdData.FNCC_DEVICE_ID, 1, 12]
+    )
+    assert attribute_index.get_prefix(12) == PasdData.SMARTBOX_PREFIX + "12"
+    assert attribute_index.get_prefix(2) == ""
+
+    registers = PasdData.CONTROLLERS_CONFIG["FNSC"]["registers"]
+    assert attribute_index.get_tango_attribute_names(1) == [
+        PasdData.SMARTBOX_PREFIX + "1" + register["tango_attr_name"]
+        for register in registers.values()
+    ]
+    assert attribute_index.get_tango_attribute_names(2) == []
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the PaSD bus attribute templates."""
+
+from __future__ import annotations
+
+import tango
+
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_attribute_template import (
+    build_attribute_templates,
+)
+from ska_low_mccs_pasd.pasd_controllers_configuration import ControllerDict
+
+
+def test_attribute_templates() -> None:
+    """Test that a template is built with the metadata of each register."""
+    controller: ControllerDict = {
+        "prefix": "smartbox",
+        "registers": {
+            "input_voltage": {
+                "data_type": "float",
+                "tango_dim_x": 1,
+                "tango_attr_name": "InputVoltage",
+                "writable": False,
+                "read_once": False,
+                "abs_deadband": 0.5,
+            },
+            "port_breakers_tripped": {
+                "data_type": "bool",
+                "tango_dim_x": 12,
+                "tango_attr_name": "PortBreakersTripped",
+                "writable": True,
+                "read_once": False,
+            },
+            "modbus_register_map_revision": {
+                "data_type": "int",
+                "tango_dim_x": 1,
+                "tango_attr_name": "ModbusRegisterMapRevisionNumber",
+                "writable": False,
+                "read_once": True,
+            },
+        },
+    }
+    voltage, breakers, revision = build_attribute_templates(
+        controller, {"int": int, "float": float, "bool": bool}
+    )
+
+    assert voltage.name == "InputVoltage"
+    assert voltage.dtype is float
+    assert voltage.access == tango.AttrWriteType.READ
+    assert (voltage.abs_deadband, voltage.rel_deadband) == (0.5, None)
+    assert voltage.event_kwargs == {"rel_change": 1, "archive_rel_change": 1}
+
+    assert breakers.dtype == (bool,)
+    assert breakers.max_dim_x == 12
+    assert breakers.access == tango.AttrWriteType.READ_WRITE
+    assert not breakers.event_kwargs
+
+    assert revision.read_once
+    assert revision.event_kwargs == {"rel_change": 1, "archive_rel_change": 1}
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the PaSD bus circuit breaker."""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_circuit_breaker import (
+    CircuitBreakerState,
+    DeviceCircuitBreaker,
+)
+
+
+def test_circuit_breaker(logger: logging.Logger) -> None:
+    """
+    Test that a circuit breaker opens, backs off and closes again.
+
+    :param logger: a logger for the circuit breaker to use.
+    """
+    circuit_breaker = DeviceCircuitBreaker(1, 10.0, 25.0, logger)
+    assert circuit_breaker.state == CircuitBreakerState.CLOSED
+    assert circuit_breaker.allow_request()
+
+    backoffs = []
+    for _ in range(3):
+        start = time.time()
+        circuit_breaker.record_failure()
+        assert circuit_breaker.state == CircuitBreakerState.OPEN
+        assert not circuit_breaker.allow_request()
+        backoffs.append(round(circuit_breaker.retry_time - start))
+    # The backoff doubles with each failure, up to the maximum
+    assert backoffs == [10, 20, 25]
+    assert circuit_breaker.consecutive_failures == 3
+
+    # Once the backoff has expired, a single probe is allowed...
+    circuit_breaker._retry_time = time.time() - 1
+    assert circuit_breaker.allow_request()
+    assert circuit_breaker.state == CircuitBreakerState.HALF_OPEN
+
+    # ... and if it succeeds, the breaker closes.
+    circuit_breaker.record_success()
+    assert circuit_breaker.state == CircuitBreakerState.CLOSED
+    assert circuit_breaker.consecutive_failures == 0
+    assert circuit_breaker.allow_request()
+
+
+def test_circuit_breaker_without_backoff(logger: logging.Logger) -> None:
+    """
+    Test that a circuit breaker with no backoff never holds a device back.
+
+    :param logger: a logger for the circuit breaker to use.
+    """
+    circuit_breaker = DeviceCircuitBreaker(1, 0.0, 60.0, logger)
+    for _ in range(1100):
+        circuit_breaker.record_failure()
+        assert circuit_breaker.allow_request()
@@ -84,16 +84,12 @@ def pasd_bus_component_manager_fixture(
 
     :yields: a PaSD bus component manager, running against a simulator.
     """
-    # The splitter mimics the hook in pasd_bus_device.py that forwards FNDH
-    # PortsPowerSensed updates to the component manager so smartboxes get
-    # added to the polling list.
-    component_manager: PasdBusComponentManager | None = None
 
     def _pasd_device_state_splitter(device_id: int, **kwargs: Any) -> None:
+        # The component manager itself updates the smartbox polling list from
+        # FNDH port power states, so the splitter need only route the updates.
         if device_id == PasdData.FNDH_DEVICE_ID:
             device_name = "fndh"
-            if "ports_power_sensed" in kwargs and component_manager is not None:
-                component_manager.update_port_power_states(kwargs["ports_power_sensed"])
         elif device_id == PasdData.FNCC_DEVICE_ID:
             device_name = "fncc"
         else:
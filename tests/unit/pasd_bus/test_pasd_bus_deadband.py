@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the PaSD attribute deadband filtering."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import pytest
+
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_deadband import within_deadband
+
+
+@pytest.mark.parametrize(
+    ("old", "new", "abs_deadband", "rel_deadband", "expected"),
+    [
+        # Without deadbands, every value is published
+        (48.0, 48.0, None, None, False),
+        (48.0, 48.4, 0.5, None, True),
+        (48.0, 47.4, 0.5, None, False),
+        (48.0, 48.4, None, 1.0, True),
+        (48.0, 48.6, None, 1.0, False),
+        # With both, the value must be within each of them
+        (48.0, 48.4, 0.5, 0.5, False),
+        ([1, 2, 3], [1, 2, 4], 1, None, True),
+        ([1, 2, 3], [1, 2, 5], 1, None, False),
+        ([1, 2, 3], [1, 2], 1, None, False),
+        # Non-numeric values are only within the deadband if they are equal
+        ("OK", "OK", 1, None, True),
+        ("OK", "WARNING", 1, None, False),
+        ([True, False], [True, False], 0, None, True),
+        ([True, False], [True, True], 0, None, False),
+    ],
+)
+def test_within_deadband(
+    old: Any,
+    new: Any,
+    abs_deadband: Optional[float],
+    rel_deadband: Optional[float],
+    expected: bool,
+) -> None:
+    """
+    Test whether values are within the deadband of the last published value.
+
+    :param old: the last published value.
+    :param new: the newly polled value.
+    :param abs_deadband: the absolute deadband.
+    :param rel_deadband: the relative deadband, in percent.
+    :param expected: whether the new value is expected to be within the deadband.
+    """
+    assert within_deadband(old, new, abs_deadband, rel_deadband) is expected
@@ -27,6 +27,7 @@ from ska_low_pasd_driver.pasd_bus_simulator import PasdHardwareSimulator
 from ska_tango_testing.mock.placeholders import Anything, OneOf
 from ska_tango_testing.mock.tango import MockTangoEventCallbackGroup
 
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_snapshot import decode_state_snapshot
 from ska_low_mccs_pasd.pasd_data import PasdData
 from tests.harness import INPUT_VOLTAGE_THRESHOLDS, PasdTangoTestHarness
 
@@ -1641,3 +1642,180 @@ def test_smartbox_fault_recorded(
         for i, count in enumerate(failed_polls)
         if i != faulted_smartbox_index
     )
+
+
+def test_read_plan(pasd_bus_device: tango.DeviceProxy) -> None:
+    """
+    Test that the read plan covers each device's poll cycle.
+
+    :param pasd_bus_device: Fixture that provides a pasdBus.
+    """
+    read_plan = json.loads(pasd_bus_device.readPlan)
+    assert set(read_plan) == {
+        PasdData.FNCC_PREFIX,
+        PasdData.FNDH_PREFIX,
+        PasdData.SMARTBOX_PREFIX,
+    }
+    for prefix in [PasdData.FNDH_PREFIX, PasdData.SMARTBOX_PREFIX]:
+        groups = [group for block in read_plan[prefix] for group in block["groups"]]
+        assert groups == ["STATUS", "PORTS", "WARNING_FLAGS", "ALARM_FLAGS"]
+        # Adjacent groups are merged into fewer reads
+        assert len(read_plan[prefix]) < len(groups)
+        for block in read_plan[prefix]:
+            assert block["name"] == "+".join(block["groups"])
+            assert block["register_count"] <= 125
+
+
+def test_poll_sla_statistics(pasd_bus_device: tango.DeviceProxy) -> None:
+    """
+    Test that there are no SLA statistics when polling in cycles.
+
+    :param pasd_bus_device: Fixture that provides a pasdBus.
+    """
+    assert json.loads(pasd_bus_device.pollSlaStatistics) == {}
+
+
+def test_rtt_estimates(
+    pasd_bus_device: tango.DeviceProxy,
+    change_event_callbacks: MockTangoEventCallbackGroup,
+) -> None:
+    """
+    Test that round-trip times are estimated for each kind of request.
+
+    :param pasd_bus_device: Fixture that provides a pasdBus.
+    :param change_event_callbacks: A dictionary of mock change event callbacks
+        with support for asynchrony.
+    """
+    pasd_bus_device.subscribe_event(
+        "state",
+        tango.EventType.CHANGE_EVENT,
+        change_event_callbacks["state"],
+    )
+    change_event_callbacks["state"].assert_change_event(tango.DevState.DISABLE)
+    pasd_bus_device.adminMode = AdminMode.ONLINE  # type: ignore[assignment]
+    change_event_callbacks["state"].assert_change_event(tango.DevState.UNKNOWN)
+    change_event_callbacks["state"].assert_change_event(tango.DevState.ON)
+
+    rtt_estimates = json.loads(pasd_bus_device.rttEstimates)
+    fndh_estimates = rtt_estimates[str(PasdData.FNDH_DEVICE_ID)]
+    assert any(estimate["samples"] >= 1 for estimate in fndh_estimates.values())
+
+
+def test_poll_latency(
+    pasd_bus_device: tango.DeviceProxy,
+    change_event_callbacks: MockTangoEventCallbackGroup,
+) -> None:
+    """
+    Test that the latency of transactions on the bus is monitored.
+
+    :param pasd_bus_device: Fixture that provides a pasdBus.
+    :param change_event_callbacks: A dictionary of mock change event callbacks
+        with support for asynchrony.
+    """
+    pasd_bus_device.subscribe_event(
+        "state",
+        tango.EventType.CHANGE_EVENT,
+        change_event_callbacks["state"],
+    )
+    change_event_callbacks["state"].assert_change_event(tango.DevState.DISABLE)
+    pasd_bus_device.adminMode = AdminMode.ONLINE  # type: ignore[assignment]
+    change_event_callbacks["state"].assert_change_event(tango.DevState.UNKNOWN)
+    change_event_callbacks["state"].assert_change_event(tango.DevState.ON)
+
+    edges = list(pasd_bus_device.pollLatencyBucketEdges)
+    histogram = list(pasd_bus_device.pollLatencyHistogram)
+    assert len(histogram) == len(edges) + 1
+    assert sum(histogram) >= 1
+
+    p50, p95, p99 = pasd_bus_device.pollLatencyPercentiles
+    assert 0 < p50 <= p95 <= p99
+    assert len(pasd_bus_device.smartboxPollLatencyP95) == (
+        PasdData.MAX_NUMBER_OF_SMARTBOXES_PER_STATION
+    )
+    assert 0.0 <= pasd_bus_device.busUtilisation <= 100.0
+
+    latency_histograms = json.loads(pasd_bus_device.pollLatencyHistograms)
+    assert latency_histograms["bucket_edges"] == edges
+    assert latency_histograms["device"][str(PasdData.FNDH_DEVICE_ID)]["count"] >= 1
+
+
+def test_dump_flight_recorder(
+    pasd_bus_device: tango.DeviceProxy,
+    change_event_callbacks: MockTangoEventCallbackGroup,
+) -> None:
+    """
+    Test that the most recent transactions can be dumped.
+
+    :param pasd_bus_device: Fixture that provides a pasdBus.
+    :param change_event_callbacks: A dictionary of mock change event callbacks
+        with support for asynchrony.
+    """
+    pasd_bus_device.subscribe_event(
+        "state",
+        tango.EventType.CHANGE_EVENT,
+        change_event_callbacks["state"],
+    )
+    change_event_callbacks["state"].assert_change_event(tango.DevState.DISABLE)
+    pasd_bus_device.adminMode = AdminMode.ONLINE  # type: ignore[assignment]
+    change_event_callbacks["state"].assert_change_event(tango.DevState.UNKNOWN)
+    change_event_callbacks["state"].assert_change_event(tango.DevState.ON)
+
+    dump = json.loads(pasd_bus_device.DumpFlightRecorder())
+    assert dump["total"] >= 1
+    entry = dict(zip(dump["fields"], dump["entries"][-1]))
+    assert dump["outcomes"][entry["outcome"]] == "OK"
+    assert entry["duration"] >= 0
+
+
+def test_state_update_queue(
+    pasd_bus_device: tango.DeviceProxy,
+    change_event_callbacks: MockTangoEventCallbackGroup,
+) -> None:
+    """
+    Test that the backlog of state updates to be published is reported.
+
+    :param pasd_bus_device: Fixture that provides a pasdBus.
+    :param change_event_callbacks: A dictionary of mock change event callbacks
+        with support for asynchrony.
+    """
+    pasd_bus_device.subscribe_event(
+        "state",
+        tango.EventType.CHANGE_EVENT,
+        change_event_callbacks["state"],
+    )
+    change_event_callbacks["state"].assert_change_event(tango.DevState.DISABLE)
+    pasd_bus_device.adminMode = AdminMode.ONLINE  # type: ignore[assignment]
+    change_event_callbacks["state"].assert_change_event(tango.DevState.UNKNOWN)
+    change_event_callbacks["state"].assert_change_event(tango.DevState.ON)
+
+    assert pasd_bus_device.stateUpdateQueueDepth >= 0
+    assert pasd_bus_device.stateUpdatesSuperseded >= 0
+    assert pasd_bus_device.stateUpdatesDropped == 0
+
+
+def test_get_pasd_snapshot(pasd_bus_device: tango.DeviceProxy) -> None:
+    """
+    Test that the state of many PaSD attributes can be got in one call.
+
+    :param pasd_bus_device: Fixture that provides a pasdBus.
+    """
+    snapshot = decode_state_snapshot(pasd_bus_device.GetPasdSnapshot("{}"))
+    assert f"{PasdData.FNDH_PREFIX}Uptime" in snapshot
+    assert f"{PasdData.FNCC_PREFIX}Status" in snapshot
+
+    snapshot = decode_state_snapshot(
+        pasd_bus_device.GetPasdSnapshot(
+            json.dumps({"device_ids": [PasdData.FNDH_DEVICE_ID]})
+        )
+    )
+    assert snapshot
+    assert all(name.startswith(PasdData.FNDH_PREFIX) for name in snapshot)
+    # Nothing has been polled yet
+    for _, quality, _ in snapshot.values():
+        assert quality == int(tango.AttrQuality.ATTR_INVALID)
+
+    snapshot = decode_state_snapshot(
+        pasd_bus_device.GetPasdSnapshot(json.dumps({"prefix": "smartbox1Ports"}))
+    )
+    assert snapshot
+    assert all(name.startswith("smartbox1Ports") for name in snapshot)
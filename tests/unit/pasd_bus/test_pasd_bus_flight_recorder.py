@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the PaSD bus flight recorder."""
+
+from __future__ import annotations
+
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_flight_recorder import (
+    FLIGHT_RECORDER_FIELDS,
+    FlightRecorder,
+    TransactionOutcome,
+)
+
+
+def test_flight_recorder() -> None:
+    """Test that the flight recorder keeps only the most recent transactions."""
+    flight_recorder = FlightRecorder(3)
+    assert flight_recorder.dump()["entries"] == []
+
+    for index in range(5):
+        flight_recorder.record(
+            1000.0 + index, 101, "STATUS", 0.01, TransactionOutcome.OK
+        )
+    flight_recorder.record(
+        1005.0, 1, "PORTS", 0.5, TransactionOutcome.FAILED, "ModbusIOException"
+    )
+
+    dump = flight_recorder.dump()
+    assert dump["fields"] == list(FLIGHT_RECORDER_FIELDS)
+    assert dump["total"] == 6
+    # Oldest first
+    assert [entry[0] for entry in dump["entries"]] == [1003.0, 1004.0, 1005.0]
+    assert dump["entries"][-1] == [
+        1005.0,
+        1,
+        "PORTS",
+        0.5,
+        TransactionOutcome.FAILED,
+        "ModbusIOException",
+    ]
+    assert dump["outcomes"][dump["entries"][-1][4]] == "FAILED"
+
+
+def test_flight_recorder_disabled() -> None:
+    """Test that a flight recorder with no capacity records nothing."""
+    flight_recorder = FlightRecorder(0)
+    flight_recorder.record(1000.0, 101, "STATUS", 0.01, TransactionOutcome.OK)
+    assert flight_recorder.dump()["entries"] == []
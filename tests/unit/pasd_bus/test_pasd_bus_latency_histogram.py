@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the PaSD bus latency histograms."""
+
+from __future__ import annotations
+
+import math
+import time
+import unittest.mock
+
+import pytest
+
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_latency_histogram import (
+    LATENCY_BUCKET_EDGES,
+    LatencyHistogram,
+    LatencyMonitor,
+)
+
+
+def test_latency_histogram() -> None:
+    """Test that latencies are counted into fixed buckets."""
+    histogram = LatencyHistogram()
+    assert histogram.count == 0
+    assert math.isnan(histogram.percentile(50.0))
+
+    # An edge is the upper bound of its bucket
+    histogram.record(0.001)
+    histogram.record(0.0015)
+    histogram.record(100.0)
+    counts = histogram.counts
+    assert len(counts) == len(LATENCY_BUCKET_EDGES) + 1
+    assert counts[0] == 1
+    assert counts[1] == 1
+    assert counts[-1] == 1
+    assert histogram.count == 3
+
+
+def test_latency_percentiles() -> None:
+    """Test that percentiles are estimated from the bucket counts."""
+    histogram = LatencyHistogram()
+    for _ in range(90):
+        histogram.record(0.015)
+    for _ in range(9):
+        histogram.record(0.15)
+    histogram.record(30.0)
+
+    assert histogram.percentile(50.0) == 0.02
+    assert histogram.percentile(95.0) == 0.2
+    # The final bucket is unbounded, so the largest latency is used
+    assert histogram.percentile(100.0) == 30.0
+    assert histogram.percentiles() == [0.02, 0.2, 0.2]
+
+    description = histogram.to_dict()
+    assert description["count"] == 100
+    assert description["max"] == 30.0
+    assert description["p99"] == 0.2
+    assert description["mean"] == pytest.approx((90 * 0.015 + 9 * 0.15 + 30) / 100)
+
+
+def test_latency_monitor() -> None:
+    """Test that latencies are recorded by device and by kind of request."""
+    latency_monitor = LatencyMonitor()
+    latency_monitor.record(101, "STATUS", 0.01)
+    latency_monitor.record(101, "PORTS", 0.03)
+    latency_monitor.record(1, "STATUS", 0.03)
+
+    assert latency_monitor.bus_histogram.count == 3
+    assert latency_monitor.get_device_histogram(101).count == 2
+    assert latency_monitor.get_device_histogram(2).count == 0
+
+    description = latency_monitor.to_dict()
+    assert description["bucket_edges"] == list(LATENCY_BUCKET_EDGES)
+    assert description["device"]["1"]["count"] == 1
+    assert description["kind"]["STATUS"]["count"] == 2
+    # A percentile is never estimated above the largest latency recorded
+    assert description["kind"]["PORTS"]["p50"] == 0.03
+
+
+def test_bus_utilisation() -> None:
+    """Test that bus utilisation is measured over a fixed window."""
+    with unittest.mock.patch.object(time, "monotonic", return_value=100.0):
+        latency_monitor = LatencyMonitor(utilisation_window=10.0)
+    with unittest.mock.patch.object(time, "monotonic", return_value=105.0):
+        latency_monitor.record(101, "STATUS", 1.0)
+        assert latency_monitor.utilisation == pytest.approx(20.0)
+    with unittest.mock.patch.object(time, "monotonic", return_value=110.0):
+        latency_monitor.record(101, "STATUS", 1.5)
+    with unittest.mock.patch.object(time, "monotonic", return_value=112.0):
+        # Once a window is complete, its utilisation is reported
+        latency_monitor.record(101, "STATUS", 2.0)
+        assert latency_monitor.utilisation == pytest.approx(25.0)
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the PaSD bus poll management."""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import time
+
+import pytest
+
+from ska_low_mccs_pasd import PasdData
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_poll_management import (
+    FNDH_READ_CYCLE,
+    DelayedRequest,
+    PasdBusRequestProvider,
+)
+
+
+@pytest.fixture(name="request_provider")
+def request_provider_fixture(logger: logging.Logger) -> PasdBusRequestProvider:
+    """
+    Return a request provider for testing.
+
+    :param logger: a logger for the request provider to use.
+
+    :return: a request provider.
+    """
+    return PasdBusRequestProvider(
+        1,
+        logger,
+        attribute_read_delay=1.0,
+        port_status_read_delay=2.0,
+        port_power_delay=3.0,
+        smartbox_ids=list(range(1, PasdData.MAX_NUMBER_OF_SMARTBOXES_PER_STATION + 1)),
+    )
+
+
+def test_delayed_request_ordering() -> None:
+    """Test that delayed requests are ordered by time, then by creation."""
+    now = time.time()
+    late = DelayedRequest(1, ("PORTS", None), now + 10)
+    first = DelayedRequest(2, ("READ", "status"), now)
+    second = DelayedRequest(3, ("READ", "status"), now)
+    early = DelayedRequest(4, ("PORTS", None), now - 10)
+
+    queue: list[DelayedRequest] = []
+    for delayed_request in [late, first, second, early]:
+        heapq.heappush(queue, delayed_request)
+
+    assert [heapq.heappop(queue).device_id for _ in range(4)] == [4, 2, 3, 1]
+
+    # The sequence number is only a tie-breaker; it doesn't affect equality
+    assert DelayedRequest(2, ("READ", "status"), now) == first
+
+
+def test_delayed_requests_actioned_in_time_order(
+    request_provider: PasdBusRequestProvider,
+) -> None:
+    """
+    Test that delayed requests are actioned in order of their 'not before' time.
+
+    :param request_provider: the request provider under test.
+    """
+    now = time.time()
+    for device_id, not_before in [(1, now + 60), (2, now - 1), (3, now - 2), (4, now)]:
+        heapq.heappush(
+            request_provider._delayed_requests,
+            DelayedRequest(device_id, ("PORTS", None), not_before),
+        )
+
+    assert request_provider.get_request(1) == (3, "PORTS", None)
+    assert request_provider.get_request(1) == (2, "PORTS", None)
+    assert request_provider.get_request(1) == (4, "PORTS", None)
+
+    # The last request is not yet due, so the regular poll carries on.
+    assert request_provider.get_request(1) == (PasdData.FNDH_DEVICE_ID, "INFO", None)
+    assert len(request_provider._delayed_requests) == 1
+
+    request_provider.abort()
+    assert request_provider._delayed_requests == []
+
+
+def test_fndh_port_power_sequence_is_staggered(
+    request_provider: PasdBusRequestProvider,
+) -> None:
+    """
+    Test that staggered FNDH port power writes are queued in order.
+
+    :param request_provider: the request provider under test.
+    """
+    request_provider.desire_port_powers(
+        PasdData.FNDH_DEVICE_ID, [True] * PasdData.NUMBER_OF_FNDH_PORTS, False
+    )
+    device_id, command, port_powers = request_provider.get_request(1)
+
+    # The first port is written straight away...
+    assert device_id == PasdData.FNDH_DEVICE_ID
+    assert command == "SET_PORT_POWERS"
+    assert port_powers[0] == (True, False)
+    assert port_powers[1:] == [None] * (PasdData.NUMBER_OF_FNDH_PORTS - 1)
+
+    # ... and the rest of the write-read sequence is queued in time order.
+    queue = list(request_provider._delayed_requests)
+    assert len(queue) == 2 * PasdData.NUMBER_OF_FNDH_PORTS - 1
+    ordered = [heapq.heappop(queue) for _ in range(len(queue))]
+    assert [request.request_description[0] for request in ordered[:3]] == [
+        "PORTS",
+        "SET_PORT_POWERS",
+        "PORTS",
+    ]
+    assert [request.not_before for request in ordered] == sorted(
+        request.not_before for request in ordered
+    )
+
+
+def test_periodic_reads(logger: logging.Logger) -> None:
+    """
+    Test that a device whose reads are all periodic gives up its turn.
+
+    :param logger: a logger for the request provider to use.
+    """
+    request_provider = PasdBusRequestProvider(
+        1,
+        logger,
+        attribute_read_delay=1.0,
+        port_status_read_delay=2.0,
+        port_power_delay=3.0,
+        smartbox_ids=[],
+        read_cycles={"FNCC": []},
+        periodic_reads={"FNCC": {"STATUS": 3600.0}},
+    )
+    requests = [request_provider.get_request(1) for _ in range(20)]
+    fncc_reads = [
+        request[1]
+        for request in requests
+        if request is not None and request[0] == PasdData.FNCC_DEVICE_ID
+    ]
+    fndh_reads = [
+        request[1]
+        for request in requests
+        if request is not None and request[0] == PasdData.FNDH_DEVICE_ID
+    ]
+
+    # The periodic read is due once the startup info has been read, and then
+    # not again for an hour...
+    assert fncc_reads == ["INFO", "STATUS"]
+    # ... leaving the rest of the bus time for the FNDH.
+    assert fndh_reads[:6] == ["INFO", "THRESHOLDS", *FNDH_READ_CYCLE]
+    assert len(fndh_reads) == 18
+
+
+def test_staleness_scheduling(logger: logging.Logger) -> None:
+    """
+    Test that the group with the largest age to maximum age ratio is read next.
+
+    :param logger: a logger for the request provider to use.
+    """
+    max_ages = {"STATUS": 1.0, "PORTS": 2.0, "WARNING_FLAGS": 60.0}
+    request_provider = PasdBusRequestProvider(
+        1,
+        logger,
+        attribute_read_delay=1.0,
+        port_status_read_delay=2.0,
+        port_power_delay=3.0,
+        smartbox_ids=[],
+        read_cycles={"FNPC": [], "FNCC": []},
+        max_ages={"FNPC": max_ages},
+    )
+    # Startup info is read first, and then every group, as none has been read.
+    requests = [request_provider.get_request(1) for _ in range(6)]
+    fndh_reads = [
+        request[1]
+        for request in requests
+        if request is not None and request[0] == PasdData.FNDH_DEVICE_ID
+    ]
+    assert fndh_reads == ["INFO", "THRESHOLDS", "STATUS", "PORTS", "WARNING_FLAGS"]
+
+    now = time.monotonic()
+    last_reads = request_provider._last_reads[PasdData.FNDH_DEVICE_ID]
+    last_reads.update(
+        {"STATUS": now - 0.5, "PORTS": now - 3.0, "WARNING_FLAGS": now - 45.0}
+    )
+    assert request_provider.get_request(1) == (PasdData.FNDH_DEVICE_ID, "PORTS", None)
+    statistics = request_provider.get_sla_statistics()["FNPC"]["PORTS"]
+    assert statistics["reads"] == 1
+    assert statistics["misses"] == 1
+    assert statistics["worst_age"] >= 3.0
+
+    # WARNING_FLAGS is now the stalest relative to its maximum age
+    assert request_provider.get_request(1) == (
+        PasdData.FNDH_DEVICE_ID,
+        "WARNING_FLAGS",
+        None,
+    )
+    statistics = request_provider.get_sla_statistics()["FNPC"]["WARNING_FLAGS"]
+    assert statistics["reads"] == 1
+    assert statistics["misses"] == 0
+
+
+def test_failing_device_is_backed_off(logger: logging.Logger) -> None:
+    """
+    Test that a failing smartbox doesn't hold up polling of the other devices.
+
+    :param logger: a logger for the request provider to use.
+    """
+    request_provider = PasdBusRequestProvider(
+        1,
+        logger,
+        attribute_read_delay=1.0,
+        port_status_read_delay=2.0,
+        port_power_delay=3.0,
+        smartbox_ids=[1, 2],
+        failure_backoff=60.0,
+    )
+    request_provider.update_port_power_states([True, True])
+    request_provider.get_request(1)  # promotes the smartboxes into the poll list
+    assert request_provider.get_smartbox_poll_list() == [1, 2]
+
+    # Smartbox 1 fails, but the other devices carry on responding
+    assert not request_provider.record_poll_failure(1)
+    request_provider.record_poll_success(2)
+
+    polled_device_ids = {
+        request[0]
+        for request in (request_provider.get_request(1) for _ in range(20))
+        if request is not None
+    }
+    assert polled_device_ids == {
+        PasdData.FNDH_DEVICE_ID,
+        PasdData.FNCC_DEVICE_ID,
+        2,
+    }
+
+    # Once its backoff has expired, smartbox 1 is probed again.
+    request_provider._circuit_breakers[1]._retry_time = time.time() - 1
+    polled_device_ids = {
+        request[0]
+        for request in (request_provider.get_request(1) for _ in range(4))
+        if request is not None
+    }
+    assert 1 in polled_device_ids
+
+
+def test_bus_failure(request_provider: PasdBusRequestProvider) -> None:
+    """
+    Test that failures of several devices in a row are put down to the bus.
+
+    :param request_provider: the request provider under test.
+    """
+    assert not request_provider.record_poll_failure(PasdData.FNDH_DEVICE_ID)
+    assert not request_provider.record_poll_failure(PasdData.FNDH_DEVICE_ID)
+    request_provider.record_poll_success(PasdData.FNCC_DEVICE_ID)
+    assert not request_provider.record_poll_failure(1)
+    assert request_provider.record_poll_failure(PasdData.FNDH_DEVICE_ID)
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the PaSD bus poll schedule."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from ska_low_mccs_pasd import PasdData
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_poll_management import (
+    FNCC_READ_CYCLE,
+    FNDH_READ_CYCLE,
+    SMARTBOX_READ_CYCLE,
+    PasdBusRequestProvider,
+)
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_poll_schedule import (
+    DEFAULT_MAX_AGE,
+    PollSchedule,
+    compile_poll_schedule,
+    load_poll_schedules,
+)
+
+
+def test_default_poll_schedule() -> None:
+    """Test that by default every group is read in every cycle."""
+    schedules = load_poll_schedules("")
+    assert schedules == {
+        "FNCC": PollSchedule((FNCC_READ_CYCLE,)),
+        "FNPC": PollSchedule((FNDH_READ_CYCLE,)),
+        "FNSC": PollSchedule((SMARTBOX_READ_CYCLE,)),
+    }
+
+
+def test_compile_poll_schedule() -> None:
+    """Test that relative frequencies are compiled into a repeating schedule."""
+    schedule = compile_poll_schedule(
+        FNDH_READ_CYCLE,
+        {
+            "STATUS": {"every": 2},
+            "WARNING_FLAGS": {"every": 4},
+            "ALARM_FLAGS": {"period": 10},
+        },
+    )
+    assert schedule.cycles == (
+        ("STATUS", "PORTS", "WARNING_FLAGS"),
+        ("PORTS",),
+        ("STATUS", "PORTS"),
+        ("PORTS",),
+    )
+    assert schedule.periodic == {"ALARM_FLAGS": 10.0}
+
+
+def test_compile_poll_schedule_keeps_empty_cycles() -> None:
+    """Test that cycles in which nothing is due are kept."""
+    schedule = compile_poll_schedule(
+        SMARTBOX_READ_CYCLE,
+        {group: {"every": 3} for group in SMARTBOX_READ_CYCLE},
+    )
+    assert schedule.cycles == (SMARTBOX_READ_CYCLE, (), ())
+
+    schedule = compile_poll_schedule(FNCC_READ_CYCLE, {"STATUS": {"period": 60}})
+    assert schedule == PollSchedule((), {"STATUS": 60.0})
+
+
+@pytest.mark.parametrize(("every", "expected_reads"), [(1, 30), (2, 15), (3, 10)])
+def test_scaling_every_lowers_read_rate(
+    logger: logging.Logger, every: int, expected_reads: int
+) -> None:
+    """
+    Test that scaling up every group's ``every`` lowers the device's read rate.
+
+    :param logger: a logger for the request provider to use.
+    :param every: the number of cycles between reads of the FNCC status.
+    :param expected_reads: the number of FNCC status reads expected.
+    """
+    schedule = compile_poll_schedule(FNCC_READ_CYCLE, {"STATUS": {"every": every}})
+    request_provider = PasdBusRequestProvider(
+        1,
+        logger,
+        attribute_read_delay=1.0,
+        port_status_read_delay=2.0,
+        port_power_delay=3.0,
+        smartbox_ids=[],
+        # An empty cycle gives up the device's turn, as in the component manager.
+        read_cycles={
+            "FNCC": [group for cycle in schedule.cycles for group in cycle or ("",)],
+            "FNPC": [""],
+        },
+    )
+    # Read the startup info from both devices.
+    for _ in range(9):
+        request_provider.get_request(1)
+
+    requests = [request_provider.get_request(1) for _ in range(30)]
+    assert requests.count((PasdData.FNCC_DEVICE_ID, "STATUS", None)) == expected_reads
+    # In the other turns, nothing is read from the bus.
+    assert requests.count(None) == 30 - expected_reads
+
+
+def test_load_poll_schedules() -> None:
+    """Test that a YAML or JSON specification is compiled per controller type."""
+    yaml_schedules = load_poll_schedules(
+        "FNPC: {WARNING_FLAGS: {every: 4}}\nFNCC: {STATUS: {period: 60}}"
+    )
+    json_schedules = load_poll_schedules(
+        '{"FNPC": {"WARNING_FLAGS": {"every": 4}}, '
+        '"FNCC": {"STATUS": {"period": 60}}}'
+    )
+    assert yaml_schedules == json_schedules
+    assert len(yaml_schedules["FNPC"].cycles) == 4
+    assert yaml_schedules["FNCC"].periodic == {"STATUS": 60.0}
+    assert yaml_schedules["FNSC"] == PollSchedule((SMARTBOX_READ_CYCLE,))
+
+
+@pytest.mark.parametrize(
+    "specification",
+    [
+        "FNPC: [STATUS]",
+        "FNPC: {INFO: {every: 2}}",
+        "FNCC: {PORTS: {every: 2}}",
+        "FNSC: {PORTS: {every: 0}}",
+        "FNSC: {PORTS: {every: 2, period: 1.0}}",
+        "FNSC: {PORTS: {}}",
+        "FNSC: {PORTS: {max_age: 2}}",
+        "{mode: staleness, FNSC: {PORTS: {every: 2}}}",
+        "{mode: fastest}",
+        "SMARTBOX: {PORTS: {every: 2}}",
+        "FNPC: {STATUS: {every: 17}, PORTS: {every: 19}, ALARM_FLAGS: {every: 23}}",
+        "just a string",
+        "{unbalanced",
+    ],
+)
+def test_invalid_poll_schedules(specification: str) -> None:
+    """
+    Test that invalid poll schedule specifications are rejected.
+
+    :param specification: an invalid poll schedule specification.
+    """
+    with pytest.raises(ValueError):
+        load_poll_schedules(specification)
+
+
+def test_staleness_poll_schedule() -> None:
+    """Test that in staleness mode every group has a maximum age."""
+    schedules = load_poll_schedules(
+        "mode: staleness\n"
+        "FNPC: {PORTS: {max_age: 2}, ALARM_FLAGS: {max_age: 5}}\n"
+        "FNCC: {STATUS: {period: 60}}"
+    )
+    assert schedules["FNPC"] == PollSchedule(
+        (),
+        {},
+        {
+            "STATUS": DEFAULT_MAX_AGE,
+            "PORTS": 2.0,
+            "WARNING_FLAGS": DEFAULT_MAX_AGE,
+            "ALARM_FLAGS": 5.0,
+        },
+    )
+    assert schedules["FNCC"] == PollSchedule((), {"STATUS": 60.0}, {})
+    assert not schedules["FNSC"].cycles
+    assert set(schedules["FNSC"].max_ages) == set(SMARTBOX_READ_CYCLE)
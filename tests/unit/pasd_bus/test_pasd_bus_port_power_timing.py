@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the PaSD bus port power timing."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_port_power_timing import PortPowerTimingTracker
+
+
+def test_fndh_port_power_timing() -> None:
+    """Test that a staggered FNDH port power request is timed until sensed."""
+    tracker = PortPowerTimingTracker()
+    tracker.start("SetFndhPortPowers", 101, [True, True, None], "abc")
+    start = tracker.reports()[0]["start"]
+
+    # Writes to other devices, and of other ports, aren't marked.
+    tracker.record_transaction(1, "SET_PORT_POWERS", [(True, True)], start + 0.1)
+    tracker.record_transaction(101, "STATUS", None, start + 0.2)
+    tracker.record_transaction(
+        101, "SET_PORT_POWERS", [None, None, (True, True)], start + 0.3
+    )
+    tracker.record_transaction(
+        101, "SET_PORT_POWERS", [(True, True), None, None], start + 0.5
+    )
+    tracker.record_transaction(
+        101, "SET_PORT_POWERS", [None, (True, True), None], start + 1.5
+    )
+    # The request isn't finished until all of its ports are sensed.
+    tracker.record_ports_sensed(101, [True, False, False])
+    assert tracker.reports()[0]["result"] is None
+    tracker.record_ports_sensed(101, [True, True, False])
+
+    (report,) = tracker.reports("abc")
+    assert report["command"] == "SetFndhPortPowers"
+    assert report["result"] == "OK"
+    assert [event["name"] for event in report["events"]] == [
+        "requested",
+        "first_response",
+        "SET_PORT_POWERS",
+        "SET_PORT_POWERS",
+    ]
+    assert report["events"][2]["ports"] == [1]
+    phases = {phase["name"]: phase for phase in report["phases"]}
+    assert phases["wait_for_write"]["duration"] == pytest.approx(0.5)
+    assert phases["port_stagger"]["duration"] == pytest.approx(1.0)
+    assert phases["wait_for_sense"]["start"] == pytest.approx(1.5)
+
+
+def test_smartbox_port_power_timing() -> None:
+    """Test that the initialisation of a smartbox is marked in its request."""
+    tracker = PortPowerTimingTracker()
+    tracker.start("SetSmartboxPortPowers", 3, [True] * 2, "abc")
+    now = time.time()
+    tracker.record_transaction(3, "INITIALIZE", [], now)
+    tracker.record_transaction(3, "WRITE", "fem_current_trip_thresholds", now)
+    tracker.record_transaction(3, "SET_PORT_POWERS", [(True, True)] * 2, now)
+
+    tracker.abort()
+    (report,) = tracker.reports()
+    assert report["result"] == "ABORTED"
+    assert [event["name"] for event in report["events"]][2:] == [
+        "INITIALIZE",
+        "WRITE",
+        "SET_PORT_POWERS",
+    ]
+    assert report["events"][3]["attribute"] == "fem_current_trip_thresholds"
+    # The ports were never sensed, so there is no sense phase.
+    assert "wait_for_sense" not in [phase["name"] for phase in report["phases"]]
+
+
+def test_stale_requests_time_out() -> None:
+    """Test that requests that are never fulfilled are given up on."""
+    tracker = PortPowerTimingTracker(max_age=0.0)
+    tracker.start("SetSmartboxPortPowers", 3, [True])
+    time.sleep(0.01)
+    tracker.start("SetSmartboxPortPowers", 3, [None])
+    assert [report["result"] for report in tracker.reports()] == ["TIMED_OUT", "OK"]
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the PaSD bus power sequencing planner."""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from ska_low_mccs_pasd import PasdData
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_poll_management import PasdBusRequestProvider
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_power_sequencer import PowerSequencingPlanner
+
+
+def test_batch_size_ramps_up_and_backs_off(logger: logging.Logger) -> None:
+    """
+    Test that the batch size doubles while there is headroom, and halves on overload.
+
+    :param logger: a logger for the planner to use.
+    """
+    planner = PowerSequencingPlanner(10.0, 1.0, 1.0, 5.0, logger)
+
+    # Without a PSU reading, ports are powered on one at a time...
+    assert planner.get_batch_size(28, 0.0) == 1
+    planner.record_batch(1, 0.0)
+    # ... and the next batch waits for the first one to settle.
+    assert planner.get_batch_size(27, 0.5) == 0
+
+    planner.update_readings(1.0, 48.0, 1.0)
+    assert planner.batch_size == 2
+    assert planner.get_batch_size(27, 1.0) == 2
+    planner.record_batch(2, 1.0)
+
+    # A reading taken before the batch has settled is not used to plan.
+    planner.update_readings(1.5, 48.0, 1.5)
+    assert planner.batch_size == 2
+
+    planner.update_readings(3.0, 48.0, 2.0)
+    assert planner.batch_size == 4
+    assert planner.port_current == 1.0
+    assert planner.get_batch_size(25, 2.0) == 4
+    planner.record_batch(4, 2.0)
+
+    # Exceeding the limit halves the batch size, and holds off until the
+    # current falls again...
+    planner.update_readings(11.0, 48.0, 3.0)
+    assert planner.batch_size == 2
+    assert planner.get_batch_size(21, 3.0) == 0
+
+    # ... and then the batch is limited by the headroom left.
+    planner.update_readings(9.0, 48.0, 4.0)
+    assert planner.headroom == 1.0
+    assert planner.get_batch_size(21, 4.0) == 1
+
+
+def test_port_current_is_learnt(logger: logging.Logger) -> None:
+    """
+    Test that the current drawn by each port is learnt from the PSU readings.
+
+    :param logger: a logger for the planner to use.
+    """
+    planner = PowerSequencingPlanner(20.0, 0.5, 1.0, 5.0, logger)
+    planner.update_readings(2.0, None, 0.0)
+    assert planner.get_batch_size(28, 0.0) == 1
+    planner.record_batch(1, 0.0)
+    planner.update_readings(3.5, None, 1.0)
+
+    # The estimate moves halfway towards the observed 1.5 A per port.
+    assert planner.port_current == 1.0
+    # 16.5 A of headroom leaves room for 16 ports, but the batch size is 2.
+    assert planner.get_batch_size(27, 1.0) == 2
+
+
+def test_voltage_sag_stops_power_on(logger: logging.Logger) -> None:
+    """
+    Test that no more ports are powered on while the PSU voltage is too low.
+
+    :param logger: a logger for the planner to use.
+    """
+    planner = PowerSequencingPlanner(10.0, 1.0, 1.0, 5.0, logger, min_voltage=45.0)
+    planner.update_readings(1.0, 44.0, 0.0)
+    assert planner.get_batch_size(28, 0.0) == 0
+
+    planner.update_readings(1.0, 47.0, 1.0)
+    assert planner.get_batch_size(28, 1.0) == 1
+
+
+def test_limit_below_idle_draw_holds_power_on(logger: logging.Logger) -> None:
+    """
+    Test that power-on is held, for a bounded time, if there is no headroom.
+
+    :param logger: a logger for the planner to use.
+    """
+    planner = PowerSequencingPlanner(1.0, 1.0, 1.0, 5.0, logger, max_hold_time=10.0)
+    planner.update_readings(2.0, 48.0, 0.0)
+    assert planner.get_batch_size(28, 0.0) == 0
+    assert not planner.is_hold_expired(9.0)
+    assert planner.get_batch_size(28, 9.0) == 0
+    assert planner.is_hold_expired(10.0)
+
+    planner.end_hold()
+    assert not planner.is_hold_expired(10.0)
+    planner.update_readings(0.5, 48.0, 11.0)
+    assert planner.get_batch_size(28, 11.0) == 0
+    assert planner.get_batch_size(28, 20.0) == 0
+    assert not planner.is_hold_expired(20.0)
+    assert planner.is_hold_expired(21.0)
+
+
+def test_fallback_without_readings(logger: logging.Logger) -> None:
+    """
+    Test that ports are staggered by the fallback time if no reading arrives.
+
+    :param logger: a logger for the planner to use.
+    """
+    planner = PowerSequencingPlanner(10.0, 1.0, 1.0, 5.0, logger)
+    planner.record_batch(1, 0.0)
+    assert planner.get_batch_size(27, 4.0) == 0
+    assert planner.get_batch_size(27, 5.0) == 1
+
+
+def test_fndh_ports_powered_on_in_planned_batches(logger: logging.Logger) -> None:
+    """
+    Test that the FNDH request provider writes the batches that are planned.
+
+    :param logger: a logger for the request provider to use.
+    """
+    request_provider = PasdBusRequestProvider(
+        1,
+        logger,
+        attribute_read_delay=1.0,
+        port_status_read_delay=0.0,
+        port_power_delay=3.0,
+        smartbox_ids=[],
+        port_power_current_limit=10.0,
+        port_power_current=1.0,
+    )
+    fndh_request_provider = request_provider._device_request_providers[
+        PasdData.FNDH_DEVICE_ID
+    ]
+    request_provider.desire_port_powers(
+        PasdData.FNDH_DEVICE_ID, [True] * PasdData.NUMBER_OF_FNDH_PORTS, False
+    )
+
+    sequence = fndh_request_provider.get_write_read_sequence(PasdData.FNDH_DEVICE_ID)
+    assert sequence is not None
+    assert [request.request_description[0] for request in sequence] == [
+        "SET_PORT_POWERS",
+        "PORTS",
+        "STATUS",
+    ]
+    port_powers = sequence[0].request_description[1]
+    assert port_powers[0] == (True, False)
+    assert port_powers[1:] == [None] * (PasdData.NUMBER_OF_FNDH_PORTS - 1)
+
+    # The other ports stay pending, and are not written by the regular writes.
+    assert fndh_request_provider.get_write()[0] != "SET_PORT_POWERS"
+    # While they wait, the PSU is read at most once every port power delay.
+    sequence = fndh_request_provider.get_write_read_sequence(PasdData.FNDH_DEVICE_ID)
+    assert sequence is not None
+    assert [request.request_description for request in sequence] == [("STATUS", None)]
+    assert fndh_request_provider.get_write_read_sequence(1) is None
+
+    # Once the first port has settled, the next two are powered on together.
+    request_provider.update_psu_readings(1.0, 48.0)
+    sequence = fndh_request_provider.get_write_read_sequence(PasdData.FNDH_DEVICE_ID)
+    assert sequence is not None
+    port_powers = sequence[0].request_description[1]
+    assert port_powers[1:3] == [(True, False)] * 2
+    assert port_powers[3:] == [None] * (PasdData.NUMBER_OF_FNDH_PORTS - 3)
+
+    # Aborting drops the ports still pending.
+    request_provider.abort()
+    request_provider.update_psu_readings(3.0, 48.0)
+    assert fndh_request_provider.get_write_read_sequence(1) is None
+
+
+def test_fndh_ports_dropped_after_max_hold_time(logger: logging.Logger) -> None:
+    """
+    Test that pending FNDH ports are dropped once power-on has been held too long.
+
+    :param logger: a logger for the request provider to use.
+    """
+    request_provider = PasdBusRequestProvider(
+        1,
+        logger,
+        attribute_read_delay=1.0,
+        port_status_read_delay=0.0,
+        port_power_delay=3.0,
+        smartbox_ids=[],
+        port_power_current_limit=1.0,
+        port_power_current=1.0,
+        port_power_max_hold_time=0.01,
+    )
+    fndh_request_provider = request_provider._device_request_providers[
+        PasdData.FNDH_DEVICE_ID
+    ]
+    # The limit is set below the idle draw of the FNDH.
+    request_provider.update_psu_readings(2.0, 48.0)
+    request_provider.desire_port_powers(
+        PasdData.FNDH_DEVICE_ID, [True] * PasdData.NUMBER_OF_FNDH_PORTS, False
+    )
+
+    sequence = fndh_request_provider.get_write_read_sequence(PasdData.FNDH_DEVICE_ID)
+    assert sequence is not None
+    assert [request.request_description for request in sequence] == [("STATUS", None)]
+
+    time.sleep(0.02)
+    assert fndh_request_provider.get_write_read_sequence(1) is None
+    assert fndh_request_provider.get_write()[0] != "SET_PORT_POWERS"
+    request_provider.update_psu_readings(0.5, 48.0)
+    assert fndh_request_provider.get_write_read_sequence(1) is None
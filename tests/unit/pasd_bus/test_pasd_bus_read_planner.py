@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the PaSD bus read planner."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from ska_low_mccs_pasd import PasdData
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_poll_management import SMARTBOX_READ_CYCLE
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_read_planner import (
+    MAX_REGISTERS_PER_READ,
+    PasdBusReadPlanner,
+)
+from ska_low_mccs_pasd.pasd_controllers_configuration import RegisterDict
+
+REGISTERS: dict[str, RegisterDict] = {
+    "uptime": {"address": 13, "size": 2},
+    "status": {"address": 16, "size": 1},
+    "ports_power_sensed": {"address": 35, "size": 12},
+    "ports_current_draw": {"address": 47, "size": 12},
+    "warning_flags": {"address": 10129, "size": 2},
+    "alarm_flags": {"address": 10131, "size": 2},
+}
+
+GROUPS: dict[str, list[str]] = {
+    "STATUS": ["status", "uptime"],
+    "PORTS": ["ports_power_sensed", "ports_current_draw"],
+    "WARNING_FLAGS": ["warning_flags"],
+    "ALARM_FLAGS": ["alarm_flags"],
+}
+
+CYCLE = ("STATUS", "PORTS", "WARNING_FLAGS", "ALARM_FLAGS")
+
+
+@pytest.mark.parametrize(
+    ("max_gap", "expected_blocks"),
+    [
+        (-1, ["STATUS", "PORTS", "WARNING_FLAGS", "ALARM_FLAGS"]),
+        (0, ["STATUS", "PORTS", "WARNING_FLAGS+ALARM_FLAGS"]),
+        (18, ["STATUS+PORTS", "WARNING_FLAGS+ALARM_FLAGS"]),
+        (20000, ["STATUS+PORTS", "WARNING_FLAGS+ALARM_FLAGS"]),
+    ],
+)
+def test_plan_cycle(
+    logger: logging.Logger, max_gap: int, expected_blocks: list[str]
+) -> None:
+    """
+    Test that groups are merged according to the gap between them.
+
+    The gap between STATUS and PORTS is 18 registers. WARNING_FLAGS and
+    ALARM_FLAGS are adjacent, but far from the other groups, so merging
+    them with the other groups would exceed the Modbus limit.
+
+    :param logger: a logger for the planner to use.
+    :param max_gap: the maximum gap between merged groups.
+    :param expected_blocks: the expected names of the planned block reads.
+    """
+    planner = PasdBusReadPlanner(REGISTERS, GROUPS, max_gap, logger)
+    plan = planner.plan_cycle(CYCLE)
+    assert [block.name for block in plan] == expected_blocks
+    for block in plan:
+        assert block.register_count <= MAX_REGISTERS_PER_READ
+        assert planner.get_block(block.name) == block
+
+
+def test_block_attributes(logger: logging.Logger) -> None:
+    """
+    Test the attributes and register span of a merged block.
+
+    :param logger: a logger for the planner to use.
+    """
+    planner = PasdBusReadPlanner(REGISTERS, GROUPS, 32, logger)
+    planner.plan_cycle(CYCLE)
+
+    block = planner.get_block("STATUS+PORTS")
+    assert block is not None
+    assert block.start_address == 13
+    assert block.register_count == 46
+    # Each group's attributes are kept, so the read can be split back up...
+    assert block.group_attributes == (
+        ("status", "uptime"),
+        ("ports_power_sensed", "ports_current_draw"),
+    )
+    # ... but the read itself is ordered by address.
+    assert planner.get_attributes("STATUS+PORTS") == [
+        "uptime",
+        "status",
+        "ports_power_sensed",
+        "ports_current_draw",
+    ]
+    assert block.to_dict() == {
+        "name": "STATUS+PORTS",
+        "groups": ["STATUS", "PORTS"],
+        "start_address": 13,
+        "register_count": 46,
+    }
+    # Individual groups can still be read on their own
+    assert planner.get_attributes("PORTS") == [
+        "ports_power_sensed",
+        "ports_current_draw",
+    ]
+    assert planner.get_block("STATUS+ALARM_FLAGS") is None
+
+
+def test_smartbox_plan_from_configuration(logger: logging.Logger) -> None:
+    """
+    Test that the smartbox poll cycle plan respects the Modbus read limit.
+
+    :param logger: a logger for the planner to use.
+    """
+    registers = PasdData.CONTROLLERS_CONFIG["FNSC"]["registers"]
+    groups = {
+        "STATUS": ["uptime", "input_voltage"],
+        "PORTS": ["ports_power_sensed"],
+        "WARNING_FLAGS": ["warning_flags"],
+        "ALARM_FLAGS": ["alarm_flags"],
+    }
+    planner = PasdBusReadPlanner(registers, groups, 32, logger)
+    plan = planner.plan_cycle(SMARTBOX_READ_CYCLE)
+
+    assert 1 <= len(plan) < len(SMARTBOX_READ_CYCLE)
+    assert [group for block in plan for group in block.groups] == list(
+        SMARTBOX_READ_CYCLE
+    )
+    for block in plan:
+        assert block.register_count <= MAX_REGISTERS_PER_READ
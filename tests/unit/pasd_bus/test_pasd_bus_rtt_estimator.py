@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the PaSD bus round-trip time estimator."""
+
+from __future__ import annotations
+
+import pytest
+
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_rtt_estimator import RttEstimator
+
+
+def test_rtt_estimator() -> None:
+    """Test that the estimate converges on the measured round-trip time."""
+    rtt_estimator = RttEstimator()
+    assert rtt_estimator.smoothed_rtt is None
+
+    rtt_estimator.record_rtt(0.1)
+    # The first measurement gives a deviation of half the round-trip time
+    assert rtt_estimator.smoothed_rtt == pytest.approx(0.1)
+    assert rtt_estimator.rtt_deviation == pytest.approx(0.05)
+
+    for _ in range(100):
+        rtt_estimator.record_rtt(0.1)
+    assert rtt_estimator.rtt_deviation == pytest.approx(0.0, abs=1e-3)
+
+    estimate = rtt_estimator.to_dict()
+    assert estimate["smoothed_rtt"] == pytest.approx(0.1)
+    assert estimate["samples"] == 101
+
+
+def test_rtt_estimator_tracks_changes() -> None:
+    """Test that the estimate follows a change in the round-trip time."""
+    rtt_estimator = RttEstimator()
+    for _ in range(100):
+        rtt_estimator.record_rtt(0.1)
+
+    rtt_estimator.record_rtt(0.9)
+    # A single slow transaction moves the estimate by an eighth of the change,
+    # and the deviation by a quarter of it.
+    assert rtt_estimator.smoothed_rtt == pytest.approx(0.2, abs=1e-3)
+    assert rtt_estimator.rtt_deviation == pytest.approx(0.2, abs=1e-3)
+
+    for _ in range(100):
+        rtt_estimator.record_rtt(0.9)
+    assert rtt_estimator.smoothed_rtt == pytest.approx(0.9, abs=1e-3)
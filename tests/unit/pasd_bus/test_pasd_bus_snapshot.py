@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the PaSD device snapshots."""
+
+from __future__ import annotations
+
+import enum
+import json
+
+import numpy as np
+import pytest
+
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_snapshot import (
+    SNAPSHOT_SCHEMA_VERSION,
+    PasdSnapshot,
+    decode_snapshot,
+    decode_state_snapshot,
+    encode_snapshot,
+    encode_state_snapshot,
+)
+
+
+class _Power(enum.IntEnum):
+    OFF = 1
+    ON = 2
+
+
+def test_snapshot_round_trip() -> None:
+    """Test that a decoded snapshot has the values of the encoded snapshot."""
+    snapshot = PasdSnapshot(
+        1760612345.5,
+        {
+            "InputVoltage": 48.1,
+            "PortsPowerSensed": [True, False, True],
+            "PasdStatus": "OK",
+        },
+        {"FemCurrents": [10, 20, 30]},
+    )
+    encoded = encode_snapshot(snapshot)
+    assert " " not in encoded
+    loaded = json.loads(encoded)
+    assert loaded["version"] == SNAPSHOT_SCHEMA_VERSION
+    # Numeric arrays are packed, in the smallest integer type that fits.
+    assert loaded["values"]["InputVoltage"] == 48.1
+    assert loaded["values"]["PortsPowerSensed"]["dtype"] == "|b1"
+    assert loaded["invalid"]["FemCurrents"]["dtype"] == "|u1"
+
+    decoded = decode_snapshot(encoded)
+    assert decoded.timestamp == snapshot.timestamp
+    for decoded_values, values in [
+        (decoded.values, snapshot.values),
+        (decoded.invalid, snapshot.invalid),
+    ]:
+        assert list(decoded_values) == list(values)
+        for name, value in values.items():
+            if isinstance(decoded_values[name], np.ndarray):
+                np.testing.assert_array_equal(decoded_values[name], value)
+            else:
+                assert decoded_values[name] == value
+
+
+def test_snapshot_enum_values() -> None:
+    """Test that enumerated values are encoded as their values."""
+    encoded = encode_snapshot(
+        PasdSnapshot(0.0, {"PortsDesiredPowerOnline": [_Power.ON, _Power.OFF]})
+    )
+    np.testing.assert_array_equal(
+        decode_snapshot(encoded).values["PortsDesiredPowerOnline"], [2, 1]
+    )
+
+
+@pytest.mark.parametrize(
+    "encoded",
+    [
+        "not json",
+        "[1, 2]",
+        '{"timestamp": 0.0, "values": {}}',
+        json.dumps({"version": SNAPSHOT_SCHEMA_VERSION + 1, "values": {}}),
+    ],
+)
+def test_invalid_snapshot(encoded: str) -> None:
+    """
+    Test that an invalid snapshot can't be decoded.
+
+    :param encoded: the invalid snapshot.
+    """
+    with pytest.raises(ValueError):
+        decode_snapshot(encoded)
+
+
+def test_state_snapshot_round_trip() -> None:
+    """Test that a decoded state snapshot has the state that was encoded."""
+    state = {
+        "fndhUptime": (1234, 0, 1760612345.5),
+        "fndhPsu48vVoltages": ([48.1, 47.9], 0, 1760612345.25),
+        "smartbox1PortsCurrentDraw": ([10, 20, 300], 1, 1760612345.0),
+        "smartbox1PortsPowerSensed": ([True, False, True], 0, 1760612345.0),
+        "smartbox1LedPattern": (None, 1, 0.0),
+        "smartbox1PasdStatus": ("OK", 0, 1760612344.0),
+        "smartbox1FemHeatsinkTemperatures": (np.array([3, -1]), 0, 1760612343.0),
+    }
+    encoded = encode_state_snapshot(state)
+    assert " " not in encoded
+    snapshot = json.loads(encoded)
+    assert snapshot["version"] == SNAPSHOT_SCHEMA_VERSION
+    assert snapshot["names"] == list(state)
+    # Numeric arrays are packed, in the smallest integer type that fits.
+    assert snapshot["values"][0] == 1234
+    assert snapshot["values"][1]["dtype"] == "<f8"
+    assert snapshot["values"][2]["dtype"] == "<u2"
+    assert snapshot["values"][3]["dtype"] == "|b1"
+    assert snapshot["values"][4] is None
+    assert snapshot["values"][5] == "OK"
+    assert snapshot["values"][6]["dtype"] == "|i1"
+    assert snapshot["qualities"]["dtype"] == "|i1"
+    assert snapshot["timestamps"]["dtype"] == "<f8"
+
+    decoded = decode_state_snapshot(encoded)
+    assert list(decoded) == list(state)
+    for name, (value, quality, timestamp) in state.items():
+        decoded_value, decoded_quality, decoded_timestamp = decoded[name]
+        if isinstance(decoded_value, np.ndarray):
+            np.testing.assert_array_equal(decoded_value, value)
+        else:
+            assert decoded_value == value
+        assert decoded_quality == quality
+        assert decoded_timestamp == timestamp
+
+
+def test_empty_state_snapshot_round_trip() -> None:
+    """Test that a state snapshot of no attributes can be decoded."""
+    assert decode_state_snapshot(encode_state_snapshot({})) == {}
+
+
+def test_state_snapshot_version() -> None:
+    """Test that a state snapshot with an unsupported version is rejected."""
+    encoded = json.dumps({"version": SNAPSHOT_SCHEMA_VERSION + 1})
+    with pytest.raises(ValueError, match="Unsupported"):
+        decode_state_snapshot(encoded)
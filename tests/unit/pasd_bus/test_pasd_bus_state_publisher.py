@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the PaSD bus state publisher."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Iterator
+
+import pytest
+
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_state_publisher import PasdStatePublisher
+
+
+class BlockingCallback:
+    """A callback that records its calls, and blocks until released."""
+
+    def __init__(self: BlockingCallback) -> None:
+        """Initialise a new instance."""
+        self.calls: list[tuple[int, dict[str, Any]]] = []
+        self.called = threading.Semaphore(0)
+        self.release = threading.Event()
+
+    def __call__(self: BlockingCallback, device_id: int, **kwargs: Any) -> None:
+        """
+        Record a call, then wait to be released.
+
+        :param device_id: the ID of the device.
+        :param kwargs: the update.
+        """
+        self.calls.append((device_id, kwargs))
+        self.called.release()
+        self.release.wait()
+
+    def wait_for_calls(self: BlockingCallback, count: int) -> None:
+        """
+        Wait for a number of calls.
+
+        :param count: the number of calls to wait for.
+        """
+        for _ in range(count):
+            assert self.called.acquire(timeout=5.0)
+
+
+@pytest.fixture(name="callback")
+def callback_fixture() -> BlockingCallback:
+    """
+    Return a callback that blocks until released.
+
+    :return: a callback that blocks until released.
+    """
+    return BlockingCallback()
+
+
+@pytest.fixture(name="state_publisher")
+def state_publisher_fixture(
+    callback: BlockingCallback, logger: logging.Logger
+) -> Iterator[PasdStatePublisher]:
+    """
+    Return a state publisher whose callback blocks until released.
+
+    :param callback: the callback to publish to.
+    :param logger: a logger.
+
+    :yields: a state publisher.
+    """
+    state_publisher = PasdStatePublisher(callback, logger, max_queued_updates=3)
+    yield state_publisher
+    callback.release.set()
+    state_publisher.stop()
+
+
+def test_values_superseded(
+    state_publisher: PasdStatePublisher, callback: BlockingCallback
+) -> None:
+    """
+    Test that only the latest values of a group of attributes are published.
+
+    :param state_publisher: the state publisher under test.
+    :param callback: the callback it publishes to.
+    """
+    state_publisher.publish(101, status="OK")
+    callback.wait_for_calls(1)
+
+    # The publisher is now blocked, so these pile up.
+    state_publisher.publish(101, ports=[1], status="OK")
+    state_publisher.publish(1, ports=[1], status="OK")
+    state_publisher.publish(101, ports=[2], status="WARNING")
+    assert state_publisher.queue_depth == 2
+    assert state_publisher.superseded_count == 1
+
+    callback.release.set()
+    callback.wait_for_calls(2)
+    assert callback.calls == [
+        (101, {"status": "OK"}),
+        (1, {"ports": [1], "status": "OK"}),
+        (101, {"ports": [2], "status": "WARNING"}),
+    ]
+
+
+def test_superseding_values_not_moved_ahead(
+    state_publisher: PasdStatePublisher, callback: BlockingCallback
+) -> None:
+    """
+    Test that newer values are not published ahead of older values of a device.
+
+    :param state_publisher: the state publisher under test.
+    :param callback: the callback it publishes to.
+    """
+    state_publisher.publish(101, uptime=1)
+    callback.wait_for_calls(1)
+
+    state_publisher.publish(101, status="OK")
+    state_publisher.publish(101, ports=[1])
+    state_publisher.publish(101, status="WARNING")
+    assert state_publisher.superseded_count == 1
+
+    callback.release.set()
+    callback.wait_for_calls(2)
+    assert [call[1] for call in callback.calls] == [
+        {"uptime": 1},
+        {"ports": [1]},
+        {"status": "WARNING"},
+    ]
+
+
+def test_errors_not_superseded(
+    state_publisher: PasdStatePublisher, callback: BlockingCallback
+) -> None:
+    """
+    Test that updates are never reordered around an error.
+
+    :param state_publisher: the state publisher under test.
+    :param callback: the callback it publishes to.
+    """
+    state_publisher.publish(101, status="OK")
+    callback.wait_for_calls(1)
+
+    state_publisher.publish(101, status="WARNING")
+    state_publisher.publish(101, error={"detail": "timeout"}, attributes=["status"])
+    state_publisher.publish(101, status="ALARM")
+    assert state_publisher.superseded_count == 0
+
+    callback.release.set()
+    callback.wait_for_calls(3)
+    assert [call[1] for call in callback.calls] == [
+        {"status": "OK"},
+        {"status": "WARNING"},
+        {"error": {"detail": "timeout"}, "attributes": ["status"]},
+        {"status": "ALARM"},
+    ]
+
+
+def test_queue_bounded(
+    state_publisher: PasdStatePublisher, callback: BlockingCallback
+) -> None:
+    """
+    Test that the oldest update is dropped when the queue is full.
+
+    :param state_publisher: the state publisher under test.
+    :param callback: the callback it publishes to.
+    """
+    state_publisher.publish(101, status="OK")
+    callback.wait_for_calls(1)
+
+    for smartbox_id in range(1, 6):
+        state_publisher.publish(smartbox_id, status="OK")
+    assert state_publisher.queue_depth == 3
+    assert state_publisher.dropped_count == 2
+
+    callback.release.set()
+    callback.wait_for_calls(3)
+    assert [call[0] for call in callback.calls] == [101, 3, 4, 5]
+
+
+def test_stop_waits_for_publishing(
+    callback: BlockingCallback, logger: logging.Logger
+) -> None:
+    """
+    Test that stopping the publisher waits for the update being published.
+
+    :param callback: the callback to publish to.
+    :param logger: a logger.
+    """
+    state_publisher = PasdStatePublisher(callback, logger)
+    state_publisher.publish(101, status="OK")
+    callback.wait_for_calls(1)
+    state_publisher.publish(101, ports=[1])
+
+    stopper = threading.Thread(target=state_publisher.stop)
+    stopper.start()
+    stopper.join(0.1)
+    # The publisher is still blocked in the callback.
+    assert stopper.is_alive()
+
+    callback.release.set()
+    stopper.join(5.0)
+    assert not stopper.is_alive()
+    # The update queued behind it was discarded.
+    assert callback.calls == [(101, {"status": "OK"})]
+
+
+def test_end_of_response(callback: BlockingCallback, logger: logging.Logger) -> None:
+    """
+    Test that the response callback is called once a response is published.
+
+    :param callback: the callback to publish to.
+    :param logger: a logger.
+    """
+    responses: list[int] = []
+    published = threading.Event()
+
+    def _response_callback(device_id: int) -> None:
+        responses.append(device_id)
+        if device_id == 1:
+            published.set()
+
+    state_publisher = PasdStatePublisher(
+        callback, logger, max_queued_updates=3, response_callback=_response_callback
+    )
+    state_publisher.publish(101, uptime=1)
+    callback.wait_for_calls(1)
+
+    # A merged read, reported group by group.
+    state_publisher.publish(101, status="OK")
+    state_publisher.publish(101, ports=[1])
+    state_publisher.end_response(101)
+    state_publisher.publish(1, status="OK")
+    state_publisher.end_response(1)
+    # The ends of responses are not counted as updates.
+    assert state_publisher.queue_depth == 3
+    assert responses == []
+
+    callback.release.set()
+    assert published.wait(5.0)
+    state_publisher.stop()
+    assert [call[0] for call in callback.calls] == [101, 101, 101, 1]
+    assert responses == [101, 1]
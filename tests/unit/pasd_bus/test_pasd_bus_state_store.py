@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the PaSD attribute state store."""
+
+from __future__ import annotations
+
+import pytest
+from tango import AttrQuality
+
+from ska_low_mccs_pasd.pasd_bus.pasd_bus_state_store import PasdStateStore
+
+
+def test_new_attributes_are_invalid() -> None:
+    """Test that attributes are invalid, with no value, until updated."""
+    store = PasdStateStore()
+    handle = store.add("fndhUptime", read_once=False, abs_deadband=1.0)
+    assert len(store) == 1
+    assert "fndhUptime" in store
+    assert store.handle("fndhUptime") == handle
+    assert store.name(handle) == "fndhUptime"
+    assert store.value(handle) is None
+    assert store.quality(handle) == AttrQuality.ATTR_INVALID
+    assert not store.is_valid(handle)
+    assert store.timestamp(handle) == 0.0
+    assert store.deadbands(handle) == (1.0, None)
+    assert not store.is_read_once(handle)
+
+    with pytest.raises(ValueError):
+        store.add("fndhUptime")
+
+
+def test_update_and_mark_invalid() -> None:
+    """Test that updating and invalidating attributes only affects them."""
+    store = PasdStateStore()
+    uptime = store.add("fndhUptime")
+    currents = store.add("smartbox1PortsCurrentDraw")
+    status = store.add("smartbox1Status")
+
+    store.update([currents, status], [[10, 20, 30], "OK"], 1000.0)
+    assert store.value(currents) == [10, 20, 30]
+    assert store.value(status) == "OK"
+    assert store.quality(currents) == AttrQuality.ATTR_VALID
+    assert store.timestamp(status) == 1000.0
+    assert store.value(uptime) is None
+    assert not store.is_valid(uptime)
+
+    assert store.mark_invalid([uptime, currents], 1001.0) == [currents]
+    # The last value is kept
+    assert store.value(currents) == [10, 20, 30]
+    assert store.quality(currents) == AttrQuality.ATTR_INVALID
+    assert store.timestamp(currents) == 1001.0
+    # Attributes that were already invalid are left alone
+    assert store.timestamp(uptime) == 0.0
+    assert store.is_valid(status)
+
+    assert store.mark_invalid([currents], 1002.0) == []
+    assert store.timestamp(currents) == 1001.0
+    store.update([], [], 1003.0)
+
+
+def test_store_grows() -> None:
+    """Test that the store grows beyond its preallocated capacity."""
+    store = PasdStateStore(capacity=2)
+    handles = [store.add(f"smartbox{i}Uptime", read_once=i % 2 == 0) for i in range(5)]
+    store.update(handles, [handle * 10 for handle in handles], 1000.0)
+    assert store.names == [f"smartbox{i}Uptime" for i in range(5)]
+    assert [store.value(handle) for handle in handles] == [0, 10, 20, 30, 40]
+    assert [store.is_read_once(handle) for handle in handles] == [
+        True,
+        False,
+        True,
+        False,
+        True,
+    ]
+    assert all(store.is_valid(handle) for handle in handles)
+
+
+def test_copy() -> None:
+    """Test that a copy of the state of attributes is independent of them."""
+    store = PasdStateStore()
+    uptime = store.add("fndhUptime")
+    status = store.add("fndhStatus")
+    store.update([uptime], [1234], 1000.0)
+
+    copy = store.copy([status, uptime])
+    assert copy == [
+        (None, int(AttrQuality.ATTR_INVALID), 0.0),
+        (1234, int(AttrQuality.ATTR_VALID), 1000.0),
+    ]
+
+    store.update([uptime], [1235], 1001.0)
+    assert copy[1] == (1234, int(AttrQuality.ATTR_VALID), 1000.0)
@@ -444,3 +444,42 @@ class TestSmartboxHealthModel:
         final_health, final_report = health_model.evaluate_health()
         assert final_health == end_expected_health
         assert end_expected_report in final_report
+
+    def test_smartbox_incremental_health(
+        self: TestSmartboxHealthModel,
+        health_model: SmartBoxHealthModel,
+    ) -> None:
+        """
+        Test that only the monitoring points that change are re-evaluated.
+
+        :param health_model: Health model fixture.
+        """
+        cache = health_model._intermediate_health
+        health_model.health_params = {
+            "SYS_48V_V_TH": [0.0, 43.0, 84.0, 100.0],
+            "SYS_PSU_V_TH": [4.0, 4.4, 4.9, 5.0],
+        }
+        monitoring_points = {"SYS_48V_V_TH": 81.0, "SYS_PSU_V_TH": 4.7}
+        health_model.update_state(
+            status=SmartboxStatusMap.OK.name,
+            port_breakers_tripped=[False] * PasdData.NUMBER_OF_SMARTBOX_PORTS,
+            monitoring_points=monitoring_points,
+        )
+        assert health_model.evaluate_health()[0] == HealthState.OK
+        evaluations = cache.evaluations
+        assert health_model.evaluate_health()[0] == HealthState.OK
+        assert cache.evaluations == evaluations
+
+        # The device updates the dictionary it passed in place.
+        monitoring_points["SYS_PSU_V_TH"] = 4.95
+        health_model.update_state(monitoring_points=monitoring_points)
+        assert health_model.evaluate_health()[0] == HealthState.DEGRADED
+        assert cache.evaluations == evaluations + 1
+
+        health_model.health_params = {"SYS_PSU_V_TH": [4.0, 4.4, 5.0, 5.5]}
+        incremental_health = health_model.evaluate_health()
+        assert incremental_health[0] == HealthState.OK
+        assert cache.evaluations == evaluations + 2
+
+        health_model.incremental = False
+        assert health_model.evaluate_health() == incremental_health
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the command timing reports."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from ska_low_mccs_pasd.command_timing import CommandTimer, CommandTimingLog
+
+
+def test_command_timer() -> None:
+    """
+    Test that a command timer reports its phases relative to its start.
+
+    :raises RuntimeError: within a timed phase, to check that it is reported
+        as failed.
+    """
+    timer = CommandTimer("On", "abc", start_time=100.0)
+    timer.add_phase("fndh_on", 100.5, 102.0)
+    timer.mark("requested", 100.25, device_id=101)
+    timer.add_child({"command": "On", "command_id": "def"})
+    with pytest.raises(RuntimeError):
+        with timer.phase("smartbox_block_1", smartboxes=["sb01"]):
+            raise RuntimeError("failed")
+    assert not timer.finished
+    timer.finish("FAILED", end_time=110.0)
+    assert timer.finished
+
+    report = timer.report()
+    assert report["command"] == "On"
+    assert report["command_id"] == "abc"
+    assert report["duration"] == 10.0
+    assert report["result"] == "FAILED"
+    assert report["phases"][0] == {"name": "fndh_on", "start": 0.5, "duration": 1.5}
+    # A phase that raises is still recorded.
+    assert report["phases"][1]["name"] == "smartbox_block_1"
+    assert report["phases"][1]["smartboxes"] == ["sb01"]
+    assert report["events"] == [{"name": "requested", "at": 0.25, "device_id": 101}]
+    assert report["children"] == [{"command": "On", "command_id": "def"}]
+    json.dumps(report)
+
+
+def test_command_timing_log() -> None:
+    """Test that a command timing log keeps the most recent commands."""
+    log = CommandTimingLog(capacity=2)
+    first = log.start("On")
+    second = log.start("On", "second")
+    third = log.start("On")
+    assert first.command_id != third.command_id
+
+    reports = log.reports()
+    assert [report["command_id"] for report in reports] == [
+        second.command_id,
+        third.command_id,
+    ]
+    # Running commands are reported with no result.
+    assert reports[0]["result"] is None
+    assert [report["command_id"] for report in log.reports("second")] == ["second"]
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the ``pasd`` device server entry point."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+import tango
+
+from ska_low_mccs_pasd.device_server import (
+    DEVICE_CLASSES,
+    StartupProfiler,
+    get_device_class_names,
+)
+
+
+@pytest.mark.parametrize(
+    ("args", "expected_classes", "expected_args"),
+    [
+        (
+            ["pasd", "ci-1", "--classes=MccsPasdBus,MccsFNDH"],
+            ["MccsFNDH", "MccsPasdBus"],
+            ["pasd", "ci-1"],
+        ),
+        (
+            ["pasd", "ci-1", "--classes", "MccsSmartBox", "-v4"],
+            ["MccsSmartBox"],
+            ["pasd", "ci-1", "-v4"],
+        ),
+        (
+            ["pasd", "ci-1", "-nodb", "-dlist", "low-mccs/pasdbus/001"],
+            list(DEVICE_CLASSES),
+            ["pasd", "ci-1", "-nodb", "-dlist", "low-mccs/pasdbus/001"],
+        ),
+    ],
+)
+def test_device_class_names_from_command_line(
+    args: list[str], expected_classes: list[str], expected_args: list[str]
+) -> None:
+    """
+    Test that the device classes can be named on the command line.
+
+    :param args: the command line arguments.
+    :param expected_classes: the device classes expected to be hosted.
+    :param expected_args: the command line arguments expected to be left
+        for Tango.
+    """
+
+    def _get_server_class_list(server: str) -> list[str]:
+        pytest.fail(f"Tango database queried for {server}")
+
+    assert get_device_class_names(args, _get_server_class_list) == expected_classes
+    assert args == expected_args
+
+
+def test_unknown_device_class_name() -> None:
+    """Test that naming a class that is not in the package is rejected."""
+    with pytest.raises(ValueError, match="MccsTile"):
+        get_device_class_names(["pasd", "ci-1", "--classes=MccsTile"])
+
+
+def test_device_class_names_from_tango_database() -> None:
+    """Test that the device classes registered in the Tango database are hosted."""
+    servers: list[str] = []
+
+    def _get_server_class_list(server: str) -> list[str]:
+        servers.append(server)
+        return ["MccsSmartBox", "MccsPasdBus"]
+
+    assert get_device_class_names(
+        ["/usr/local/bin/pasd", "ci-1"], _get_server_class_list
+    ) == ["MccsPasdBus", "MccsSmartBox"]
+    assert servers == ["pasd/ci-1"]
+
+
+def test_device_class_names_without_tango_database() -> None:
+    """Test that all device classes are hosted if the database can't say which."""
+
+    def _get_server_class_list(server: str) -> list[str]:
+        raise tango.DevFailed()
+
+    assert get_device_class_names(["pasd", "ci-1"], _get_server_class_list) == list(
+        DEVICE_CLASSES
+    )
+
+
+def test_startup_profiler() -> None:
+    """Test that the profiler only records once enabled, and reports its timings."""
+    stream = io.StringIO()
+    profiler = StartupProfiler(stream)
+    with profiler.measure("import", "MccsPasdBus"):
+        pass
+    profiler.mark("first successful poll", "low-mccs/pasdbus/001")
+    assert not profiler.timings
+    assert not stream.getvalue()
+
+    profiler.enable()
+    with profiler.measure("import", "MccsPasdBus"):
+        pass
+    profiler.mark("first successful poll", "low-mccs/pasdbus/001")
+    profiler.mark("first successful poll", "low-mccs/pasdbus/001")
+    assert list(profiler.timings) == [
+        ("import", "MccsPasdBus"),
+        ("first successful poll", "low-mccs/pasdbus/001"),
+    ]
+    assert (
+        stream.getvalue()
+        .splitlines()[0]
+        .startswith("Startup profile: import MccsPasdBus: ")
+    )
+    assert len(stream.getvalue().splitlines()) == 2
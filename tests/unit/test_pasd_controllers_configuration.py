@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the PaSD controllers' configuration."""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Iterator
+
+import pytest
+
+from ska_low_mccs_pasd import pasd_controllers_configuration
+from ska_low_mccs_pasd.pasd_controllers_configuration import (
+    CACHE_DIR_ENV_VAR,
+    PasdControllersConfig,
+)
+
+
+@pytest.fixture(name="file_reads")
+def file_reads_fixture(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[bytes]]:
+    """
+    Count the reads of the configuration file, starting from a fresh process.
+
+    :param monkeypatch: the pytest monkeypatch fixture.
+
+    :yields: a list of the contents of each read of the file.
+    """
+    reads: list[bytes] = []
+    read_configuration_file = PasdControllersConfig._read_configuration_file
+
+    def _read() -> bytes:
+        contents = read_configuration_file()
+        reads.append(contents)
+        return contents
+
+    monkeypatch.setattr(PasdControllersConfig, "_read_configuration_file", _read)
+    monkeypatch.delenv(CACHE_DIR_ENV_VAR, raising=False)
+    PasdControllersConfig.clear_cache()
+    yield reads
+    PasdControllersConfig.clear_cache()
+
+
+def test_configuration_is_read_once(file_reads: list[bytes]) -> None:
+    """
+    Test that the configuration file is only read and validated once.
+
+    :param file_reads: the reads of the configuration file.
+    """
+    all_config = PasdControllersConfig.get_all()
+    assert PasdControllersConfig.get_fncc() == all_config["FNCC"]
+    assert PasdControllersConfig.get_fndh() == all_config["FNPC"]
+    assert PasdControllersConfig.get_smartbox() == all_config["FNSC"]
+    PasdControllersConfig.get_register_map_revisions()
+    assert len(file_reads) == 1
+
+
+def test_configurations_are_independent(file_reads: list[bytes]) -> None:
+    """
+    Test that modifying a configuration doesn't affect the others.
+
+    :param file_reads: the reads of the configuration file.
+    """
+    smartbox_config = PasdControllersConfig.get_smartbox()
+    register = next(iter(smartbox_config["registers"].values()))
+    register["tango_attr_name"] = "Modified"
+    del smartbox_config["prefix"]
+
+    assert PasdControllersConfig.get_smartbox() != smartbox_config
+    assert PasdControllersConfig.get_all()["FNSC"] != smartbox_config
+    assert len(file_reads) == 1
+
+
+def test_on_disk_cache(
+    file_reads: list[bytes],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Any,
+) -> None:
+    """
+    Test that the validated configuration is cached on disk.
+
+    :param file_reads: the reads of the configuration file.
+    :param monkeypatch: the pytest monkeypatch fixture.
+    :param tmp_path: a temporary directory for the cache.
+    """
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path))
+    validated = PasdControllersConfig.get_all()
+    assert len(os.listdir(tmp_path)) == 1
+
+    # A new process reads the cache instead of validating the file
+    PasdControllersConfig.clear_cache()
+
+    def _fail_validation(_: Any) -> None:
+        raise AssertionError("The cached configuration should have been used")
+
+    with monkeypatch.context() as context:
+        context.setattr(
+            PasdControllersConfig, "_validate_configuration", _fail_validation
+        )
+        assert PasdControllersConfig.get_all() == validated
+
+    # A changed file is validated again, and cached separately
+    PasdControllersConfig.clear_cache()
+    monkeypatch.setattr(
+        PasdControllersConfig,
+        "_read_configuration_file",
+        lambda: file_reads[0] + b"\n# A comment\n",
+    )
+    assert PasdControllersConfig.get_all() == validated
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_unreadable_cache_is_ignored(
+    file_reads: list[bytes],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Any,
+) -> None:
+    """
+    Test that a corrupt cache file is ignored.
+
+    :param file_reads: the reads of the configuration file.
+    :param monkeypatch: the pytest monkeypatch fixture.
+    :param tmp_path: a temporary directory for the cache.
+    """
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path))
+    validated = PasdControllersConfig.get_all()
+    (cache_file,) = os.listdir(tmp_path)
+    with open(os.path.join(tmp_path, cache_file), "w", encoding="UTF-8") as file:
+        file.write("{not json")
+
+    PasdControllersConfig.clear_cache()
+    assert PasdControllersConfig.get_all() == validated
+    assert len(file_reads) == 2
+
+
+def test_cache_key_covers_this_package(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that the cache key changes with the version of this package.
+
+    :param monkeypatch: the pytest monkeypatch fixture.
+    """
+    versions = {"ska-low-pasd-driver": "1.0.0", "ska-low-mccs-pasd": "1.0.0"}
+    monkeypatch.setattr(
+        pasd_controllers_configuration, "version", lambda package: versions[package]
+    )
+    key = PasdControllersConfig._cache_key(b"contents")
+    assert PasdControllersConfig._cache_key(b"contents") == key
+
+    versions["ska-low-mccs-pasd"] = "1.1.0"
+    assert PasdControllersConfig._cache_key(b"contents") != key
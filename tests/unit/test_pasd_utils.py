@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of the SKA Low MCCS project
+#
+#
+# Distributed under the terms of the BSD 3-clause new license.
+# See LICENSE for more info.
+"""This module contains the tests of the common code for PaSD devices."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import numpy as np
+import pytest
+from ska_control_model import HealthState, PowerState
+
+from ska_low_mccs_pasd.pasd_controllers_configuration import PasdControllersConfig
+from ska_low_mccs_pasd.pasd_utils import (
+    MonitoringPointHealthCache,
+    PasdAttributeKind,
+    PortStateCondition,
+    build_attribute_dispatch_table,
+    get_pasd_attribute_kind,
+)
+
+
+@pytest.mark.parametrize(
+    ("attribute_name", "expected_kind"),
+    [
+        ("InputVoltageThresholds", PasdAttributeKind.THRESHOLD),
+        ("pcbtemperaturethresholds", PasdAttributeKind.THRESHOLD),
+        ("PasdStatus", PasdAttributeKind.STATUS),
+        ("PortsPowerSensed", PasdAttributeKind.PORT_POWER),
+        ("portspowercontrol", PasdAttributeKind.PORT_POWER),
+        ("PortBreakersTripped", PasdAttributeKind.BREAKER),
+        ("InputVoltage", PasdAttributeKind.MONITORING_POINT),
+        ("PortsDesiredPowerWhenOnline", PasdAttributeKind.MONITORING_POINT),
+    ],
+)
+def test_pasd_attribute_kind(
+    attribute_name: str, expected_kind: PasdAttributeKind
+) -> None:
+    """
+    Test that PaSD attributes are classified by name.
+
+    :param attribute_name: the name of the attribute.
+    :param expected_kind: the kind that the attribute is expected to be.
+    """
+    assert get_pasd_attribute_kind(attribute_name) == expected_kind
+
+
+def test_attribute_dispatch_table() -> None:
+    """Test that every register of a controller is dispatched to its handler."""
+    calls: list[tuple[PasdAttributeKind, str]] = []
+
+    def _handler(kind: PasdAttributeKind) -> Any:
+        return lambda attr_name: calls.append((kind, attr_name))
+
+    config = PasdControllersConfig.get_smartbox()
+    table = build_attribute_dispatch_table(
+        config, {kind: _handler(kind) for kind in PasdAttributeKind}
+    )
+
+    names = [
+        register["tango_attr_name"].lower() for register in config["registers"].values()
+    ]
+    assert sorted(table) == sorted(names)
+    for name in names:
+        table[name](name)
+    assert calls == [(get_pasd_attribute_kind(name), name) for name in names]
+
+
+def test_monitoring_point_health_cache() -> None:
+    """Test that health is only recomputed when a value or threshold changes."""
+    calls: list[tuple[str, Any, Any]] = []
+
+    def _compute_health(name: str, value: Any, thresholds: Any) -> Any:
+        calls.append((name, value, thresholds))
+        return (HealthState.OK, f"{name} is {value}")
+
+    cache = MonitoringPointHealthCache(_compute_health)
+    thresholds = [100.0, 80.0, 2.0, 0.0]
+    assert cache.get("voltage", 48.0, thresholds) == (HealthState.OK, "voltage is 48.0")
+    assert cache.get("voltage", 48.0, thresholds) == (HealthState.OK, "voltage is 48.0")
+    assert cache.get("current", 1.0, thresholds) == (HealthState.OK, "current is 1.0")
+    assert len(calls) == 2
+
+    # A value updated in place is a change.
+    ports = np.array([True, False])
+    cache.get("ports", ports, None)
+    ports[1] = True
+    cache.get("ports", ports, None)
+    cache.get("ports", [True, True], None)
+    assert len(calls) == 4
+
+    cache.invalidate("voltage", "temperature")
+    cache.get("voltage", 48.0, [100.0, 90.0, 2.0, 0.0])
+    cache.get("current", 1.0, thresholds)
+    assert len(calls) == 5
+
+    cache.clear()
+    cache.get("current", 1.0, thresholds)
+    assert len(calls) == 6
+    assert cache.evaluations == 6
+
+
+def test_port_state_condition() -> None:
+    """Test that waiters are woken when the ports reach their desired states."""
+    port_states = PortStateCondition()
+    assert PortStateCondition.desired_masks([True, None, False]) == (0b001, 0b100)
+    assert not port_states.wait_for([True, None, False], 0.01)
+
+    results: list[bool] = []
+    waiter = threading.Thread(
+        target=lambda: results.append(
+            port_states.wait_for([True, None, False], timeout=10.0)
+        )
+    )
+    waiter.start()
+    port_states.update([PowerState.ON, PowerState.ON, PowerState.UNKNOWN])
+    time.sleep(0.05)
+    assert waiter.is_alive()
+    port_states.update([PowerState.ON, PowerState.ON, PowerState.OFF])
+    waiter.join(timeout=1.0)
+    assert results == [True]
+    # A desired state that already holds doesn't wait.
+    assert port_states.wait_for([None, True, False], 0.0)
+
+
+def test_port_state_condition_abort() -> None:
+    """Test that an interrupted waiter stops waiting once it is aborted."""
+    port_states = PortStateCondition()
+    abort_event = threading.Event()
+    results: list[bool] = []
+    waiter = threading.Thread(
+        target=lambda: results.append(
+            port_states.wait_for([True], timeout=10.0, abort_event=abort_event)
+        )
+    )
+    waiter.start()
+    time.sleep(0.05)
+    abort_event.set()
+    port_states.interrupt()
+    waiter.join(timeout=0.5)
+    assert results == [False]